@@ -0,0 +1,112 @@
+// GENERATED by `python -m generator build` from assets/ASSET_MANIFEST.jsonl.
+// Do not edit; change the assets or pubspec.yaml and build again.
+
+import 'dart:ui' show Color;
+
+/// Size and placeholder of a bundled image, known before it is decoded.
+class AssetInfo {
+  const AssetInfo(this.path, this.width, this.height, this.color, this.blurHash);
+
+  final String path;
+  final int width;
+  final int height;
+
+  /// Dominant color, to paint while the image loads.
+  final Color color;
+
+  /// BlurHash (https://blurha.sh) of the image, for a blurred preview.
+  final String blurHash;
+
+  double get aspectRatio => width / height;
+}
+
+class AssetIndex {
+  AssetIndex._();
+
+  static const examplesExampleScene1 = AssetInfo('assets/examples/example_scene_1.svg', 400, 400, Color(0xFF101A18), 'L23+ZRoz4URjtQayWBofIUfQxuay');
+  static const icon = AssetInfo('assets/icon.jpg', 1024, 1024, Color(0xFF23282C), 'L97UM54nxu%MxuWBofWB00?bIURj');
+  static const styleThumbsStyleBbqSocial = AssetInfo('assets/style_thumbs/style_bbq_social.svg', 400, 400, Color(0xFFBF8040), 'L5LLv?^h:i^M}?jsaeof}8j@T0j@');
+  static const styleThumbsStyleBeachyCoastal = AssetInfo('assets/style_thumbs/style_beachy_coastal.svg', 400, 400, Color(0xFFA3ACA2), 'L4IYUj_3kl_2_Mj[WAof?uj[jcj[');
+  static const styleThumbsStyleBistroParis = AssetInfo('assets/style_thumbs/style_bistro_paris.svg', 400, 400, Color(0xFF263332), 'L25#^WtR00bHx]ayV@ofIAay%Mj[');
+  static const styleThumbsStyleBohoRattan = AssetInfo('assets/style_thumbs/style_boho_rattan.svg', 400, 400, Color(0xFFD4AF37), 'L7Nc3q^#]{^f^#j?afoe}+j@Nyj@');
+  static const styleThumbsStyleCompactNarrow = AssetInfo('assets/style_thumbs/style_compact_narrow.svg', 400, 400, Color(0xFF212121), 'L25E\$[t700j[xuj[WBayIUay%Mj[');
+  static const styleThumbsStyleCozyLantern = AssetInfo('assets/style_thumbs/style_cozy_lantern.svg', 400, 400, Color(0xFFE7A35A), 'LAPg=v^O]g^N^ij@jFoL}mj@OFj@');
+  static const styleThumbsStyleFirePit = AssetInfo('assets/style_thumbs/style_fire_pit.svg', 400, 400, Color(0xFFEF5350), 'LBQN#k].{L]n^6jtjFj[{zjtOrj[');
+  static const styleThumbsStyleJapandiCalm = AssetInfo('assets/style_thumbs/style_japandi_calm.svg', 400, 400, Color(0xFFA3ACA2), 'L4IYUj_3o_?u_Mj[Rjof?uj[o3j[');
+  static const styleThumbsStyleKoreanMinimal = AssetInfo('assets/style_thumbs/style_korean_minimal.svg', 400, 400, Color(0xFFFAFAFA), 'LDRfkB?b~q_3?bj[ofj[~qj[M{j[');
+  static const styleThumbsStyleLuxuryHotel = AssetInfo('assets/style_thumbs/style_luxury_hotel.svg', 400, 400, Color(0xFF070B0A), 'L12~ZBj[00oft7ofV[WBD%ay%Mof');
+  static const styleThumbsStyleMediterranean = AssetInfo('assets/style_thumbs/style_mediterranean.svg', 400, 400, Color(0xFF2FA37B), 'L36xyJug6@c=ugbFV@ofLafkxIj[');
+  static const styleThumbsStyleMinimalGreen = AssetInfo('assets/style_thumbs/style_minimal_green.svg', 400, 400, Color(0xFF2FA37B), 'L36xyJuf6@qCy;kCV@WoLabFxIkC');
+  static const styleThumbsStyleModernMinimal = AssetInfo('assets/style_thumbs/style_modern_minimal.svg', 400, 400, Color(0xFF263332), 'L25#^WtR00W:x[ayRjofIAfQ%MfQ');
+  static const styleThumbsStyleMoroccan = AssetInfo('assets/style_thumbs/style_moroccan.svg', 400, 400, Color(0xFFE7A35A), 'LAPg=v^O]g^N^ij[jFj[}mj@OFj[');
+  static const styleThumbsStylePetFriendly = AssetInfo('assets/style_thumbs/style_pet_friendly.svg', 400, 400, Color(0xFF66BB6A), 'L5C9sr%{GhuK*GbFR%ofYZfkwPfk');
+  static const styleThumbsStylePlantJungle = AssetInfo('assets/style_thumbs/style_plant_jungle.svg', 400, 400, Color(0xFF142220), 'L242u7oz4TWVtRfQV@j[IAayx]fk');
+  static const styleThumbsStyleRainyCozy = AssetInfo('assets/style_thumbs/style_rainy_cozy.svg', 400, 400, Color(0xFF6F7CFF), 'LDD0q9tVN9tCxxfRWFj[bifRoZj[');
+  static const styleThumbsStyleRomanticCandle = AssetInfo('assets/style_thumbs/style_romantic_candle.svg', 400, 400, Color(0xFFD14B4B), 'L7NFu5].@t]n^6jtaeoL{zjtOrj[');
+  static const styleThumbsStyleRooftopParty = AssetInfo('assets/style_thumbs/style_rooftop_party.svg', 400, 400, Color(0xFF6F7CFF), 'LDD0tGtVN9tCxxfRa\$j]bifRoZfR');
+  static const styleThumbsStyleScandiSoft = AssetInfo('assets/style_thumbs/style_scandi_soft.svg', 400, 400, Color(0xFFD2D7CF), 'L7NT?x_3_2_3_3j[a{of~qj[M|j[');
+  static const styleThumbsStyleTropicalGarden = AssetInfo('assets/style_thumbs/style_tropical_garden.svg', 400, 400, Color(0xFF2DBA8A), 'L46o~mugCFd8qDbGaekCQ3fkw5fk');
+  static const styleThumbsStyleUrbanIndustrial = AssetInfo('assets/style_thumbs/style_urban_industrial.svg', 400, 400, Color(0xFF3E2723), 'L27^Mgxa00s.-pj[NGayD%ay%Mj[');
+  static const styleThumbsStyleWabiSabi = AssetInfo('assets/style_thumbs/style_wabi_sabi.svg', 400, 400, Color(0xFF9E9E9E), 'L3H.Qb_3ay_3~qofRjof?bj[ofof');
+  static const styleThumbsStyleZenGarden = AssetInfo('assets/style_thumbs/style_zen_garden.svg', 400, 400, Color(0xFF0B1110), 'L23bs}of4nWBkCayjuj[IUayxufQ');
+
+  /// Every entry by path, for paths built at run time.
+  static const byPath = <String, AssetInfo>{
+    'assets/examples/example_scene_1.svg': examplesExampleScene1,
+    'assets/icon.jpg': icon,
+    'assets/style_thumbs/style_bbq_social.svg': styleThumbsStyleBbqSocial,
+    'assets/style_thumbs/style_beachy_coastal.svg': styleThumbsStyleBeachyCoastal,
+    'assets/style_thumbs/style_bistro_paris.svg': styleThumbsStyleBistroParis,
+    'assets/style_thumbs/style_boho_rattan.svg': styleThumbsStyleBohoRattan,
+    'assets/style_thumbs/style_compact_narrow.svg': styleThumbsStyleCompactNarrow,
+    'assets/style_thumbs/style_cozy_lantern.svg': styleThumbsStyleCozyLantern,
+    'assets/style_thumbs/style_fire_pit.svg': styleThumbsStyleFirePit,
+    'assets/style_thumbs/style_japandi_calm.svg': styleThumbsStyleJapandiCalm,
+    'assets/style_thumbs/style_korean_minimal.svg': styleThumbsStyleKoreanMinimal,
+    'assets/style_thumbs/style_luxury_hotel.svg': styleThumbsStyleLuxuryHotel,
+    'assets/style_thumbs/style_mediterranean.svg': styleThumbsStyleMediterranean,
+    'assets/style_thumbs/style_minimal_green.svg': styleThumbsStyleMinimalGreen,
+    'assets/style_thumbs/style_modern_minimal.svg': styleThumbsStyleModernMinimal,
+    'assets/style_thumbs/style_moroccan.svg': styleThumbsStyleMoroccan,
+    'assets/style_thumbs/style_pet_friendly.svg': styleThumbsStylePetFriendly,
+    'assets/style_thumbs/style_plant_jungle.svg': styleThumbsStylePlantJungle,
+    'assets/style_thumbs/style_rainy_cozy.svg': styleThumbsStyleRainyCozy,
+    'assets/style_thumbs/style_romantic_candle.svg': styleThumbsStyleRomanticCandle,
+    'assets/style_thumbs/style_rooftop_party.svg': styleThumbsStyleRooftopParty,
+    'assets/style_thumbs/style_scandi_soft.svg': styleThumbsStyleScandiSoft,
+    'assets/style_thumbs/style_tropical_garden.svg': styleThumbsStyleTropicalGarden,
+    'assets/style_thumbs/style_urban_industrial.svg': styleThumbsStyleUrbanIndustrial,
+    'assets/style_thumbs/style_wabi_sabi.svg': styleThumbsStyleWabiSabi,
+    'assets/style_thumbs/style_zen_garden.svg': styleThumbsStyleZenGarden,
+  };
+
+  /// Entries by path without the extension, for files that may be in either format.
+  static const byStem = <String, AssetInfo>{
+    'assets/examples/example_scene_1': examplesExampleScene1,
+    'assets/icon': icon,
+    'assets/style_thumbs/style_bbq_social': styleThumbsStyleBbqSocial,
+    'assets/style_thumbs/style_beachy_coastal': styleThumbsStyleBeachyCoastal,
+    'assets/style_thumbs/style_bistro_paris': styleThumbsStyleBistroParis,
+    'assets/style_thumbs/style_boho_rattan': styleThumbsStyleBohoRattan,
+    'assets/style_thumbs/style_compact_narrow': styleThumbsStyleCompactNarrow,
+    'assets/style_thumbs/style_cozy_lantern': styleThumbsStyleCozyLantern,
+    'assets/style_thumbs/style_fire_pit': styleThumbsStyleFirePit,
+    'assets/style_thumbs/style_japandi_calm': styleThumbsStyleJapandiCalm,
+    'assets/style_thumbs/style_korean_minimal': styleThumbsStyleKoreanMinimal,
+    'assets/style_thumbs/style_luxury_hotel': styleThumbsStyleLuxuryHotel,
+    'assets/style_thumbs/style_mediterranean': styleThumbsStyleMediterranean,
+    'assets/style_thumbs/style_minimal_green': styleThumbsStyleMinimalGreen,
+    'assets/style_thumbs/style_modern_minimal': styleThumbsStyleModernMinimal,
+    'assets/style_thumbs/style_moroccan': styleThumbsStyleMoroccan,
+    'assets/style_thumbs/style_pet_friendly': styleThumbsStylePetFriendly,
+    'assets/style_thumbs/style_plant_jungle': styleThumbsStylePlantJungle,
+    'assets/style_thumbs/style_rainy_cozy': styleThumbsStyleRainyCozy,
+    'assets/style_thumbs/style_romantic_candle': styleThumbsStyleRomanticCandle,
+    'assets/style_thumbs/style_rooftop_party': styleThumbsStyleRooftopParty,
+    'assets/style_thumbs/style_scandi_soft': styleThumbsStyleScandiSoft,
+    'assets/style_thumbs/style_tropical_garden': styleThumbsStyleTropicalGarden,
+    'assets/style_thumbs/style_urban_industrial': styleThumbsStyleUrbanIndustrial,
+    'assets/style_thumbs/style_wabi_sabi': styleThumbsStyleWabiSabi,
+    'assets/style_thumbs/style_zen_garden': styleThumbsStyleZenGarden,
+  };
+}
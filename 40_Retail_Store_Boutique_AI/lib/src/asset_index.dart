@@ -0,0 +1,37 @@
+// GENERATED by `python -m generator build` from assets/ASSET_MANIFEST.jsonl.
+// Do not edit; change the assets or pubspec.yaml and build again.
+
+import 'dart:ui' show Color;
+
+/// Size and placeholder of a bundled image, known before it is decoded.
+class AssetInfo {
+  const AssetInfo(this.path, this.width, this.height, this.color, this.blurHash);
+
+  final String path;
+  final int width;
+  final int height;
+
+  /// Dominant color, to paint while the image loads.
+  final Color color;
+
+  /// BlurHash (https://blurha.sh) of the image, for a blurred preview.
+  final String blurHash;
+
+  double get aspectRatio => width / height;
+}
+
+class AssetIndex {
+  AssetIndex._();
+
+  static const icon = AssetInfo('assets/icon.jpg', 1024, 1024, Color(0xFF23282C), 'L97UM54nxu%MxuWBofWB00?bIURj');
+
+  /// Every entry by path, for paths built at run time.
+  static const byPath = <String, AssetInfo>{
+    'assets/icon.jpg': icon,
+  };
+
+  /// Entries by path without the extension, for files that may be in either format.
+  static const byStem = <String, AssetInfo>{
+    'assets/icon': icon,
+  };
+}
@@ -0,0 +1,235 @@
+// GENERATED by `python -m generator build` from assets/ASSET_MANIFEST.jsonl.
+// Do not edit; change the assets or pubspec.yaml and build again.
+
+import 'dart:ui' show Color;
+
+/// Size and placeholder of a bundled image, known before it is decoded.
+class AssetInfo {
+  const AssetInfo(this.path, this.width, this.height, this.color, this.blurHash);
+
+  final String path;
+  final int width;
+  final int height;
+
+  /// Dominant color, to paint while the image loads.
+  final Color color;
+
+  /// BlurHash (https://blurha.sh) of the image, for a blurred preview.
+  final String blurHash;
+
+  double get aspectRatio => width / height;
+}
+
+class AssetIndex {
+  AssetIndex._();
+
+  static const examplesExample1 = AssetInfo('assets/examples/example_1.svg', 400, 600, Color(0xFF2A3350), 'T26Ri\$00~qtSWBj]IAWA%Mo\$WBt7');
+  static const examplesExample2 = AssetInfo('assets/examples/example_2.svg', 400, 600, Color(0xFF0F1422), 'T242Yi00_4ogWBj[IUWBxuj]WBof');
+  static const examplesExample3 = AssetInfo('assets/examples/example_3.svg', 400, 600, Color(0xFF4B86FF), 'TF9vPWNlxqp1a~j@Rmazodp1a\$j@');
+  static const examplesExample4 = AssetInfo('assets/examples/example_4.svg', 400, 600, Color(0xFFD14B4B), 'T6OIXt@t-;}Fn%j[RPaet7}FjZof');
+  static const examplesExample5 = AssetInfo('assets/examples/example_5.svg', 400, 600, Color(0xFF151C2E), 'T24esa00_4o#WBj[ITWBxvj^WBog');
+  static const examplesExample6 = AssetInfo('assets/examples/example_6.svg', 400, 600, Color(0xFFD0A85C), 'T6OCAn]{-;~9j?j[RPaet7~9jsof');
+  static const icon = AssetInfo('assets/icon.jpg', 1024, 1024, Color(0xFF23282C), 'L97UM54nxu%MxuWBofWB00?bIURj');
+  static const onboardingOnboardBad = AssetInfo('assets/onboarding/onboard_bad.svg', 400, 600, Color(0xFF151C2E), 'T24esa00_4t8WBj[ITWBxvj]WBog');
+  static const onboardingOnboardGood = AssetInfo('assets/onboarding/onboard_good.svg', 400, 600, Color(0xFF151C2E), 'T24esa00_4t8WBj[ITWBxvj]WBog');
+  static const styleMoodboardsBotanicalCalm = AssetInfo('assets/style_moodboards/botanical_calm.svg', 400, 400, Color(0xFF2A261D), 'LqC6+lDzWAxwJ[r-oIW@NMxVayWE');
+  static const styleMoodboardsCozyLamp = AssetInfo('assets/style_moodboards/cozy_lamp.svg', 400, 400, Color(0xFFC74C4B), 'LWG@JeMgV[xt+K2@X8#nIWKgWVr?');
+  static const styleMoodboardsCreativeArt = AssetInfo('assets/style_moodboards/creative_art.svg', 400, 400, Color(0xFFD1AA5E), 'LcJPuI}ro0NbXj?Et6NI9^kUayWC');
+  static const styleMoodboardsCustomAdv = AssetInfo('assets/style_moodboards/custom_adv.svg', 400, 400, Color(0xFF1B2440), 'LZFX9mt\$WonR11VuoLf*5maMWBbZ');
+  static const styleMoodboardsDarkAcademia = AssetInfo('assets/style_moodboards/dark_academia.svg', 400, 400, Color(0xFF1D2640), 'LRFs3g95Rk%J[U0#W=-TQoJjWBn*');
+  static const styleMoodboardsDaylightProd = AssetInfo('assets/style_moodboards/daylight_prod.svg', 400, 400, Color(0xFF0E1524), 'L+I3,?kgaxn.}jo~kCnhs6kEazaw');
+  static const styleMoodboardsExamFocus = AssetInfo('assets/style_moodboards/exam_focus.svg', 400, 400, Color(0xFF2B291D), 'LYDbvP7_Se#T{N9uWXxZrFVtWBkB');
+  static const styleMoodboardsFuturisticPod = AssetInfo('assets/style_moodboards/futuristic_pod.svg', 400, 400, Color(0xFF181F35), 'L23+WbkEIUj[9Do\$%MjYxRozIUWA');
+  static const styleMoodboardsGamingHybrid = AssetInfo('assets/style_moodboards/gaming_hybrid.svg', 400, 400, Color(0xFFABA69C), 'LsGSPg#7e.bv}@xooea\$rskVayaf');
+  static const styleMoodboardsHighContrast = AssetInfo('assets/style_moodboards/high_contrast.svg', 400, 400, Color(0xFF121827), 'L14B@29x9F%1VUEA-=\$}?CkED%ad');
+  static const styleMoodboardsIndustrialLoft = AssetInfo('assets/style_moodboards/industrial_loft.svg', 400, 400, Color(0xFF1A2441), 'LU5iEiR1WAo%Vokaoge,i@kZa#ac');
+  static const styleMoodboardsJapandiCalm = AssetInfo('assets/style_moodboards/japandi_calm.svg', 400, 400, Color(0xFFD0A75B), 'LRJQPw0iNH-mWC4?Wq%059R+WBay');
+  static const styleMoodboardsKoreanClean = AssetInfo('assets/style_moodboards/korean_clean.svg', 400, 400, Color(0xFF2B3248), 'LOBp2z~8oIIr59E5flt59vIrR*s,');
+  static const styleMoodboardsLibraryWall = AssetInfo('assets/style_moodboards/library_wall.svg', 400, 400, Color(0xFF0A0D14), 'LF9G{z~poeIV4oD%j[xaD*IURjs:');
+  static const styleMoodboardsMidCentury = AssetInfo('assets/style_moodboards/mid_century.svg', 400, 400, Color(0xFF0A0D15), 'Lq5PYDVnado\$p3VpjrkFogaxayfk');
+  static const styleMoodboardsMinimalMono = AssetInfo('assets/style_moodboards/minimal_mono.svg', 400, 400, Color(0xFF25253B), 'LrB{dCKnWrr;KnxxogR\$OFxHf6WV');
+  static const styleMoodboardsModernMinimal = AssetInfo('assets/style_moodboards/modern_minimal.svg', 400, 400, Color(0xFF2A2A1F), 'LXDcsk6*R+\$g}S9IWE%1rYVtWBkB');
+  static const styleMoodboardsMontessoriKids = AssetInfo('assets/style_moodboards/montessori_kids.svg', 400, 400, Color(0xFF2E354C), 'LrCP_6-0jXSRKBISaxt8NMNGWCoe');
+  static const styleMoodboardsNightOwl = AssetInfo('assets/style_moodboards/night_owl.svg', 400, 400, Color(0xFF1C2747), 'LeDkZx}xoMNE[S;JoJS\$nLnMaebJ');
+  static const styleMoodboardsParisianNook = AssetInfo('assets/style_moodboards/parisian_nook.svg', 400, 400, Color(0xFF3AA9B0), 'LqGuh1PdW-rx|=T2f+s8rVe[azfg');
+  static const styleMoodboardsScandiBright = AssetInfo('assets/style_moodboards/scandi_bright.svg', 400, 400, Color(0xFF07090E), 'LjA_qdG9WUw|.kKJbaspt7bFayju');
+  static const styleMoodboardsSilentZen = AssetInfo('assets/style_moodboards/silent_zen.svg', 400, 400, Color(0xFF141C29), 'LpD,yU9nWFxm^nKAbJw@rvXSayjF');
+  static const styleMoodboardsSmallDeskHack = AssetInfo('assets/style_moodboards/small_desk_hack.svg', 400, 400, Color(0xFFA8A39A), 'LaDvZg~pofIVxuxuofWBRjRkWBj[');
+  static const styleMoodboardsSoftPastel = AssetInfo('assets/style_moodboards/soft_pastel.svg', 400, 400, Color(0xFF222430), 'LJBUqM1wNa,@1g,[s:NuAs,@aeNu');
+  static const styleMoodboardsStorageMax = AssetInfo('assets/style_moodboards/storage_max.svg', 400, 400, Color(0xFF161C2D), 'L13+J^?aD%Ip4=Ni-=xr-;bdD%Ri');
+  static const styleMoodboardsStudentDorm = AssetInfo('assets/style_moodboards/student_dorm.svg', 400, 400, Color(0xFFA8A39A), 'LZD^P*}[o2I:#Yx[ofV[Q:SxWUjG');
+  static const styleMoodboardsTechWorkspace = AssetInfo('assets/style_moodboards/tech_workspace.svg', 400, 400, Color(0xFF1A2030), 'LOH_6y9FRj%MAL9GfQxu0jR*WBa}');
+  static const styleMoodboardsWarmWood = AssetInfo('assets/style_moodboards/warm_wood.svg', 400, 400, Color(0xFF21293D), 'LNBXZ08GSg#SCj.jt7Mz9_%JaxRl');
+  static const styleMoodboardsWhiteboardPro = AssetInfo('assets/style_moodboards/whiteboard_pro.svg', 400, 400, Color(0xFF3BA8AF), 'LVD^Dm1DR%-W|m9Qa\$\${q@V\$WCk7');
+  static const styleTilesBotanicalCalm = AssetInfo('assets/style_tiles/botanical_calm.svg', 400, 400, Color(0xFF131825), 'LYDU3N~8oII@{L?Et6NHqwofayae');
+  static const styleTilesCozyLamp = AssetInfo('assets/style_tiles/cozy_lamp.svg', 400, 400, Color(0xFF0A0D15), 'LZDJkH4XRk%d}S9_W;xYrYXRayjG');
+  static const styleTilesCreativeArt = AssetInfo('assets/style_tiles/creative_art.svg', 400, 400, Color(0xFF151C2E), 'Lr5?7WVnadkYp3VpjrohkDaxayfk');
+  static const styleTilesCustomAdv = AssetInfo('assets/style_tiles/custom_adv.svg', 400, 400, Color(0xFF0F1422), 'L02==lx{00ad01R:_Nt7~pof4nae');
+  static const styleTilesDarkAcademia = AssetInfo('assets/style_tiles/dark_academia.svg', 400, 400, Color(0xFFB7A687), 'LeEx|Z0MRk-otSRPj[ogI@xYayWD');
+  static const styleTilesDaylightProd = AssetInfo('assets/style_tiles/daylight_prod.svg', 400, 400, Color(0xFF4B86FF), 'L{8F,Wo*a\$axp3acj?kDjXacaxfl');
+  static const styleTilesExamFocus = AssetInfo('assets/style_tiles/exam_focus.svg', 400, 400, Color(0xFF4B86FE), 'Ll6,=ZVEaekri-V-j=oiZ#bUaxjd');
+  static const styleTilesFuturisticPod = AssetInfo('assets/style_tiles/futuristic_pod.svg', 400, 400, Color(0xFF0B0F16), 'LLBh[30jRk--63*Mr@Tc8}#8aeS#');
+  static const styleTilesGamingHybrid = AssetInfo('assets/style_tiles/gaming_hybrid.svg', 400, 400, Color(0xFF4C86FD), 'LpEpdT=+n}Nix_s%oKbJRNWGayjr');
+  static const styleTilesHighContrast = AssetInfo('assets/style_tiles/high_contrast.svg', 400, 400, Color(0xFF2B251B), 'LYDa1E}Fn%Nt}E=Ks:Nus:oKayaz');
+  static const styleTilesIndustrialLoft = AssetInfo('assets/style_tiles/industrial_loft.svg', 400, 400, Color(0xFFA8A39A), 'LaDl=-~pofIV%3xtofWCRjRjWBj[');
+  static const styleTilesJapandiCalm = AssetInfo('assets/style_tiles/japandi_calm.svg', 400, 400, Color(0xFFA8A39A), 'LhIDj+]Sn\$S#}smmjZo|V@RjWBkB');
+  static const styleTilesKoreanClean = AssetInfo('assets/style_tiles/korean_clean.svg', 400, 400, Color(0xFF5188FA), 'LpG[?O\$xf5bc}}w@oLbInJjrayay');
+  static const styleTilesLibraryWall = AssetInfo('assets/style_tiles/library_wall.svg', 400, 400, Color(0xFF2A251A), 'L44_w#XrM|s6xxkZxuoIxuoeM{ay');
+  static const styleTilesMidCentury = AssetInfo('assets/style_tiles/mid_century.svg', 400, 400, Color(0xFF0A0D14), 'LB9G]o01M{-p01-;t7NG9G-:WBM|');
+  static const styleTilesMinimalMono = AssetInfo('assets/style_tiles/minimal_mono.svg', 400, 400, Color(0xFF0C101B), 'LZH1AVL}V@x^%A17Wr\$xI+J;WXs8');
+  static const styleTilesModernMinimal = AssetInfo('assets/style_tiles/modern_minimal.svg', 400, 400, Color(0xFF2DB98A), 'LdD_A|6;R.\$w^rBzX7wgrUXKaxjJ');
+  static const styleTilesMontessoriKids = AssetInfo('assets/style_tiles/montessori_kids.svg', 400, 400, Color(0xFFA8A39A), 'LfEgBXiJaeo}~Co}kCnjrYkpaye.');
+  static const styleTilesNightOwl = AssetInfo('assets/style_tiles/night_owl.svg', 400, 400, Color(0xFF2DBA8A), 'La6L0uc|X4i+b,k?kDe-ZzjMagbD');
+  static const styleTilesParisianNook = AssetInfo('assets/style_tiles/parisian_nook.svg', 400, 400, Color(0xFFD14B4B), 'LbJ7E\$8uS#+I}GoMofoKMyv\$aeX7');
+  static const styleTilesScandiBright = AssetInfo('assets/style_tiles/scandi_bright.svg', 400, 400, Color(0xFFA9A49B), 'LmFPc.{*njKNqEiyjug2OrNbWVoL');
+  static const styleTilesSilentZen = AssetInfo('assets/style_tiles/silent_zen.svg', 400, 400, Color(0xFF121826), 'LT9,HU?]kCM{GFP,kWn5IBOnWUnj');
+  static const styleTilesSmallDeskHack = AssetInfo('assets/style_tiles/small_desk_hack.svg', 400, 400, Color(0xFF242B42), 'LkF5mX~Us.Ipo~o#kCf5NKNIWCoK');
+  static const styleTilesSoftPastel = AssetInfo('assets/style_tiles/soft_pastel.svg', 400, 400, Color(0xFF282A24), 'LQ4~1=pFWUa\$Y2l,ozeAidk;WVaK');
+  static const styleTilesStorageMax = AssetInfo('assets/style_tiles/storage_max.svg', 400, 400, Color(0xFFC0A776), 'LtEzcu#ce?XMGdRaj]kQIrWZayjY');
+  static const styleTilesStudentDorm = AssetInfo('assets/style_tiles/student_dorm.svg', 400, 400, Color(0xFF39C3A4), 'LU4#EyUdV@l7d9ZOnjk;ozjFaefk');
+  static const styleTilesTechWorkspace = AssetInfo('assets/style_tiles/tech_workspace.svg', 400, 400, Color(0xFF2D2B1E), 'Ln5IAKqDbuZ%kobukBjZixaKaef*');
+  static const styleTilesWarmWood = AssetInfo('assets/style_tiles/warm_wood.svg', 400, 400, Color(0xFF0E1424), 'LmDv+#:4nOPB?S+Pn,S_nxoia#aw');
+  static const styleTilesWhiteboardPro = AssetInfo('assets/style_tiles/whiteboard_pro.svg', 400, 400, Color(0xFF0A0D15), 'LdE{5-0MRk-oo~ROj[ozI=xWaxWD');
+
+  /// Every entry by path, for paths built at run time.
+  static const byPath = <String, AssetInfo>{
+    'assets/examples/example_1.svg': examplesExample1,
+    'assets/examples/example_2.svg': examplesExample2,
+    'assets/examples/example_3.svg': examplesExample3,
+    'assets/examples/example_4.svg': examplesExample4,
+    'assets/examples/example_5.svg': examplesExample5,
+    'assets/examples/example_6.svg': examplesExample6,
+    'assets/icon.jpg': icon,
+    'assets/onboarding/onboard_bad.svg': onboardingOnboardBad,
+    'assets/onboarding/onboard_good.svg': onboardingOnboardGood,
+    'assets/style_moodboards/botanical_calm.svg': styleMoodboardsBotanicalCalm,
+    'assets/style_moodboards/cozy_lamp.svg': styleMoodboardsCozyLamp,
+    'assets/style_moodboards/creative_art.svg': styleMoodboardsCreativeArt,
+    'assets/style_moodboards/custom_adv.svg': styleMoodboardsCustomAdv,
+    'assets/style_moodboards/dark_academia.svg': styleMoodboardsDarkAcademia,
+    'assets/style_moodboards/daylight_prod.svg': styleMoodboardsDaylightProd,
+    'assets/style_moodboards/exam_focus.svg': styleMoodboardsExamFocus,
+    'assets/style_moodboards/futuristic_pod.svg': styleMoodboardsFuturisticPod,
+    'assets/style_moodboards/gaming_hybrid.svg': styleMoodboardsGamingHybrid,
+    'assets/style_moodboards/high_contrast.svg': styleMoodboardsHighContrast,
+    'assets/style_moodboards/industrial_loft.svg': styleMoodboardsIndustrialLoft,
+    'assets/style_moodboards/japandi_calm.svg': styleMoodboardsJapandiCalm,
+    'assets/style_moodboards/korean_clean.svg': styleMoodboardsKoreanClean,
+    'assets/style_moodboards/library_wall.svg': styleMoodboardsLibraryWall,
+    'assets/style_moodboards/mid_century.svg': styleMoodboardsMidCentury,
+    'assets/style_moodboards/minimal_mono.svg': styleMoodboardsMinimalMono,
+    'assets/style_moodboards/modern_minimal.svg': styleMoodboardsModernMinimal,
+    'assets/style_moodboards/montessori_kids.svg': styleMoodboardsMontessoriKids,
+    'assets/style_moodboards/night_owl.svg': styleMoodboardsNightOwl,
+    'assets/style_moodboards/parisian_nook.svg': styleMoodboardsParisianNook,
+    'assets/style_moodboards/scandi_bright.svg': styleMoodboardsScandiBright,
+    'assets/style_moodboards/silent_zen.svg': styleMoodboardsSilentZen,
+    'assets/style_moodboards/small_desk_hack.svg': styleMoodboardsSmallDeskHack,
+    'assets/style_moodboards/soft_pastel.svg': styleMoodboardsSoftPastel,
+    'assets/style_moodboards/storage_max.svg': styleMoodboardsStorageMax,
+    'assets/style_moodboards/student_dorm.svg': styleMoodboardsStudentDorm,
+    'assets/style_moodboards/tech_workspace.svg': styleMoodboardsTechWorkspace,
+    'assets/style_moodboards/warm_wood.svg': styleMoodboardsWarmWood,
+    'assets/style_moodboards/whiteboard_pro.svg': styleMoodboardsWhiteboardPro,
+    'assets/style_tiles/botanical_calm.svg': styleTilesBotanicalCalm,
+    'assets/style_tiles/cozy_lamp.svg': styleTilesCozyLamp,
+    'assets/style_tiles/creative_art.svg': styleTilesCreativeArt,
+    'assets/style_tiles/custom_adv.svg': styleTilesCustomAdv,
+    'assets/style_tiles/dark_academia.svg': styleTilesDarkAcademia,
+    'assets/style_tiles/daylight_prod.svg': styleTilesDaylightProd,
+    'assets/style_tiles/exam_focus.svg': styleTilesExamFocus,
+    'assets/style_tiles/futuristic_pod.svg': styleTilesFuturisticPod,
+    'assets/style_tiles/gaming_hybrid.svg': styleTilesGamingHybrid,
+    'assets/style_tiles/high_contrast.svg': styleTilesHighContrast,
+    'assets/style_tiles/industrial_loft.svg': styleTilesIndustrialLoft,
+    'assets/style_tiles/japandi_calm.svg': styleTilesJapandiCalm,
+    'assets/style_tiles/korean_clean.svg': styleTilesKoreanClean,
+    'assets/style_tiles/library_wall.svg': styleTilesLibraryWall,
+    'assets/style_tiles/mid_century.svg': styleTilesMidCentury,
+    'assets/style_tiles/minimal_mono.svg': styleTilesMinimalMono,
+    'assets/style_tiles/modern_minimal.svg': styleTilesModernMinimal,
+    'assets/style_tiles/montessori_kids.svg': styleTilesMontessoriKids,
+    'assets/style_tiles/night_owl.svg': styleTilesNightOwl,
+    'assets/style_tiles/parisian_nook.svg': styleTilesParisianNook,
+    'assets/style_tiles/scandi_bright.svg': styleTilesScandiBright,
+    'assets/style_tiles/silent_zen.svg': styleTilesSilentZen,
+    'assets/style_tiles/small_desk_hack.svg': styleTilesSmallDeskHack,
+    'assets/style_tiles/soft_pastel.svg': styleTilesSoftPastel,
+    'assets/style_tiles/storage_max.svg': styleTilesStorageMax,
+    'assets/style_tiles/student_dorm.svg': styleTilesStudentDorm,
+    'assets/style_tiles/tech_workspace.svg': styleTilesTechWorkspace,
+    'assets/style_tiles/warm_wood.svg': styleTilesWarmWood,
+    'assets/style_tiles/whiteboard_pro.svg': styleTilesWhiteboardPro,
+  };
+
+  /// Entries by path without the extension, for files that may be in either format.
+  static const byStem = <String, AssetInfo>{
+    'assets/examples/example_1': examplesExample1,
+    'assets/examples/example_2': examplesExample2,
+    'assets/examples/example_3': examplesExample3,
+    'assets/examples/example_4': examplesExample4,
+    'assets/examples/example_5': examplesExample5,
+    'assets/examples/example_6': examplesExample6,
+    'assets/icon': icon,
+    'assets/onboarding/onboard_bad': onboardingOnboardBad,
+    'assets/onboarding/onboard_good': onboardingOnboardGood,
+    'assets/style_moodboards/botanical_calm': styleMoodboardsBotanicalCalm,
+    'assets/style_moodboards/cozy_lamp': styleMoodboardsCozyLamp,
+    'assets/style_moodboards/creative_art': styleMoodboardsCreativeArt,
+    'assets/style_moodboards/custom_adv': styleMoodboardsCustomAdv,
+    'assets/style_moodboards/dark_academia': styleMoodboardsDarkAcademia,
+    'assets/style_moodboards/daylight_prod': styleMoodboardsDaylightProd,
+    'assets/style_moodboards/exam_focus': styleMoodboardsExamFocus,
+    'assets/style_moodboards/futuristic_pod': styleMoodboardsFuturisticPod,
+    'assets/style_moodboards/gaming_hybrid': styleMoodboardsGamingHybrid,
+    'assets/style_moodboards/high_contrast': styleMoodboardsHighContrast,
+    'assets/style_moodboards/industrial_loft': styleMoodboardsIndustrialLoft,
+    'assets/style_moodboards/japandi_calm': styleMoodboardsJapandiCalm,
+    'assets/style_moodboards/korean_clean': styleMoodboardsKoreanClean,
+    'assets/style_moodboards/library_wall': styleMoodboardsLibraryWall,
+    'assets/style_moodboards/mid_century': styleMoodboardsMidCentury,
+    'assets/style_moodboards/minimal_mono': styleMoodboardsMinimalMono,
+    'assets/style_moodboards/modern_minimal': styleMoodboardsModernMinimal,
+    'assets/style_moodboards/montessori_kids': styleMoodboardsMontessoriKids,
+    'assets/style_moodboards/night_owl': styleMoodboardsNightOwl,
+    'assets/style_moodboards/parisian_nook': styleMoodboardsParisianNook,
+    'assets/style_moodboards/scandi_bright': styleMoodboardsScandiBright,
+    'assets/style_moodboards/silent_zen': styleMoodboardsSilentZen,
+    'assets/style_moodboards/small_desk_hack': styleMoodboardsSmallDeskHack,
+    'assets/style_moodboards/soft_pastel': styleMoodboardsSoftPastel,
+    'assets/style_moodboards/storage_max': styleMoodboardsStorageMax,
+    'assets/style_moodboards/student_dorm': styleMoodboardsStudentDorm,
+    'assets/style_moodboards/tech_workspace': styleMoodboardsTechWorkspace,
+    'assets/style_moodboards/warm_wood': styleMoodboardsWarmWood,
+    'assets/style_moodboards/whiteboard_pro': styleMoodboardsWhiteboardPro,
+    'assets/style_tiles/botanical_calm': styleTilesBotanicalCalm,
+    'assets/style_tiles/cozy_lamp': styleTilesCozyLamp,
+    'assets/style_tiles/creative_art': styleTilesCreativeArt,
+    'assets/style_tiles/custom_adv': styleTilesCustomAdv,
+    'assets/style_tiles/dark_academia': styleTilesDarkAcademia,
+    'assets/style_tiles/daylight_prod': styleTilesDaylightProd,
+    'assets/style_tiles/exam_focus': styleTilesExamFocus,
+    'assets/style_tiles/futuristic_pod': styleTilesFuturisticPod,
+    'assets/style_tiles/gaming_hybrid': styleTilesGamingHybrid,
+    'assets/style_tiles/high_contrast': styleTilesHighContrast,
+    'assets/style_tiles/industrial_loft': styleTilesIndustrialLoft,
+    'assets/style_tiles/japandi_calm': styleTilesJapandiCalm,
+    'assets/style_tiles/korean_clean': styleTilesKoreanClean,
+    'assets/style_tiles/library_wall': styleTilesLibraryWall,
+    'assets/style_tiles/mid_century': styleTilesMidCentury,
+    'assets/style_tiles/minimal_mono': styleTilesMinimalMono,
+    'assets/style_tiles/modern_minimal': styleTilesModernMinimal,
+    'assets/style_tiles/montessori_kids': styleTilesMontessoriKids,
+    'assets/style_tiles/night_owl': styleTilesNightOwl,
+    'assets/style_tiles/parisian_nook': styleTilesParisianNook,
+    'assets/style_tiles/scandi_bright': styleTilesScandiBright,
+    'assets/style_tiles/silent_zen': styleTilesSilentZen,
+    'assets/style_tiles/small_desk_hack': styleTilesSmallDeskHack,
+    'assets/style_tiles/soft_pastel': styleTilesSoftPastel,
+    'assets/style_tiles/storage_max': styleTilesStorageMax,
+    'assets/style_tiles/student_dorm': styleTilesStudentDorm,
+    'assets/style_tiles/tech_workspace': styleTilesTechWorkspace,
+    'assets/style_tiles/warm_wood': styleTilesWarmWood,
+    'assets/style_tiles/whiteboard_pro': styleTilesWhiteboardPro,
+  };
+}
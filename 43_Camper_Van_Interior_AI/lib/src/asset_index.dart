@@ -0,0 +1,148 @@
+// GENERATED by `python -m generator build` from assets/ASSET_MANIFEST.jsonl.
+// Do not edit; change the assets or pubspec.yaml and build again.
+
+import 'dart:ui' show Color;
+
+/// Size and placeholder of a bundled image, known before it is decoded.
+class AssetInfo {
+  const AssetInfo(this.path, this.width, this.height, this.color, this.blurHash);
+
+  final String path;
+  final int width;
+  final int height;
+
+  /// Dominant color, to paint while the image loads.
+  final Color color;
+
+  /// BlurHash (https://blurha.sh) of the image, for a blurred preview.
+  final String blurHash;
+
+  double get aspectRatio => width / height;
+}
+
+class AssetIndex {
+  AssetIndex._();
+
+  static const examplesEx0 = AssetInfo('assets/examples/ex_0.jpg', 800, 600, Color(0xFFADA792), 'LXCsKtRjRkj[xvayf6j[0Lt7ofay');
+  static const examplesEx1 = AssetInfo('assets/examples/ex_1.jpg', 800, 600, Color(0xFF503520), 'LQJkW2%eWT^+Di%MxuMx4VN2Rlog');
+  static const examplesEx2 = AssetInfo('assets/examples/ex_2.jpg', 800, 600, Color(0xFF534849), 'LAC~}00KD+-o^~9aM}%M=Bt9Ipt2');
+  static const examplesEx3 = AssetInfo('assets/examples/ex_3.jpg', 800, 600, Color(0xFF0A0A0A), 'L02=o,%M9YMc^7n4NFg34TR5x^.9');
+  static const examplesEx4 = AssetInfo('assets/examples/ex_4.jpg', 800, 600, Color(0xFF828385), 'LHE{b39Z9FRjI.?Ht7E0~X9Yxv%M');
+  static const examplesEx5 = AssetInfo('assets/examples/ex_5.jpg', 800, 600, Color(0xFF6E625C), 'LzG+%Ioyayof?^ofjskCS*bHfQj[');
+  static const icon = AssetInfo('assets/icon.jpg', 1024, 1024, Color(0xFF23282C), 'L97UM54nxu%MxuWBofWB00?bIURj');
+  static const styleMoodboardsBikeBoardGearHauler = AssetInfo('assets/style_moodboards/bike_board_gear_hauler.svg', 400, 400, Color(0xFFBEA487), 'LjEoD7~BoeE2OZS\$fkn\$WXWWayj?');
+  static const styleMoodboardsBohoAdventureVan = AssetInfo('assets/style_moodboards/boho_adventure_van.svg', 400, 400, Color(0xFF171C2A), 'LTB|QO~noeD+7KBnbHwJR+S3ayoK');
+  static const styleMoodboardsBrightDaylightWhite = AssetInfo('assets/style_moodboards/bright_daylight_white.svg', 400, 400, Color(0xFF1C2231), 'LIA1%]}bnPJ~]p?[oyIBnPoybGae');
+  static const styleMoodboardsBudgetDiyBuild = AssetInfo('assets/style_moodboards/budget_diy_build.svg', 400, 400, Color(0xFF131825), 'LmK1Bq0MM|?G#%%hkCRORjt6j[WB');
+  static const styleMoodboardsCoupleCozyLayout = AssetInfo('assets/style_moodboards/couple_cozy_layout.svg', 400, 400, Color(0xFF19191D), 'L*Gv0S.Aa~RO\$^--oeM}awocfQaz');
+  static const styleMoodboardsCustomAdvanced = AssetInfo('assets/style_moodboards/custom_advanced.svg', 400, 400, Color(0xFFD19A62), 'LUKJ[900Io^+:#_2ozIBRit7j[R*');
+  static const styleMoodboardsDarkMoodyCabin = AssetInfo('assets/style_moodboards/dark_moody_cabin.svg', 400, 400, Color(0xFF5B8CFC), 'Lk7pN2iyadkqk=tDj^W7axkDfRax');
+  static const styleMoodboardsDesertNomadVan = AssetInfo('assets/style_moodboards/desert_nomad_van.svg', 400, 400, Color(0xFFE3B168), 'LmJGr{},jYI[E2t8kCRjRkbHfQf6');
+  static const styleMoodboardsFamilyBunkLayout = AssetInfo('assets/style_moodboards/family_bunk_layout.svg', 400, 400, Color(0xFF1B1D25), 'LeHe5v%\$WqZ~%\$~Vs:E1W=s:j@WC');
+  static const styleMoodboardsFullBathroomMicroWetBath = AssetInfo('assets/style_moodboards/full_bathroom_micro_wet_bath.svg', 400, 400, Color(0xFFAAA397), 'LAJ%n1={IV%2xt3ZS\$+ZE3X9jtWB');
+  static const styleMoodboardsFuturisticCleanPod = AssetInfo('assets/style_moodboards/futuristic_clean_pod.svg', 400, 400, Color(0xFF141926), 'LwL4NXI=Rk%14TIqbIsmM{azj[ay');
+  static const styleMoodboardsHiddenStorageMax = AssetInfo('assets/style_moodboards/hidden_storage_max.svg', 400, 400, Color(0xFF1B1D26), 'LWC\$vk]vjDJs]v?JogImnzogfRax');
+  static const styleMoodboardsIndustrialMatteBlack = AssetInfo('assets/style_moodboards/industrial_matte_black.svg', 400, 400, Color(0xFF5D8EFE), 'Lm7L,3ogaxflj[R1awo%adawf6fk');
+  static const styleMoodboardsJapandiCamperCalm = AssetInfo('assets/style_moodboards/japandi_camper_calm.svg', 400, 400, Color(0xFF131826), 'LfAxQ6#4e-TLEGM.f9osV?WYa}jY');
+  static const styleMoodboardsLShapeLoungeLayout = AssetInfo('assets/style_moodboards/l-shape_lounge_layout.svg', 400, 400, Color(0xFF151823), 'L?IX~sozWBof~qofayj[oej[fQay');
+  static const styleMoodboardsLuxurySprinterLounge = AssetInfo('assets/style_moodboards/luxury_sprinter_lounge.svg', 400, 400, Color(0xFF578AF3), 'LcE|rm~Dn\$EM56D^ajxlRPWFa}oI');
+  static const styleMoodboardsMicroVanUltraCompact = AssetInfo('assets/style_moodboards/micro_van_ultra_compact.svg', 400, 400, Color(0xFFE9AF60), 'LyHwyC}\$n}EnXWRhaxohWEWVa|j?');
+  static const styleMoodboardsMinimalKitchenGalley = AssetInfo('assets/style_moodboards/minimal_kitchen_galley.svg', 400, 400, Color(0xFF2A2119), 'L24LRY-?WERhThx^s:Rif,j]WBay');
+  static const styleMoodboardsMountainCabinVan = AssetInfo('assets/style_moodboards/mountain_cabin_van.svg', 400, 400, Color(0xFFEEB159), 'LqKJ=M\$[WAW[}gWba\$oGadj]fRax');
+  static const styleMoodboardsOffGridSolarPro = AssetInfo('assets/style_moodboards/off-grid_solar_pro.svg', 400, 400, Color(0xFF2FA27A), 'LUA{3^B[R\$\$VJIxRoIR=RkoLjtWU');
+  static const styleMoodboardsOutdoorShowerSetup = AssetInfo('assets/style_moodboards/outdoor_shower_setup.svg', 400, 400, Color(0xFF5C8DFE), 'L{DcY1OxWYs5I?xZoLR*WBoJfQa#');
+  static const styleMoodboardsPetFriendlyVan = AssetInfo('assets/style_moodboards/pet-friendly_van.svg', 400, 400, Color(0xFF272527), 'L[IrBA~qofD*oeofj[ayWBayfQj[');
+  static const styleMoodboardsPremiumCustomCabinetry = AssetInfo('assets/style_moodboards/premium_custom_cabinetry.svg', 400, 400, Color(0xFF131825), 'LjIhc?tUWDs%uO~Bs.E2WYs:j@WC');
+  static const styleMoodboardsRetroClassicVan = AssetInfo('assets/style_moodboards/retro_classic_van.svg', 400, 400, Color(0xFFCCAB79), 'LbK15ZHqRP%hKR0fWB-oNHWXfQf5');
+  static const styleMoodboardsScandinavianVanMinimal = AssetInfo('assets/style_moodboards/scandinavian_van_minimal.svg', 400, 400, Color(0xFF8699C5), 'LjAdg4DzV?x_\$tR?a\$oGadj^fRax');
+  static const styleMoodboardsSummerVentilationBreeze = AssetInfo('assets/style_moodboards/summer_ventilation_breeze.svg', 400, 400, Color(0xFFC2A280), 'LbEo@^0}NH=xzqN0a}s,V[o2jtWV');
+  static const styleMoodboardsSurfVanCoastal = AssetInfo('assets/style_moodboards/surf_van_coastal.svg', 400, 400, Color(0xFFA49D91), 'LYLp:JrARPx^0gpKofROIpkDj[WB');
+  static const styleMoodboardsUShapeSocialLayout = AssetInfo('assets/style_moodboards/u-shape_social_layout.svg', 400, 400, Color(0xFF1A1D27), 'LhC\$sa=TjXN\$^-\$ujYS8oLj@fQay');
+  static const styleMoodboardsWarmWoodCraft = AssetInfo('assets/style_moodboards/warm_wood_craft.svg', 400, 400, Color(0xFF313633), 'LmJHKc}8jFK5Xf\$%oLNaR*j[fQay');
+  static const styleMoodboardsWinterInsulatedVan = AssetInfo('assets/style_moodboards/winter_insulated_van.svg', 400, 400, Color(0xFF2C3246), 'LcE39w~qofD*~p?bofIUofoffQay');
+  static const styleMoodboardsWorkFromVanStudio = AssetInfo('assets/style_moodboards/work-from-van_studio.svg', 400, 400, Color(0xFF2C3246), 'LgExw,\$eaeX9~Aw[ayW=oKj[fQay');
+
+  /// Every entry by path, for paths built at run time.
+  static const byPath = <String, AssetInfo>{
+    'assets/examples/ex_0.jpg': examplesEx0,
+    'assets/examples/ex_1.jpg': examplesEx1,
+    'assets/examples/ex_2.jpg': examplesEx2,
+    'assets/examples/ex_3.jpg': examplesEx3,
+    'assets/examples/ex_4.jpg': examplesEx4,
+    'assets/examples/ex_5.jpg': examplesEx5,
+    'assets/icon.jpg': icon,
+    'assets/style_moodboards/bike_board_gear_hauler.svg': styleMoodboardsBikeBoardGearHauler,
+    'assets/style_moodboards/boho_adventure_van.svg': styleMoodboardsBohoAdventureVan,
+    'assets/style_moodboards/bright_daylight_white.svg': styleMoodboardsBrightDaylightWhite,
+    'assets/style_moodboards/budget_diy_build.svg': styleMoodboardsBudgetDiyBuild,
+    'assets/style_moodboards/couple_cozy_layout.svg': styleMoodboardsCoupleCozyLayout,
+    'assets/style_moodboards/custom_advanced.svg': styleMoodboardsCustomAdvanced,
+    'assets/style_moodboards/dark_moody_cabin.svg': styleMoodboardsDarkMoodyCabin,
+    'assets/style_moodboards/desert_nomad_van.svg': styleMoodboardsDesertNomadVan,
+    'assets/style_moodboards/family_bunk_layout.svg': styleMoodboardsFamilyBunkLayout,
+    'assets/style_moodboards/full_bathroom_micro_wet_bath.svg': styleMoodboardsFullBathroomMicroWetBath,
+    'assets/style_moodboards/futuristic_clean_pod.svg': styleMoodboardsFuturisticCleanPod,
+    'assets/style_moodboards/hidden_storage_max.svg': styleMoodboardsHiddenStorageMax,
+    'assets/style_moodboards/industrial_matte_black.svg': styleMoodboardsIndustrialMatteBlack,
+    'assets/style_moodboards/japandi_camper_calm.svg': styleMoodboardsJapandiCamperCalm,
+    'assets/style_moodboards/l-shape_lounge_layout.svg': styleMoodboardsLShapeLoungeLayout,
+    'assets/style_moodboards/luxury_sprinter_lounge.svg': styleMoodboardsLuxurySprinterLounge,
+    'assets/style_moodboards/micro_van_ultra_compact.svg': styleMoodboardsMicroVanUltraCompact,
+    'assets/style_moodboards/minimal_kitchen_galley.svg': styleMoodboardsMinimalKitchenGalley,
+    'assets/style_moodboards/mountain_cabin_van.svg': styleMoodboardsMountainCabinVan,
+    'assets/style_moodboards/off-grid_solar_pro.svg': styleMoodboardsOffGridSolarPro,
+    'assets/style_moodboards/outdoor_shower_setup.svg': styleMoodboardsOutdoorShowerSetup,
+    'assets/style_moodboards/pet-friendly_van.svg': styleMoodboardsPetFriendlyVan,
+    'assets/style_moodboards/premium_custom_cabinetry.svg': styleMoodboardsPremiumCustomCabinetry,
+    'assets/style_moodboards/retro_classic_van.svg': styleMoodboardsRetroClassicVan,
+    'assets/style_moodboards/scandinavian_van_minimal.svg': styleMoodboardsScandinavianVanMinimal,
+    'assets/style_moodboards/summer_ventilation_breeze.svg': styleMoodboardsSummerVentilationBreeze,
+    'assets/style_moodboards/surf_van_coastal.svg': styleMoodboardsSurfVanCoastal,
+    'assets/style_moodboards/u-shape_social_layout.svg': styleMoodboardsUShapeSocialLayout,
+    'assets/style_moodboards/warm_wood_craft.svg': styleMoodboardsWarmWoodCraft,
+    'assets/style_moodboards/winter_insulated_van.svg': styleMoodboardsWinterInsulatedVan,
+    'assets/style_moodboards/work-from-van_studio.svg': styleMoodboardsWorkFromVanStudio,
+  };
+
+  /// Entries by path without the extension, for files that may be in either format.
+  static const byStem = <String, AssetInfo>{
+    'assets/examples/ex_0': examplesEx0,
+    'assets/examples/ex_1': examplesEx1,
+    'assets/examples/ex_2': examplesEx2,
+    'assets/examples/ex_3': examplesEx3,
+    'assets/examples/ex_4': examplesEx4,
+    'assets/examples/ex_5': examplesEx5,
+    'assets/icon': icon,
+    'assets/style_moodboards/bike_board_gear_hauler': styleMoodboardsBikeBoardGearHauler,
+    'assets/style_moodboards/boho_adventure_van': styleMoodboardsBohoAdventureVan,
+    'assets/style_moodboards/bright_daylight_white': styleMoodboardsBrightDaylightWhite,
+    'assets/style_moodboards/budget_diy_build': styleMoodboardsBudgetDiyBuild,
+    'assets/style_moodboards/couple_cozy_layout': styleMoodboardsCoupleCozyLayout,
+    'assets/style_moodboards/custom_advanced': styleMoodboardsCustomAdvanced,
+    'assets/style_moodboards/dark_moody_cabin': styleMoodboardsDarkMoodyCabin,
+    'assets/style_moodboards/desert_nomad_van': styleMoodboardsDesertNomadVan,
+    'assets/style_moodboards/family_bunk_layout': styleMoodboardsFamilyBunkLayout,
+    'assets/style_moodboards/full_bathroom_micro_wet_bath': styleMoodboardsFullBathroomMicroWetBath,
+    'assets/style_moodboards/futuristic_clean_pod': styleMoodboardsFuturisticCleanPod,
+    'assets/style_moodboards/hidden_storage_max': styleMoodboardsHiddenStorageMax,
+    'assets/style_moodboards/industrial_matte_black': styleMoodboardsIndustrialMatteBlack,
+    'assets/style_moodboards/japandi_camper_calm': styleMoodboardsJapandiCamperCalm,
+    'assets/style_moodboards/l-shape_lounge_layout': styleMoodboardsLShapeLoungeLayout,
+    'assets/style_moodboards/luxury_sprinter_lounge': styleMoodboardsLuxurySprinterLounge,
+    'assets/style_moodboards/micro_van_ultra_compact': styleMoodboardsMicroVanUltraCompact,
+    'assets/style_moodboards/minimal_kitchen_galley': styleMoodboardsMinimalKitchenGalley,
+    'assets/style_moodboards/mountain_cabin_van': styleMoodboardsMountainCabinVan,
+    'assets/style_moodboards/off-grid_solar_pro': styleMoodboardsOffGridSolarPro,
+    'assets/style_moodboards/outdoor_shower_setup': styleMoodboardsOutdoorShowerSetup,
+    'assets/style_moodboards/pet-friendly_van': styleMoodboardsPetFriendlyVan,
+    'assets/style_moodboards/premium_custom_cabinetry': styleMoodboardsPremiumCustomCabinetry,
+    'assets/style_moodboards/retro_classic_van': styleMoodboardsRetroClassicVan,
+    'assets/style_moodboards/scandinavian_van_minimal': styleMoodboardsScandinavianVanMinimal,
+    'assets/style_moodboards/summer_ventilation_breeze': styleMoodboardsSummerVentilationBreeze,
+    'assets/style_moodboards/surf_van_coastal': styleMoodboardsSurfVanCoastal,
+    'assets/style_moodboards/u-shape_social_layout': styleMoodboardsUShapeSocialLayout,
+    'assets/style_moodboards/warm_wood_craft': styleMoodboardsWarmWoodCraft,
+    'assets/style_moodboards/winter_insulated_van': styleMoodboardsWinterInsulatedVan,
+    'assets/style_moodboards/work-from-van_studio': styleMoodboardsWorkFromVanStudio,
+  };
+}
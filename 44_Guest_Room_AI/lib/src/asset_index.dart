@@ -0,0 +1,76 @@
+// GENERATED by `python -m generator build` from assets/ASSET_MANIFEST.jsonl.
+// Do not edit; change the assets or pubspec.yaml and build again.
+
+import 'dart:ui' show Color;
+
+/// Size and placeholder of a bundled image, known before it is decoded.
+class AssetInfo {
+  const AssetInfo(this.path, this.width, this.height, this.color, this.blurHash);
+
+  final String path;
+  final int width;
+  final int height;
+
+  /// Dominant color, to paint while the image loads.
+  final Color color;
+
+  /// BlurHash (https://blurha.sh) of the image, for a blurred preview.
+  final String blurHash;
+
+  double get aspectRatio => width / height;
+}
+
+class AssetIndex {
+  AssetIndex._();
+
+  static const examplesGuestExample1 = AssetInfo('assets/examples/guest_example_1.jpg', 1024, 684, Color(0xFF605A42), 'LTC6.0~p-;-;-:%MtRxuRkRkafWC');
+  static const examplesGuestExample10 = AssetInfo('assets/examples/guest_example_10.jpg', 1024, 768, Color(0xFFB9B7AE), 'LdJRN+-;xvoz_NNGRjRjM_WARjae');
+  static const examplesGuestExample11 = AssetInfo('assets/examples/guest_example_11.jpg', 683, 1024, Color(0xFF1E170C), 'T6AS}B^\$0M-4-:Iq0i4;xt9bxF\$%');
+  static const examplesGuestExample12 = AssetInfo('assets/examples/guest_example_12.jpg', 683, 1024, Color(0xFF212B28), 'TPD]bot7%1^%%0xa00%Lxa9HW=xt');
+  static const examplesGuestExample13 = AssetInfo('assets/examples/guest_example_13.jpg', 1024, 683, Color(0xFFC8CACC), 'LaNm.*_NRjoz~oRjRPt6%2WBa#ae');
+  static const examplesGuestExample14 = AssetInfo('assets/examples/guest_example_14.jpg', 1024, 683, Color(0xFFBEBAB3), 'LCKd#n~qo~4T?F4mM{-;-=bcIA-:');
+  static const examplesGuestExample2 = AssetInfo('assets/examples/guest_example_2.jpg', 1024, 684, Color(0xFF0E0F0B), 'L597kLpG4o^%9u-:xZD+03IWIVxt');
+  static const examplesGuestExample3 = AssetInfo('assets/examples/guest_example_3.jpg', 819, 1024, Color(0xFF36210D), 'TDBfnX00o}^+0Kxu?v9Fxv-;smV@');
+  static const examplesGuestExample4 = AssetInfo('assets/examples/guest_example_4.jpg', 1024, 683, Color(0xFF9C9484), 'LeK1m?RjoMxu~qRja#xujYt7WBR*');
+  static const examplesGuestExample5 = AssetInfo('assets/examples/guest_example_5.jpg', 683, 1024, Color(0xFF100E09), 'TTF\$U]00a~.79FWCWZ%LWBD%oet8');
+  static const examplesGuestExample6 = AssetInfo('assets/examples/guest_example_6.jpg', 1024, 683, Color(0xFF40342A), 'LNDbp99u0f%1xuIpslofwbR+bbo0');
+  static const examplesGuestExample8 = AssetInfo('assets/examples/guest_example_8.jpg', 1024, 683, Color(0xFF785B44), 'LGGkwP.T_3~Wxt?a-=Shs=4o9G%2');
+  static const examplesGuestExample9 = AssetInfo('assets/examples/guest_example_9.jpg', 1024, 683, Color(0xFF15282C), 'LGFFsnxa-o_3_M9FRix[-T-:ozxZ');
+  static const icon = AssetInfo('assets/icon.jpg', 1024, 684, Color(0xFF605A42), 'LTC6.0~p-;-;-:%MtRxuRkRkafWC');
+
+  /// Every entry by path, for paths built at run time.
+  static const byPath = <String, AssetInfo>{
+    'assets/examples/guest_example_1.jpg': examplesGuestExample1,
+    'assets/examples/guest_example_10.jpg': examplesGuestExample10,
+    'assets/examples/guest_example_11.jpg': examplesGuestExample11,
+    'assets/examples/guest_example_12.jpg': examplesGuestExample12,
+    'assets/examples/guest_example_13.jpg': examplesGuestExample13,
+    'assets/examples/guest_example_14.jpg': examplesGuestExample14,
+    'assets/examples/guest_example_2.jpg': examplesGuestExample2,
+    'assets/examples/guest_example_3.jpg': examplesGuestExample3,
+    'assets/examples/guest_example_4.jpg': examplesGuestExample4,
+    'assets/examples/guest_example_5.jpg': examplesGuestExample5,
+    'assets/examples/guest_example_6.jpg': examplesGuestExample6,
+    'assets/examples/guest_example_8.jpg': examplesGuestExample8,
+    'assets/examples/guest_example_9.jpg': examplesGuestExample9,
+    'assets/icon.jpg': icon,
+  };
+
+  /// Entries by path without the extension, for files that may be in either format.
+  static const byStem = <String, AssetInfo>{
+    'assets/examples/guest_example_1': examplesGuestExample1,
+    'assets/examples/guest_example_10': examplesGuestExample10,
+    'assets/examples/guest_example_11': examplesGuestExample11,
+    'assets/examples/guest_example_12': examplesGuestExample12,
+    'assets/examples/guest_example_13': examplesGuestExample13,
+    'assets/examples/guest_example_14': examplesGuestExample14,
+    'assets/examples/guest_example_2': examplesGuestExample2,
+    'assets/examples/guest_example_3': examplesGuestExample3,
+    'assets/examples/guest_example_4': examplesGuestExample4,
+    'assets/examples/guest_example_5': examplesGuestExample5,
+    'assets/examples/guest_example_6': examplesGuestExample6,
+    'assets/examples/guest_example_8': examplesGuestExample8,
+    'assets/examples/guest_example_9': examplesGuestExample9,
+    'assets/icon': icon,
+  };
+}
@@ -1,4 +1,5 @@
 import '../model/meeting_style.dart';
+import '../src/asset_index.dart';
 
 class MeetingStyleRepository {
   static const _baseAssetPath = 'assets/style_sources';
@@ -8,19 +9,14 @@ class MeetingStyleRepository {
     // We have ~30 images. We need 4 per style.
     // We cycle through them using modulo.
     final start = (index * 2) % 30; // Shift by 2 each time
-    return [
-      '$_baseAssetPath/source_${(start % 30) + 1}.jpg', // +1 because files are 1-based? No, I formatted 001.
-      '$_baseAssetPath/source_${((start + 1) % 30) + 1}.jpg',
-      '$_baseAssetPath/source_${((start + 2) % 30) + 1}.jpg',
-      '$_baseAssetPath/source_${((start + 3) % 30) + 1}.jpg',
-    ].map((s) {
-       // Fix 0 padding if I used %03d in python
-       // Python: f"source_{i+1:03d}.jpg" -> source_001.jpg
-       // Here: I need to pad manually or use a helper.
-       // Simpler: Just rely on string interpolation logic below.
-       final id = int.parse(s.split('_').last.split('.').first);
-       return '$_baseAssetPath/source_${id.toString().padLeft(3, '0')}.jpg';
-    }).toList();
+    return [for (var i = 0; i < 4; i++) _source((start + i) % 30 + 1)];
+  }
+
+  // Sources are downloaded JPEGs, or PNGs generated where a download
+  // failed; the asset index knows which one is bundled.
+  static String _source(int id) {
+    final stem = '$_baseAssetPath/source_${id.toString().padLeft(3, '0')}';
+    return AssetIndex.byStem[stem]?.path ?? '$stem.png';
   }
 
   static final List<StyleControl> _commonControls = [
@@ -0,0 +1,127 @@
+// GENERATED by `python -m generator build` from assets/ASSET_MANIFEST.jsonl.
+// Do not edit; change the assets or pubspec.yaml and build again.
+
+import 'dart:ui' show Color;
+
+/// Size and placeholder of a bundled image, known before it is decoded.
+class AssetInfo {
+  const AssetInfo(this.path, this.width, this.height, this.color, this.blurHash);
+
+  final String path;
+  final int width;
+  final int height;
+
+  /// Dominant color, to paint while the image loads.
+  final Color color;
+
+  /// BlurHash (https://blurha.sh) of the image, for a blurred preview.
+  final String blurHash;
+
+  double get aspectRatio => width / height;
+}
+
+class AssetIndex {
+  AssetIndex._();
+
+  static const icon = AssetInfo('assets/icon.jpg', 1024, 1024, Color(0xFF23282C), 'L97UM54nxu%MxuWBofWB00?bIURj');
+  static const styleSourcesSource001 = AssetInfo('assets/style_sources/source_001.png', 400, 400, Color(0xFF0B0D11), 'LiH.WvIpWVxt_4%NofRjozofj[ay');
+  static const styleSourcesSource002 = AssetInfo('assets/style_sources/source_002.png', 400, 400, Color(0xFF0A0C10), 'LcE2O30hR+-m9v%0oLRlWCoLj@az');
+  static const styleSourcesSource003 = AssetInfo('assets/style_sources/source_003.png', 400, 400, Color(0xFF0A0D11), 'Lr4}%3XtbXjMU[eIf8fzadf8fRfi');
+  static const styleSourcesSource004 = AssetInfo('assets/style_sources/source_004.png', 400, 400, Color(0xFF2FC8A6), 'LlJm2Q4.R%%g34tkj[R*Sej[fQay');
+  static const styleSourcesSource005 = AssetInfo('assets/style_sources/source_005.png', 400, 400, Color(0xFF0A0C10), 'LYBND}_4t7M_8^D\$WBt8WAWBayj[');
+  static const styleSourcesSource006 = AssetInfo('assets/style_sources/source_006.png', 400, 400, Color(0xFF0A0C10), 'LlFiV_~qt7M_ngROaxoff6axfPj[');
+  static const styleSourcesSource007 = AssetInfo('assets/style_sources/source_007.png', 400, 400, Color(0xFF151B28), 'LNBf|d01Rj-:9Z%LoLRjWBoej[ay');
+  static const styleSourcesSource008 = AssetInfo('assets/style_sources/source_008.png', 400, 400, Color(0xFFD0A85C), 'LzIW_N~9s.IqxZWCazj[j@azfQfQ');
+  static const styleSourcesSource009 = AssetInfo('assets/style_sources/source_009.png', 400, 400, Color(0xFF0A0D11), 'Lz4}%3pykDa0nGi+f8f#f9f8fQfj');
+  static const styleSourcesSource010 = AssetInfo('assets/style_sources/source_010.png', 400, 400, Color(0xFF2EC8A6), 'LcE}#X3qS#,oGY#mn%S#W;n%fQa|');
+  static const styleSourcesSource011 = AssetInfo('assets/style_sources/source_011.png', 400, 400, Color(0xFF151B28), 'L*4~5tpfkDaIcNbnfhjdf#fhfPfR');
+  static const styleSourcesSource012 = AssetInfo('assets/style_sources/source_012.png', 400, 400, Color(0xFF151B28), 'L]DAWg%jogV?-ixTj?WYocj?fQfR');
+  static const styleSourcesSource013 = AssetInfo('assets/style_sources/source_013.png', 400, 400, Color(0xFF0A0C10), 'LlEWW]?@oyR7[o#8n%S#sAn%jtbH');
+  static const styleSourcesSource014 = AssetInfo('assets/style_sources/source_014.png', 400, 400, Color(0xFF0B0D11), 'LlFiV_~qt7M_ngROaxogf6axfQj[');
+  static const styleSourcesSource015 = AssetInfo('assets/style_sources/source_015.png', 400, 400, Color(0xFF151C29), 'L,5l6[dze;kpoTkrfladjwflfRf6');
+  static const styleSourcesSource016 = AssetInfo('assets/style_sources/source_016.png', 400, 400, Color(0xFF2FC8A6), 'LhHftg{Nr@O==Ct2j?agn\$j?fQf7');
+  static const styleSourcesSource017 = AssetInfo('assets/style_sources/source_017.png', 400, 400, Color(0xFFF4F2ED), 'LvQlq1jEayxuMHRiayj[WAayfQfQ');
+  static const styleSourcesSource018 = AssetInfo('assets/style_sources/source_018.png', 400, 400, Color(0xFF4A7FEF), 'LeBY]u-[oaR@G%KQW;n#X4bIfRjs');
+  static const styleSourcesSource019 = AssetInfo('assets/style_sources/source_019.png', 400, 400, Color(0xFF0A0D11), 'Lr4}%3XtbXjMU[eIf8fzadf8fRfi');
+  static const styleSourcesSource020 = AssetInfo('assets/style_sources/source_020.png', 400, 400, Color(0xFFD0A85C), 'LfN0O_p0bIxVT#XUbHjYbcbIfQfP');
+  static const styleSourcesSource021 = AssetInfo('assets/style_sources/source_021.png', 400, 400, Color(0xFF151B28), 'L#B}3C-eoIR;DzM~a#obWAazfQj?');
+  static const styleSourcesSource022 = AssetInfo('assets/style_sources/source_022.png', 400, 400, Color(0xFF151B28), 'LcELZm0iR+-m9w%0oLRlWCoLjtaz');
+  static const styleSourcesSource023 = AssetInfo('assets/style_sources/source_023.png', 400, 400, Color(0xFF2FC8A6), 'L-K.w*}EsUOq.9o~fke.offlfQf6');
+  static const styleSourcesSource024 = AssetInfo('assets/style_sources/source_024.png', 400, 400, Color(0xFF0B0D11), 'LkJ@zQ5aWE\$|?w-pofRkogofj@ay');
+  static const styleSourcesSource025 = AssetInfo('assets/style_sources/source_025.png', 400, 400, Color(0xFF151C29), 'L-G]{i?]oyRP^l\$+oLS2s:oLjta|');
+  static const styleSourcesSource026 = AssetInfo('assets/style_sources/source_026.png', 400, 400, Color(0xFF0B0D10), 'LjD1TD_Kt6M|CQFyW;s9X8W;a|js');
+  static const styleSourcesSource027 = AssetInfo('assets/style_sources/source_027.png', 400, 400, Color(0xFF161C28), 'LhGuEtwGjYkX0NI[a#oIR*a#fQjs');
+  static const styleSourcesSource028 = AssetInfo('assets/style_sources/source_028.png', 400, 400, Color(0xFF161B28), 'LtGu,l00Rj-;9G%MofRjWBofj[ay');
+  static const styleSourcesSource029 = AssetInfo('assets/style_sources/source_029.png', 400, 400, Color(0xFF151B28), 'L*4pU=kaflawp3kGflf4j^flfRfP');
+  static const styleSourcesSource030 = AssetInfo('assets/style_sources/source_030.png', 400, 400, Color(0xFF2FC8A6), 'LbHftgGIW=\$x3.f~j?WXSzfjjta}');
+
+  /// Every entry by path, for paths built at run time.
+  static const byPath = <String, AssetInfo>{
+    'assets/icon.jpg': icon,
+    'assets/style_sources/source_001.png': styleSourcesSource001,
+    'assets/style_sources/source_002.png': styleSourcesSource002,
+    'assets/style_sources/source_003.png': styleSourcesSource003,
+    'assets/style_sources/source_004.png': styleSourcesSource004,
+    'assets/style_sources/source_005.png': styleSourcesSource005,
+    'assets/style_sources/source_006.png': styleSourcesSource006,
+    'assets/style_sources/source_007.png': styleSourcesSource007,
+    'assets/style_sources/source_008.png': styleSourcesSource008,
+    'assets/style_sources/source_009.png': styleSourcesSource009,
+    'assets/style_sources/source_010.png': styleSourcesSource010,
+    'assets/style_sources/source_011.png': styleSourcesSource011,
+    'assets/style_sources/source_012.png': styleSourcesSource012,
+    'assets/style_sources/source_013.png': styleSourcesSource013,
+    'assets/style_sources/source_014.png': styleSourcesSource014,
+    'assets/style_sources/source_015.png': styleSourcesSource015,
+    'assets/style_sources/source_016.png': styleSourcesSource016,
+    'assets/style_sources/source_017.png': styleSourcesSource017,
+    'assets/style_sources/source_018.png': styleSourcesSource018,
+    'assets/style_sources/source_019.png': styleSourcesSource019,
+    'assets/style_sources/source_020.png': styleSourcesSource020,
+    'assets/style_sources/source_021.png': styleSourcesSource021,
+    'assets/style_sources/source_022.png': styleSourcesSource022,
+    'assets/style_sources/source_023.png': styleSourcesSource023,
+    'assets/style_sources/source_024.png': styleSourcesSource024,
+    'assets/style_sources/source_025.png': styleSourcesSource025,
+    'assets/style_sources/source_026.png': styleSourcesSource026,
+    'assets/style_sources/source_027.png': styleSourcesSource027,
+    'assets/style_sources/source_028.png': styleSourcesSource028,
+    'assets/style_sources/source_029.png': styleSourcesSource029,
+    'assets/style_sources/source_030.png': styleSourcesSource030,
+  };
+
+  /// Entries by path without the extension, for files that may be in either format.
+  static const byStem = <String, AssetInfo>{
+    'assets/icon': icon,
+    'assets/style_sources/source_001': styleSourcesSource001,
+    'assets/style_sources/source_002': styleSourcesSource002,
+    'assets/style_sources/source_003': styleSourcesSource003,
+    'assets/style_sources/source_004': styleSourcesSource004,
+    'assets/style_sources/source_005': styleSourcesSource005,
+    'assets/style_sources/source_006': styleSourcesSource006,
+    'assets/style_sources/source_007': styleSourcesSource007,
+    'assets/style_sources/source_008': styleSourcesSource008,
+    'assets/style_sources/source_009': styleSourcesSource009,
+    'assets/style_sources/source_010': styleSourcesSource010,
+    'assets/style_sources/source_011': styleSourcesSource011,
+    'assets/style_sources/source_012': styleSourcesSource012,
+    'assets/style_sources/source_013': styleSourcesSource013,
+    'assets/style_sources/source_014': styleSourcesSource014,
+    'assets/style_sources/source_015': styleSourcesSource015,
+    'assets/style_sources/source_016': styleSourcesSource016,
+    'assets/style_sources/source_017': styleSourcesSource017,
+    'assets/style_sources/source_018': styleSourcesSource018,
+    'assets/style_sources/source_019': styleSourcesSource019,
+    'assets/style_sources/source_020': styleSourcesSource020,
+    'assets/style_sources/source_021': styleSourcesSource021,
+    'assets/style_sources/source_022': styleSourcesSource022,
+    'assets/style_sources/source_023': styleSourcesSource023,
+    'assets/style_sources/source_024': styleSourcesSource024,
+    'assets/style_sources/source_025': styleSourcesSource025,
+    'assets/style_sources/source_026': styleSourcesSource026,
+    'assets/style_sources/source_027': styleSourcesSource027,
+    'assets/style_sources/source_028': styleSourcesSource028,
+    'assets/style_sources/source_029': styleSourcesSource029,
+    'assets/style_sources/source_030': styleSourcesSource030,
+  };
+}
@@ -1,9 +1,16 @@
+import argparse
 import os
-import urllib.request
-import ssl
+import sys
 
-# Bypass SSL verification for legacy environments
-ssl._create_default_https_context = ssl._create_unverified_context
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from generator import dartindex, manifest
+from generator.cache import default_cache
+from generator.fetch import Downloader, report
+from generator.journal import JobJournal
+from generator.png import write_png
+from generator.seed import asset_rng
+from generate_bmp import render_source
 
 IDs = [
     "GWe0dlVD9e0", "RNsKphkdBTk", "_-KLkj7on_c", "zjoQRRdff5k",
@@ -23,32 +30,56 @@ IDs = [
 BASE_URL = "https://images.unsplash.com/photo-{}?w=600&q=80"
 
 TARGET_DIR = "45_Meeting_Room_AI/assets/style_sources"
+JOURNAL_FILE = "45_Meeting_Room_AI/.fetch_journal.json"
 MANIFEST_FILE = "45_Meeting_Room_AI/assets/ASSET_SOURCES.md"
 
 if not os.path.exists(TARGET_DIR):
     os.makedirs(TARGET_DIR)
 
+parser = argparse.ArgumentParser(description="Download Unsplash style sources.")
+parser.add_argument("--refresh", action="store_true", help="re-check finished downloads with conditional requests")
+args = parser.parse_args()
+
 manifest_content = "| Filename | Source | License |\n| --- | --- | --- |\n"
 
 print(f"Downloading {len(IDs)} images...")
 
-opener = urllib.request.build_opener()
-opener.addheaders = [('User-Agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')]
-urllib.request.install_opener(opener)
+def discard(path):
+    # A source is either the downloaded JPEG or the generated PNG; the app
+    # finds whichever one is there through AssetIndex.byStem.
+    if os.path.exists(path):
+        os.remove(path)
 
+def procedural_fallback(url, dest):
+    # Dead IDs get the same generated placeholder generate_bmp.py makes
+    stem = os.path.splitext(os.path.basename(dest))[0]
+    raster, colors = render_source(asset_rng("45_Meeting_Room_AI", f"style_sources/{stem}"), 400, 400)
+    path = os.path.join(TARGET_DIR, stem + ".png")
+    write_png(path, raster, palette=colors)
+    discard(dest)
+    return path
+
+jobs = []
 for i, img_id in enumerate(IDs):
-    url = BASE_URL.format(img_id)
     filename = f"source_{i+1:03d}.jpg"
-    filepath = os.path.join(TARGET_DIR, filename)
+    jobs.append((BASE_URL.format(img_id), os.path.join(TARGET_DIR, filename)))
+
+# SSL verification stays off for legacy environments
+downloader = Downloader(verify=False, cache=default_cache(), journal=JobJournal(JOURNAL_FILE),
+                        revalidate=args.refresh, headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'})
+with downloader:
+    results = downloader.download_all(jobs, on_done=report, fallback=procedural_fallback)
 
-    try:
-        print(f"Downloading {img_id} to {filename}...")
-        urllib.request.urlretrieve(url, filepath)
-        manifest_content += f"| {filename} | https://unsplash.com/photos/{img_id} | Unsplash License |\n"
-    except Exception as e:
-        print(f"Failed to download {img_id}: {e}")
+for img_id, result in zip(IDs, results):
+    if result.fallback:
+        manifest_content += f"| {os.path.basename(result.dest)} | Generated In-Project | MIT |\n"
+    elif result.ok:
+        discard(os.path.splitext(result.dest)[0] + ".png")
+        manifest_content += f"| {os.path.basename(result.dest)} | https://unsplash.com/photos/{img_id} | Unsplash License |\n"
 
 with open(MANIFEST_FILE, "w") as f:
     f.write("# Asset Sources\n\n" + manifest_content)
+manifest.update("45_Meeting_Room_AI")
+dartindex.write_index("45_Meeting_Room_AI")
 
 print("Download complete.")
@@ -1,7 +1,14 @@
 import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from generator.index import SymbolIndex, print_preview
+from generator.rewrite import Rewriter, rewrite_tree
 
 project_dir = '45_Meeting_Room_AI/lib'
 
+# Applied in one pass, longest key first: 'ShoeAIText' wins over 'ShoeAI'.
 replacements = {
     'Shoe Room AI': 'Meeting Room AI',
     'ShoeRoomAI': 'MeetingRoomAI',
@@ -23,18 +30,14 @@ replacements = {
     'package:shoe_room_ai': 'package:meeting_room_ai',
 }
 
-for root, dirs, files in os.walk(project_dir):
-    for file in files:
-        if file.endswith('.dart'):
-            filepath = os.path.join(root, file)
-            with open(filepath, 'r') as f:
-                content = f.read()
-
-            new_content = content
-            for old, new in replacements.items():
-                new_content = new_content.replace(old, new)
+def main():
+    rewriter = Rewriter(replacements)
+    # Only the files that contain an old name are opened.
+    index = SymbolIndex(project_dir, suffixes=('.dart',)).refresh()
+    print_preview(index.preview(rewriter), replacements)
+    report = rewrite_tree(project_dir, rewriter, '.dart', index=index,
+                          on_change=lambda path, count: print(f"Updating {path}"))
+    print(report.summary())
 
-            if new_content != content:
-                print(f"Updating {filepath}")
-                with open(filepath, 'w') as f:
-                    f.write(new_content)
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+// GENERATED by `python -m generator build` from assets/ASSET_MANIFEST.jsonl.
+// Do not edit; change the assets or pubspec.yaml and build again.
+
+import 'dart:ui' show Color;
+
+/// Size and placeholder of a bundled image, known before it is decoded.
+class AssetInfo {
+  const AssetInfo(this.path, this.width, this.height, this.color, this.blurHash);
+
+  final String path;
+  final int width;
+  final int height;
+
+  /// Dominant color, to paint while the image loads.
+  final Color color;
+
+  /// BlurHash (https://blurha.sh) of the image, for a blurred preview.
+  final String blurHash;
+
+  double get aspectRatio => width / height;
+}
+
+class AssetIndex {
+  AssetIndex._();
+
+  static const examplesEx01 = AssetInfo('assets/examples/ex_01.jpg', 800, 533, Color(0xFFCABCB2), 'LiN,oIRit7xa~qxut8V@jst7RjV@');
+  static const examplesEx02 = AssetInfo('assets/examples/ex_02.jpg', 800, 533, Color(0xFFCABCB2), 'LiN,oIRit7xa~qxut8V@jst7RjV@');
+  static const examplesEx03 = AssetInfo('assets/examples/ex_03.jpg', 800, 533, Color(0xFFDCD4D0), 'LZNASIe-i^M_~qRkbct7t7t7ozRj');
+  static const examplesEx04 = AssetInfo('assets/examples/ex_04.jpg', 800, 533, Color(0xFFC1BFBC), 'LJMaO,_4tR-;_2tRxuWB.8xujZMx');
+  static const icon = AssetInfo('assets/icon.jpg', 1024, 1024, Color(0xFF23282C), 'L97UM54nxu%MxuWBofWB00?bIURj');
+  static const onboardingGuideBad = AssetInfo('assets/onboarding/guide_bad.jpg', 768, 1024, Color(0xFF959693), 'TRJ[L?WA00\$fRjNb%M%MIU-;afV@');
+  static const styleTilesTileBasket = AssetInfo('assets/style_tiles/tile_basket.jpg', 600, 800, Color(0xFFBDB8B5), 'TGK^]L_N?w-;V@RjIoV@s:-;j[V@');
+  static const styleTilesTileMetal = AssetInfo('assets/style_tiles/tile_metal.jpg', 800, 450, Color(0xFF929292), 'LFHC1R%MM{M{~qt7ofayM{fQRjof');
+  static const styleTilesTileShelf = AssetInfo('assets/style_tiles/tile_shelf.jpg', 800, 533, Color(0xFFC1BFBC), 'LJMaO,_4tR-;_2tRxuWB.8xujZMx');
+  static const styleTilesTileWhite = AssetInfo('assets/style_tiles/tile_white.jpg', 800, 533, Color(0xFFDCD4D0), 'LZNASIe-i^M_~qRkbct7t7t7ozRj');
+  static const styleTilesTileWood = AssetInfo('assets/style_tiles/tile_wood.jpg', 600, 800, Color(0xFFBDB8B5), 'TGK^]L_N?w-;V@RjIoV@s:-;j[V@');
+
+  /// Every entry by path, for paths built at run time.
+  static const byPath = <String, AssetInfo>{
+    'assets/examples/ex_01.jpg': examplesEx01,
+    'assets/examples/ex_02.jpg': examplesEx02,
+    'assets/examples/ex_03.jpg': examplesEx03,
+    'assets/examples/ex_04.jpg': examplesEx04,
+    'assets/icon.jpg': icon,
+    'assets/onboarding/guide_bad.jpg': onboardingGuideBad,
+    'assets/style_tiles/tile_basket.jpg': styleTilesTileBasket,
+    'assets/style_tiles/tile_metal.jpg': styleTilesTileMetal,
+    'assets/style_tiles/tile_shelf.jpg': styleTilesTileShelf,
+    'assets/style_tiles/tile_white.jpg': styleTilesTileWhite,
+    'assets/style_tiles/tile_wood.jpg': styleTilesTileWood,
+  };
+
+  /// Entries by path without the extension, for files that may be in either format.
+  static const byStem = <String, AssetInfo>{
+    'assets/examples/ex_01': examplesEx01,
+    'assets/examples/ex_02': examplesEx02,
+    'assets/examples/ex_03': examplesEx03,
+    'assets/examples/ex_04': examplesEx04,
+    'assets/icon': icon,
+    'assets/onboarding/guide_bad': onboardingGuideBad,
+    'assets/style_tiles/tile_basket': styleTilesTileBasket,
+    'assets/style_tiles/tile_metal': styleTilesTileMetal,
+    'assets/style_tiles/tile_shelf': styleTilesTileShelf,
+    'assets/style_tiles/tile_white': styleTilesTileWhite,
+    'assets/style_tiles/tile_wood': styleTilesTileWood,
+  };
+}
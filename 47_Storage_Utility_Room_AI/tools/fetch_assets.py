@@ -1,11 +1,21 @@
+import argparse
 import os
-import urllib.request
+import sys
 import datetime
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from generator import manifest
+from generator.builddb import write_if_changed
+from generator.cache import default_cache
+from generator.fetch import Downloader
+from generator.journal import JobJournal
+
 # Configuration
 BASE_DIR = "47_Storage_Utility_Room_AI"
 ASSETS_DIR = os.path.join(BASE_DIR, "assets")
 MANIFEST_FILE = os.path.join(ASSETS_DIR, "ASSET_SOURCES.md")
+JOURNAL_FILE = os.path.join(BASE_DIR, ".fetch_journal.json")
 
 # Unsplash Source IDs (High quality utility/storage/interior)
 # We map target filenames to Unsplash LONG IDs
@@ -52,19 +62,17 @@ MOODBOARD_PLACEHOLDERS = [
     "style_moodboards/style_05.jpg",
 ]
 
-def download_file(url, filepath):
-    try:
-        print(f"Downloading {url} to {filepath}...")
-        req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-        with urllib.request.urlopen(req) as response:
-            with open(filepath, 'wb') as out_file:
-                out_file.write(response.read())
-        return True
-    except Exception as e:
-        print(f"Error downloading {url}: {e}")
-        return False
+def report(result):
+    if result.ok:
+        print(f"Downloaded {result.url} to {result.dest}")
+    else:
+        print(f"Error downloading {result.url}: {result.error}")
 
 def main():
+    parser = argparse.ArgumentParser(description="Fetch Storage Utility Room assets.")
+    parser.add_argument("--refresh", action="store_true", help="re-check finished downloads with conditional requests")
+    args = parser.parse_args()
+
     manifest_lines = [
         "# Asset Sources and Licenses",
         "",
@@ -74,16 +82,19 @@ def main():
         "|---|---|---|---|"
     ]
 
+    jobs = []
     for rel_path, unsplash_id in IMAGE_MAP.items():
         # Using the direct photo-ID url structure
         url = f"https://images.unsplash.com/photo-{unsplash_id}?auto=format&fit=crop&w=800&q=80"
-        filepath = os.path.join(ASSETS_DIR, rel_path)
+        jobs.append((url, os.path.join(ASSETS_DIR, rel_path)))
 
-        # Ensure dir exists
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    with Downloader(headers={'User-Agent': 'Mozilla/5.0'}, cache=default_cache(),
+                    journal=JobJournal(JOURNAL_FILE), revalidate=args.refresh) as downloader:
+        results = downloader.download_all(jobs, on_done=report)
 
-        if download_file(url, filepath):
-            date_str = datetime.date.today().isoformat()
+    date_str = datetime.date.today().isoformat()
+    for (rel_path, unsplash_id), result in zip(IMAGE_MAP.items(), results):
+        if result.ok:
             manifest_lines.append(f"| `{rel_path}` | `https://unsplash.com/photos/{unsplash_id}` | {date_str} | Unsplash License (Free) |")
 
     # Handle moodboard placeholders (copying existing)
@@ -91,16 +102,16 @@ def main():
         src = os.path.join(ASSETS_DIR, "examples/ex_01.jpg")
         for mb in MOODBOARD_PLACEHOLDERS:
              dst = os.path.join(ASSETS_DIR, mb)
-             # Copy file
+             # Copy file; replaced, not overwritten, in case dedup --link
+             # made it a hardlink of the example
              with open(src, 'rb') as fsrc:
-                 content = fsrc.read()
-                 with open(dst, 'wb') as fdst:
-                     fdst.write(content)
+                 write_if_changed(dst, fsrc.read())
              manifest_lines.append(f"| `{mb}` | Derived from `examples/ex_01.jpg` | - | - |")
 
     # Write manifest
     with open(MANIFEST_FILE, "w") as f:
         f.write("\n".join(manifest_lines))
+    manifest.update(BASE_DIR)
 
     print("Asset acquisition complete.")
 
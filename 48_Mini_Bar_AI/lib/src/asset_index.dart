@@ -0,0 +1,136 @@
+// GENERATED by `python -m generator build` from assets/ASSET_MANIFEST.jsonl.
+// Do not edit; change the assets or pubspec.yaml and build again.
+
+import 'dart:ui' show Color;
+
+/// Size and placeholder of a bundled image, known before it is decoded.
+class AssetInfo {
+  const AssetInfo(this.path, this.width, this.height, this.color, this.blurHash);
+
+  final String path;
+  final int width;
+  final int height;
+
+  /// Dominant color, to paint while the image loads.
+  final Color color;
+
+  /// BlurHash (https://blurha.sh) of the image, for a blurred preview.
+  final String blurHash;
+
+  double get aspectRatio => width / height;
+}
+
+class AssetIndex {
+  AssetIndex._();
+
+  static const examplesExample1 = AssetInfo('assets/examples/example_1.svg', 400, 400, Color(0xFF141620), 'L=MhlbvzV@bb~BIoWBs:W:R*a}oL');
+  static const examplesExample2 = AssetInfo('assets/examples/example_2.svg', 400, 400, Color(0xFF101624), 'L-Dn6WIuRjod.TMxWBozjrWAjsj]');
+  static const examplesExample3 = AssetInfo('assets/examples/example_3.svg', 400, 400, Color(0xFFCAE6CB), 'LtEq1%IURjs;?]IURjt7f6V[juof');
+  static const examplesExample4 = AssetInfo('assets/examples/example_4.svg', 400, 400, Color(0xFF131521), 'L,KIxkR6RjkC}]IoR*s:WVR*bGoL');
+  static const onboardingOnboard1 = AssetInfo('assets/onboarding/onboard_1.svg', 400, 400, Color(0xFF151620), 'L=MOX9vgV@bb~CIoWBs:WpR*bHoL');
+  static const styleMoodboardsStyle1 = AssetInfo('assets/style_moodboards/style_1.svg', 400, 400, Color(0xFF3D2070), 'LGAk*1G0OFsl{-EyShsqobX5j@n+');
+  static const styleMoodboardsStyle10 = AssetInfo('assets/style_moodboards/style_10.svg', 400, 400, Color(0xFFE2C1E8), 'LuHA}IIYRjoe~EIUR%s;fhR%a{oM');
+  static const styleMoodboardsStyle11 = AssetInfo('assets/style_moodboards/style_11.svg', 400, 400, Color(0xFF141621), 'L=MOaGvgV@bb~CIoWBs:W;R*bHoL');
+  static const styleMoodboardsStyle12 = AssetInfo('assets/style_moodboards/style_12.svg', 400, 400, Color(0xFF181920), 'L?Ox:H;1nOW=~nIVWBt6S4NHazoe');
+  static const styleMoodboardsStyle13 = AssetInfo('assets/style_moodboards/style_13.svg', 400, 400, Color(0xFF10141E), 'LB9jy9IAM{t7~qD%Rjt7ofWCazj[');
+  static const styleMoodboardsStyle14 = AssetInfo('assets/style_moodboards/style_14.svg', 400, 400, Color(0xFF111823), 'LyC[aoInRjof.mMxV@ozjsV@f6kC');
+  static const styleMoodboardsStyle15 = AssetInfo('assets/style_moodboards/style_15.svg', 400, 400, Color(0xFF171923), 'L=OBW6+bi_X8~UIVWBs:W;R*azoL');
+  static const styleMoodboardsStyle16 = AssetInfo('assets/style_moodboards/style_16.svg', 400, 400, Color(0xFF3D206F), 'LGAk*1F%NysS|4EyX8sqobX4ayja');
+  static const styleMoodboardsStyle17 = AssetInfo('assets/style_moodboards/style_17.svg', 400, 400, Color(0xFF101720), 'LyHdckAHNdsn}-EOR-s.fkR-jaoJ');
+  static const styleMoodboardsStyle18 = AssetInfo('assets/style_moodboards/style_18.svg', 400, 400, Color(0xFF111620), 'LlFPd5D%RPt7_NIARjt7j[RjfPof');
+  static const styleMoodboardsStyle19 = AssetInfo('assets/style_moodboards/style_19.svg', 400, 400, Color(0xFFD8CECA), 'LkGR*hIARjoz~WE1Rjt7j@R*fkof');
+  static const styleMoodboardsStyle2 = AssetInfo('assets/style_moodboards/style_2.svg', 400, 400, Color(0xFF101721), 'LyHdckAHNdsn}-EOR-s.fkR-jaoJ');
+  static const styleMoodboardsStyle20 = AssetInfo('assets/style_moodboards/style_20.svg', 400, 400, Color(0xFF111720), 'LwGcbyInRjof_LIURkt7juV[f7oe');
+  static const styleMoodboardsStyle21 = AssetInfo('assets/style_moodboards/style_21.svg', 400, 400, Color(0xFF151720), 'L=MhlbvzV@bb~BIoWBs:WpR*a}oL');
+  static const styleMoodboardsStyle22 = AssetInfo('assets/style_moodboards/style_22.svg', 400, 400, Color(0xFFBEDFFA), 'L-Dn6WIuRjod.TMxWBozjrWAf6j]');
+  static const styleMoodboardsStyle23 = AssetInfo('assets/style_moodboards/style_23.svg', 400, 400, Color(0xFF111821), 'LsEziVIURjs;?[IUV[t7juV[f7oe');
+  static const styleMoodboardsStyle24 = AssetInfo('assets/style_moodboards/style_24.svg', 400, 400, Color(0xFF161723), 'L*KSMLR6RjkC}]IoWBs:bHR*ayof');
+  static const styleMoodboardsStyle25 = AssetInfo('assets/style_moodboards/style_25.svg', 400, 400, Color(0xFFE1C1E7), 'LuHKe,IYRjoe~EIUR*s;j?R%a{oM');
+  static const styleMoodboardsStyle26 = AssetInfo('assets/style_moodboards/style_26.svg', 400, 400, Color(0xFF141621), 'L=MOX9vgV@bb~CIoWBs:W:R*bHoL');
+  static const styleMoodboardsStyle27 = AssetInfo('assets/style_moodboards/style_27.svg', 400, 400, Color(0xFF181920), 'L?Ox:G;1nOSh~nIVWBt6S3NHayoe');
+  static const styleMoodboardsStyle28 = AssetInfo('assets/style_moodboards/style_28.svg', 400, 400, Color(0xFF11151F), 'LB9tJwIAM{t7~qD%WBt7t7WBayoL');
+  static const styleMoodboardsStyle29 = AssetInfo('assets/style_moodboards/style_29.svg', 400, 400, Color(0xFF101722), 'LzC*^1InRjof.mMxV@ozjZV@f6kC');
+  static const styleMoodboardsStyle3 = AssetInfo('assets/style_moodboards/style_3.svg', 400, 400, Color(0xFF101520), 'LlFPd5D%RPt7_NIARjt7jsRjjtof');
+  static const styleMoodboardsStyle4 = AssetInfo('assets/style_moodboards/style_4.svg', 400, 400, Color(0xFF13151E), 'LkGR*hIANGt7~WE1Rjt7j@R*a|of');
+  static const styleMoodboardsStyle5 = AssetInfo('assets/style_moodboards/style_5.svg', 400, 400, Color(0xFF111820), 'LxGS_BInRjof_LIURkt6jaV[f7oe');
+  static const styleMoodboardsStyle6 = AssetInfo('assets/style_moodboards/style_6.svg', 400, 400, Color(0xFF161822), 'L=Mr74vzV@bb~BIoWBs:W;R*azoL');
+  static const styleMoodboardsStyle7 = AssetInfo('assets/style_moodboards/style_7.svg', 400, 400, Color(0xFFBEDFFA), 'L-Dn3PIbRjod.TMxWBozjrWAf6j]');
+  static const styleMoodboardsStyle8 = AssetInfo('assets/style_moodboards/style_8.svg', 400, 400, Color(0xFF111720), 'LsEq1*IURjog_MIUV[t7juV[f7kB');
+  static const styleMoodboardsStyle9 = AssetInfo('assets/style_moodboards/style_9.svg', 400, 400, Color(0xFF141522), 'L+KSMKR6RjkC}]IoR*s:bGR*a{oL');
+
+  /// Every entry by path, for paths built at run time.
+  static const byPath = <String, AssetInfo>{
+    'assets/examples/example_1.svg': examplesExample1,
+    'assets/examples/example_2.svg': examplesExample2,
+    'assets/examples/example_3.svg': examplesExample3,
+    'assets/examples/example_4.svg': examplesExample4,
+    'assets/onboarding/onboard_1.svg': onboardingOnboard1,
+    'assets/style_moodboards/style_1.svg': styleMoodboardsStyle1,
+    'assets/style_moodboards/style_10.svg': styleMoodboardsStyle10,
+    'assets/style_moodboards/style_11.svg': styleMoodboardsStyle11,
+    'assets/style_moodboards/style_12.svg': styleMoodboardsStyle12,
+    'assets/style_moodboards/style_13.svg': styleMoodboardsStyle13,
+    'assets/style_moodboards/style_14.svg': styleMoodboardsStyle14,
+    'assets/style_moodboards/style_15.svg': styleMoodboardsStyle15,
+    'assets/style_moodboards/style_16.svg': styleMoodboardsStyle16,
+    'assets/style_moodboards/style_17.svg': styleMoodboardsStyle17,
+    'assets/style_moodboards/style_18.svg': styleMoodboardsStyle18,
+    'assets/style_moodboards/style_19.svg': styleMoodboardsStyle19,
+    'assets/style_moodboards/style_2.svg': styleMoodboardsStyle2,
+    'assets/style_moodboards/style_20.svg': styleMoodboardsStyle20,
+    'assets/style_moodboards/style_21.svg': styleMoodboardsStyle21,
+    'assets/style_moodboards/style_22.svg': styleMoodboardsStyle22,
+    'assets/style_moodboards/style_23.svg': styleMoodboardsStyle23,
+    'assets/style_moodboards/style_24.svg': styleMoodboardsStyle24,
+    'assets/style_moodboards/style_25.svg': styleMoodboardsStyle25,
+    'assets/style_moodboards/style_26.svg': styleMoodboardsStyle26,
+    'assets/style_moodboards/style_27.svg': styleMoodboardsStyle27,
+    'assets/style_moodboards/style_28.svg': styleMoodboardsStyle28,
+    'assets/style_moodboards/style_29.svg': styleMoodboardsStyle29,
+    'assets/style_moodboards/style_3.svg': styleMoodboardsStyle3,
+    'assets/style_moodboards/style_4.svg': styleMoodboardsStyle4,
+    'assets/style_moodboards/style_5.svg': styleMoodboardsStyle5,
+    'assets/style_moodboards/style_6.svg': styleMoodboardsStyle6,
+    'assets/style_moodboards/style_7.svg': styleMoodboardsStyle7,
+    'assets/style_moodboards/style_8.svg': styleMoodboardsStyle8,
+    'assets/style_moodboards/style_9.svg': styleMoodboardsStyle9,
+  };
+
+  /// Entries by path without the extension, for files that may be in either format.
+  static const byStem = <String, AssetInfo>{
+    'assets/examples/example_1': examplesExample1,
+    'assets/examples/example_2': examplesExample2,
+    'assets/examples/example_3': examplesExample3,
+    'assets/examples/example_4': examplesExample4,
+    'assets/onboarding/onboard_1': onboardingOnboard1,
+    'assets/style_moodboards/style_1': styleMoodboardsStyle1,
+    'assets/style_moodboards/style_10': styleMoodboardsStyle10,
+    'assets/style_moodboards/style_11': styleMoodboardsStyle11,
+    'assets/style_moodboards/style_12': styleMoodboardsStyle12,
+    'assets/style_moodboards/style_13': styleMoodboardsStyle13,
+    'assets/style_moodboards/style_14': styleMoodboardsStyle14,
+    'assets/style_moodboards/style_15': styleMoodboardsStyle15,
+    'assets/style_moodboards/style_16': styleMoodboardsStyle16,
+    'assets/style_moodboards/style_17': styleMoodboardsStyle17,
+    'assets/style_moodboards/style_18': styleMoodboardsStyle18,
+    'assets/style_moodboards/style_19': styleMoodboardsStyle19,
+    'assets/style_moodboards/style_2': styleMoodboardsStyle2,
+    'assets/style_moodboards/style_20': styleMoodboardsStyle20,
+    'assets/style_moodboards/style_21': styleMoodboardsStyle21,
+    'assets/style_moodboards/style_22': styleMoodboardsStyle22,
+    'assets/style_moodboards/style_23': styleMoodboardsStyle23,
+    'assets/style_moodboards/style_24': styleMoodboardsStyle24,
+    'assets/style_moodboards/style_25': styleMoodboardsStyle25,
+    'assets/style_moodboards/style_26': styleMoodboardsStyle26,
+    'assets/style_moodboards/style_27': styleMoodboardsStyle27,
+    'assets/style_moodboards/style_28': styleMoodboardsStyle28,
+    'assets/style_moodboards/style_29': styleMoodboardsStyle29,
+    'assets/style_moodboards/style_3': styleMoodboardsStyle3,
+    'assets/style_moodboards/style_4': styleMoodboardsStyle4,
+    'assets/style_moodboards/style_5': styleMoodboardsStyle5,
+    'assets/style_moodboards/style_6': styleMoodboardsStyle6,
+    'assets/style_moodboards/style_7': styleMoodboardsStyle7,
+    'assets/style_moodboards/style_8': styleMoodboardsStyle8,
+    'assets/style_moodboards/style_9': styleMoodboardsStyle9,
+  };
+}
@@ -0,0 +1,154 @@
+// GENERATED by `python -m generator build` from assets/ASSET_MANIFEST.jsonl.
+// Do not edit; change the assets or pubspec.yaml and build again.
+
+import 'dart:ui' show Color;
+
+/// Size and placeholder of a bundled image, known before it is decoded.
+class AssetInfo {
+  const AssetInfo(this.path, this.width, this.height, this.color, this.blurHash);
+
+  final String path;
+  final int width;
+  final int height;
+
+  /// Dominant color, to paint while the image loads.
+  final Color color;
+
+  /// BlurHash (https://blurha.sh) of the image, for a blurred preview.
+  final String blurHash;
+
+  double get aspectRatio => width / height;
+}
+
+class AssetIndex {
+  AssetIndex._();
+
+  static const examplesShop01 = AssetInfo('assets/examples/shop_01.svg', 600, 800, Color(0xFF373433), 'T47-NQRP4;pyNGxCDhj[%L4ot8NH');
+  static const examplesShop02 = AssetInfo('assets/examples/shop_02.svg', 600, 800, Color(0xFF373433), 'T47-NQRP4;pyNGxCDhj[%L4ot8NH');
+  static const examplesShop03 = AssetInfo('assets/examples/shop_03.svg', 600, 800, Color(0xFF373433), 'T47-NQRP4;pyNGxCDhj[%L4ot8NH');
+  static const examplesShop04 = AssetInfo('assets/examples/shop_04.svg', 600, 800, Color(0xFF373433), 'T47-NQRP4;pyNGxCDhj[%L4ot8NH');
+  static const examplesShop05 = AssetInfo('assets/examples/shop_05.svg', 600, 800, Color(0xFF373433), 'T47-NQRP4;pyNGxCDhj[%L4ot8NH');
+  static const examplesShop06 = AssetInfo('assets/examples/shop_06.svg', 600, 800, Color(0xFF373433), 'T47-NQRP4;pyNGxCDhj[%L4ot8NH');
+  static const examplesShop07 = AssetInfo('assets/examples/shop_07.svg', 600, 800, Color(0xFF373433), 'T47-NQRP4;pyNGxCDhj[%L4ot8NH');
+  static const examplesShop08 = AssetInfo('assets/examples/shop_08.svg', 600, 800, Color(0xFF373433), 'T47-NQRP4;pyNGxCDhj[%L4ot8NH');
+  static const examplesShop09 = AssetInfo('assets/examples/shop_09.svg', 600, 800, Color(0xFF373433), 'T47-NQRP4;pyNGxCDhj[%L4ot8NH');
+  static const icon = AssetInfo('assets/icon.jpg', 1024, 1024, Color(0xFF23282C), 'L97UM54nxu%MxuWBofWB00?bIURj');
+  static const styleMoodboardsBrightClean = AssetInfo('assets/style_moodboards/bright_clean.svg', 400, 400, Color(0xFF98999B), 'LtH2f#~qt7M{-;%MoeRkfRfQayay');
+  static const styleMoodboardsBudgetDiy = AssetInfo('assets/style_moodboards/budget_diy.svg', 400, 400, Color(0xFFCBCBC8), 'LiFr@g~qt7IUR+WAaya#RkWBfQj[');
+  static const styleMoodboardsClassicHeritage = AssetInfo('assets/style_moodboards/classic_heritage.svg', 400, 400, Color(0xFFCDA861), 'LXEB]7~7s,I[E8IpWVj[RlWCj@oL');
+  static const styleMoodboardsCompact2chair = AssetInfo('assets/style_moodboards/compact_2chair.svg', 400, 400, Color(0xFF4E515B), 'LaEfWr~qt7IU9GITWBogM|Rjj[of');
+  static const styleMoodboardsContentCreator = AssetInfo('assets/style_moodboards/content_creator.svg', 400, 400, Color(0xFF1F1F25), 'LkF.r.{.sCKIB4FXWnn,NtSdo2n+');
+  static const styleMoodboardsCozyWarm = AssetInfo('assets/style_moodboards/cozy_warm.svg', 400, 400, Color(0xFFF3AA0F), 'LpGaH%}lsmJCESI=WVoLR-R,j@oK');
+  static const styleMoodboardsCustomCabinetry = AssetInfo('assets/style_moodboards/custom_cabinetry.svg', 400, 400, Color(0xFF484748), 'L89jGu}RjEtm^6=poII]jGoIa|WE');
+  static const styleMoodboardsDarkMoody = AssetInfo('assets/style_moodboards/dark_moody.svg', 400, 400, Color(0xFF010101), 'L45=CM8_M{_MIyV;awN4Rnj=j@WE');
+  static const styleMoodboardsEfficientLine = AssetInfo('assets/style_moodboards/efficient_line.svg', 400, 400, Color(0xFF202226), 'LHBWi9~qofM{9GD\$WAj^M{Rjj[of');
+  static const styleMoodboardsGlassSteel = AssetInfo('assets/style_moodboards/glass_steel.svg', 400, 400, Color(0xFF050609), 'LoFPd6_NogM{%hx]kCV[bHfkayay');
+  static const styleMoodboardsHeritageStripe = AssetInfo('assets/style_moodboards/heritage_stripe.svg', 400, 400, Color(0xFF000021), 'LUDtPD|1sAKOAbEzWVn+NvS2oKn*');
+  static const styleMoodboardsHighCapacity = AssetInfo('assets/style_moodboards/high_capacity.svg', 400, 400, Color(0xFF424858), 'LCATl^~pofRj4pD\$WAfmM{Rjoeof');
+  static const styleMoodboardsIndustrialConcrete = AssetInfo('assets/style_moodboards/industrial_concrete.svg', 400, 400, Color(0xFF000000), 'L66kbVMxRj?b.A-nocN2fmoefPWC');
+  static const styleMoodboardsJapandi = AssetInfo('assets/style_moodboards/japandi.svg', 400, 400, Color(0xFFF9F7F4), 'L@I}ns~Wt6IURPV?axbIV@WBfRj]');
+  static const styleMoodboardsKidsFriendly = AssetInfo('assets/style_moodboards/kids_friendly.svg', 400, 400, Color(0xFF030406), 'LZE1qX}esXJ}B@KSW=nhN{Shjsn%');
+  static const styleMoodboardsLuxuryBlackGold = AssetInfo('assets/style_moodboards/luxury_black_gold.svg', 400, 400, Color(0xFFCAA760), 'LSDSBe~4s,I]9eE3WCoMNIR+oLoe');
+  static const styleMoodboardsMarbleGrooming = AssetInfo('assets/style_moodboards/marble_grooming.svg', 400, 400, Color(0xFF2F3135), 'LYD,7i~WofRj~q?bofM|ogofayWC');
+  static const styleMoodboardsMinimalMono = AssetInfo('assets/style_moodboards/minimal_mono.svg', 400, 400, Color(0xFF000000), 'LjF\$bG~qt7IU9FD%WBogM{Rjofof');
+  static const styleMoodboardsModernMinimal = AssetInfo('assets/style_moodboards/modern_minimal.svg', 400, 400, Color(0xFF202227), 'LkF=~?~qt7IU9FD%WBogM{Rjoeof');
+  static const styleMoodboardsNeonSubtle = AssetInfo('assets/style_moodboards/neon_subtle.svg', 400, 400, Color(0xFF37504D), 'Lj5II-UObrrLZWiMe:baa5i}f%bZ');
+  static const styleMoodboardsPremiumHotel = AssetInfo('assets/style_moodboards/premium_hotel.svg', 400, 400, Color(0xFF1A1D23), 'LNCj2|~qs:In9FD\$WBogM{Rjj[of');
+  static const styleMoodboardsProductRetail = AssetInfo('assets/style_moodboards/product_retail.svg', 400, 400, Color(0xFF282B33), 'LUDlM|~7s,I[9#EMWCoMNIR+j@oL');
+  static const styleMoodboardsRetroDiner = AssetInfo('assets/style_moodboards/retro_diner.svg', 400, 400, Color(0xFF050609), 'L[JG~O~Cs:IoVYVraebbV@WBfkkC');
+  static const styleMoodboardsScandinavian = AssetInfo('assets/style_moodboards/scandinavian.svg', 400, 400, Color(0xFF394051), 'L_Jb5E~qt7IUa#axf6a#WBWBfQj[');
+  static const styleMoodboardsStreetwearUrban = AssetInfo('assets/style_moodboards/streetwear_urban.svg', 400, 400, Color(0xFFF00303), 'LlF{M9{zsAKOBUFaWon+N^Sfjtn*');
+  static const styleMoodboardsTattooHybrid = AssetInfo('assets/style_moodboards/tattoo_hybrid.svg', 400, 400, Color(0xFF000000), 'LjFy2a{?sEKGA*FCWnn-NrSco3n,');
+  static const styleMoodboardsVintageBrick = AssetInfo('assets/style_moodboards/vintage_brick.svg', 400, 400, Color(0xFF6C5347), 'LsG[l^~Vt6IVIBMxaekCRjWBj[of');
+  static const styleMoodboardsWaitingLounge = AssetInfo('assets/style_moodboards/waiting_lounge.svg', 400, 400, Color(0xFF202123), 'L37A_9mPRP~q^n^GskE9ajs,fPRl');
+  static const styleMoodboardsWashStation = AssetInfo('assets/style_moodboards/wash_station.svg', 400, 400, Color(0xFF000031), 'LqF\$bN_4t7IU9GIBWBofRjRjoeof');
+  static const styleMoodboardsWoodChrome = AssetInfo('assets/style_moodboards/wood_chrome.svg', 400, 400, Color(0xFF38363D), 'LkF=w5~Ws:IoIAMxaekCRjWBj[kC');
+
+  /// Every entry by path, for paths built at run time.
+  static const byPath = <String, AssetInfo>{
+    'assets/examples/shop_01.svg': examplesShop01,
+    'assets/examples/shop_02.svg': examplesShop02,
+    'assets/examples/shop_03.svg': examplesShop03,
+    'assets/examples/shop_04.svg': examplesShop04,
+    'assets/examples/shop_05.svg': examplesShop05,
+    'assets/examples/shop_06.svg': examplesShop06,
+    'assets/examples/shop_07.svg': examplesShop07,
+    'assets/examples/shop_08.svg': examplesShop08,
+    'assets/examples/shop_09.svg': examplesShop09,
+    'assets/icon.jpg': icon,
+    'assets/style_moodboards/bright_clean.svg': styleMoodboardsBrightClean,
+    'assets/style_moodboards/budget_diy.svg': styleMoodboardsBudgetDiy,
+    'assets/style_moodboards/classic_heritage.svg': styleMoodboardsClassicHeritage,
+    'assets/style_moodboards/compact_2chair.svg': styleMoodboardsCompact2chair,
+    'assets/style_moodboards/content_creator.svg': styleMoodboardsContentCreator,
+    'assets/style_moodboards/cozy_warm.svg': styleMoodboardsCozyWarm,
+    'assets/style_moodboards/custom_cabinetry.svg': styleMoodboardsCustomCabinetry,
+    'assets/style_moodboards/dark_moody.svg': styleMoodboardsDarkMoody,
+    'assets/style_moodboards/efficient_line.svg': styleMoodboardsEfficientLine,
+    'assets/style_moodboards/glass_steel.svg': styleMoodboardsGlassSteel,
+    'assets/style_moodboards/heritage_stripe.svg': styleMoodboardsHeritageStripe,
+    'assets/style_moodboards/high_capacity.svg': styleMoodboardsHighCapacity,
+    'assets/style_moodboards/industrial_concrete.svg': styleMoodboardsIndustrialConcrete,
+    'assets/style_moodboards/japandi.svg': styleMoodboardsJapandi,
+    'assets/style_moodboards/kids_friendly.svg': styleMoodboardsKidsFriendly,
+    'assets/style_moodboards/luxury_black_gold.svg': styleMoodboardsLuxuryBlackGold,
+    'assets/style_moodboards/marble_grooming.svg': styleMoodboardsMarbleGrooming,
+    'assets/style_moodboards/minimal_mono.svg': styleMoodboardsMinimalMono,
+    'assets/style_moodboards/modern_minimal.svg': styleMoodboardsModernMinimal,
+    'assets/style_moodboards/neon_subtle.svg': styleMoodboardsNeonSubtle,
+    'assets/style_moodboards/premium_hotel.svg': styleMoodboardsPremiumHotel,
+    'assets/style_moodboards/product_retail.svg': styleMoodboardsProductRetail,
+    'assets/style_moodboards/retro_diner.svg': styleMoodboardsRetroDiner,
+    'assets/style_moodboards/scandinavian.svg': styleMoodboardsScandinavian,
+    'assets/style_moodboards/streetwear_urban.svg': styleMoodboardsStreetwearUrban,
+    'assets/style_moodboards/tattoo_hybrid.svg': styleMoodboardsTattooHybrid,
+    'assets/style_moodboards/vintage_brick.svg': styleMoodboardsVintageBrick,
+    'assets/style_moodboards/waiting_lounge.svg': styleMoodboardsWaitingLounge,
+    'assets/style_moodboards/wash_station.svg': styleMoodboardsWashStation,
+    'assets/style_moodboards/wood_chrome.svg': styleMoodboardsWoodChrome,
+  };
+
+  /// Entries by path without the extension, for files that may be in either format.
+  static const byStem = <String, AssetInfo>{
+    'assets/examples/shop_01': examplesShop01,
+    'assets/examples/shop_02': examplesShop02,
+    'assets/examples/shop_03': examplesShop03,
+    'assets/examples/shop_04': examplesShop04,
+    'assets/examples/shop_05': examplesShop05,
+    'assets/examples/shop_06': examplesShop06,
+    'assets/examples/shop_07': examplesShop07,
+    'assets/examples/shop_08': examplesShop08,
+    'assets/examples/shop_09': examplesShop09,
+    'assets/icon': icon,
+    'assets/style_moodboards/bright_clean': styleMoodboardsBrightClean,
+    'assets/style_moodboards/budget_diy': styleMoodboardsBudgetDiy,
+    'assets/style_moodboards/classic_heritage': styleMoodboardsClassicHeritage,
+    'assets/style_moodboards/compact_2chair': styleMoodboardsCompact2chair,
+    'assets/style_moodboards/content_creator': styleMoodboardsContentCreator,
+    'assets/style_moodboards/cozy_warm': styleMoodboardsCozyWarm,
+    'assets/style_moodboards/custom_cabinetry': styleMoodboardsCustomCabinetry,
+    'assets/style_moodboards/dark_moody': styleMoodboardsDarkMoody,
+    'assets/style_moodboards/efficient_line': styleMoodboardsEfficientLine,
+    'assets/style_moodboards/glass_steel': styleMoodboardsGlassSteel,
+    'assets/style_moodboards/heritage_stripe': styleMoodboardsHeritageStripe,
+    'assets/style_moodboards/high_capacity': styleMoodboardsHighCapacity,
+    'assets/style_moodboards/industrial_concrete': styleMoodboardsIndustrialConcrete,
+    'assets/style_moodboards/japandi': styleMoodboardsJapandi,
+    'assets/style_moodboards/kids_friendly': styleMoodboardsKidsFriendly,
+    'assets/style_moodboards/luxury_black_gold': styleMoodboardsLuxuryBlackGold,
+    'assets/style_moodboards/marble_grooming': styleMoodboardsMarbleGrooming,
+    'assets/style_moodboards/minimal_mono': styleMoodboardsMinimalMono,
+    'assets/style_moodboards/modern_minimal': styleMoodboardsModernMinimal,
+    'assets/style_moodboards/neon_subtle': styleMoodboardsNeonSubtle,
+    'assets/style_moodboards/premium_hotel': styleMoodboardsPremiumHotel,
+    'assets/style_moodboards/product_retail': styleMoodboardsProductRetail,
+    'assets/style_moodboards/retro_diner': styleMoodboardsRetroDiner,
+    'assets/style_moodboards/scandinavian': styleMoodboardsScandinavian,
+    'assets/style_moodboards/streetwear_urban': styleMoodboardsStreetwearUrban,
+    'assets/style_moodboards/tattoo_hybrid': styleMoodboardsTattooHybrid,
+    'assets/style_moodboards/vintage_brick': styleMoodboardsVintageBrick,
+    'assets/style_moodboards/waiting_lounge': styleMoodboardsWaitingLounge,
+    'assets/style_moodboards/wash_station': styleMoodboardsWashStation,
+    'assets/style_moodboards/wood_chrome': styleMoodboardsWoodChrome,
+  };
+}
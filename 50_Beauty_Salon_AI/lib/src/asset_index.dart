@@ -0,0 +1,169 @@
+// GENERATED by `python -m generator build` from assets/ASSET_MANIFEST.jsonl.
+// Do not edit; change the assets or pubspec.yaml and build again.
+
+import 'dart:ui' show Color;
+
+/// Size and placeholder of a bundled image, known before it is decoded.
+class AssetInfo {
+  const AssetInfo(this.path, this.width, this.height, this.color, this.blurHash);
+
+  final String path;
+  final int width;
+  final int height;
+
+  /// Dominant color, to paint while the image loads.
+  final Color color;
+
+  /// BlurHash (https://blurha.sh) of the image, for a blurred preview.
+  final String blurHash;
+
+  double get aspectRatio => width / height;
+}
+
+class AssetIndex {
+  AssetIndex._();
+
+  static const examplesExampleSalon1 = AssetInfo('assets/examples/example_salon_1.svg', 400, 400, Color(0xFFF8E2EA), 'LcQ+]G4UWB?b~W-qofNF%MxuayRj');
+  static const examplesExampleSalon10 = AssetInfo('assets/examples/example_salon_10.svg', 400, 400, Color(0xFFFFFEFF), 'LnQSxU4mWB?b?F%0j[R*xut7ayWB');
+  static const examplesExampleSalon11 = AssetInfo('assets/examples/example_salon_11.svg', 400, 400, Color(0xFFF8D7E5), 'LZQ[Q2D5WV.8w0aej[j?t+ozayae');
+  static const examplesExampleSalon12 = AssetInfo('assets/examples/example_salon_12.svg', 400, 400, Color(0xFFF8D8E6), 'LLR_;uL%WC?v^l.SozMeyCtlayV@');
+  static const examplesExampleSalon2 = AssetInfo('assets/examples/example_salon_2.svg', 400, 400, Color(0xFFF2D4D6), 'LXPY;t9Ybb?H~C\$_j?WG.8t5aeWX');
+  static const examplesExampleSalon3 = AssetInfo('assets/examples/example_salon_3.svg', 400, 400, Color(0xFFF2D4D6), 'LXPY;t9Ybb?H~C\$_j?WG.8t5aeWX');
+  static const examplesExampleSalon4 = AssetInfo('assets/examples/example_salon_4.svg', 400, 400, Color(0xFFF7D9E4), 'LYRU:hw7kD%K_4tjkBaMyEbYWBjb');
+  static const examplesExampleSalon5 = AssetInfo('assets/examples/example_salon_5.svg', 400, 400, Color(0xFFE7D2BC), 'LgRoa7HXWB.8%co]j[aftRozayae');
+  static const examplesExampleSalon6 = AssetInfo('assets/examples/example_salon_6.svg', 400, 400, Color(0xFFCD97A0), 'LVLz,CqKxHu2K6|3spFZ.8xZaeWX');
+  static const examplesExampleSalon7 = AssetInfo('assets/examples/example_salon_7.svg', 400, 400, Color(0xFFF8D8E6), 'LLS5VML%WC?v^l.SozMeyDtlWVV@');
+  static const examplesExampleSalon8 = AssetInfo('assets/examples/example_salon_8.svg', 400, 400, Color(0xFFF8E2EA), 'LcQ+]G4UWB?b~W-qofNF%MxuayRj');
+  static const examplesExampleSalon9 = AssetInfo('assets/examples/example_salon_9.svg', 400, 400, Color(0xFFF9E4EB), 'LfQ9Wa4mWU?b=a%eofRQ%LxuayWB');
+  static const icon = AssetInfo('assets/icon.jpg', 1024, 1024, Color(0xFF23282C), 'L97UM54nxu%MxuWBofWB00?bIURj');
+  static const styleMoodboardsStyleBohoSoftBeauty = AssetInfo('assets/style_moodboards/style_boho_soft_beauty.svg', 400, 400, Color(0xFF8FD2C6), 'LiNwvJv5sDt+X+~Ds;EK%MxuayRj');
+  static const styleMoodboardsStyleBridalBeautySuite = AssetInfo('assets/style_moodboards/style_bridal_beauty_suite.svg', 400, 400, Color(0xFF96C7A9), 'LaNAxCq[spyDKt}ts:Ee%fxaayR*');
+  static const styleMoodboardsStyleBudgetPracticalSalon = AssetInfo('assets/style_moodboards/style_budget_practical_salon.svg', 400, 400, Color(0xFFFFF7FB), 'LoRoW~rxj]xt?^tQjsahx^bYayjb');
+  static const styleMoodboardsStyleClinicCleanAesthetic = AssetInfo('assets/style_moodboards/style_clinic-clean_aesthetic.svg', 400, 400, Color(0xFFE7CAB9), 'LgQ9Zi4mWB?b^%\$gjuS4%Mt7ayWU');
+  static const styleMoodboardsStyleContentCreatorFriendlySalon = AssetInfo('assets/style_moodboards/style_content-creator_friendly_salon.svg', 400, 400, Color(0xFFB3A0AA), 'LbMa6NQ9spyWJ5|}spEx%MxajaR*');
+  static const styleMoodboardsStyleCozyWarmLoungeSalon = AssetInfo('assets/style_moodboards/style_cozy_warm_lounge_salon.svg', 400, 400, Color(0xFFF7D9E4), 'LZRLO.ryog%K_4tjfiV[yDbYayjv');
+  static const styleMoodboardsStyleDarkChicSalon = AssetInfo('assets/style_moodboards/style_dark_chic_salon.svg', 400, 400, Color(0xFFFFF7FB), 'LbQvRY9ZWV?H~D?vofMx%MxuayRj');
+  static const styleMoodboardsStyleEcoFriendlyNaturalBeauty = AssetInfo('assets/style_moodboards/style_eco-friendly_natural_beauty.svg', 400, 400, Color(0xFFFFF7FB), 'LgSF9YVZa|%M?]x]juV@tlozf6ay');
+  static const styleMoodboardsStyleHairStudioFocus = AssetInfo('assets/style_moodboards/style_hair_studio_focus.svg', 400, 400, Color(0xFFF8D7E5), 'LXP~pG0cW.^l^i-nofRk%gxaayR*');
+  static const styleMoodboardsStyleHighCapacityMultiStation = AssetInfo('assets/style_moodboards/style_high_capacity_multi-station.svg', 400, 400, Color(0xFFD189A0), 'LSOzJO?{w|lm2i~Bs:E1pHtRj[V[');
+  static const styleMoodboardsStyleHollywoodMirrorGlam = AssetInfo('assets/style_moodboards/style_hollywood_mirror_glam.svg', 400, 400, Color(0xFFF6D5E2), 'LdQlh79@ba=|~W?bkCM{%gxbjtWB');
+  static const styleMoodboardsStyleIndustrialBeautyLoft = AssetInfo('assets/style_moodboards/style_industrial_beauty_loft.svg', 400, 400, Color(0xFFDDBF9E), 'LcPZAQ4na#?a~pw@jYW?-=s.axWX');
+  static const styleMoodboardsStyleJapandiCalmBeauty = AssetInfo('assets/style_moodboards/style_japandi_calm_beauty.svg', 400, 400, Color(0xFFF7D6E4), 'LbQb%_9ZW:?H~D?HofM{%gxbayR*');
+  static const styleMoodboardsStyleKoreanCleanBeauty = AssetInfo('assets/style_moodboards/style_korean_clean_beauty.svg', 400, 400, Color(0xFFFFF7FB), 'LoRoW~rxj]xt?^tPjsahx^bYaxjb');
+  static const styleMoodboardsStyleLuxuryHotelSalonSuite = AssetInfo('assets/style_moodboards/style_luxury_hotel_salon_suite.svg', 400, 400, Color(0xFFF9DCE9), 'LgNwZnz[s:pHY4}]s:EK%MxajaWU');
+  static const styleMoodboardsStyleMakeupStationPro = AssetInfo('assets/style_moodboards/style_makeup_station_pro.svg', 400, 400, Color(0xFFD3899D), 'LgOzGH}cxHOlP.?Hs:IoyDkAaxa#');
+  static const styleMoodboardsStyleMensGroomingCorner = AssetInfo('assets/style_moodboards/style_mens_grooming_corner.svg', 400, 400, Color(0xFF96C7A9), 'LbM@o%mRs:yDP1}us:EL%fxbjaR*');
+  static const styleMoodboardsStyleMinimalWhiteGlam = AssetInfo('assets/style_moodboards/style_minimal_white_glam.svg', 400, 400, Color(0xFFA7A3A9), 'LlMtaPQAsCyWIU^7s:I.xuxujtWB');
+  static const styleMoodboardsStyleModernMarbleBeauty = AssetInfo('assets/style_moodboards/style_modern_marble_beauty.svg', 400, 400, Color(0xFFCE6E94), 'LSQRkfHakD.7,_M_a_t8%#X4aejv');
+  static const styleMoodboardsStyleNailBarFocus = AssetInfo('assets/style_moodboards/style_nail_bar_focus.svg', 400, 400, Color(0xFFF8D8E6), 'LZQlnN4oWV?b}]?bofMx-pxuayRj');
+  static const styleMoodboardsStyleOrchidNeonSubtleStudio = AssetInfo('assets/style_moodboards/style_orchid_neon-subtle_studio.svg', 400, 400, Color(0xFFF8D7E5), 'LYP~m90cbY^l^i-nj[NG%fxajaWU');
+  static const styleMoodboardsStyleParisianChicSalon = AssetInfo('assets/style_moodboards/style_parisian_chic_salon.svg', 400, 400, Color(0xFFFFF7FB), 'LwQ9o~IqbI%1_4%1jsR+%Ns:ayWW');
+  static const styleMoodboardsStylePastelCandyBeauty = AssetInfo('assets/style_moodboards/style_pastel_candy_beauty.svg', 400, 400, Color(0xFFFFF7FA), 'LnP~+tJVbb%1~X%fkBRj%gt6ayWV');
+  static const styleMoodboardsStylePremiumBlackAndChampagne = AssetInfo('assets/style_moodboards/style_premium_black_and_champagne.svg', 400, 400, Color(0xFFD39FB2), 'LoPiST4Tay?b+gxbj[R%xut7j[WB');
+  static const styleMoodboardsStyleReceptionFirstBoutique = AssetInfo('assets/style_moodboards/style_reception-first_boutique.svg', 400, 400, Color(0xFFD5BE9C), 'LUN^C.{SxIP8Cf^Ms.I=yXf#axjv');
+  static const styleMoodboardsStyleRetailProductWallShowcase = AssetInfo('assets/style_moodboards/style_retail_product_wall_showcase.svg', 400, 400, Color(0xFF8CC4A2), 'LdM@o%+kxbgdyY}usoEe%hxZjsWX');
+  static const styleMoodboardsStyleRoseGoldBoutique = AssetInfo('assets/style_moodboards/style_rose_gold_boutique.svg', 400, 400, Color(0xFFFFF7FA), 'LnP~+tJVbb%1~X%fkBRj%gt6ayWW');
+  static const styleMoodboardsStyleRunwayRoseLuxe = AssetInfo('assets/style_moodboards/style_runway_rose_luxe.svg', 400, 400, Color(0xFFF7D9E4), 'LiP?2ZIrbb-n~E%Lj[Rk-;t6ayWW');
+  static const styleMoodboardsStyleScandinavianSoftBeauty = AssetInfo('assets/style_moodboards/style_scandinavian_soft_beauty.svg', 400, 400, Color(0xFFF6D4E0), 'LcQv5*Eeba=|~W?bofM{%fxaayWB');
+  static const styleMoodboardsStyleSmallSalonSpaceHack = AssetInfo('assets/style_moodboards/style_small_salon_space_hack.svg', 400, 400, Color(0xFFFFFEFF), 'LXPP}-_.wzT^B%~DxHE0pHtRf6WB');
+  static const styleMoodboardsStyleSpaSerenityCorner = AssetInfo('assets/style_moodboards/style_spa_serenity_corner.svg', 400, 400, Color(0xFFE7CAB8), 'LYRep#DNWB.8\$wt%ofVttko|ayV[');
+  static const styleMoodboardsStyleTropicalBeautyStudio = AssetInfo('assets/style_moodboards/style_tropical_beauty_studio.svg', 400, 400, Color(0xFFCE6E94), 'LvRLeUHYWB%zsCaej[j[o|kWayae');
+
+  /// Every entry by path, for paths built at run time.
+  static const byPath = <String, AssetInfo>{
+    'assets/examples/example_salon_1.svg': examplesExampleSalon1,
+    'assets/examples/example_salon_10.svg': examplesExampleSalon10,
+    'assets/examples/example_salon_11.svg': examplesExampleSalon11,
+    'assets/examples/example_salon_12.svg': examplesExampleSalon12,
+    'assets/examples/example_salon_2.svg': examplesExampleSalon2,
+    'assets/examples/example_salon_3.svg': examplesExampleSalon3,
+    'assets/examples/example_salon_4.svg': examplesExampleSalon4,
+    'assets/examples/example_salon_5.svg': examplesExampleSalon5,
+    'assets/examples/example_salon_6.svg': examplesExampleSalon6,
+    'assets/examples/example_salon_7.svg': examplesExampleSalon7,
+    'assets/examples/example_salon_8.svg': examplesExampleSalon8,
+    'assets/examples/example_salon_9.svg': examplesExampleSalon9,
+    'assets/icon.jpg': icon,
+    'assets/style_moodboards/style_boho_soft_beauty.svg': styleMoodboardsStyleBohoSoftBeauty,
+    'assets/style_moodboards/style_bridal_beauty_suite.svg': styleMoodboardsStyleBridalBeautySuite,
+    'assets/style_moodboards/style_budget_practical_salon.svg': styleMoodboardsStyleBudgetPracticalSalon,
+    'assets/style_moodboards/style_clinic-clean_aesthetic.svg': styleMoodboardsStyleClinicCleanAesthetic,
+    'assets/style_moodboards/style_content-creator_friendly_salon.svg': styleMoodboardsStyleContentCreatorFriendlySalon,
+    'assets/style_moodboards/style_cozy_warm_lounge_salon.svg': styleMoodboardsStyleCozyWarmLoungeSalon,
+    'assets/style_moodboards/style_dark_chic_salon.svg': styleMoodboardsStyleDarkChicSalon,
+    'assets/style_moodboards/style_eco-friendly_natural_beauty.svg': styleMoodboardsStyleEcoFriendlyNaturalBeauty,
+    'assets/style_moodboards/style_hair_studio_focus.svg': styleMoodboardsStyleHairStudioFocus,
+    'assets/style_moodboards/style_high_capacity_multi-station.svg': styleMoodboardsStyleHighCapacityMultiStation,
+    'assets/style_moodboards/style_hollywood_mirror_glam.svg': styleMoodboardsStyleHollywoodMirrorGlam,
+    'assets/style_moodboards/style_industrial_beauty_loft.svg': styleMoodboardsStyleIndustrialBeautyLoft,
+    'assets/style_moodboards/style_japandi_calm_beauty.svg': styleMoodboardsStyleJapandiCalmBeauty,
+    'assets/style_moodboards/style_korean_clean_beauty.svg': styleMoodboardsStyleKoreanCleanBeauty,
+    'assets/style_moodboards/style_luxury_hotel_salon_suite.svg': styleMoodboardsStyleLuxuryHotelSalonSuite,
+    'assets/style_moodboards/style_makeup_station_pro.svg': styleMoodboardsStyleMakeupStationPro,
+    'assets/style_moodboards/style_mens_grooming_corner.svg': styleMoodboardsStyleMensGroomingCorner,
+    'assets/style_moodboards/style_minimal_white_glam.svg': styleMoodboardsStyleMinimalWhiteGlam,
+    'assets/style_moodboards/style_modern_marble_beauty.svg': styleMoodboardsStyleModernMarbleBeauty,
+    'assets/style_moodboards/style_nail_bar_focus.svg': styleMoodboardsStyleNailBarFocus,
+    'assets/style_moodboards/style_orchid_neon-subtle_studio.svg': styleMoodboardsStyleOrchidNeonSubtleStudio,
+    'assets/style_moodboards/style_parisian_chic_salon.svg': styleMoodboardsStyleParisianChicSalon,
+    'assets/style_moodboards/style_pastel_candy_beauty.svg': styleMoodboardsStylePastelCandyBeauty,
+    'assets/style_moodboards/style_premium_black_and_champagne.svg': styleMoodboardsStylePremiumBlackAndChampagne,
+    'assets/style_moodboards/style_reception-first_boutique.svg': styleMoodboardsStyleReceptionFirstBoutique,
+    'assets/style_moodboards/style_retail_product_wall_showcase.svg': styleMoodboardsStyleRetailProductWallShowcase,
+    'assets/style_moodboards/style_rose_gold_boutique.svg': styleMoodboardsStyleRoseGoldBoutique,
+    'assets/style_moodboards/style_runway_rose_luxe.svg': styleMoodboardsStyleRunwayRoseLuxe,
+    'assets/style_moodboards/style_scandinavian_soft_beauty.svg': styleMoodboardsStyleScandinavianSoftBeauty,
+    'assets/style_moodboards/style_small_salon_space_hack.svg': styleMoodboardsStyleSmallSalonSpaceHack,
+    'assets/style_moodboards/style_spa_serenity_corner.svg': styleMoodboardsStyleSpaSerenityCorner,
+    'assets/style_moodboards/style_tropical_beauty_studio.svg': styleMoodboardsStyleTropicalBeautyStudio,
+  };
+
+  /// Entries by path without the extension, for files that may be in either format.
+  static const byStem = <String, AssetInfo>{
+    'assets/examples/example_salon_1': examplesExampleSalon1,
+    'assets/examples/example_salon_10': examplesExampleSalon10,
+    'assets/examples/example_salon_11': examplesExampleSalon11,
+    'assets/examples/example_salon_12': examplesExampleSalon12,
+    'assets/examples/example_salon_2': examplesExampleSalon2,
+    'assets/examples/example_salon_3': examplesExampleSalon3,
+    'assets/examples/example_salon_4': examplesExampleSalon4,
+    'assets/examples/example_salon_5': examplesExampleSalon5,
+    'assets/examples/example_salon_6': examplesExampleSalon6,
+    'assets/examples/example_salon_7': examplesExampleSalon7,
+    'assets/examples/example_salon_8': examplesExampleSalon8,
+    'assets/examples/example_salon_9': examplesExampleSalon9,
+    'assets/icon': icon,
+    'assets/style_moodboards/style_boho_soft_beauty': styleMoodboardsStyleBohoSoftBeauty,
+    'assets/style_moodboards/style_bridal_beauty_suite': styleMoodboardsStyleBridalBeautySuite,
+    'assets/style_moodboards/style_budget_practical_salon': styleMoodboardsStyleBudgetPracticalSalon,
+    'assets/style_moodboards/style_clinic-clean_aesthetic': styleMoodboardsStyleClinicCleanAesthetic,
+    'assets/style_moodboards/style_content-creator_friendly_salon': styleMoodboardsStyleContentCreatorFriendlySalon,
+    'assets/style_moodboards/style_cozy_warm_lounge_salon': styleMoodboardsStyleCozyWarmLoungeSalon,
+    'assets/style_moodboards/style_dark_chic_salon': styleMoodboardsStyleDarkChicSalon,
+    'assets/style_moodboards/style_eco-friendly_natural_beauty': styleMoodboardsStyleEcoFriendlyNaturalBeauty,
+    'assets/style_moodboards/style_hair_studio_focus': styleMoodboardsStyleHairStudioFocus,
+    'assets/style_moodboards/style_high_capacity_multi-station': styleMoodboardsStyleHighCapacityMultiStation,
+    'assets/style_moodboards/style_hollywood_mirror_glam': styleMoodboardsStyleHollywoodMirrorGlam,
+    'assets/style_moodboards/style_industrial_beauty_loft': styleMoodboardsStyleIndustrialBeautyLoft,
+    'assets/style_moodboards/style_japandi_calm_beauty': styleMoodboardsStyleJapandiCalmBeauty,
+    'assets/style_moodboards/style_korean_clean_beauty': styleMoodboardsStyleKoreanCleanBeauty,
+    'assets/style_moodboards/style_luxury_hotel_salon_suite': styleMoodboardsStyleLuxuryHotelSalonSuite,
+    'assets/style_moodboards/style_makeup_station_pro': styleMoodboardsStyleMakeupStationPro,
+    'assets/style_moodboards/style_mens_grooming_corner': styleMoodboardsStyleMensGroomingCorner,
+    'assets/style_moodboards/style_minimal_white_glam': styleMoodboardsStyleMinimalWhiteGlam,
+    'assets/style_moodboards/style_modern_marble_beauty': styleMoodboardsStyleModernMarbleBeauty,
+    'assets/style_moodboards/style_nail_bar_focus': styleMoodboardsStyleNailBarFocus,
+    'assets/style_moodboards/style_orchid_neon-subtle_studio': styleMoodboardsStyleOrchidNeonSubtleStudio,
+    'assets/style_moodboards/style_parisian_chic_salon': styleMoodboardsStyleParisianChicSalon,
+    'assets/style_moodboards/style_pastel_candy_beauty': styleMoodboardsStylePastelCandyBeauty,
+    'assets/style_moodboards/style_premium_black_and_champagne': styleMoodboardsStylePremiumBlackAndChampagne,
+    'assets/style_moodboards/style_reception-first_boutique': styleMoodboardsStyleReceptionFirstBoutique,
+    'assets/style_moodboards/style_retail_product_wall_showcase': styleMoodboardsStyleRetailProductWallShowcase,
+    'assets/style_moodboards/style_rose_gold_boutique': styleMoodboardsStyleRoseGoldBoutique,
+    'assets/style_moodboards/style_runway_rose_luxe': styleMoodboardsStyleRunwayRoseLuxe,
+    'assets/style_moodboards/style_scandinavian_soft_beauty': styleMoodboardsStyleScandinavianSoftBeauty,
+    'assets/style_moodboards/style_small_salon_space_hack': styleMoodboardsStyleSmallSalonSpaceHack,
+    'assets/style_moodboards/style_spa_serenity_corner': styleMoodboardsStyleSpaSerenityCorner,
+    'assets/style_moodboards/style_tropical_beauty_studio': styleMoodboardsStyleTropicalBeautyStudio,
+  };
+}
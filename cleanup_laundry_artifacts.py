@@ -1,49 +1,64 @@
+import argparse
 import os
 
+from generator.index import SymbolIndex, print_preview
+from generator.rewrite import Rewriter, rewrite_tree
+from generator.walk import iter_files
+
 PROJECT_DIR = "44_Guest_Room_AI"
 OLD_PREFIX = "laundry"
 NEW_PREFIX = "guest"
 OLD_CLASS = "Laundry"
 NEW_CLASS = "Guest"
 
-def replace_in_file(filepath):
-    try:
-        with open(filepath, 'r') as f:
-            content = f.read()
-
-        new_content = content
-        # Replace imports and identifiers
-        new_content = new_content.replace(f"{OLD_PREFIX}_", f"{NEW_PREFIX}_")
-        new_content = new_content.replace(OLD_CLASS, NEW_CLASS)
-
-        if content != new_content:
-            with open(filepath, 'w') as f:
-                f.write(new_content)
-            print(f"Updated content: {filepath}")
-    except Exception as e:
-        print(f"Error processing {filepath}: {e}")
-
-def rename_files():
-    for root, dirs, files in os.walk(PROJECT_DIR, topdown=False):
-        for filename in files:
-            if OLD_PREFIX in filename:
-                old_path = os.path.join(root, filename)
-                new_filename = filename.replace(OLD_PREFIX, NEW_PREFIX)
-                new_path = os.path.join(root, new_filename)
-                os.rename(old_path, new_path)
-                print(f"Renamed: {old_path} -> {new_path}")
+# Imports and identifiers, replaced in a single pass
+REPLACEMENTS = Rewriter({
+    f"{OLD_PREFIX}_": f"{NEW_PREFIX}_",
+    OLD_CLASS: NEW_CLASS,
+})
+
+CONTENT_SUFFIXES = ('.dart', '.yaml', '.xml', '.plist', '.md')
+
+def planned_renames():
+    # Only files are renamed, so collecting the list first keeps every path valid.
+    # Build output, Pods and other ignored trees are skipped.
+    renames = []
+    for old_path, _ in iter_files(PROJECT_DIR):
+        root, filename = os.path.split(old_path)
+        if OLD_PREFIX in filename:
+            renames.append((old_path, os.path.join(root, filename.replace(OLD_PREFIX, NEW_PREFIX))))
+    return renames
+
+def rename_files(renames):
+    for old_path, new_path in renames:
+        os.rename(old_path, new_path)
+        print(f"Renamed: {old_path} -> {new_path}")
 
 def main():
+    parser = argparse.ArgumentParser(description="Replace leftover laundry names in the Guest Room project.")
+    parser.add_argument("--dry-run", action="store_true", help="print the edit set and exit without changing files")
+    args = parser.parse_args()
+
     print(f"Starting laundry cleanup for {PROJECT_DIR}...")
 
+    # The index only opens files that contain one of the old names.
+    index = SymbolIndex(PROJECT_DIR).refresh()
+    renames = planned_renames()
+    print("Planned edits:")
+    print_preview(index.preview(REPLACEMENTS, CONTENT_SUFFIXES), REPLACEMENTS.table)
+    for old_path, new_path in renames:
+        print(f"  rename {old_path} -> {new_path}")
+    if args.dry_run:
+        return
+
     # 1. Content Replacement
-    for root, dirs, files in os.walk(PROJECT_DIR):
-        for filename in files:
-            if filename.endswith(('.dart', '.yaml', '.xml', '.plist', '.md')):
-                replace_in_file(os.path.join(root, filename))
+    report = rewrite_tree(PROJECT_DIR, REPLACEMENTS, CONTENT_SUFFIXES, index=index,
+                          on_change=lambda path, count: print(f"Updated content: {path}"),
+                          on_error=lambda path, e: print(f"Error processing {path}: {e}"))
+    print(report.summary())
 
     # 2. File Renaming
-    rename_files()
+    rename_files(renames)
 
     print("Cleanup complete.")
 
@@ -1,10 +1,18 @@
+import argparse
 import os
-import urllib.request
-import random
-import base64
+
+from generator import manifest
+from generator.builddb import write_if_changed
+from generator.cache import default_cache
+from generator.fetch import Downloader, report
+from generator.journal import JobJournal
+from generator.moodboard import MODES as MOODBOARD_MODES, write_moodboards
+from generator.resize import derive
+from generator.seed import asset_rng
 
 PROJECT_DIR = "44_Guest_Room_AI"
 ASSETS_DIR = os.path.join(PROJECT_DIR, "assets")
+JOURNAL_FILE = os.path.join(PROJECT_DIR, ".fetch_journal.json")
 DIRS = {
     "examples": os.path.join(ASSETS_DIR, "examples"),
     "style_tiles": os.path.join(ASSETS_DIR, "style_tiles"),
@@ -34,46 +42,41 @@ SOURCES = [
 
 STYLES_COUNT = 29 # 28 + Custom
 
+# Smaller variants cut locally from each full-size example: (dir, filename, width).
+# The first entry is the tile the moodboards are built from.
+DERIVED_SIZES = [
+    ("style_tiles", "thumb_{n}.jpg", 300),
+]
+DERIVED_QUALITY = 80
+
 def ensure_dirs():
     for d in DIRS.values():
         os.makedirs(d, exist_ok=True)
 
-def download_image(url_base, dest_path, width=600):
-    url = f"{url_base}?fm=jpg&q=80&w={width}&fit=max"
-    try:
-        urllib.request.urlretrieve(url, dest_path)
-        print(f"Downloaded: {dest_path}")
-        return True
-    except Exception as e:
-        print(f"Failed to download {url}: {e}")
-        return False
-
-def create_svg_collage(filepath, images_base64):
-    # images_base64 is a list of 4 base64 strings (jpeg)
-    # 2x2 grid in SVG
-
-    svg_content = f"""<svg width="600" height="600" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink">
-  <defs>
-    <clipPath id="c1"><rect x="0" y="0" width="300" height="300" rx="0" /></clipPath>
-    <clipPath id="c2"><rect x="300" y="0" width="300" height="300" rx="0" /></clipPath>
-    <clipPath id="c3"><rect x="0" y="300" width="300" height="300" rx="0" /></clipPath>
-    <clipPath id="c4"><rect x="300" y="300" width="300" height="300" rx="0" /></clipPath>
-  </defs>
-
-  <image x="0" y="0" width="300" height="300" preserveAspectRatio="xMidYMid slice" clip-path="url(#c1)" xlink:href="data:image/jpeg;base64,{images_base64[0]}" />
-  <image x="300" y="0" width="300" height="300" preserveAspectRatio="xMidYMid slice" clip-path="url(#c2)" xlink:href="data:image/jpeg;base64,{images_base64[1]}" />
-  <image x="0" y="300" width="300" height="300" preserveAspectRatio="xMidYMid slice" clip-path="url(#c3)" xlink:href="data:image/jpeg;base64,{images_base64[2]}" />
-  <image x="300" y="300" width="300" height="300" preserveAspectRatio="xMidYMid slice" clip-path="url(#c4)" xlink:href="data:image/jpeg;base64,{images_base64[3]}" />
-
-  <rect x="0" y="0" width="600" height="600" fill="none" stroke="#FAF7F2" stroke-width="4" />
-  <line x1="300" y1="0" x2="300" y2="600" stroke="#FAF7F2" stroke-width="4" />
-  <line x1="0" y1="300" x2="600" y2="300" stroke="#FAF7F2" stroke-width="4" />
-</svg>"""
-
-    with open(filepath, 'w') as f:
-        f.write(svg_content)
+def image_url(url_base, width=600):
+    return f"{url_base}?fm=jpg&q=80&w={width}&fit=max"
+
+def copy_placeholders(count=4):
+    # Replace rather than overwrite: `generator dedup --link` may have made
+    # these copies hardlinks of their example, and writing through one
+    # would truncate the example too.
+    for i in range(min(count, len(SOURCES))):
+        src = os.path.join(DIRS["examples"], f"guest_example_{i+1}.jpg")
+        if not os.path.exists(src):
+            continue
+        with open(src, 'rb') as s:
+            data = s.read()
+        write_if_changed(os.path.join(DIRS["onboarding"], f"onboard_{i+1}.jpg"), data)
+        write_if_changed(os.path.join(DIRS["illustrations"], f"empty_{i+1}.jpg"), data)
 
 def main():
+    parser = argparse.ArgumentParser(description="Fetch Guest Room assets.")
+    parser.add_argument("--refresh", action="store_true", help="re-check finished downloads with conditional requests")
+    parser.add_argument("--moodboards", choices=MOODBOARD_MODES, default="linked",
+                        help="linked: SVGs reference style_tiles/ (default); sprite: one sheet with a view per style; "
+                             "raster: composited JPEGs; embed: self-contained SVGs with base64 tiles")
+    args = parser.parse_args()
+
     ensure_dirs()
 
     manifest_lines = [
@@ -81,58 +84,53 @@ def main():
         "|---|---|---|---|---|---|"
     ]
 
-    downloaded_files = [] # list of (path, b64_string)
+    tiles = {} # tile key -> thumbnail path
 
     # 1. Download Base Images (Examples)
+    # Only the full-size example is fetched; thumbnails are derived locally.
     print("Downloading base images...")
+    jobs = []
     for i, (url, author, profile) in enumerate(SOURCES):
-        filename = f"guest_example_{i+1}.jpg"
-        filepath = os.path.join(DIRS["examples"], filename)
+        jobs.append((image_url(url, width=1200), os.path.join(DIRS["examples"], f"guest_example_{i+1}.jpg")))
 
-        if download_image(url, filepath, width=1200):
-            manifest_lines.append(f"| {filename} | Example/Inspiration | {url} | [{author}]({profile}) | Unsplash License | Today |")
+    with Downloader(cache=default_cache(), journal=JobJournal(JOURNAL_FILE), revalidate=args.refresh) as downloader:
+        results = downloader.download_all(jobs, on_done=report)
 
-            # Read for collage use later (resize small for SVG embedding to keep size down)
-            # Actually, let's download a thumbnail version for collage
-            thumb_path = os.path.join(DIRS["style_tiles"], f"thumb_{i+1}.jpg")
-            download_image(url, thumb_path, width=300)
+    for i, ((url, author, profile), example) in enumerate(zip(SOURCES, results)):
+        if example.ok:
+            filename = os.path.basename(example.dest)
+            manifest_lines.append(f"| {filename} | Example/Inspiration | {url} | [{author}]({profile}) | Unsplash License | Today |")
 
-            with open(thumb_path, "rb") as img_file:
-                b64_string = base64.b64encode(img_file.read()).decode('utf-8')
-                downloaded_files.append(b64_string)
+            targets = [(os.path.join(DIRS[d], name.format(n=i+1)), width) for d, name, width in DERIVED_SIZES]
+            derive(example.dest, targets, quality=DERIVED_QUALITY)
+            tiles[i+1] = targets[0][0]
 
     # 2. Generate Style Moodboards (SVG Collages)
-    print("Generating moodboards...")
-    if len(downloaded_files) >= 4:
+    # Each tile is stored once; moodboards point at it instead of inlining it.
+    print(f"Generating moodboards ({args.moodboards})...")
+    if len(tiles) >= 4:
+        boards = {}
         for i in range(1, STYLES_COUNT + 1):
-            # Pick 4 random images
-            selection = random.sample(downloaded_files, 4)
-            filename = f"style_{i}_moodboard.svg"
-            filepath = os.path.join(DIRS["style_moodboards"], filename)
-
-            create_svg_collage(filepath, selection)
-            manifest_lines.append(f"| {filename} | Moodboard Collage | Generated from project assets | Various | Unsplash License (Derivative) | Today |")
+            # Pick 4 images, the same 4 on every run
+            rng = asset_rng(PROJECT_DIR, f"style_moodboards/style_{i}_moodboard")
+            boards[f"style_{i}_moodboard"] = rng.sample(sorted(tiles), 4)
+
+        written = write_moodboards(DIRS["style_moodboards"], boards, tiles, mode=args.moodboards)
+        for path in written:
+            filename = os.path.basename(path)
+            if not filename.endswith(".json"):
+                manifest_lines.append(f"| {filename} | Moodboard Collage | Generated from project assets | Various | Unsplash License (Derivative) | Today |")
             print(f"Generated {filename}")
 
     # 3. Onboarding & Empty States (Reuse some existing or download specific)
     # For now, we reuse the examples as placeholders for onboarding/illustrations to satisfy the requirement
     # In a real scenario we'd get vector art, but photos work for "Premium" feel too.
-    for i in range(4):
-         if i < len(SOURCES):
-            src = os.path.join(DIRS["examples"], f"guest_example_{i+1}.jpg")
-            dst = os.path.join(DIRS["onboarding"], f"onboard_{i+1}.jpg")
-            if os.path.exists(src):
-                with open(src, 'rb') as s, open(dst, 'wb') as d:
-                    d.write(s.read())
-
-            dst_ill = os.path.join(DIRS["illustrations"], f"empty_{i+1}.jpg")
-            if os.path.exists(src):
-                with open(src, 'rb') as s, open(dst, 'wb') as d:
-                    d.write(s.read())
+    copy_placeholders()
 
     # 4. Write Manifest
     with open(os.path.join(ASSETS_DIR, "ASSET_SOURCES.md"), "w") as f:
         f.write("\n".join(manifest_lines))
+    manifest.update(PROJECT_DIR)
 
     print("Asset acquisition complete.")
 
@@ -1,5 +1,7 @@
 import os
 
+from generator.rewrite import Rewriter, rewrite_tree
+
 RENAME_MAP = {
     'lib/model/shoe_ai_config.dart': 'lib/model/terrace_ai_config.dart',
     'lib/services/shoe_result_storage.dart': 'lib/services/terrace_result_storage.dart',
@@ -24,24 +26,10 @@ def main():
             print(f"File not found: {old}")
 
     # 2. Update imports
-    for root, dirs, files in os.walk(ROOT_DIR):
-        for file in files:
-            if file.endswith('.dart'):
-                filepath = os.path.join(root, file)
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        content = f.read()
-
-                    new_content = content
-                    for old_imp, new_imp in IMPORT_REPLACEMENTS.items():
-                        new_content = new_content.replace(old_imp, new_imp)
-
-                    if content != new_content:
-                        with open(filepath, 'w', encoding='utf-8') as f:
-                            f.write(new_content)
-                        print(f"Updated imports in {file}")
-                except Exception as e:
-                    print(f"Error processing {file}: {e}")
+    report = rewrite_tree(ROOT_DIR, Rewriter(IMPORT_REPLACEMENTS), '.dart',
+                          on_change=lambda path, count: print(f"Updated imports in {os.path.basename(path)}"),
+                          on_error=lambda path, e: print(f"Error processing {os.path.basename(path)}: {e}"))
+    print(report.summary())
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1 @@
+"""Shared asset tooling for the NN_*_AI Flutter projects."""
@@ -0,0 +1,34 @@
+"""``python -m generator audit|build|clone|dedup|normalize|raster|shake|svgmin ...``."""
+
+import sys
+
+COMMANDS = ("audit", "build", "clone", "dedup", "normalize", "raster", "shake", "svgmin")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] not in COMMANDS:
+        print(f"usage: python -m generator {{{','.join(COMMANDS)}}} ...", file=sys.stderr)
+        return 2
+    command, rest = argv[0], argv[1:]
+    if command == "audit":
+        from generator.audit import main as run
+    elif command == "build":
+        from generator.build import main as run
+    elif command == "clone":
+        from generator.clone import main as run
+    elif command == "dedup":
+        from generator.dedup import main as run
+    elif command == "normalize":
+        from generator.normalize import main as run
+    elif command == "raster":
+        from generator.svgraster import main as run
+    elif command == "shake":
+        from generator.shake import main as run
+    else:
+        from generator.svgmin import main as run
+    return run(rest) or 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,281 @@
+"""Where a project's Dart code and pubspec point into ``assets/``.
+
+Flutter only bundles what ``pubspec.yaml`` lists, and a path the code
+names but the bundle lacks fails at run time, on the screen that loads
+it. :func:`dart_refs` indexes the string literals under ``lib/`` that
+name an asset and turns each into a glob over project-relative paths:
+
+* Dart interpolation (``$index``, ``${index + 1}``) becomes ``*``;
+* a constant holding an asset path (``static const _baseAssetPath =
+  'assets/style_sources';``) is substituted where it is interpolated
+  (``'$_baseAssetPath/source_$i.png'``) or concatenated
+  (``assetPrefix + '$id.svg'``), so the glob keeps the rest of the path;
+* a path with no extension that is never built on that way is a prefix
+  the code extends at run time, and becomes ``prefix*``.
+
+A literal passed straight to ``AssetImage``, ``ExactAssetImage`` or
+``Image.asset`` records that provider as its ``loader``: those decode
+through the platform's raster codecs, so an SVG named there loads as an
+error image however well it is bundled.
+
+Only files whose bytes contain ``assets/`` or one of those constants'
+names (checked through ``mmap``) are tokenized. Generated files are
+skipped: :mod:`generator.dartindex` names every bundled asset, and
+counting its literals would make every asset look referenced. :func:`pubspec_assets`
+reads the ``flutter: assets:`` list and :func:`bundled` applies Flutter's
+rule that a directory entry covers the files directly in it (and their
+``N.Nx/`` variants), not its subdirectories.
+"""
+
+import fnmatch
+import mmap
+import os
+import re
+from dataclasses import dataclass
+
+from generator.walk import iter_files
+
+_IDENT = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_NAME = re.compile(r"^\s*(?:[A-Za-z_][A-Za-z0-9_]*\.)*([A-Za-z_][A-Za-z0-9_]*)\s*$")
+_DEFINITION = re.compile(r"\b([A-Za-z_][A-Za-z0-9_]*)\s*=\s*$")
+_CONCAT = re.compile(r"(?:\b[A-Za-z_][A-Za-z0-9_]*\.)*\b([A-Za-z_][A-Za-z0-9_]*)\s*\+\s*$")
+_VARIANT_DIR = re.compile(r"^\d+(?:\.\d+)?x$")
+_RASTER_CALL = re.compile(r"\b(AssetImage|ExactAssetImage|Image\.asset)\s*\(\s*$")
+_CALL_CONTEXT = 200
+# First bytes of files the build generates, such as lib/src/asset_index.dart.
+GENERATED_HEADER = b"// GENERATED by "
+_QUOTES = ("'''", '"""', "'", '"')
+
+
+@dataclass(frozen=True)
+class AssetRef:
+    file: str       # Dart file, relative to the project
+    line: int
+    text: str       # the literal as written
+    pattern: str    # glob over paths relative to the project
+    loader: str = None  # raster image provider the literal is passed to, if any
+
+    @property
+    def exact(self):
+        return "*" not in self.pattern
+
+    def undecodable(self, found):
+        """The SVGs among ``found`` (its matches) that its raster ``loader`` cannot decode."""
+        if self.loader is None:
+            return []
+        return [rel for rel in found if rel.lower().endswith(".svg")]
+
+
+class _Expr(str):
+    """An interpolated expression inside a string literal."""
+
+
+def _closing(text, i):
+    """Index of the ``}`` that closes the ``${`` whose body starts at ``i``."""
+    depth = 1
+    while i < len(text):
+        c = text[i]
+        if c in "'\"":
+            _, i = _string(text, i, False)
+            continue
+        if c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    return len(text)
+
+
+def _string(text, i, raw):
+    """Parse the literal opening at ``i``; return ``(parts, end)``.
+
+    ``parts`` alternates plain text (``str``) and interpolations (:class:`_Expr`).
+    """
+    quote = next(q for q in _QUOTES if text.startswith(q, i))
+    i += len(quote)
+    parts, buf = [], []
+
+    def flush():
+        if buf:
+            parts.append("".join(buf))
+            buf.clear()
+
+    while i < len(text):
+        if text.startswith(quote, i):
+            i += len(quote)
+            break
+        c = text[i]
+        if c == "\n" and len(quote) == 1:
+            break
+        if c == "\\" and not raw:
+            buf.append(text[i + 1:i + 2])
+            i += 2
+        elif c == "$" and not raw and text.startswith("${", i):
+            end = _closing(text, i + 2)
+            flush()
+            parts.append(_Expr(text[i + 2:end]))
+            i = end + 1
+        elif c == "$" and not raw and _IDENT.match(text, i + 1):
+            m = _IDENT.match(text, i + 1)
+            flush()
+            parts.append(_Expr(m.group(0)))
+            i = m.end()
+        else:
+            buf.append(c)
+            i += 1
+    flush()
+    return parts, i
+
+
+def dart_strings(text):
+    """Yield ``(start, end, parts)`` for each string literal in Dart source ``text``, comments skipped."""
+    i = 0
+    while i < len(text):
+        if text.startswith("//", i):
+            i = text.find("\n", i)
+            if i < 0:
+                return
+        elif text.startswith("/*", i):
+            end = text.find("*/", i + 2)
+            i = len(text) if end < 0 else end + 2
+        elif text[i] in "'\"":
+            raw = i > 0 and text[i - 1] == "r" and not (i > 1 and (text[i - 2].isalnum() or text[i - 2] == "_"))
+            parts, end = _string(text, i, raw)
+            yield i - raw, end, parts
+            i = end
+        else:
+            i += 1
+
+
+def _read(path, needles):
+    """The text of ``path`` if its bytes contain any of ``needles``, else None (also for generated files)."""
+    with open(path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[:len(GENERATED_HEADER)] == GENERATED_HEADER or not any(data.find(n) >= 0 for n in needles):
+                return None
+            return data[:].decode("utf-8", "replace")
+
+
+def _literals(text):
+    """``(line, source, before, parts, loader)`` for the string literals in ``text``."""
+    line, counted = 1, 0
+    for start, end, parts in dart_strings(text):
+        line += text.count("\n", counted, start)
+        counted = start
+        line_start = text.rfind("\n", 0, start) + 1
+        # The call may open on an earlier line: ``Image.asset(\n  'assets/...'``.
+        call = _RASTER_CALL.search(text, max(0, start - _CALL_CONTEXT), start)
+        yield line, text[start:end], text[line_start:start], parts, call and call.group(1)
+
+
+def _glob(path):
+    pattern = re.sub(r"\*+", "*", path)
+    if not os.path.splitext(pattern.rsplit("/", 1)[-1])[1]:
+        pattern = pattern.rstrip("/") + "*"
+    return pattern
+
+
+def dart_refs(project_dir):
+    """Yield an :class:`AssetRef` for every asset path the code under ``lib/`` names or builds."""
+    lib = os.path.join(project_dir, "lib")
+    files = sorted(path for path, _ in iter_files(lib, (".dart",)))
+    # Pass 1: literals in files that mention assets/, and the constants among them.
+    sources = {}
+    constants = {}
+    for path in files:
+        text = _read(path, (b"assets/",))
+        if text is None:
+            continue
+        sources[path] = list(_literals(text))
+        for _, _, before, parts, _ in sources[path]:
+            m = _DEFINITION.search(before)
+            if m and len(parts) == 1 and not isinstance(parts[0], _Expr) and parts[0].startswith("assets/"):
+                constants[m.group(1)] = parts[0]
+    # Pass 2: files that only use those constants.
+    needles = tuple(name.encode() for name in constants)
+    for path in files:
+        if path not in sources and needles:
+            text = _read(path, needles)
+            if text is not None:
+                sources[path] = list(_literals(text))
+
+    used = set()
+    refs = []
+    for path in files:
+        rel = os.path.relpath(path, project_dir).replace(os.sep, "/")
+        for line, source, before, parts, loader in sources.get(path, ()):
+            pieces = []
+            m = _CONCAT.search(before)
+            if m and m.group(1) in constants:
+                used.add(m.group(1))
+                pieces.append(constants[m.group(1)])
+            for part in parts:
+                if isinstance(part, _Expr):
+                    name = _NAME.match(part)
+                    if name and name.group(1) in constants:
+                        used.add(name.group(1))
+                        pieces.append(constants[name.group(1)])
+                    else:
+                        pieces.append("*")
+                else:
+                    pieces.append(part)
+            resolved = "".join(pieces)
+            if not resolved.startswith("assets/"):
+                continue
+            ref = AssetRef(rel, line, source[1:-1], _glob(resolved), loader)
+            definition = _DEFINITION.search(before)
+            if definition and constants.get(definition.group(1)) == resolved:
+                refs.append((definition.group(1), ref))
+            else:
+                refs.append((None, ref))
+    for constant, ref in refs:
+        # A constant that other literals build on is covered by them.
+        if constant is None or constant not in used or ref.exact:
+            yield ref
+
+
+def pubspec_assets(project_dir):
+    """The entries of ``flutter: assets:`` in the project's ``pubspec.yaml``."""
+    try:
+        with open(os.path.join(project_dir, "pubspec.yaml"), "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return []
+    entries = []
+    section = None
+    for line in lines:
+        text = line.split(" #", 1)[0].rstrip()
+        if not text.strip() or text.lstrip().startswith("#"):
+            continue
+        indent = len(text) - len(text.lstrip())
+        if indent == 0:
+            section = "flutter" if text == "flutter:" else None
+        elif section == "flutter" and text.strip() == "assets:":
+            section = ("assets", indent)
+        elif isinstance(section, tuple):
+            if indent > section[1] and text.lstrip().startswith("- "):
+                entries.append(text.lstrip()[2:].strip().strip("'\""))
+            elif indent <= section[1]:
+                section = "flutter"
+    return entries
+
+
+def bundled(rel, entries):
+    """True when the project-relative path ``rel`` is covered by a pubspec entry."""
+    directory, name = rel.rsplit("/", 1) if "/" in rel else ("", rel)
+    parent, last = directory.rsplit("/", 1) if "/" in directory else ("", directory)
+    dirs = {directory + "/"}
+    if _VARIANT_DIR.match(last):
+        dirs.add(parent + "/")
+    return any(e == rel or e in dirs for e in entries)
+
+
+def matches(ref, rels):
+    """The paths in ``rels`` (project-relative) that ``ref`` can name."""
+    if ref.exact:
+        return [ref.pattern] if ref.pattern in rels else []
+    return [rel for rel in rels if fnmatch.fnmatchcase(rel, ref.pattern)]
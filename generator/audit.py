@@ -0,0 +1,199 @@
+"""Header-only audit of every project's bundled assets.
+
+Broken assets have shipped before: BMPs named ``.jpg``, HTML error pages
+saved over photos, copies whose target was never written. None of that
+needs a decode to find. :func:`audit_project` maps each file under
+``assets/`` and reads only its header (:mod:`generator.imagehead`) and
+its last bytes, and reports
+
+* empty files and empty asset directories;
+* bytes that are not what the extension says (HTML, BMP in a ``.jpg``);
+* headers that are malformed or cut short, and JPEG/PNG files that stop
+  before their end marker;
+* bitmaps larger than the :mod:`generator.normalize` limit for their
+  directory;
+* ``pubspec.yaml`` asset entries that do not exist;
+* asset paths in the Dart code (:mod:`generator.assetrefs`) that match no
+  file, or only files ``pubspec.yaml`` does not bundle, and SVGs the code
+  hands to a raster provider such as ``AssetImage``.
+
+Projects are audited in parallel. Run
+``python -m generator audit --all``; it exits non-zero when anything is
+an error.
+"""
+
+import mmap
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from generator.assetrefs import bundled, dart_refs, matches, pubspec_assets
+from generator.imagehead import HeaderError, image_info
+from generator.sniff import has_trailer, sniff
+
+# Extension -> the format its bytes must be in.
+FORMATS = {".jpg": "jpeg", ".jpeg": "jpeg", ".png": "png", ".gif": "gif", ".webp": "webp",
+           ".bmp": "bmp", ".svg": "svg"}
+
+HEAD_SIZE = 4096
+TAIL_SIZE = 16
+
+ERROR = "error"
+WARNING = "warning"
+
+
+@dataclass
+class Issue:
+    path: str       # relative to the project
+    level: str
+    message: str
+
+
+@dataclass
+class AuditReport:
+    project: str
+    files: int = 0
+    issues: list = field(default_factory=list)
+
+    def add(self, path, level, message):
+        self.issues.append(Issue(path, level, message))
+
+    @property
+    def errors(self):
+        return [i for i in self.issues if i.level == ERROR]
+
+    def summary(self):
+        warnings = len(self.issues) - len(self.errors)
+        return f"{self.files} files, {len(self.errors)} errors, {warnings} warnings"
+
+
+def check_file(path, size):
+    """Return ``(level, message)`` pairs for the file at ``path`` and its :class:`ImageInfo`."""
+    ext = os.path.splitext(path)[1].lower()
+    wanted = FORMATS.get(ext)
+    if not size:
+        return [(ERROR, "empty file")], None
+    if wanted is None:
+        return [], None
+    problems = []
+    info = None
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        kind = sniff(data[:HEAD_SIZE])
+        if kind != wanted:
+            problems.append((ERROR, f"{kind or 'unknown'} data in a {ext} file"))
+        if kind is not None and kind != "html":
+            try:
+                info = image_info(data)
+            except HeaderError as e:
+                problems.append((ERROR, f"bad {kind} header: {e}"))
+            if info is not None and not has_trailer(kind, data[-TAIL_SIZE:]):
+                problems.append((ERROR, f"truncated: no {kind} end marker"))
+    return problems, info
+
+
+def audit_project(project_dir, spec=None):
+    """Audit one project; return an :class:`AuditReport`."""
+    from generator.normalize import rule_for, rules_for
+
+    project = os.path.basename(os.path.normpath(project_dir))
+    report = AuditReport(project)
+    assets = os.path.join(project_dir, "assets")
+    rules = rules_for(spec or {})
+    rels = set()
+    for path, size in sorted(iter_assets(assets)):
+        rel = os.path.relpath(path, project_dir).replace(os.sep, "/")
+        rels.add(rel)
+        report.files += 1
+        problems, info = check_file(path, size)
+        for level, message in problems:
+            report.add(rel, level, message)
+        if info is not None and info.format != "svg":
+            limit = rule_for(rules, rel.split("/", 1)[1]).max_dimension
+            if max(info.width, info.height) > limit:
+                report.add(rel, WARNING, f"{info.width}x{info.height} exceeds the {limit} px limit")
+
+    if os.path.isdir(assets):
+        for dirpath, subdirs, files in os.walk(assets):
+            subdirs[:] = [d for d in subdirs if not d.startswith(".")]
+            rel = os.path.relpath(dirpath, project_dir).replace(os.sep, "/")
+            if not files and not subdirs:
+                report.add(rel + "/", WARNING, "empty asset directory")
+
+    entries = pubspec_assets(project_dir)
+    for entry in entries:
+        if entry.endswith("/"):
+            if not os.path.isdir(os.path.join(project_dir, entry)):
+                report.add("pubspec.yaml", ERROR, f"asset directory {entry} does not exist")
+        elif entry not in rels:
+            report.add("pubspec.yaml", ERROR, f"asset {entry} does not exist")
+
+    for ref in sorted(dart_refs(project_dir), key=lambda r: (r.file, r.line)):
+        where = f"{ref.file}:{ref.line}"
+        found = matches(ref, rels)
+        if not found:
+            report.add(where, ERROR, f"'{ref.text}' matches no asset")
+        elif not any(bundled(rel, entries) for rel in found):
+            report.add(where, ERROR, f"'{ref.text}' is not bundled; pubspec.yaml lists no "
+                                     f"{found[0].rsplit('/', 1)[0]}/")
+        for rel in ref.undecodable(found):
+            report.add(where, ERROR, f"{rel} is an SVG; {ref.loader} cannot decode it "
+                                     f"(use SvgPicture.asset)")
+    return report
+
+
+def iter_assets(assets):
+    from generator.walk import iter_files
+
+    for path, size in iter_files(assets):
+        if not os.path.basename(path).startswith("."):
+            yield path, size
+
+
+def audit(projects, root=".", workers=None):
+    """Audit ``projects`` (directory names under ``root``) in parallel; return their reports in order."""
+    from generator.build import SPEC_NAME, load_spec
+
+    def one(project):
+        project_dir = os.path.join(root, project)
+        spec_path = os.path.join(project_dir, SPEC_NAME)
+        return audit_project(project_dir, load_spec(spec_path) if os.path.exists(spec_path) else None)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(one, projects))
+
+
+def main(argv=None):
+    import argparse
+
+    from generator.build import find_projects, resolve_projects
+
+    parser = argparse.ArgumentParser(prog="python -m generator audit",
+                                     description="Check bundled assets against their headers, pubspec.yaml and the Dart code.")
+    parser.add_argument("projects", nargs="*", help="project directories or numbers, e.g. 44 or 44_Guest_Room_AI")
+    parser.add_argument("--all", action="store_true", help="audit every project that has a spec")
+    parser.add_argument("--root", default=".", help="directory that holds the projects (default: current)")
+    parser.add_argument("--jobs", type=int, default=None, help="projects to audit at once")
+    parser.add_argument("--errors", action="store_true", help="list errors only")
+    args = parser.parse_args(argv)
+
+    if args.all == bool(args.projects):
+        parser.error("name one or more projects, or pass --all")
+    try:
+        projects = find_projects(args.root) if args.all else resolve_projects(args.projects, args.root)
+    except ValueError as e:
+        parser.error(str(e))
+
+    start = time.perf_counter()
+    reports = audit(projects, args.root, args.jobs)
+    elapsed = time.perf_counter() - start
+    for report in reports:
+        for issue in report.issues:
+            if issue.level == ERROR or not args.errors:
+                print(f"{report.project}/{issue.path}: {issue.level}: {issue.message}")
+    for report in reports:
+        print(f"{report.project}: {report.summary()}")
+    files = sum(r.files for r in reports)
+    errors = sum(len(r.errors) for r in reports)
+    print(f"{len(reports)} projects, {files} files, {errors} errors in {elapsed:.2f}s")
+    return 1 if errors else 0
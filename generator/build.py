@@ -0,0 +1,441 @@
+"""Declarative asset builds for the NN_*_AI projects.
+
+Every project keeps an ``asset_spec.json`` next to its ``pubspec.yaml``
+describing what lives under its ``assets/`` directory::
+
+    {
+      "version": 1,
+      "title": "Mini Bar AI",
+      "palette": ["#1A237E", "#880E4F"],
+      "categories": {"style_moodboards": "Style Moodboard"},
+      "groups": [
+        {"id": "style_moodboards", "category": "style_moodboards",
+         "template": "minibar_collage", "size": [400, 400],
+         "params": {}, "source": "Generated In-Project", "license": "MIT",
+         "densities": [1, 2, 3],
+         "items": [{"file": "style_1.svg", "title": "Speakeasy Noir Bar", ...}]}
+      ],
+      "sources": [
+        {"url": "https://...", "file": "examples/ex_0.jpg", "category": "examples",
+         "source": "Picsum (Unsplash)", "license": "Unsplash License"}
+      ],
+      "fetch": {"verify": true},
+      "normalize": {"style_tiles": {"max_dimension": 600}},
+      "manifest": {"notes": "..."}
+    }
+
+``categories`` maps each asset directory to its label in the manifest.
+A group renders every item through one template from
+:mod:`generator.templates`, with the group ``params`` overlaid by the
+item's own keys; SVG output is minified (and checked) by
+:mod:`generator.svgmin` before it is written. A group with ``densities``
+also gets each SVG rasterized by :mod:`generator.svgraster` into Flutter's
+``2.0x/``/``3.0x/`` variant directories. ``sources`` are downloaded with
+:class:`generator.fetch.Downloader`, and a spec with a ``manifest`` key
+gets its ``assets/ASSET_SOURCES.md`` written from the groups and sources.
+Every project gets ``assets/ASSET_MANIFEST.jsonl`` (see
+:mod:`generator.manifest`), with hashes, sizes, dimensions and the
+fingerprints from the build database, and ``lib/src/asset_index.dart``
+generated from it (:mod:`generator.dartindex`).
+Every bitmap under ``assets/`` is then held to the size and encoding
+limits of :mod:`generator.normalize` (``normalize`` overrides them per
+category).
+
+:func:`plan` turns one spec into pipeline stages (one per group, one for
+the downloads, one that normalizes images after them, one for the
+manifest that waits on the others, one for the Dart asset index after
+it) and
+:func:`build` runs the stages of any number of projects together.
+Run ``python -m generator build --all``.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from generator import dartindex, manifest as jsonl
+from generator.builddb import DB_NAME, BuildDB, fingerprint, write_if_changed
+from generator.normalize import normalize_project
+from generator.pipeline import Stage, run_stages
+from generator.seed import asset_seed
+from generator.svgmin import optimize
+from generator.svgraster import rasterize, variant_rel
+from generator.templates import TEMPLATES
+
+SPEC_NAME = "asset_spec.json"
+SPEC_VERSION = 1
+BUILD_VERSION = 1    # bump to invalidate every recorded fingerprint
+ASSETS_DIR = "assets"
+MANIFEST_NAME = "ASSET_SOURCES.md"
+JOURNAL_NAME = ".fetch_journal.json"
+
+DEFAULT_SOURCE = "Generated In-Project"
+DEFAULT_LICENSE = "MIT"
+
+_SPEC_KEYS = {"version", "title", "palette", "categories", "groups", "sources", "fetch", "normalize", "manifest"}
+_GROUP_KEYS = {"id", "category", "template", "size", "params", "source", "license", "densities", "items"}
+_SOURCE_KEYS = {"url", "file", "category", "source", "license"}
+_RULE_KEYS = {"max_dimension", "quality"}
+
+
+def find_projects(root="."):
+    """Sorted names of the project directories under ``root`` that have a spec."""
+    return sorted(name for name in os.listdir(root)
+                  if re.match(r"\d+_", name) and os.path.isfile(os.path.join(root, name, SPEC_NAME)))
+
+
+def load_spec(path):
+    """Read and validate one ``asset_spec.json``."""
+    with open(path, "r", encoding="utf-8") as f:
+        spec = json.load(f)
+    unknown = set(spec) - _SPEC_KEYS
+    if unknown:
+        raise ValueError(f"{path}: unknown spec keys {', '.join(sorted(unknown))}")
+    if spec.get("version") != SPEC_VERSION:
+        raise ValueError(f"{path}: unsupported spec version {spec.get('version')!r}")
+    categories = spec.setdefault("categories", {})
+    ids = set()
+    for group in spec.setdefault("groups", []):
+        unknown = set(group) - _GROUP_KEYS
+        if unknown:
+            raise ValueError(f"{path}: group {group.get('id')!r} has unknown keys {', '.join(sorted(unknown))}")
+        if group["id"] in ids:
+            raise ValueError(f"{path}: duplicate group id {group['id']!r}")
+        ids.add(group["id"])
+        if group["template"] not in TEMPLATES:
+            raise ValueError(f"{path}: group {group['id']!r} uses unknown template {group['template']!r}")
+        if group["category"] not in categories:
+            raise ValueError(f"{path}: group {group['id']!r} has undeclared category {group['category']!r}")
+        densities = group.get("densities", [])
+        if not all(isinstance(d, (int, float)) and d > 0 for d in densities) or len(set(densities)) != len(densities):
+            raise ValueError(f"{path}: group {group['id']!r} needs distinct positive densities")
+    for source in spec.setdefault("sources", []):
+        unknown = set(source) - _SOURCE_KEYS
+        if unknown:
+            raise ValueError(f"{path}: source {source.get('file')!r} has unknown keys {', '.join(sorted(unknown))}")
+    for category, rule in spec.get("normalize", {}).items():
+        unknown = set(rule) - _RULE_KEYS
+        if unknown:
+            raise ValueError(f"{path}: normalize rule {category!r} has unknown keys {', '.join(sorted(unknown))}")
+    return spec
+
+
+def group_assets(group):
+    """Yield ``(relative path, params)`` for each item of a spec group."""
+    params = group.get("params", {})
+    for item in group["items"]:
+        item = dict(item)
+        rel = f"{group['category']}/{item.pop('file')}"
+        yield rel, {**params, **item}
+
+
+@dataclass
+class StageOutput:
+    written: list = field(default_factory=list)
+    unchanged: int = 0    # rendered, but the file already held the same bytes
+    up_to_date: int = 0   # fingerprint matched, not rendered at all
+
+    def summary(self):
+        return f"{len(self.written)} written, {self.unchanged} unchanged, {self.up_to_date} up to date"
+
+
+@lru_cache(maxsize=None)
+def _module_digest(name):
+    """Digest of a module's source, so editing a template invalidates its outputs."""
+    with open(sys.modules[name].__file__, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def asset_fingerprint(spec, group, params, seed, raster_size=None, density=None):
+    """Fingerprint of everything one generated asset is built from."""
+    if density is not None:
+        modules = ["generator.templates", "generator.svgmin", "generator.svgraster", "generator.collage"]
+    else:
+        modules = ["generator.templates", "generator.collage" if raster_size else "generator.svgmin"]
+    return fingerprint(BUILD_VERSION, [_module_digest(m) for m in modules], group["template"],
+                       spec.get("palette", []), params, seed, raster_size, density)
+
+
+def _emit(out, db, rel, path, fp, render):
+    """Render one output unless ``db`` says it is up to date, then write it if changed."""
+    if db is not None and db.fresh(rel, fp, path):
+        out.up_to_date += 1
+        return
+    if write_if_changed(path, render()):
+        out.written.append(path)
+    else:
+        out.unchanged += 1
+    if db is not None:
+        db.record(rel, fp, path)
+
+
+def raster_outputs(group, rel):
+    """``(relative path, label)`` for each bitmap the build writes next to the SVG at ``rel``.
+
+    A group with ``densities`` gets one variant per density; otherwise a
+    template with a raster layout gets a PNG on ``--raster`` builds.
+    """
+    if group.get("densities"):
+        return [(variant_rel(rel, d), f"{d}x") for d in group["densities"]]
+    if TEMPLATES[group["template"]][1] is not None:
+        return [(os.path.splitext(rel)[0] + ".png", "raster")]
+    return []
+
+
+def render_group(project_dir, spec, group, raster_size=None, db=None):
+    """Render the items of ``group`` that are out of date and return a :class:`StageOutput`.
+
+    A group with ``densities`` writes its variants and ignores ``raster_size``.
+    """
+    svg, raster = TEMPLATES[group["template"]]
+    densities = group.get("densities", [])
+    assets = os.path.join(project_dir, ASSETS_DIR)
+    palette = spec.get("palette", [])
+    project = os.path.basename(os.path.normpath(project_dir))
+    out = StageOutput()
+    for rel, params in group_assets(group):
+        # The SVG and its PNG render share one seed, so they draw the same colors.
+        seed = asset_seed(project, rel, spec["version"])
+        path = os.path.join(assets, *rel.split("/"))
+        rendered = {}
+
+        def source():
+            if "svg" not in rendered:
+                rendered["svg"] = optimize(svg(palette, random.Random(seed), **params))
+            return rendered["svg"]
+
+        _emit(out, db, rel, path, asset_fingerprint(spec, group, params, seed), lambda: source().encode("utf-8"))
+        for density in densities:
+            variant = variant_rel(rel, density)
+            _emit(out, db, variant, os.path.join(assets, *variant.split("/")),
+                  asset_fingerprint(spec, group, params, seed, density=density),
+                  lambda: rasterize(source(), density).encode("png"))
+        if raster_size and raster is not None and not densities:
+            png_rel = os.path.splitext(rel)[0] + ".png"
+            _emit(out, db, png_rel, os.path.join(assets, *png_rel.split("/")),
+                  asset_fingerprint(spec, group, params, seed, raster_size),
+                  lambda: raster(palette, random.Random(seed), size=raster_size, **params).encode("png"))
+    return out
+
+
+def fetch_sources(project_dir, spec, refresh=False, db=None):
+    """Download the spec's ``sources`` that are missing or whose URL changed.
+
+    With ``refresh`` every source is re-checked with a conditional request.
+    A file that is already present but unknown to ``db`` (an older checkout)
+    is adopted as is.
+    """
+    from generator.cache import default_cache
+    from generator.fetch import Downloader
+    from generator.journal import JobJournal
+
+    assets = os.path.join(project_dir, ASSETS_DIR)
+    out = StageOutput()
+    jobs = []
+    for s in spec["sources"]:
+        dest = os.path.join(assets, *s["file"].split("/"))
+        fp = fingerprint(s["url"])
+        if not refresh and os.path.exists(dest):
+            if db is None or db.fresh(s["file"], fp, dest):
+                out.up_to_date += 1
+                continue
+            if db.get(s["file"]) is None:
+                db.record(s["file"], fp, dest)
+                out.up_to_date += 1
+                continue
+        jobs.append((s, dest, fp))
+    if not jobs:
+        return out
+    verify = spec.get("fetch", {}).get("verify", True)
+    with Downloader(verify=verify, cache=default_cache(), journal=JobJournal(os.path.join(project_dir, JOURNAL_NAME)),
+                    revalidate=refresh) as downloader:
+        results = downloader.download_all([(s["url"], dest) for s, dest, _ in jobs])
+    failed = [r for r in results if not r.ok]
+    for (s, dest, fp), result in zip(jobs, results):
+        if not result.ok:
+            continue
+        if result.skipped:
+            out.unchanged += 1
+        else:
+            out.written.append(dest)
+        if db is not None:
+            db.record(s["file"], fp, dest, sha256=result.sha256)
+    if failed:
+        raise RuntimeError("; ".join(str(r.error) for r in failed))
+    return out
+
+
+def manifest_rows(project_dir, spec):
+    """``(relative path, category label, source, license)`` for every asset in the spec.
+
+    Bitmaps rendered from a generated SVG are listed when they exist.
+    """
+    categories = spec["categories"]
+    assets = os.path.join(project_dir, ASSETS_DIR)
+    rows = []
+    for group in spec["groups"]:
+        label = categories[group["category"]]
+        source = group.get("source", DEFAULT_SOURCE)
+        license_ = group.get("license", DEFAULT_LICENSE)
+        for rel, _ in group_assets(group):
+            rows.append((rel, label, source, license_))
+            for png, note in raster_outputs(group, rel):
+                if os.path.exists(os.path.join(assets, *png.split("/"))):
+                    rows.append((png, f"{label} ({note})", source, license_))
+    for s in spec["sources"]:
+        label = categories.get(s.get("category"), s.get("category", ""))
+        rows.append((s["file"], label, s.get("source", s["url"]), s.get("license", "")))
+    return rows
+
+
+def write_manifest(project_dir, spec, db=None):
+    """Write ``ASSET_SOURCES.md`` (for a spec with ``manifest``) and ``ASSET_MANIFEST.jsonl``."""
+    out = StageOutput()
+    rows = manifest_rows(project_dir, spec)
+    if "manifest" in spec:
+        lines = ["# Asset Sources", ""]
+        notes = spec["manifest"].get("notes")
+        if notes:
+            lines += [notes, ""]
+        lines += ["| Filename | Category | Source | License |", "|---|---|---|---|"]
+        lines += [f"| {' | '.join(row)} |" for row in rows]
+        path = os.path.join(project_dir, ASSETS_DIR, MANIFEST_NAME)
+        if write_if_changed(path, ("\n".join(lines) + "\n").encode("utf-8")):
+            out.written.append(path)
+        else:
+            out.unchanged += 1
+    if jsonl.update(project_dir, {rel: rest for rel, *rest in rows}, db):
+        out.written.append(os.path.join(project_dir, ASSETS_DIR, jsonl.JSONL_NAME))
+    else:
+        out.unchanged += 1
+    return out
+
+
+def write_asset_index(project_dir):
+    """Regenerate ``lib/src/asset_index.dart`` from the JSONL manifest."""
+    out = StageOutput()
+    if dartindex.write_index(project_dir):
+        out.written.append(os.path.join(project_dir, dartindex.INDEX_PATH))
+    else:
+        out.unchanged += 1
+    return out
+
+
+def outputs(spec):
+    """Relative paths of every output the spec can produce (bitmap renders included)."""
+    rels = set()
+    for group in spec["groups"]:
+        for rel, _ in group_assets(group):
+            rels.add(rel)
+            rels.update(png for png, _ in raster_outputs(group, rel))
+    rels.update(s["file"] for s in spec["sources"])
+    return rels
+
+
+def plan(project_dir, spec, raster_size=None, refresh=False, db=None):
+    """Return the :class:`generator.pipeline.Stage` list that builds one project.
+
+    Without a :class:`generator.builddb.BuildDB` every output is rendered
+    (and still only written when its bytes change).
+    """
+    project = os.path.basename(os.path.normpath(project_dir))
+    stages = []
+    for group in spec["groups"]:
+        stages.append(Stage(f"{project}:{group['id']}",
+                            lambda group=group: render_group(project_dir, spec, group, raster_size, db)))
+    if spec["sources"]:
+        stages.append(Stage(f"{project}:fetch", lambda: fetch_sources(project_dir, spec, refresh, db)))
+    stages.append(Stage(f"{project}:normalize", lambda: normalize_project(project_dir, spec, db),
+                        [f"{project}:fetch"] if spec["sources"] else []))
+    stages.append(Stage(f"{project}:manifest", lambda: write_manifest(project_dir, spec, db),
+                        [s.name for s in stages]))
+    stages.append(Stage(f"{project}:asset_index", lambda: write_asset_index(project_dir),
+                        [f"{project}:manifest"]))
+    return stages
+
+
+def build(projects, root=".", raster_size=None, refresh=False, workers=None, on_done=None, force=False):
+    """Build ``projects`` (directory names under ``root``) in one pipeline run.
+
+    Outputs recorded as up to date in each project's build database are
+    skipped unless ``force`` is set. Returns a
+    :class:`generator.pipeline.PipelineReport`.
+    """
+    stages = []
+    dbs = []
+    for project in projects:
+        project_dir = os.path.join(root, project)
+        spec = load_spec(os.path.join(project_dir, SPEC_NAME))
+        db = BuildDB(os.path.join(project_dir, DB_NAME), load=not force)
+        dbs.append((db, spec))
+        stages += plan(project_dir, spec, raster_size, refresh, db)
+    report = run_stages(stages, workers, on_done)
+    for db, spec in dbs:
+        db.save(outputs(spec))
+    return report
+
+
+def resolve_projects(names, root="."):
+    """Map ``48``, ``48_Mini_Bar_AI`` or ``48_Mini_Bar_AI/`` to project directory names."""
+    known = find_projects(root)
+    resolved = []
+    for name in names:
+        name = name.rstrip("/\\")
+        matches = [p for p in known if p == name or p.split("_", 1)[0] == name]
+        if len(matches) != 1:
+            raise ValueError(f"unknown project {name!r}")
+        resolved.append(matches[0])
+    return resolved
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m generator build",
+                                     description="Build project assets from their asset_spec.json.")
+    parser.add_argument("projects", nargs="*", help="project directories or numbers, e.g. 48 or 48_Mini_Bar_AI")
+    parser.add_argument("--all", action="store_true", help="build every project that has a spec")
+    parser.add_argument("--root", default=".", help="directory that holds the projects (default: current)")
+    parser.add_argument("--raster", action="store_true", help="also write a PNG render next to each SVG that has one "
+                        "(groups with densities write their variants instead)")
+    parser.add_argument("--raster-size", type=int, default=400, help="edge length of the PNG renders in px (default 400)")
+    parser.add_argument("--refresh", action="store_true", help="re-check downloaded sources with conditional requests")
+    parser.add_argument("--force", action="store_true", help="ignore the build database and render everything")
+    parser.add_argument("--jobs", type=int, help="worker threads (default: CPU count + 4)")
+    parser.add_argument("--list", action="store_true", help="print the planned stages and exit")
+    args = parser.parse_args(argv)
+
+    if args.all == bool(args.projects):
+        parser.error("name one or more projects, or pass --all")
+    try:
+        projects = find_projects(args.root) if args.all else resolve_projects(args.projects, args.root)
+    except ValueError as e:
+        parser.error(str(e))
+    raster_size = args.raster_size if args.raster else None
+
+    if args.list:
+        for project in projects:
+            project_dir = os.path.join(args.root, project)
+            for stage in plan(project_dir, load_spec(os.path.join(project_dir, SPEC_NAME)), raster_size):
+                after = f" (after {', '.join(stage.deps)})" if stage.deps else ""
+                print(f"{stage.name}{after}")
+        return 0
+
+    def on_done(result):
+        if result.ok:
+            print(f"{result.name}: {result.value.summary()} in {result.seconds:.2f}s")
+        else:
+            print(f"{result.name}: {result.error}")
+
+    print(f"Building {len(projects)} projects...")
+    report = build(projects, args.root, raster_size, args.refresh, args.jobs, on_done, args.force)
+    print(report.summary())
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,106 @@
+"""What the asset build produced last time, and from which inputs.
+
+Each project keeps a ``.build_db.json`` next to its ``asset_spec.json``.
+For every output it records a fingerprint of the inputs that produced it
+(template code, parameters, palette, seed, upstream hashes) and the size
+and mtime the file had when it was written. An output whose fingerprint
+matches and whose file still has that size and mtime is up to date and is
+not rendered again; anything else (a new parameter, an edited template, a
+file touched by hand or deleted) is rebuilt.
+
+Writes go through :func:`write_if_changed`, so an output that renders to
+the same bytes keeps its mtime and Flutter does not re-bundle it.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+VERSION = 1
+DB_NAME = ".build_db.json"
+
+
+def fingerprint(*parts):
+    """Stable hex digest of JSON-serializable ``parts``."""
+    data = json.dumps(parts, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def write_if_changed(path, data):
+    """Write ``data`` to ``path`` unless it already holds exactly those bytes.
+
+    Returns True when the file was written.
+    """
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, "rb") as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return True
+
+
+class BuildDB:
+    def __init__(self, path, load=True):
+        """With ``load=False`` the recorded outputs are ignored and replaced on save."""
+        self.path = path
+        self._entries = {}    # relpath -> {"fp": hex, "size": n, "mtime": ns}
+        self._dirty = False
+        self._lock = threading.Lock()
+        if not load:
+            self._dirty = True
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == VERSION:
+            self._entries = data.get("outputs", {})
+
+    def get(self, rel):
+        with self._lock:
+            return self._entries.get(rel)
+
+    def fresh(self, rel, fp, path):
+        """True when ``path`` was built from ``fp`` and has not changed since."""
+        entry = self.get(rel)
+        if entry is None or entry["fp"] != fp:
+            return False
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        return st.st_size == entry["size"] and st.st_mtime_ns == entry["mtime"]
+
+    def record(self, rel, fp, path, **extra):
+        """Remember that ``path`` (now on disk) was built from ``fp``."""
+        st = os.stat(path)
+        entry = {"fp": fp, "size": st.st_size, "mtime": st.st_mtime_ns, **extra}
+        with self._lock:
+            if self._entries.get(rel) != entry:
+                self._entries[rel] = entry
+                self._dirty = True
+
+    def save(self, keep=None):
+        """Write the database if anything changed, dropping entries not in ``keep``."""
+        with self._lock:
+            if keep is not None:
+                stale = set(self._entries) - set(keep)
+                for rel in stale:
+                    del self._entries[rel]
+                self._dirty = self._dirty or bool(stale)
+            if not self._dirty:
+                return
+            tmp = f"{self.path}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": VERSION, "outputs": self._entries}, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.path)
+            self._dirty = False
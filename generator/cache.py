@@ -0,0 +1,192 @@
+"""Content-addressed on-disk cache for downloaded assets.
+
+Entries are keyed by the canonical source URL, query parameters sorted so
+``?w=800&q=80`` and ``?q=80&w=800`` hit the same entry, which means size
+parameters are part of the key. Bodies are stored once under their SHA-256
+in ``objects/``, so two URLs that serve the same bytes share one blob. An
+SQLite index tracks last use and evicts least-recently-used blobs once the
+cache grows past its size cap.
+
+Permanent failures (404/410) are remembered too, for a limited time, so a
+dead image ID costs one probe per TTL instead of one per run.
+
+The cache lives outside the repository (``~/.cache/generator_pribadi`` by
+default) and is shared by every NN_*_AI project. Set
+``GENERATOR_CACHE_DIR`` to move it, ``GENERATOR_CACHE_MAX_MB`` to change
+the cap, or ``GENERATOR_NO_CACHE=1`` to bypass it.
+"""
+
+import hashlib
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+DEFAULT_MAX_MB = 2048
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    sha256 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS blobs (
+    sha256 TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS blobs_last_used ON blobs (last_used);
+CREATE TABLE IF NOT EXISTS failures (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    expires REAL NOT NULL
+);
+"""
+
+
+def canonical_url(url):
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ""))
+
+
+def file_sha256(path):
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def materialize(src, dest):
+    """Place ``src`` at ``dest`` as a hardlink, or a copy across devices.
+
+    The link is built next to ``dest`` and renamed over it, so an existing
+    file (which may itself be a hardlink into the cache) is replaced rather
+    than written through.
+    """
+    os.makedirs(os.path.dirname(dest) or ".", exist_ok=True)
+    tmp = f"{dest}.{os.getpid()}.{threading.get_ident()}.link"
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dest)
+
+
+class DownloadCache:
+    def __init__(self, root, max_bytes=DEFAULT_MAX_MB * 1024 * 1024):
+        self.root = root
+        self.max_bytes = max_bytes
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.path.join(root, "index.sqlite3"), timeout=30,
+                                   check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self.evict()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def _blob_path(self, sha256):
+        return os.path.join(self.root, "objects", sha256[:2], sha256)
+
+    def _key(self, url):
+        return hashlib.sha256(canonical_url(url).encode("utf-8")).hexdigest()
+
+    def lookup(self, url):
+        """Return the blob path cached for ``url``, or ``None``."""
+        key = self._key(url)
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT e.sha256, b.size FROM entries e JOIN blobs b ON b.sha256 = e.sha256"
+                " WHERE e.key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            sha256, size = row
+            path = self._blob_path(sha256)
+            try:
+                intact = os.path.getsize(path) == size
+            except OSError:
+                intact = False
+            if not intact:
+                # Missing or modified through a hardlinked target; forget it.
+                self._forget_blob(sha256)
+                return None
+            self._db.execute("UPDATE blobs SET last_used = ? WHERE sha256 = ?", (time.time(), sha256))
+            return path
+
+    def put(self, url, path, sha256=None):
+        """Record the file at ``path`` as the body of ``url``.
+
+        The file is hardlinked into the object store when possible, so the
+        freshly downloaded target and the cache share one copy on disk.
+        """
+        if sha256 is None:
+            sha256 = file_sha256(path)
+        blob = self._blob_path(sha256)
+        if not os.path.exists(blob):
+            materialize(path, blob)
+        size = os.path.getsize(blob)
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT INTO blobs (sha256, size, last_used) VALUES (?, ?, ?)"
+                " ON CONFLICT (sha256) DO UPDATE SET size = excluded.size, last_used = excluded.last_used",
+                (sha256, size, time.time()))
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (key, url, sha256) VALUES (?, ?, ?)",
+                (self._key(url), canonical_url(url), sha256))
+            self._db.execute("DELETE FROM failures WHERE key = ?", (self._key(url),))
+        self.evict()
+        return blob
+
+    def lookup_failure(self, url):
+        """Return the remembered permanent-failure status for ``url``, or ``None``."""
+        with self._lock, self._db:
+            row = self._db.execute("SELECT status, expires FROM failures WHERE key = ?",
+                                   (self._key(url),)).fetchone()
+            if row is None:
+                return None
+            status, expires = row
+            if expires <= time.time():
+                self._db.execute("DELETE FROM failures WHERE key = ?", (self._key(url),))
+                return None
+            return status
+
+    def put_failure(self, url, status, ttl):
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO failures (key, url, status, expires) VALUES (?, ?, ?, ?)",
+                (self._key(url), canonical_url(url), status, time.time() + ttl))
+
+    def _forget_blob(self, sha256):
+        self._db.execute("DELETE FROM entries WHERE sha256 = ?", (sha256,))
+        self._db.execute("DELETE FROM blobs WHERE sha256 = ?", (sha256,))
+        try:
+            os.unlink(self._blob_path(sha256))
+        except FileNotFoundError:
+            pass
+
+    def evict(self):
+        """Drop least-recently-used blobs until the cache fits its cap."""
+        with self._lock, self._db:
+            total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            for sha256, size in self._db.execute(
+                    "SELECT sha256, size FROM blobs ORDER BY last_used").fetchall():
+                if total <= self.max_bytes:
+                    break
+                self._forget_blob(sha256)
+                total -= size
+
+
+def default_cache():
+    """Return the shared cache configured by the environment, or ``None``."""
+    if os.environ.get("GENERATOR_NO_CACHE"):
+        return None
+    root = os.environ.get("GENERATOR_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "generator_pribadi")
+    max_mb = float(os.environ.get("GENERATOR_CACHE_MAX_MB", DEFAULT_MAX_MB))
+    return DownloadCache(root, int(max_mb * 1024 * 1024))
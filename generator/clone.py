@@ -0,0 +1,248 @@
+"""Clone an NN_*_AI project into a new vertical in one pass.
+
+New verticals used to be made by copying a whole project folder by hand and
+then running ``setup_guest_project.py``, ``cleanup_laundry_artifacts.py`` or
+``fix_filenames.py`` over the copy. :func:`clone_project` does it in one
+walk of the source (build output, Pods and ``.gitignore``d files are
+skipped):
+
+* text files are read once, rewritten with a single-pass
+  :class:`generator.rewrite.Rewriter` and written to their new path;
+* everything else is shared rather than copied: a reflink (copy-on-write
+  clone) where the filesystem supports it, otherwise ``copy_file_range`` so
+  the kernel copies without a trip through Python, otherwise a hardlink;
+* ``RENAME_MAP``-style renames (exact relative paths) and file-name
+  rewrites (``shoe_`` -> ``guest_``) are applied to the destination paths in
+  the same pass, so imports and file names always agree.
+
+The rename spec is a JSON file::
+
+    {
+      "replace": {"ShoeResultStorage": "GuestResultStorage", "shoe_": "guest_"},
+      "rename": {"lib/model/shoe_ai_config.dart": "lib/model/guest_ai_config.dart"},
+      "rename_names": {"shoe_": "guest_"}
+    }
+
+Run ``python -m generator.clone 32_shoe_room_ai 51 "Laundry Room AI" --spec spec.json``.
+"""
+
+import argparse
+import errno
+import json
+import os
+import re
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from generator.index import TEXT_SUFFIXES
+from generator.rewrite import Rewriter
+from generator.walk import iter_files
+
+REFLINK = "reflink"
+COPY_RANGE = "copy_file_range"
+HARDLINK = "hardlink"
+COPY = "copy"
+
+_FICLONE = 0x40049409  # _IOW(0x94, 9, int) from linux/fs.h
+
+# Errors that mean "this filesystem can't do that", as opposed to real I/O errors.
+_UNSUPPORTED = {errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS,
+                errno.EPERM, errno.EBADF}
+
+
+@dataclass
+class CloneReport:
+    files: int = 0
+    rewritten: int = 0
+    renamed: list = field(default_factory=list)
+    methods: dict = field(default_factory=dict)
+    bytes_rewritten: int = 0
+    bytes_shared: int = 0
+    seconds: float = 0.0
+
+    def summary(self):
+        methods = ", ".join(f"{n} {m}" for m, n in sorted(self.methods.items())) or "none"
+        return (f"{self.files} files ({self.rewritten} rewritten, {len(self.renamed)} renamed; "
+                f"binaries: {methods}), {self.bytes_rewritten / 1024:.0f} KiB rewritten, "
+                f"{self.bytes_shared / 1024:.0f} KiB shared in {self.seconds:.2f}s")
+
+
+def _reflink(src, dest):
+    import fcntl
+    with open(src, "rb") as s, open(dest, "wb") as d:
+        fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+
+
+def _copy_range(src, dest):
+    with open(src, "rb") as s, open(dest, "wb") as d:
+        remaining = os.fstat(s.fileno()).st_size
+        while remaining > 0:
+            n = os.copy_file_range(s.fileno(), d.fileno(), remaining)
+            if n == 0:
+                break
+            remaining -= n
+
+
+class _Sharer:
+    """Materializes binaries with the cheapest method the filesystem allows.
+
+    A method that fails as unsupported is not tried again for the rest of
+    the clone.
+    """
+
+    def __init__(self, prefer_hardlinks=False):
+        order = [REFLINK] if sys.platform.startswith("linux") else []
+        copies = [COPY_RANGE] if hasattr(os, "copy_file_range") else []
+        order += [HARDLINK] + copies if prefer_hardlinks else copies + [HARDLINK]
+        self.order = order + [COPY]
+        self._disabled = set()
+        self._lock = threading.Lock()
+
+    def share(self, src, dest):
+        for method in self.order:
+            if method in self._disabled:
+                continue
+            try:
+                if method == REFLINK:
+                    _reflink(src, dest)
+                elif method == COPY_RANGE:
+                    _copy_range(src, dest)
+                elif method == HARDLINK:
+                    os.link(src, dest)
+                    return method
+                else:
+                    shutil.copyfile(src, dest)
+                shutil.copymode(src, dest)
+                return method
+            except OSError as e:
+                if method == COPY or e.errno not in _UNSUPPORTED:
+                    raise
+                with self._lock:
+                    self._disabled.add(method)
+                try:
+                    os.unlink(dest)
+                except FileNotFoundError:
+                    pass
+        raise AssertionError("unreachable: plain copy is always tried")
+
+
+def project_dir_name(number, name):
+    """``51, "Laundry Room AI"`` -> ``51_Laundry_Room_AI``."""
+    return f"{int(number):02d}_" + re.sub(r"[^A-Za-z0-9]+", "_", name).strip("_")
+
+
+def clone_project(src, dest, replace, rename=None, rename_names=None, text_suffixes=TEXT_SUFFIXES,
+                  prefer_hardlinks=False, workers=None, on_file=None):
+    """Clone the project at ``src`` into ``dest`` and return a :class:`CloneReport`.
+
+    ``replace`` is the content rewrite table, ``rename`` maps exact source
+    paths (relative to ``src``) to new relative paths, and ``rename_names``
+    is a rewrite table applied to the file names of every other file.
+    ``on_file(src_path, dest_path, method)`` is called as each file lands,
+    with ``method`` ``"rewrite"`` for text files.
+    """
+    if os.path.exists(dest) and os.listdir(dest):
+        raise FileExistsError(f"{dest} already exists and is not empty")
+    started = time.perf_counter()
+    rewriter = Rewriter(replace)
+    namer = Rewriter(rename_names or {})
+    rename = {k.replace(os.sep, "/"): v for k, v in (rename or {}).items()}
+    sharer = _Sharer(prefer_hardlinks)
+    report = CloneReport()
+    lock = threading.Lock()
+
+    def target(rel):
+        if rel in rename:
+            return rename[rel]
+        head, _, name = rel.rpartition("/")
+        new_name, _ = namer.rewrite(name)
+        return f"{head}/{new_name}" if head else new_name
+
+    def clone_one(item):
+        path, size = item
+        rel = os.path.relpath(path, src).replace(os.sep, "/")
+        new_rel = target(rel)
+        out = os.path.join(dest, *new_rel.split("/"))
+        os.makedirs(os.path.dirname(out), exist_ok=True)
+        if path.endswith(text_suffixes):
+            with open(path, "rb") as f:
+                data, count = rewriter.rewrite(f.read())
+            with open(out, "wb") as f:
+                f.write(data)
+            shutil.copymode(path, out)
+            method = "rewrite"
+        else:
+            method = sharer.share(path, out)
+        with lock:
+            report.files += 1
+            if method == "rewrite":
+                report.bytes_rewritten += size
+                if count:
+                    report.rewritten += 1
+            else:
+                report.bytes_shared += size
+                report.methods[method] = report.methods.get(method, 0) + 1
+            if new_rel != rel:
+                report.renamed.append((rel, new_rel))
+            if on_file is not None:
+                on_file(path, out, method)
+
+    files = list(iter_files(src))
+    unknown = set(rename) - {os.path.relpath(p, src).replace(os.sep, "/") for p, _ in files}
+    for rel in sorted(unknown):
+        print(f"File not found: {rel}")
+    os.makedirs(dest, exist_ok=True)
+    with ThreadPoolExecutor(workers or min(32, (os.cpu_count() or 1) * 4)) as pool:
+        for _ in pool.map(clone_one, files):
+            pass
+    report.renamed.sort()
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def load_spec(path):
+    with open(path, "r", encoding="utf-8") as f:
+        spec = json.load(f)
+    unknown = set(spec) - {"replace", "rename", "rename_names"}
+    if unknown:
+        raise ValueError(f"{path}: unknown spec keys {', '.join(sorted(unknown))}")
+    return spec
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m generator.clone",
+                                     description="Clone a project into a new NN_*_AI vertical.")
+    parser.add_argument("source", help="project to clone, e.g. 32_shoe_room_ai")
+    parser.add_argument("number", type=int, help="number of the new project, e.g. 51")
+    parser.add_argument("name", help='display name of the new project, e.g. "Laundry Room AI"')
+    parser.add_argument("--spec", help="JSON rename spec with replace/rename/rename_names tables")
+    parser.add_argument("--replace", action="append", default=[], metavar="OLD=NEW",
+                        help="extra content replacement (repeatable)")
+    parser.add_argument("--dest-root", default=".", help="directory the new project is created in")
+    parser.add_argument("--hardlinks", action="store_true",
+                        help="hardlink binaries before trying a kernel copy when reflinks are unavailable")
+    args = parser.parse_args(argv)
+
+    spec = load_spec(args.spec) if args.spec else {}
+    replace = dict(spec.get("replace", {}))
+    for item in args.replace:
+        old, sep, new = item.partition("=")
+        if not sep or not old:
+            parser.error(f"--replace expects OLD=NEW, got {item!r}")
+        replace[old] = new
+
+    dest = os.path.join(args.dest_root, project_dir_name(args.number, args.name))
+    print(f"Cloning {args.source} -> {dest}...")
+    report = clone_project(args.source, dest, replace, spec.get("rename"), spec.get("rename_names"),
+                           prefer_hardlinks=args.hardlinks)
+    for old, new in report.renamed:
+        print(f"Renamed {old} -> {new}")
+    print(report.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+"""Build-time raster compositor for the 2x2 moodboard layouts.
+
+The generators describe moodboards as SVG, which flutter_svg has to parse
+and rasterize on the UI thread for every style card. :class:`Collage` draws
+the same layouts straight into a bitmap: solid, gradient and photo cells
+(photos center-cropped like ``preserveAspectRatio="xMidYMid slice"``),
+rounded corners, translucent overlays, gutters and label bands.
+
+Coordinates are given in the layout's design units (the SVG user space), so
+a template can be drawn at any output size by changing ``scale``. Shapes are
+drawn supersampled and downsampled once at the end, which gives antialiased
+edges without a vector renderer.
+
+Needs Pillow, like :mod:`generator.resize`.
+"""
+
+import io
+import math
+import re
+from functools import lru_cache
+
+from generator.builddb import write_if_changed
+from generator.resize import require_pillow
+
+try:
+    from PIL import Image, ImageChops, ImageColor, ImageDraw, ImageFilter, ImageFont
+except ImportError:  # pragma: no cover - exercised on machines without Pillow
+    Image = None
+
+SUPERSAMPLE = 2
+JPEG_QUALITY = 85
+
+GRID = ((0, 0), (1, 0), (0, 1), (1, 1))
+
+_FONTS = {
+    "serif": ("DejaVuSerif.ttf", "Times New Roman.ttf", "LiberationSerif-Regular.ttf"),
+    "sans": ("DejaVuSans.ttf", "Arial.ttf", "LiberationSans-Regular.ttf", "Helvetica.ttc"),
+    "serif-bold": ("DejaVuSerif-Bold.ttf", "Times New Roman Bold.ttf", "LiberationSerif-Bold.ttf"),
+    "sans-bold": ("DejaVuSans-Bold.ttf", "Arial Bold.ttf", "LiberationSans-Bold.ttf"),
+}
+
+_RGBA = re.compile(r"rgba?\(\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*(?:,\s*([\d.]+)\s*)?\)$")
+
+
+def parse_color(color):
+    """Return ``color`` as an ``(r, g, b, a)`` tuple.
+
+    Accepts what the SVG templates use: ``#rgb``, ``#rrggbb``,
+    ``#rrggbbaa``, named colors and ``rgba()`` with a 0-1 alpha.
+    """
+    if isinstance(color, tuple):
+        return color if len(color) == 4 else (*color, 255)
+    m = _RGBA.match(color.strip())
+    if m:
+        r, g, b, a = m.groups()
+        return (int(float(r)), int(float(g)), int(float(b)), round(float(a if a is not None else 1) * 255))
+    rgb = ImageColor.getrgb(color)
+    return rgb if len(rgb) == 4 else (*rgb, 255)
+
+
+class Gradient:
+    """Two-stop linear gradient across the filled shape's bounding box.
+
+    The default runs from the top-left to the bottom-right corner, like
+    ``x1="0%" y1="0%" x2="100%" y2="100%"``. ``direction`` picks another
+    axis: ``"x"`` runs left to right (SVG's default vector), ``"y"`` top to
+    bottom (what ``diagonal=False`` means).
+    """
+
+    def __init__(self, start, end, diagonal=True, direction=None):
+        self.start = parse_color(start)
+        self.end = parse_color(end)
+        self.direction = direction or ("xy" if diagonal else "y")
+        if self.direction not in ("x", "y", "xy"):
+            raise ValueError(f"unknown gradient direction {direction!r}")
+
+    def render(self, size):
+        ramp = Image.linear_gradient("L")
+        if self.direction == "xy":
+            across = ramp.rotate(90).resize(size)
+            mask = ImageChops.add(across, ramp.resize(size), scale=2)
+        elif self.direction == "x":
+            mask = ramp.rotate(90).resize(size)
+        else:
+            mask = ramp.resize(size)
+        start = Image.new("RGBA", size, self.start)
+        return Image.composite(Image.new("RGBA", size, self.end), start, mask)
+
+
+@lru_cache(maxsize=None)
+def _font(family, size, bold=False):
+    key = "serif" if "serif" in family and "sans" not in family else "sans"
+    names = _FONTS[f"{key}-bold"] + _FONTS[key] if bold else _FONTS[key]
+    for name in names:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:  # Pillow < 10.1 has only the fixed bitmap font
+        return ImageFont.load_default()
+
+
+def cover(image, width, height):
+    """Scale ``image`` to fill ``width`` x ``height`` and crop the overflow evenly.
+
+    This is ``preserveAspectRatio="xMidYMid slice"``: the crop box is taken
+    from the source first, so only the pixels that survive are resampled.
+    """
+    scale = max(width / image.width, height / image.height)
+    crop_w, crop_h = width / scale, height / scale
+    left = (image.width - crop_w) / 2
+    top = (image.height - crop_h) / 2
+    resample = getattr(Image, "Resampling", Image).LANCZOS
+    return image.resize((width, height), resample, box=(left, top, left + crop_w, top + crop_h))
+
+
+class Collage:
+    def __init__(self, width, height=None, scale=1.0, background=None, supersample=SUPERSAMPLE):
+        require_pillow("Raster moodboards")
+        self.width = width
+        self.height = height if height is not None else width
+        self.scale = scale
+        self._k = scale * supersample
+        fill = parse_color(background) if background is not None else (0, 0, 0, 0)
+        self.image = Image.new("RGBA", (round(self.width * self._k), round(self.height * self._k)), fill)
+        self.photos = False   # set once a photo cell is drawn; see :attr:`format`
+
+    @property
+    def size(self):
+        """Output size in pixels."""
+        return round(self.width * self.scale), round(self.height * self.scale)
+
+    @property
+    def format(self):
+        """``jpg`` for boards with photo cells, ``png`` for flat art."""
+        return "jpg" if self.photos else "png"
+
+    def cells(self, margin=0, gap=0):
+        """Return the four cell boxes of a 2x2 grid, row by row."""
+        cell_w = (self.width - 2 * margin - gap) / 2
+        cell_h = (self.height - 2 * margin - gap) / 2
+        return [(margin + col * (cell_w + gap), margin + row * (cell_h + gap),
+                 margin + col * (cell_w + gap) + cell_w, margin + row * (cell_h + gap) + cell_h)
+                for col, row in GRID]
+
+    def _composite(self, box, fill, draw_mask, opacity=1.0, blur=0, shape_box=None):
+        k = self._k
+        pad = 3 * blur
+        x0 = max(0, math.floor((box[0] - pad) * k))
+        y0 = max(0, math.floor((box[1] - pad) * k))
+        x1 = min(self.image.width, math.ceil((box[2] + pad) * k))
+        y1 = min(self.image.height, math.ceil((box[3] + pad) * k))
+        if x1 <= x0 or y1 <= y0:
+            return
+        size = (x1 - x0, y1 - y0)
+
+        mask = Image.new("L", size, 0)
+        draw_mask(ImageDraw.Draw(mask), lambda x, y: (x * k - x0, y * k - y0), k)
+        if blur:
+            mask = mask.filter(ImageFilter.GaussianBlur(blur * k))
+
+        if isinstance(fill, Gradient):
+            sx0, sy0, sx1, sy1 = shape_box or box
+            layer = Image.new("RGBA", size, fill.start)
+            grad_size = (max(1, round((sx1 - sx0) * k)), max(1, round((sy1 - sy0) * k)))
+            layer.paste(fill.render(grad_size), (round(sx0 * k) - x0, round(sy0 * k) - y0))
+            alpha = 255
+        elif isinstance(fill, Image.Image):
+            layer = fill.convert("RGBA")
+            alpha = 255
+        else:
+            rgba = parse_color(fill)
+            layer = Image.new("RGBA", size, rgba)
+            alpha = rgba[3]
+
+        factor = alpha / 255 * opacity
+        if factor < 1:
+            mask = mask.point(lambda v: round(v * factor))
+        layer.putalpha(mask)
+        self.image.alpha_composite(layer, dest=(x0, y0))
+
+    def rect(self, box, fill, radius=0, opacity=1.0, stroke=None, stroke_width=1):
+        """Fill ``box`` (``fill`` may be None) and stroke its outline centered on the edges."""
+        def shape(d, to_px, k, grow, value):
+            x0, y0 = to_px(box[0] - grow, box[1] - grow)
+            x1, y1 = to_px(box[2] + grow, box[3] + grow)
+            if x1 <= x0 or y1 <= y0:
+                return
+            xy = (x0, y0, x1 - 1, y1 - 1)  # Pillow's corners are inclusive
+            if radius:
+                d.rounded_rectangle(xy, radius=max(0, radius + grow) * k, fill=value)
+            else:
+                d.rectangle(xy, fill=value)
+
+        if fill is not None:
+            self._composite(box, fill, lambda d, to_px, k: shape(d, to_px, k, 0, 255), opacity)
+        if stroke is not None:
+            half = stroke_width / 2
+            outer = (box[0] - half, box[1] - half, box[2] + half, box[3] + half)
+
+            def draw_stroke(d, to_px, k):
+                shape(d, to_px, k, half, 255)
+                shape(d, to_px, k, -half, 0)
+            self._composite(outer, stroke, draw_stroke, opacity)
+
+    def circle(self, cx, cy, r, fill=None, stroke=None, stroke_width=1, opacity=1.0, blur=0):
+        box = (cx - r - stroke_width, cy - r - stroke_width, cx + r + stroke_width, cy + r + stroke_width)
+        if fill is not None:
+            def draw_fill(d, to_px, k):
+                d.ellipse((*to_px(cx - r, cy - r), *to_px(cx + r, cy + r)), fill=255)
+            self._composite(box, fill, draw_fill, opacity, blur, shape_box=(cx - r, cy - r, cx + r, cy + r))
+        if stroke is not None:
+            half = stroke_width / 2
+
+            def draw_stroke(d, to_px, k):
+                d.ellipse((*to_px(cx - r - half, cy - r - half), *to_px(cx + r + half, cy + r + half)), fill=255)
+                d.ellipse((*to_px(cx - r + half, cy - r + half), *to_px(cx + r - half, cy + r - half)), fill=0)
+            self._composite(box, stroke, draw_stroke, opacity, blur)
+
+    def line(self, x1, y1, x2, y2, stroke, width=1, opacity=1.0):
+        half = width / 2
+        box = (min(x1, x2) - half, min(y1, y2) - half, max(x1, x2) + half, max(y1, y2) + half)
+
+        def draw(d, to_px, k):
+            d.line((*to_px(x1, y1), *to_px(x2, y2)), fill=255, width=max(1, round(width * k)))
+        self._composite(box, stroke, draw, opacity)
+
+    def polygon(self, points, fill=None, stroke=None, stroke_width=1, closed=True, opacity=1.0):
+        """Fill the polygon through ``points`` and/or stroke its outline.
+
+        The fill always closes the shape, like SVG; ``closed`` only decides
+        whether the stroke runs back to the first point.
+        """
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+        half = stroke_width / 2 if stroke is not None else 0
+        box = (min(xs) - half, min(ys) - half, max(xs) + half, max(ys) + half)
+        if fill is not None and len(points) > 2:
+            def draw_fill(d, to_px, k):
+                d.polygon([to_px(x, y) for x, y in points], fill=255)
+            self._composite(box, fill, draw_fill, opacity, shape_box=(min(xs), min(ys), max(xs), max(ys)))
+        if stroke is not None and len(points) > 1:
+            path = list(points) + [points[0]] if closed else list(points)
+
+            def draw_stroke(d, to_px, k):
+                d.line([to_px(x, y) for x, y in path], fill=255, width=max(1, round(stroke_width * k)),
+                       joint="curve")
+            self._composite(box, stroke, draw_stroke, opacity)
+
+    def dots(self, box, spacing, offset, r, fill, opacity=1.0):
+        """Repeat a dot every ``spacing`` units, like a tiny ``<pattern>`` tile.
+
+        ``spacing`` and ``offset`` are numbers or ``(x, y)`` pairs.
+        """
+        sx, sy = spacing if isinstance(spacing, tuple) else (spacing, spacing)
+        ox, oy = offset if isinstance(offset, tuple) else (offset, offset)
+
+        def draw(d, to_px, k):
+            y = box[1] + oy
+            while y - r < box[3]:
+                x = box[0] + ox
+                while x - r < box[2]:
+                    d.ellipse((*to_px(x - r, y - r), *to_px(x + r, y + r)), fill=255)
+                    x += sx
+                y += sy
+        self._composite(box, fill, draw, opacity)
+
+    def image_cell(self, box, src, radius=0):
+        """Fill ``box`` with ``src`` (a path or Pillow image), center-cropped."""
+        self.photos = True
+        k = self._k
+        x0, y0 = math.floor(box[0] * k), math.floor(box[1] * k)
+        size = (math.ceil(box[2] * k) - x0, math.ceil(box[3] * k) - y0)
+        if isinstance(src, str):
+            with Image.open(src) as im:
+                im.draft("RGB", size)
+                tile = cover(im.convert("RGB"), *size)
+        else:
+            tile = cover(src.convert("RGB"), *size)
+        if radius:
+            self.rect(box, tile, radius)
+        else:
+            self.image.paste(tile, (x0, y0))
+
+    def text(self, x, y, text, size, fill, family="sans", anchor="ls", opacity=1.0, bold=False):
+        """Draw ``text`` with its ``anchor`` point at ``(x, y)``.
+
+        Anchors follow Pillow: ``"ls"`` is SVG's default start/baseline,
+        ``"mm"`` is ``text-anchor="middle" dominant-baseline="middle"`` and
+        ``"ms"`` is ``text-anchor="middle"`` on the baseline.
+        """
+        font = _font(family, max(1, round(size * self._k)), bold)
+        left, top, right, bottom = font.getbbox(text, anchor=anchor)
+        k = self._k
+        box = (x + left / k, y + top / k, x + right / k, y + bottom / k)
+
+        def draw(d, to_px, k):
+            d.text(to_px(x, y), text, fill=255, font=font, anchor=anchor)
+        self._composite(box, fill, draw, opacity)
+
+    def label_band(self, text, height, band, text_color, size, x=20, baseline=25, family="sans",
+                   band_opacity=1.0, anchor="ls"):
+        """Draw a full-width caption band along the bottom edge."""
+        top = self.height - height
+        self.rect((0, top, self.width, self.height), band, opacity=band_opacity)
+        self.text(x, top + baseline, text, size, text_color, family=family, anchor=anchor)
+
+    def gutters(self, width, color):
+        """Stroke the outer border and the center cross, like SVG strokes centered on the edges."""
+        half = width / 2
+        self.rect((0, 0, self.width, half), color)
+        self.rect((0, self.height - half, self.width, self.height), color)
+        self.rect((0, 0, half, self.height), color)
+        self.rect((self.width - half, 0, self.width, self.height), color)
+        self.rect((self.width / 2 - half, 0, self.width / 2 + half, self.height), color)
+        self.rect((0, self.height / 2 - half, self.width, self.height / 2 + half), color)
+
+    def render(self):
+        """Return the finished RGB image at the output size."""
+        out = self.image
+        if out.size != self.size:
+            out = out.resize(self.size, getattr(Image, "Resampling", Image).LANCZOS)
+        if out.getextrema()[3][0] == 255:
+            out = out.convert("RGB")
+        return out
+
+    def encode(self, fmt, quality=JPEG_QUALITY):
+        """Return the board encoded as ``fmt`` (``jpg``, ``png`` or ``webp``) bytes."""
+        out = self.render()
+        buf = io.BytesIO()
+        if fmt in ("jpg", "jpeg"):
+            out.convert("RGB").save(buf, "JPEG", quality=quality, optimize=True, progressive=True)
+        elif fmt == "webp":
+            out.save(buf, "WEBP", quality=quality, method=6)
+        else:
+            # Flat layouts often fit a palette exactly; use it when they do.
+            if out.mode == "RGB" and out.getcolors(256) is not None:
+                out = out.quantize(256, dither=Image.Dither.NONE)
+            out.save(buf, "PNG", optimize=True)
+        return buf.getvalue()
+
+    def save(self, path, quality=JPEG_QUALITY):
+        """Encode by extension: ``.jpg`` for photos, ``.png``/``.webp`` for flat art."""
+        write_if_changed(path, self.encode(path.rsplit(".", 1)[-1].lower(), quality))
+        return path
@@ -0,0 +1,140 @@
+"""Generate each project's ``lib/src/asset_index.dart``.
+
+Screens name assets by string and only learn an image's size once it has
+been decoded, so grids cannot lay out, or paint anything, until then.
+:func:`render_index` turns the project's ``ASSET_MANIFEST.jsonl`` (see
+:mod:`generator.manifest`) into ``const`` Dart: one ``AssetInfo`` per
+image that ``pubspec.yaml`` bundles, with its path, width, height,
+dominant color and BlurHash, named after its path
+(``assets/examples/ex_01.jpg`` -> ``AssetIndex.examplesEx01``), plus
+``AssetIndex.byPath`` for paths built at run time and
+``AssetIndex.byStem`` for files whose format is not fixed, such as a
+downloaded JPEG that may be a generated PNG instead
+(``AssetIndex.byStem['assets/style_sources/source_001']``)::
+
+    final info = AssetIndex.byPath['assets/examples/ex_$i.jpg'];
+    AspectRatio(aspectRatio: info!.aspectRatio,
+                child: ColoredBox(color: info.color, child: Image.asset(info.path)));
+
+The build writes it after the manifest; it only changes when the
+bundled assets do.
+"""
+
+import os
+import re
+
+from generator.assetrefs import bundled, pubspec_assets
+from generator.builddb import write_if_changed
+from generator.manifest import JSONL_NAME, read_manifest
+
+INDEX_PATH = "lib/src/asset_index.dart"
+
+_VARIANT_DIR = re.compile(r"^\d+(?:\.\d+)?x$")
+
+# Starts with assetrefs.GENERATED_HEADER, so dart_refs does not count the index as references.
+_HEADER = """\
+// GENERATED by `python -m generator build` from assets/ASSET_MANIFEST.jsonl.
+// Do not edit; change the assets or pubspec.yaml and build again.
+
+import 'dart:ui' show Color;
+
+/// Size and placeholder of a bundled image, known before it is decoded.
+class AssetInfo {
+  const AssetInfo(this.path, this.width, this.height, this.color, this.blurHash);
+
+  final String path;
+  final int width;
+  final int height;
+
+  /// Dominant color, to paint while the image loads.
+  final Color color;
+
+  /// BlurHash (https://blurha.sh) of the image, for a blurred preview.
+  final String blurHash;
+
+  double get aspectRatio => width / height;
+}
+
+class AssetIndex {
+  AssetIndex._();
+"""
+
+
+def _quote(text):
+    return "'" + text.replace("\\", "\\\\").replace("'", "\\'").replace("$", "\\$") + "'"
+
+
+def _name(rel, taken):
+    """``examples/ex_01.jpg`` -> ``examplesEx01``, unique within ``taken``."""
+    stem, ext = os.path.splitext(rel)
+    words = [w for w in re.split(r"[^A-Za-z0-9]+", stem) if w]
+    name = words[0].lower() + "".join(w[:1].upper() + w[1:] for w in words[1:]) if words else "asset"
+    if name[0].isdigit():
+        name = "a" + name
+    if name in taken:
+        name += ext[1:].capitalize()
+    base, n = name, 2
+    while name in taken:
+        name, n = f"{base}{n}", n + 1
+    taken.add(name)
+    return name
+
+
+def index_entries(project_dir):
+    """The manifest entries of the images ``pubspec.yaml`` bundles, sorted by path."""
+    path = os.path.join(project_dir, "assets", JSONL_NAME)
+    if not os.path.exists(path):
+        return []
+    listed = pubspec_assets(project_dir)
+    entries = []
+    for entry in read_manifest(path):
+        parts = entry["path"].split("/")
+        if len(parts) > 1 and _VARIANT_DIR.match(parts[-2]):
+            continue    # Flutter picks the variant; the index names the main asset
+        if entry["format"] and entry["blurhash"] and bundled("assets/" + entry["path"], listed):
+            entries.append(entry)
+    return entries
+
+
+def render_index(entries):
+    """The Dart source of an asset index over manifest ``entries``."""
+    lines = [_HEADER]
+    names = []
+    taken = set()
+    for entry in entries:
+        name = _name(entry["path"], taken)
+        names.append((name, "assets/" + entry["path"]))
+        color = "0xFF" + entry["color"].lstrip("#").upper()
+        lines.append(f"  static const {name} = AssetInfo({_quote('assets/' + entry['path'])}, "
+                     f"{entry['width']}, {entry['height']}, Color({color}), {_quote(entry['blurhash'])});")
+    if entries:
+        lines.append("")
+    lines.append("  /// Every entry by path, for paths built at run time.")
+    if names:
+        lines.append("  static const byPath = <String, AssetInfo>{")
+        lines += [f"    {_quote(path)}: {name}," for name, path in names]
+        lines.append("  };")
+    else:
+        lines.append("  static const byPath = <String, AssetInfo>{};")
+    stems = {}
+    for name, path in names:
+        stems.setdefault(os.path.splitext(path)[0], []).append(name)
+    unique = [(stem, found[0]) for stem, found in stems.items() if len(found) == 1]
+    lines.append("")
+    lines.append("  /// Entries by path without the extension, for files that may be in either format.")
+    if unique:
+        lines.append("  static const byStem = <String, AssetInfo>{")
+        lines += [f"    {_quote(stem)}: {name}," for stem, name in unique]
+        lines.append("  };")
+    else:
+        lines.append("  static const byStem = <String, AssetInfo>{};")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def write_index(project_dir):
+    """Write ``lib/src/asset_index.dart``; return True if it changed."""
+    if not os.path.isdir(os.path.join(project_dir, "lib")):
+        return False
+    source = render_index(index_entries(project_dir))
+    return write_if_changed(os.path.join(project_dir, *INDEX_PATH.split("/")), source.encode("utf-8"))
@@ -0,0 +1,302 @@
+"""Find assets that are stored more than once across the projects.
+
+The projects were cloned from each other and several scripts fill
+placeholders by copying: 47's ``fetch_assets.py`` copies
+``examples/ex_01.jpg`` into each ``style_moodboards/style_0N.jpg``,
+``fetch_guest_assets.py`` copies examples into ``onboarding/``, and the
+iOS icon and launch sets came along with every clone. :func:`find_duplicates`
+groups the media files of the given projects
+
+* exactly, by size first, then by a hash of the first 4 KiB, then by the
+  SHA-256 of the whole file, so only files that could be equal are read
+  in full;
+* approximately, by a 64-bit difference hash (dHash) of an 9x8 grayscale
+  thumbnail, for re-encoded or re-sized copies of the same picture. The
+  members of one icon or density set (``AppIcon.appiconset``,
+  ``mipmap-*``, ``2.0x/``) are meant to look alike and are not paired.
+
+Every copy after the first of an exact group counts as wasted bytes in
+its project. With ``--link`` the copies are replaced by hardlinks to the
+first one, which frees the space in a working tree (git still stores the
+blob once and checks out separate files). Anything that later rewrites
+one of the paths must replace the file, as
+:func:`generator.builddb.write_if_changed` does, or it writes through to
+all of them; the package's image writers and the fetch scripts all go
+through it.
+
+Near-duplicate grouping needs Pillow; ``--exact`` skips it.
+"""
+
+import hashlib
+import os
+import re
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from generator.resize import require_pillow
+from generator.walk import iter_files
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - exercised on machines without Pillow
+    Image = None
+
+SUFFIXES = (".png", ".jpg", ".jpeg", ".webp", ".gif", ".bmp", ".svg", ".ttf", ".otf")
+BITMAPS = (".png", ".jpg", ".jpeg", ".webp", ".gif", ".bmp")
+HEAD_SIZE = 4096
+MAX_DISTANCE = 6    # differing dHash bits still counted as the same picture
+
+_SET_DIR = re.compile(r"^(?:.+\.(?:appiconset|imageset|launchimage)|mipmap-[a-z]+|drawable-[a-z]+|\d+(?:\.\d+)?x)$")
+
+
+@dataclass
+class DuplicateGroup:
+    size: int
+    sha256: str
+    paths: list             # sorted; the first is kept
+    linked: list = field(default_factory=list)    # copies already sharing the first one's inode
+
+    @property
+    def copies(self):
+        return [p for p in self.paths[1:] if p not in self.linked]
+
+    @property
+    def wasted(self):
+        return self.size * len(self.copies)
+
+
+@dataclass
+class NearGroup:
+    paths: list
+    distance: int           # largest dHash distance to the first path
+
+
+@dataclass
+class DedupReport:
+    files: int = 0
+    groups: list = field(default_factory=list)
+    near: list = field(default_factory=list)
+    linked: int = 0         # bytes freed by --link
+
+    def wasted_by_project(self):
+        wasted = defaultdict(int)
+        for group in self.groups:
+            for path in group.copies:
+                wasted[_project(path)] += group.size
+        return dict(sorted(wasted.items()))
+
+    def summary(self):
+        wasted = sum(g.wasted for g in self.groups)
+        return (f"{self.files} files, {len(self.groups)} duplicate groups "
+                f"({sum(len(g.copies) for g in self.groups)} copies, {wasted / 1024:.1f} KiB wasted), "
+                f"{len(self.near)} near-duplicate groups")
+
+
+def _project(path):
+    return path.replace(os.sep, "/").split("/", 1)[0]
+
+
+def _digest(path, limit=None):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        if limit is not None:
+            h.update(f.read(limit))
+        else:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+def _refine(groups, key):
+    out = []
+    for paths in groups:
+        buckets = defaultdict(list)
+        for path in paths:
+            buckets[key(path)].append(path)
+        out += [b for b in buckets.values() if len(b) > 1]
+    return out
+
+
+def exact_duplicates(files, root="."):
+    """Group ``(path, size)`` pairs into :class:`DuplicateGroup` lists of byte-identical files.
+
+    ``path`` is relative to ``root``.
+    """
+    by_size = defaultdict(list)
+    for path, size in files:
+        if size:
+            by_size[size].append(path)
+    candidates = [paths for paths in by_size.values() if len(paths) > 1]
+    inode = {}
+    for paths in candidates:
+        for path in paths:
+            st = os.stat(os.path.join(root, path))
+            inode[path] = (st.st_dev, st.st_ino)
+    # Paths that are already one file are read only once.
+    heads, digests = {}, {}
+
+    def head(path):
+        if inode[path] not in heads:
+            heads[inode[path]] = _digest(os.path.join(root, path), HEAD_SIZE)
+        return heads[inode[path]]
+
+    def full(path):
+        if inode[path] not in digests:
+            digests[inode[path]] = _digest(os.path.join(root, path))
+        return digests[inode[path]]
+
+    groups = []
+    for paths in _refine(_refine(candidates, head), full):
+        paths.sort()
+        linked = [p for p in paths[1:] if inode[p] == inode[paths[0]]]
+        groups.append(DuplicateGroup(os.path.getsize(os.path.join(root, paths[0])), full(paths[0]), paths, linked))
+    groups.sort(key=lambda g: (-g.wasted, g.paths[0]))
+    return groups
+
+
+def dhash(path):
+    """The 64-bit difference hash of the bitmap at ``path``, or None if Pillow cannot read it."""
+    try:
+        with Image.open(path) as im:
+            im.draft("L", (64, 64))
+            small = im.convert("L").resize((9, 8), getattr(Image, "Resampling", Image).BOX)
+    except (OSError, ValueError):
+        return None
+    px = list(small.getdata())
+    bits = 0
+    for row in range(8):
+        for col in range(8):
+            bits = (bits << 1) | (px[row * 9 + col] > px[row * 9 + col + 1])
+    return bits
+
+
+def _set_key(path):
+    """Files with the same key belong to one icon or density set."""
+    parts = path.replace(os.sep, "/").split("/")
+    for i in range(len(parts) - 2, -1, -1):
+        if _SET_DIR.match(parts[i]):
+            rest = parts[i + 1:] if not parts[i].endswith(("set", "image")) else []
+            return "/".join(parts[:i] + rest)
+    return None
+
+
+def near_duplicates(paths, max_distance=MAX_DISTANCE, root="."):
+    """Group bitmaps (paths relative to ``root``) whose dHashes differ in at most ``max_distance`` bits."""
+    require_pillow("Finding near-duplicate images")
+    hashes = [(p, h) for p in sorted(paths) if (h := dhash(os.path.join(root, p))) is not None]
+    parent = list(range(len(hashes)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, (a, ha) in enumerate(hashes):
+        for j in range(i + 1, len(hashes)):
+            b, hb = hashes[j]
+            if bin(ha ^ hb).count("1") > max_distance:
+                continue
+            key = _set_key(a)
+            if key is not None and key == _set_key(b):
+                continue
+            parent[find(j)] = find(i)
+    members = defaultdict(list)
+    for i in range(len(hashes)):
+        members[find(i)].append(i)
+    groups = []
+    for idx in members.values():
+        if len(idx) > 1:
+            first = hashes[idx[0]][1]
+            groups.append(NearGroup([hashes[i][0] for i in idx],
+                                    max(bin(first ^ hashes[i][1]).count("1") for i in idx)))
+    return groups
+
+
+def link_duplicates(group, root="."):
+    """Replace the copies in ``group`` with hardlinks to its first path; return the bytes freed."""
+    keep = os.path.join(root, group.paths[0])
+    freed = 0
+    for path in group.copies:
+        dest = os.path.join(root, path)
+        tmp = f"{dest}.tmp"
+        os.link(keep, tmp)
+        os.replace(tmp, dest)
+        group.linked.append(path)
+        freed += group.size
+    return freed
+
+
+def find_duplicates(projects, root=".", suffixes=SUFFIXES, near=True, max_distance=MAX_DISTANCE):
+    """Scan ``projects`` (directory names under ``root``); return a :class:`DedupReport`.
+
+    Paths in the report are relative to ``root``.
+    """
+    files = []
+    for project in projects:
+        for path, size in iter_files(os.path.join(root, project), suffixes):
+            files.append((os.path.relpath(path, root).replace(os.sep, "/"), size))
+    report = DedupReport(files=len(files))
+    report.groups = exact_duplicates(files, root)
+    if near:
+        # One representative per exact group; its copies add nothing.
+        copies = {p for g in report.groups for p in g.paths[1:]}
+        bitmaps = [p for p, _ in files if p.lower().endswith(BITMAPS) and p not in copies]
+        report.near = near_duplicates(bitmaps, max_distance, root)
+    return report
+
+
+def suggestion(paths):
+    """What to do about one group of duplicate paths."""
+    projects = sorted({_project(p) for p in paths})
+    keep = paths[0].split("/", 1)[1]
+    if len(projects) == 1:
+        return f"reference {keep} instead of the other copies"
+    if all(_set_key(p) for p in paths):
+        return f"icon/launch set shared by {len(projects)} projects; generate it from one source"
+    return f"shared by {len(projects)} projects; keep one copy and have the build copy or reference it"
+
+
+def main(argv=None):
+    import argparse
+
+    from generator.build import find_projects, resolve_projects
+
+    parser = argparse.ArgumentParser(prog="python -m generator dedup",
+                                     description="Find duplicate and near-duplicate assets across projects.")
+    parser.add_argument("projects", nargs="*", help="project directories or numbers, e.g. 44 or 44_Guest_Room_AI")
+    parser.add_argument("--all", action="store_true", help="scan every project that has a spec")
+    parser.add_argument("--root", default=".", help="directory that holds the projects (default: current)")
+    parser.add_argument("--exact", action="store_true", help="skip the near-duplicate pass (no Pillow needed)")
+    parser.add_argument("--distance", type=int, default=MAX_DISTANCE,
+                        help=f"dHash bits two near-duplicates may differ in (default: {MAX_DISTANCE})")
+    parser.add_argument("--link", action="store_true", help="replace exact copies with hardlinks to the first one")
+    args = parser.parse_args(argv)
+
+    if args.all == bool(args.projects):
+        parser.error("name one or more projects, or pass --all")
+    try:
+        projects = find_projects(args.root) if args.all else resolve_projects(args.projects, args.root)
+    except ValueError as e:
+        parser.error(str(e))
+
+    start = time.perf_counter()
+    report = find_duplicates(projects, args.root, near=not args.exact, max_distance=args.distance)
+    for group in report.groups:
+        print(f"{len(group.paths)} x {group.size / 1024:.1f} KiB {group.sha256[:12]}: {suggestion(group.paths)}")
+        for path in group.paths:
+            note = " (kept)" if path == group.paths[0] else " (hardlinked)" if path in group.linked else ""
+            print(f"  {path}{note}")
+    for group in report.near:
+        print(f"near-duplicates (within {group.distance} bits of the first): {suggestion(group.paths)}")
+        for path in group.paths:
+            print(f"  {path}")
+    if args.link:
+        for group in report.groups:
+            report.linked += link_duplicates(group, args.root)
+        print(f"hardlinked copies, {report.linked / 1024:.1f} KiB freed")
+    for project, wasted in report.wasted_by_project().items():
+        print(f"{project}: {wasted / 1024:.1f} KiB in duplicate copies")
+    print(f"{report.summary()} in {time.perf_counter() - start:.2f}s")
+    return 0
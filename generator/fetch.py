@@ -0,0 +1,573 @@
+"""Concurrent HTTP downloader with per-host keep-alive connection pools.
+
+Every fetch script used to call ``urlretrieve``/``urlopen`` once per file,
+paying a fresh TCP + TLS handshake each time and waiting for each image
+before starting the next. :class:`Downloader` keeps idle connections per
+host, caps how many requests hit one host at once, and runs a bounded
+thread pool, so a batch takes roughly as long as its slowest image.
+
+Given a :class:`generator.cache.DownloadCache`, cached URLs are served
+without touching the network, and a URL that appears several times in one
+batch is fetched once and materialized at every destination. Given a
+:class:`generator.journal.JobJournal`, finished items are skipped on
+re-runs, interrupted ones resume from their ``.part`` file, and
+``revalidate=True`` re-checks finished ones with conditional requests.
+
+Only transient failures are retried: connection errors, 429 and 5xx, with
+jittered exponential backoff that defers to ``Retry-After``. 404/410 are
+permanent; they are remembered in the cache's negative table and fail
+instantly until the TTL runs out. A per-host circuit breaker stops a dead
+host from soaking up every retry in a batch, and ``download_all`` can hand
+whatever is still missing to a procedural ``fallback``.
+"""
+
+import email.utils
+import hashlib
+import http.client
+import os
+import random
+import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from urllib.parse import urljoin, urlsplit
+
+from generator.cache import file_sha256, materialize
+from generator.journal import DONE, PARTIAL
+from generator.sniff import HEAD_SIZE, IMAGE_FORMATS, has_trailer, sniff
+
+USER_AGENT = "Mozilla/5.0 (compatible; generator_pribadi asset fetcher)"
+MAX_REDIRECTS = 5
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+CHUNK_SIZE = 64 * 1024
+PERMANENT_CODES = (404, 410)
+TRANSIENT_CODES = (429, 500, 502, 503, 504)
+TAIL_SIZE = 16
+
+
+class FetchError(Exception):
+    def __init__(self, url, message, status=None, retry_after=None, transient=None):
+        super().__init__(f"{url}: {message}")
+        self.url = url
+        self.status = status
+        self.retry_after = retry_after
+        if transient is None:
+            transient = status is None or status in TRANSIENT_CODES
+        self.transient = transient
+
+
+@dataclass
+class DownloadResult:
+    url: str
+    dest: str
+    ok: bool
+    error: str = None
+    size: int = 0
+    from_cache: bool = False
+    skipped: bool = False
+    fallback: bool = False
+    sha256: str = None
+
+
+class _CircuitBreaker:
+    """Opens after ``threshold`` consecutive transient failures on a host.
+
+    While open every request to the host fails fast. After ``cooldown``
+    seconds a single trial request is let through; success closes the
+    breaker, failure opens it again.
+    """
+
+    def __init__(self, threshold, cooldown):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.open_until = 0.0
+        self.trial = False
+        self.lock = threading.Lock()
+
+    def allow(self):
+        with self.lock:
+            if self.failures < self.threshold:
+                return True
+            if time.monotonic() < self.open_until or self.trial:
+                return False
+            self.trial = True
+            return True
+
+    def record(self, ok):
+        with self.lock:
+            self.trial = False
+            if ok:
+                self.failures = 0
+                return
+            self.failures += 1
+            if self.failures >= self.threshold:
+                self.open_until = time.monotonic() + self.cooldown
+
+
+class _HostPool:
+    """Idle keep-alive connections for one scheme://host, plus a slot limit."""
+
+    def __init__(self, scheme, netloc, limit, timeout, context, breaker):
+        self.scheme = scheme
+        self.netloc = netloc
+        self.timeout = timeout
+        self.context = context
+        self.breaker = breaker
+        self.slots = threading.BoundedSemaphore(limit)
+        self.idle = []
+        self.lock = threading.Lock()
+
+    def _connect(self):
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.netloc, timeout=self.timeout, context=self.context)
+        return http.client.HTTPConnection(self.netloc, timeout=self.timeout)
+
+    def acquire(self):
+        """Block for a slot and return ``(connection, reused)``."""
+        self.slots.acquire()
+        with self.lock:
+            if self.idle:
+                return self.idle.pop(), True
+        return self._connect(), False
+
+    def release(self, conn, keep):
+        if keep:
+            with self.lock:
+                self.idle.append(conn)
+        else:
+            conn.close()
+        self.slots.release()
+
+    def close(self):
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for conn in idle:
+            conn.close()
+
+
+class Downloader:
+    def __init__(self, max_workers=8, per_host=4, timeout=30, verify=True, headers=None,
+                 cache=None, journal=None, revalidate=False, retries=3, backoff=0.5,
+                 max_backoff=30.0, negative_ttl=24 * 3600, breaker_threshold=5,
+                 breaker_cooldown=30.0):
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self.timeout = timeout
+        self.cache = cache
+        self.journal = journal
+        self.revalidate = revalidate
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.negative_ttl = negative_ttl
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        self.headers = {"User-Agent": USER_AGENT, "Accept": "image/*,*/*;q=0.8"}
+        self.headers.update(headers or {})
+        self.context = ssl.create_default_context()
+        if not verify:
+            self.context.check_hostname = False
+            self.context.verify_mode = ssl.CERT_NONE
+        self._pools = {}
+        self._pools_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        with self._pools_lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.close()
+        if self.cache is not None:
+            self.cache.close()
+
+    def _pool(self, scheme, netloc):
+        key = (scheme, netloc)
+        with self._pools_lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                breaker = _CircuitBreaker(self.breaker_threshold, self.breaker_cooldown)
+                pool = _HostPool(scheme, netloc, self.per_host, self.timeout, self.context, breaker)
+                self._pools[key] = pool
+            return pool
+
+    def _send(self, pool, path, headers):
+        # A reused keep-alive connection may have been closed by the server
+        # while idle; retry once on a fresh one before giving up.
+        while True:
+            conn, reused = pool.acquire()
+            try:
+                conn.request("GET", path, headers=headers)
+                return conn, conn.getresponse()
+            except (http.client.HTTPException, OSError):
+                pool.release(conn, keep=False)
+                if not reused:
+                    raise
+
+    @contextmanager
+    def _request(self, url, headers=None):
+        """GET ``url``, following redirects, and yield the open response.
+
+        The connection goes back to its pool when the block exits; it is
+        only kept alive if the body was read to the end.
+        """
+        merged = dict(self.headers)
+        merged.update(headers or {})
+        target = url
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(target)
+            if parts.scheme not in ("http", "https"):
+                raise FetchError(url, f"unsupported scheme {parts.scheme!r}", transient=False)
+            path = parts.path or "/"
+            if parts.query:
+                path += "?" + parts.query
+            pool = self._pool(parts.scheme, parts.netloc)
+            if not pool.breaker.allow():
+                raise FetchError(url, f"circuit open for {parts.netloc}, skipping", transient=False)
+            try:
+                conn, resp = self._send(pool, path, merged)
+            except (http.client.HTTPException, OSError) as e:
+                pool.breaker.record(ok=False)
+                raise FetchError(url, str(e)) from e
+            pool.breaker.record(ok=resp.status not in TRANSIENT_CODES)
+            if resp.status in REDIRECT_CODES:
+                location = resp.getheader("Location")
+                try:
+                    resp.read()
+                finally:
+                    pool.release(conn, keep=not resp.will_close)
+                if not location:
+                    raise FetchError(url, f"HTTP {resp.status} without Location", resp.status)
+                target = urljoin(target, location)
+                continue
+            try:
+                yield resp
+            except BaseException:
+                pool.release(conn, keep=False)
+                raise
+            pool.release(conn, keep=not resp.will_close and resp.isclosed())
+            return
+        raise FetchError(url, "too many redirects", transient=False)
+
+    def fetch(self, url, headers=None):
+        """GET ``url``, following redirects, and return the body bytes."""
+        try:
+            with self._request(url, headers) as resp:
+                if resp.status != 200:
+                    resp.read()
+                    raise _status_error(url, resp)
+                return resp.read()
+        except (http.client.HTTPException, OSError) as e:
+            raise FetchError(url, str(e)) from e
+
+    def download(self, url, dest):
+        """Fetch ``url`` into ``dest`` and return a :class:`DownloadResult`.
+
+        The body is streamed into ``dest + ".part"`` and renamed over
+        ``dest`` only once complete, so a half-written file never appears
+        under its final name.
+        """
+        journal = self.journal
+        if journal is not None and not self.revalidate and journal.is_done(dest, url):
+            entry = journal.get(dest, url)
+            return DownloadResult(url, dest, True, size=entry["size"], sha256=entry.get("sha256"),
+                                  skipped=True)
+        # Revalidating asks the server, not the cache, about items it can
+        # send validators for.
+        verified = _verified(journal.get(dest, url) if journal is not None else None, dest)
+        revalidating = self.revalidate and verified is not None
+
+        if self.cache is not None and not revalidating:
+            blob = self.cache.lookup(url)
+            if blob is not None:
+                materialize(blob, dest)
+                size = os.path.getsize(dest)
+                sha256 = os.path.basename(blob)
+                if journal is not None:
+                    journal.complete(dest, url, size, sha256=sha256)
+                return DownloadResult(url, dest, True, size=size, sha256=sha256, from_cache=True)
+
+        if self.cache is not None:
+            status = self.cache.lookup_failure(url)
+            if status is not None:
+                return DownloadResult(url, dest, False, f"{url}: HTTP {status} (remembered, not retried)")
+
+        attempt = 0
+        while True:
+            try:
+                return self._stream(url, dest, verified)
+            except FetchError as e:
+                error = e
+            except (http.client.HTTPException, OSError) as e:
+                error = FetchError(url, str(e))
+            if error.status in PERMANENT_CODES and self.cache is not None:
+                self.cache.put_failure(url, error.status, self.negative_ttl)
+            if not error.transient or attempt >= self.retries:
+                return DownloadResult(url, dest, False, str(error))
+            time.sleep(self._delay(attempt, error.retry_after))
+            attempt += 1
+
+    def _delay(self, attempt, retry_after):
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff) + random.uniform(0, self.backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def _stream(self, url, dest, verified=None):
+        """Download ``url`` into ``dest``; ``verified`` is the sha256 of an intact finished copy, if any."""
+        journal = self.journal
+        entry = journal.get(dest, url) if journal is not None else None
+        part = dest + ".part"
+        headers = {}
+        offset = 0
+        if entry is not None and (entry.get("etag") or entry.get("last_modified")):
+            validator = entry.get("etag") or entry.get("last_modified")
+            if verified is not None:
+                if entry.get("etag"):
+                    headers["If-None-Match"] = entry["etag"]
+                if entry.get("last_modified"):
+                    headers["If-Modified-Since"] = entry["last_modified"]
+            elif entry["state"] == PARTIAL and os.path.exists(part):
+                offset = os.path.getsize(part)
+                if offset:
+                    headers["Range"] = f"bytes={offset}-"
+                    headers["If-Range"] = validator
+
+        with self._request(url, headers) as resp:
+            if resp.status == 304 and ("If-None-Match" in headers or "If-Modified-Since" in headers):
+                resp.read()
+                size = os.path.getsize(dest)
+                sha256 = verified
+                normalized = entry.get("normalized", False)
+                journal.complete(dest, url, size, entry.get("etag"), entry.get("last_modified"), sha256,
+                                 normalized)
+                if self.cache is not None and not normalized:
+                    # A normalized file is not the URL's body; keep it out of the cache.
+                    self.cache.put(url, dest, sha256)
+                return DownloadResult(url, dest, True, size=size, sha256=sha256, skipped=True)
+            if resp.status == 416 and offset:
+                # The partial file no longer lines up with the resource.
+                resp.read()
+                os.unlink(part)
+                raise FetchError(url, "stale partial download discarded, restarting")
+            if resp.status == 206 and offset:
+                if _content_range_start(resp.getheader("Content-Range")) != offset:
+                    resp.read()
+                    os.unlink(part)
+                    raise FetchError(url, "server resumed at the wrong offset, restarting")
+                mode = "ab"
+            elif resp.status == 200:
+                # A full body, even if a range was asked for: start over.
+                mode = "wb"
+                offset = 0
+            else:
+                resp.read()
+                raise _status_error(url, resp)
+
+            content_type = (resp.getheader("Content-Type") or "").lower()
+            if content_type.startswith(("text/", "application/json", "application/xhtml")):
+                resp.read()
+                raise FetchError(url, f"expected an image, got {content_type}", resp.status,
+                                 transient=False)
+            expected = _expected_length(resp, offset)
+            etag = resp.getheader("ETag")
+            last_modified = resp.getheader("Last-Modified")
+            if journal is not None:
+                journal.start(dest, url, etag, last_modified)
+            os.makedirs(os.path.dirname(dest) or ".", exist_ok=True)
+            try:
+                sha256, size = self._write_validated(url, resp, part, mode, offset, expected)
+            except FetchError as e:
+                if not e.transient:
+                    os.unlink(part)
+                raise
+
+        # Renaming replaces the directory entry, so an old hardlink into the
+        # cache at ``dest`` is never written through.
+        os.replace(part, dest)
+        if journal is not None:
+            journal.complete(dest, url, size, etag, last_modified, sha256)
+        if self.cache is not None:
+            self.cache.put(url, dest, sha256)
+        return DownloadResult(url, dest, True, size=size, sha256=sha256)
+
+    def _write_validated(self, url, resp, part, mode, offset, expected):
+        """Stream ``resp`` into ``part`` and return ``(sha256, size)``.
+
+        Hashing, byte counting and the magic-number and trailer checks all
+        happen on the chunks as they pass through, so memory stays at one
+        chunk whatever the image size and the file is never read back.
+        Only the bytes of a resumed ``.part`` are read, once, to seed the
+        hash.
+        """
+        hasher = hashlib.sha256()
+        head = b""
+        tail = b""
+        size = 0
+        if mode == "ab":
+            with open(part, "rb") as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                    if len(head) < HEAD_SIZE:
+                        head += chunk[:HEAD_SIZE - len(head)]
+                    hasher.update(chunk)
+                    tail = (tail + chunk)[-TAIL_SIZE:]
+                    size += len(chunk)
+        kind = _require_image(url, head) if len(head) >= HEAD_SIZE else None
+
+        with open(part, mode) as f:
+            while True:
+                chunk = resp.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                if kind is None and len(head) < HEAD_SIZE:
+                    head += chunk[:HEAD_SIZE - len(head)]
+                    if len(head) >= HEAD_SIZE:
+                        kind = _require_image(url, head)
+                hasher.update(chunk)
+                f.write(chunk)
+                tail = (tail + chunk)[-TAIL_SIZE:]
+                size += len(chunk)
+
+        if kind is None:
+            kind = _require_image(url, head)
+        received = size - offset
+        if expected is not None and received != expected:
+            raise FetchError(url, f"truncated body: got {received} of {expected} bytes")
+        if not has_trailer(kind, tail):
+            raise FetchError(url, f"truncated {kind}: missing end marker", transient=False)
+        return hasher.hexdigest(), size
+
+    def download_all(self, jobs, on_done=None, fallback=None):
+        """Download ``(url, dest)`` pairs concurrently.
+
+        Results come back in job order. Each distinct URL is requested at
+        most once; extra destinations are hardlinked (or copied) from the
+        first. ``on_done`` is called with each result as soon as it
+        finishes, from the worker thread.
+
+        ``fallback(url, dest)`` is called for every job that still failed;
+        it returns the path it wrote instead (possibly with a different
+        extension), or ``None`` to leave the job failed.
+        """
+        jobs = list(jobs)
+        by_url = {}
+        for index, (url, dest) in enumerate(jobs):
+            by_url.setdefault(url, []).append(index)
+        results = [None] * len(jobs)
+
+        def run(url):
+            indexes = by_url[url]
+            first = self.download(url, jobs[indexes[0]][1])
+            done = [(indexes[0], first)]
+            for index in indexes[1:]:
+                dest = jobs[index][1]
+                if first.ok:
+                    if self.journal is not None and self.journal.is_done(dest, url) and first.skipped:
+                        done.append((index, DownloadResult(url, dest, True, size=first.size,
+                                                           sha256=first.sha256, skipped=True)))
+                        continue
+                    materialize(first.dest, dest)
+                    if self.journal is not None:
+                        self.journal.complete(dest, url, first.size, sha256=first.sha256)
+                    done.append((index, DownloadResult(url, dest, True, size=first.size,
+                                                       sha256=first.sha256, from_cache=True)))
+                else:
+                    done.append((index, DownloadResult(url, dest, False, first.error)))
+            for index, result in done:
+                if not result.ok and fallback is not None:
+                    os.makedirs(os.path.dirname(result.dest) or ".", exist_ok=True)
+                    written = fallback(url, result.dest)
+                    if written is not None:
+                        result = DownloadResult(url, written, True, result.error,
+                                                size=os.path.getsize(written), fallback=True)
+                results[index] = result
+                if on_done is not None:
+                    on_done(result)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            list(pool.map(run, by_url))
+        return results
+
+
+def report(result):
+    """Default ``on_done`` callback used by the fetch scripts."""
+    if result.fallback:
+        print(f"Generated fallback {result.dest} ({result.error})")
+    elif result.ok and result.skipped:
+        print(f"Up to date: {result.dest}")
+    elif result.ok:
+        print(f"{'Cached' if result.from_cache else 'Downloaded'}: {result.dest}")
+    else:
+        print(f"Failed to download {result.url}: {result.error}")
+
+
+def _verified(entry, dest):
+    """The sha256 of ``dest`` if ``entry`` is a finished item it still matches and that has validators.
+
+    Only such a file may be re-checked with a conditional GET: a 304 vouches
+    for the bytes the journal recorded, not for a truncated or edited copy.
+    """
+    if (entry is None or entry.get("state") != DONE or not entry.get("sha256")
+            or not (entry.get("etag") or entry.get("last_modified"))):
+        return None
+    try:
+        if os.path.getsize(dest) != entry.get("size"):
+            return None
+        sha256 = file_sha256(dest)
+    except OSError:
+        return None
+    return sha256 if sha256 == entry["sha256"] else None
+
+
+def _content_range_start(value):
+    # "bytes 100-199/200" -> 100
+    try:
+        unit, spec = value.split(" ", 1)
+        return int(spec.split("-", 1)[0]) if unit == "bytes" else None
+    except (AttributeError, ValueError):
+        return None
+
+
+def _retry_after(value):
+    # Either delta-seconds or an HTTP-date.
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def _status_error(url, resp):
+    return FetchError(url, f"HTTP {resp.status} {resp.reason}", resp.status,
+                      _retry_after(resp.getheader("Retry-After")))
+
+
+def _expected_length(resp, offset):
+    if offset and resp.status == 206:
+        # "bytes 100-199/200" -> 100 bytes still to come
+        try:
+            first, last = resp.getheader("Content-Range").split(" ", 1)[1].split("/")[0].split("-")
+            return int(last) - int(first) + 1
+        except (AttributeError, IndexError, ValueError):
+            return None
+    length = resp.getheader("Content-Length")
+    return int(length) if length and length.isdigit() else None
+
+
+def _require_image(url, head):
+    kind = sniff(head)
+    if kind not in IMAGE_FORMATS:
+        raise FetchError(url, f"expected an image, got {kind or 'unknown data'}", transient=False)
+    return kind
@@ -0,0 +1,138 @@
+"""Pixel size and format of an image from its header alone.
+
+Decoding an image to learn its size costs a full read and decode. Every
+format the apps bundle stores its size in the first few hundred bytes
+(JPEG after its metadata segments, which are skipped by length without
+being read), so :func:`image_info` only touches those. It takes any
+sliceable buffer, so an ``mmap`` of the file works as well as ``bytes``.
+
+Stdlib only; Pillow is not needed.
+"""
+
+import re
+import struct
+from dataclasses import dataclass
+
+from generator.sniff import sniff
+
+
+class HeaderError(ValueError):
+    """The header is cut short or malformed."""
+
+
+@dataclass(frozen=True)
+class ImageInfo:
+    format: str
+    width: int
+    height: int
+
+
+# JPEG start-of-frame markers (DHT, JPG and DAC share the range but are not frames).
+_SOF = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+_STANDALONE = frozenset(range(0xD0, 0xDA)) | {0x01}
+_SVG_TAG = re.compile(rb"<svg\b[^>]*>", re.S)
+_SVG_ATTR = re.compile(rb"""\s(width|height|viewBox)\s*=\s*["']([^"']*)["']""")
+_SVG_LENGTH = re.compile(r"^\s*(\d+(?:\.\d+)?|\.\d+)\s*(px)?\s*$")
+
+
+def _unpack(fmt, buf, offset):
+    end = offset + struct.calcsize(fmt)
+    if len(buf) < end:
+        raise HeaderError("header is truncated")
+    return struct.unpack(fmt, buf[offset:end])
+
+
+def _jpeg(buf):
+    pos = 2
+    while True:
+        if len(buf) < pos + 2:
+            raise HeaderError("no frame header before the end of the file")
+        if buf[pos] != 0xFF:
+            raise HeaderError(f"expected a marker at byte {pos}")
+        marker = buf[pos + 1]
+        if marker == 0xFF:          # fill byte
+            pos += 1
+            continue
+        if marker in _STANDALONE:
+            pos += 2
+            continue
+        if marker in (0xD9, 0xDA):
+            raise HeaderError("no frame header before the image data")
+        (length,) = _unpack(">H", buf, pos + 2)
+        if marker in _SOF:
+            height, width = _unpack(">HH", buf, pos + 5)
+            return width, height
+        pos += 2 + length
+
+
+def _webp(buf):
+    chunk = bytes(buf[12:16])
+    if chunk == b"VP8 ":
+        (w, h) = _unpack("<HH", buf, 26)
+        return w & 0x3FFF, h & 0x3FFF
+    if chunk == b"VP8L":
+        (bits,) = _unpack("<I", buf, 21)
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        raw = bytes(buf[24:30])
+        if len(raw) < 6:
+            raise HeaderError("header is truncated")
+        return int.from_bytes(raw[:3], "little") + 1, int.from_bytes(raw[3:], "little") + 1
+    raise HeaderError(f"unknown WebP chunk {chunk!r}")
+
+
+def _svg_length(value):
+    m = _SVG_LENGTH.match(value)
+    return round(float(m.group(1))) if m else None
+
+
+def _svg(buf):
+    m = _SVG_TAG.search(bytes(buf[:8192]))
+    if not m:
+        raise HeaderError("no <svg> start tag in the first 8 KiB")
+    attrs = {k.decode(): v.decode("utf-8", "replace") for k, v in _SVG_ATTR.findall(m.group(0))}
+    width, height = _svg_length(attrs.get("width", "")), _svg_length(attrs.get("height", ""))
+    if (width is None or height is None) and "viewBox" in attrs:
+        parts = re.split(r"[\s,]+", attrs["viewBox"].strip())
+        if len(parts) == 4:
+            try:
+                vw, vh = float(parts[2]), float(parts[3])
+            except ValueError:
+                raise HeaderError(f"bad viewBox {attrs['viewBox']!r}") from None
+            width = width if width is not None else round(vw)
+            height = height if height is not None else round(vh)
+    if width is None or height is None:
+        raise HeaderError("the <svg> element has no usable size")
+    return width, height
+
+
+def image_info(buf):
+    """Return the :class:`ImageInfo` of the image in ``buf``, or None if it is not an image.
+
+    Raises :class:`HeaderError` when the header is truncated or malformed.
+    """
+    kind = sniff(bytes(buf[:32]))
+    if kind == "png":
+        if bytes(buf[12:16]) != b"IHDR":
+            raise HeaderError("PNG does not start with IHDR")
+        width, height = _unpack(">II", buf, 16)
+    elif kind == "jpeg":
+        width, height = _jpeg(buf)
+    elif kind == "gif":
+        width, height = _unpack("<HH", buf, 6)
+    elif kind == "bmp":
+        (dib,) = _unpack("<I", buf, 14)
+        if dib == 12:
+            width, height = _unpack("<HH", buf, 18)
+        else:
+            width, height = _unpack("<ii", buf, 18)
+            height = abs(height)    # negative means top-down rows
+    elif kind == "webp":
+        width, height = _webp(buf)
+    elif kind == "svg":
+        width, height = _svg(buf)
+    else:
+        return None
+    if width <= 0 or height <= 0:
+        raise HeaderError(f"{kind} header gives a {width}x{height} image")
+    return ImageInfo(kind, width, height)
@@ -0,0 +1,159 @@
+"""Cached inverted index of the identifiers each project file contains.
+
+Most files in a project contain none of the names a rename is looking for,
+yet a plain rewrite reads all of them. :class:`SymbolIndex` records, per
+text file, the set of word tokens (``[A-Za-z0-9_]+``) it contains, found
+with a bytes-level regex over an ``mmap`` so nothing is decoded. The index
+is stored next to the project (``.symbol_index.json``) and each entry is
+keyed on the file's mtime and size, so a refresh only rescans files that
+changed since the last run.
+
+A rewrite key such as ``package:shoe_room_ai`` or ``Shoe Room`` is split
+into its word tokens; a file is a candidate when, for every token of the
+key, it contains a token with that text in it. That is a superset of the
+files that really match, and :meth:`SymbolIndex.preview` then scans just
+those candidates to report the exact edits.
+"""
+
+import json
+import mmap
+import os
+import re
+from collections import Counter
+
+from generator.walk import iter_files
+
+VERSION = 1
+INDEX_NAME = ".symbol_index.json"
+
+TEXT_SUFFIXES = (
+    ".dart", ".yaml", ".yml", ".json", ".arb", ".md", ".txt", ".xml", ".plist",
+    ".gradle", ".kts", ".kt", ".java", ".swift", ".m", ".h", ".xcconfig",
+    ".pbxproj", ".xcscheme", ".storyboard", ".html", ".properties",
+)
+
+_TOKEN = re.compile(rb"[A-Za-z0-9_]+")
+_KEY_TOKEN = re.compile(r"[A-Za-z0-9_]+")
+
+
+def scan_tokens(path, size=None):
+    """Return the set of word tokens in ``path``, read through ``mmap``."""
+    if size is None:
+        size = os.path.getsize(path)
+    if size == 0:
+        return set()
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return {t.decode("ascii") for t in set(_TOKEN.findall(data))}
+
+
+class SymbolIndex:
+    def __init__(self, root, suffixes=TEXT_SUFFIXES, cache_path=None):
+        self.root = root
+        self.suffixes = suffixes
+        self.cache_path = cache_path or os.path.join(root, INDEX_NAME)
+        self._files = {}    # relpath -> {"mtime": ns, "size": n, "tokens": [...]}
+        self._postings = None
+        self.rescanned = 0
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == VERSION:
+            self._files = data.get("files", {})
+
+    def _save(self):
+        tmp = f"{self.cache_path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": VERSION, "files": self._files}, f, separators=(",", ":"))
+        os.replace(tmp, self.cache_path)
+
+    def refresh(self):
+        """Bring the index up to date with the tree and return ``self``.
+
+        Files whose mtime and size match the cached entry are not opened.
+        """
+        seen = {}
+        self.rescanned = 0
+        dirty = False
+        for path, size in iter_files(self.root, self.suffixes):
+            rel = os.path.relpath(path, self.root).replace(os.sep, "/")
+            if rel == INDEX_NAME:
+                continue
+            mtime = os.stat(path).st_mtime_ns
+            entry = self._files.get(rel)
+            if entry is None or entry["mtime"] != mtime or entry["size"] != size:
+                try:
+                    tokens = scan_tokens(path, size)
+                except OSError:
+                    continue
+                entry = {"mtime": mtime, "size": size, "tokens": sorted(tokens)}
+                self.rescanned += 1
+                dirty = True
+            seen[rel] = entry
+        if dirty or seen.keys() != self._files.keys():
+            self._files = seen
+            self._save()
+        self._postings = None
+        return self
+
+    def _index(self):
+        if self._postings is None:
+            postings = {}
+            for rel, entry in self._files.items():
+                for token in entry["tokens"]:
+                    postings.setdefault(token, set()).add(rel)
+            self._postings = postings
+        return self._postings
+
+    def files_containing(self, key):
+        """Relative paths of the files that may contain ``key``."""
+        postings = self._index()
+        tokens = _KEY_TOKEN.findall(key)
+        if not tokens:
+            return set(self._files)
+        result = None
+        for part in tokens:
+            files = set()
+            for token, rels in postings.items():
+                if part in token:
+                    files |= rels
+            result = files if result is None else result & files
+            if not result:
+                break
+        return result
+
+    def candidates(self, keys, suffixes=None):
+        """Sorted paths (joined to ``root``) of files that may contain any of ``keys``."""
+        rels = set()
+        for key in keys:
+            rels |= self.files_containing(key)
+        if suffixes is not None:
+            rels = {rel for rel in rels if rel.endswith(suffixes)}
+        return [os.path.join(self.root, rel) for rel in sorted(rels)]
+
+    def preview(self, rewriter, suffixes=None):
+        """Return ``[(path, Counter({old: n}))]`` for the files ``rewriter`` would change.
+
+        Only candidate files are read; the counts are exact.
+        """
+        plan = []
+        for path in self.candidates(rewriter.table, suffixes):
+            with open(path, "rb") as f:
+                counts = rewriter.matches(f.read())
+            if counts:
+                plan.append((path, counts))
+        return plan
+
+
+def print_preview(plan, table):
+    """Print a plan from :meth:`SymbolIndex.preview`, one line per file."""
+    total = Counter()
+    for path, counts in plan:
+        total.update(counts)
+        edits = ", ".join(f"{n} x {old!r} -> {table[old]!r}" for old, n in sorted(counts.items()))
+        print(f"  {path}: {edits}")
+    print(f"{len(plan)} files, {sum(total.values())} replacements")
@@ -0,0 +1,98 @@
+"""Persistent per-project journal of download jobs.
+
+The journal is a small JSON file mapping each destination path to the URL
+it was fetched from, whether it finished, and the ``ETag``/``Last-Modified``
+validators the server sent. A re-run skips finished items, resumes
+unfinished ``.part`` files with a ``Range`` request, and, when asked to
+revalidate, turns finished items into conditional GETs.
+
+Every update is written to a temporary file and renamed into place, so an
+interrupted run never leaves a torn journal behind.
+"""
+
+import json
+import os
+import threading
+
+VERSION = 1
+
+PARTIAL = "partial"
+DONE = "done"
+
+
+class JobJournal:
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._items = {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except ValueError:
+            print(f"Ignoring unreadable download journal: {path}")
+            return
+        if data.get("version") == VERSION:
+            self._items = data.get("items", {})
+
+    def get(self, dest, url):
+        """Return the entry for ``dest`` if it was recorded for ``url``."""
+        with self._lock:
+            entry = self._items.get(dest)
+        if entry is None or entry.get("url") != url:
+            return None
+        return dict(entry)
+
+    def is_done(self, dest, url):
+        """True when ``dest`` finished from ``url`` and is still on disk intact."""
+        entry = self.get(dest, url)
+        if entry is None or entry.get("state") != DONE:
+            return False
+        try:
+            return os.path.getsize(dest) == entry.get("size")
+        except OSError:
+            return False
+
+    def start(self, dest, url, etag=None, last_modified=None):
+        self._record(dest, {"url": url, "state": PARTIAL, "etag": etag,
+                            "last_modified": last_modified})
+
+    def complete(self, dest, url, size, etag=None, last_modified=None, sha256=None, normalized=False):
+        entry = {"url": url, "state": DONE, "size": size, "etag": etag,
+                 "last_modified": last_modified, "sha256": sha256}
+        if normalized:
+            entry["normalized"] = True
+        self._record(dest, entry)
+
+    def rewritten(self, dest, size, sha256):
+        """Re-record finished ``dest`` after it was rewritten in place; return True if known.
+
+        :func:`generator.normalize.normalize_project` shrinks downloads
+        after the fact; without this the size check in :meth:`is_done`
+        would fail and every run would fetch them again. The entry is
+        marked ``normalized``, so its bytes are no longer the URL's body.
+        Paths are compared absolute, so ``./p/a.jpg`` matches ``p/a.jpg``.
+        """
+        target = os.path.abspath(dest)
+        found = False
+        with self._lock:
+            for key, entry in self._items.items():
+                if entry.get("state") == DONE and os.path.abspath(key) == target:
+                    entry.update(size=size, sha256=sha256, normalized=True)
+                    found = True
+            if found:
+                self._save()
+        return found
+
+    def _record(self, dest, entry):
+        with self._lock:
+            self._items[dest] = entry
+            self._save()
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": VERSION, "items": self._items}, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
@@ -0,0 +1,212 @@
+"""Machine-readable asset manifests.
+
+``ASSET_SOURCES.md`` is written for people, and every script used to write
+it differently. Next to it, each project gets ``ASSET_MANIFEST.jsonl``:
+one JSON object per line for every file under ``assets/``, sorted by
+path::
+
+    {"path": "examples/ex_0.jpg", "category": "examples", "label": "Example",
+     "source": "Picsum (Unsplash)", "license": "Unsplash License",
+     "sha256": "...", "bytes": 49215, "width": 800, "height": 600,
+     "format": "jpeg", "color": "#605A42", "blurhash": "LTC6.0~p-;...",
+     "fingerprint": "..."}
+
+``category`` is the asset directory and ``label`` its name in the
+Markdown. ``source`` and ``license`` come from the spec when it covers
+the file, else from the tables in ``ASSET_SOURCES.md`` (matched by path,
+file name or glob), else they are null. ``width``/``height``/``format``
+are read from the header (:mod:`generator.imagehead`); ``color`` and
+``blurhash`` are the image's :mod:`generator.placeholder` values, carried
+over from the previous manifest while the file's hash is unchanged (and
+null where Pillow is missing). ``fingerprint`` is
+the build database's record of the inputs the file was built or
+downloaded from, null for files the build does not produce.
+
+Tools that need hashes, sizes or dimensions (incremental builds, dedup,
+size budgets) stream the manifest with :func:`read_manifest` instead of
+opening every asset.
+"""
+
+import fnmatch
+import hashlib
+import json
+import mmap
+import os
+import re
+
+from generator import placeholder
+from generator.builddb import DB_NAME, BuildDB, write_if_changed
+from generator.imagehead import HeaderError, image_info
+
+JSONL_NAME = "ASSET_MANIFEST.jsonl"
+MARKDOWN_NAME = "ASSET_SOURCES.md"
+FIELDS = ("path", "category", "label", "source", "license", "sha256", "bytes", "width", "height",
+          "format", "color", "blurhash", "fingerprint")
+
+_SKIP = {JSONL_NAME, MARKDOWN_NAME}
+_CHUNK = 1 << 20
+
+
+def _cells(line):
+    return [cell.strip().strip("`").strip() for cell in line.strip().strip("|").split("|")]
+
+
+def markdown_rows(path):
+    """``(file pattern, label, source, license)`` from the tables in a Markdown manifest.
+
+    Column names vary between the scripts that wrote them (``Source`` or
+    ``Source URL``, ``License`` or ``License Note``); any column whose name
+    mentions it is used.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return []
+    rows = []
+    columns = None
+    for line in lines:
+        if not line.lstrip().startswith("|"):
+            columns = None
+            continue
+        cells = _cells(line)
+        if columns is None:
+            names = [c.lower() for c in cells]
+            find = lambda word: next((i for i, n in enumerate(names) if word in n), None)
+            columns = {"file": find("file"), "label": find("category"), "source": find("source"),
+                       "license": find("license")}
+            continue
+        if all(re.fullmatch(r":?-+:?", c) for c in cells if c):
+            continue
+        if columns["file"] is None or columns["file"] >= len(cells):
+            continue
+        rows.append(tuple(_cell(cells, columns[key]) for key in ("file", "label", "source", "license")))
+    return rows
+
+
+def _cell(cells, index):
+    if index is None or index >= len(cells):
+        return None
+    return cells[index] or None
+
+
+def _lookup(markdown):
+    """Return a function mapping a relative path to its Markdown row, or None."""
+    exact, by_name, globs = {}, {}, []
+    for row in markdown:
+        pattern = row[0].removeprefix("assets/")
+        if any(c in pattern for c in "*?["):
+            globs.append((pattern, row))
+        elif "/" in pattern:
+            exact.setdefault(pattern, row)
+        else:
+            by_name.setdefault(pattern, row)
+
+    def find(rel):
+        if rel in exact:
+            return exact[rel]
+        name = rel.rsplit("/", 1)[-1]
+        if name in by_name:
+            return by_name[name]
+        for pattern, row in globs:
+            if fnmatch.fnmatch(rel if "/" in pattern else name, pattern):
+                return row
+        return None
+    return find
+
+
+def file_entry(path, rel):
+    """The hash, size and header fields of one file."""
+    digest = hashlib.sha256()
+    size = os.path.getsize(path)
+    info = None
+    with open(path, "rb") as f:
+        if size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                try:
+                    info = image_info(mm)
+                except HeaderError:
+                    info = None
+                for offset in range(0, size, _CHUNK):
+                    digest.update(mm[offset:offset + _CHUNK])
+    return {"path": rel, "sha256": digest.hexdigest(), "bytes": size,
+            "width": info.width if info else None, "height": info.height if info else None,
+            "format": info.format if info else None}
+
+
+def _placeholder(path, entry, previous):
+    old = previous.get(entry["sha256"])
+    if old is not None and "blurhash" in old:
+        return old["color"], old["blurhash"]
+    if entry["format"] is None or placeholder.Image is None:
+        return None, None
+    try:
+        return placeholder.placeholder(path)
+    except (OSError, ValueError):    # undecodable, or an SVG svgraster cannot draw
+        return None, None
+
+
+def scan(assets_dir, provenance=None, markdown=None, db=None, previous=None):
+    """Yield one manifest entry per file under ``assets_dir``, sorted by path.
+
+    ``provenance`` maps a relative path to ``(label, source, license)``
+    and wins over the ``markdown`` rows; ``db`` supplies fingerprints and
+    ``previous`` (sha256 -> old entry) the placeholders of unchanged files.
+    """
+    from generator.walk import iter_files
+
+    provenance = provenance or {}
+    find = _lookup(markdown or [])
+    rels = []
+    for path, _ in iter_files(assets_dir):
+        rel = os.path.relpath(path, assets_dir).replace(os.sep, "/")
+        name = rel.rsplit("/", 1)[-1]
+        if name in _SKIP or name.startswith(".") or name.endswith((".tmp", ".part")):
+            continue
+        rels.append(rel)
+    for rel in sorted(rels):
+        path = os.path.join(assets_dir, *rel.split("/"))
+        entry = file_entry(path, rel)
+        entry["color"], entry["blurhash"] = _placeholder(path, entry, previous or {})
+        if rel in provenance:
+            label, source, license_ = provenance[rel]
+        else:
+            row = find(rel)
+            label, source, license_ = row[1:] if row else (None, None, None)
+        recorded = db.get(rel) if db is not None else None
+        entry.update(category=rel.split("/", 1)[0] if "/" in rel else "", label=label, source=source,
+                     license=license_, fingerprint=recorded["fp"] if recorded else None)
+        yield {key: entry[key] for key in FIELDS}
+
+
+def write_manifest(assets_dir, entries):
+    """Write ``entries`` as ``ASSET_MANIFEST.jsonl``; return True if the file changed."""
+    lines = [json.dumps(entry, ensure_ascii=False, separators=(", ", ": ")) for entry in entries]
+    return write_if_changed(os.path.join(assets_dir, JSONL_NAME), ("\n".join(lines) + "\n").encode("utf-8"))
+
+
+def read_manifest(path):
+    """Yield the entries of an ``ASSET_MANIFEST.jsonl`` one at a time."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def update(project_dir, provenance=None, db=None):
+    """Rewrite ``project_dir``'s JSONL manifest; return True if the file changed.
+
+    The build passes the spec's rows as ``provenance`` and its open
+    database; scripts that write ``ASSET_SOURCES.md`` by hand call this
+    after writing it, and their rows are read back from the Markdown.
+    """
+    assets = os.path.join(project_dir, "assets")
+    if not os.path.isdir(assets):
+        return False
+    if db is None:
+        db = BuildDB(os.path.join(project_dir, DB_NAME))
+    markdown = markdown_rows(os.path.join(assets, MARKDOWN_NAME))
+    previous = {}
+    if os.path.exists(os.path.join(assets, JSONL_NAME)):
+        previous = {e["sha256"]: e for e in read_manifest(os.path.join(assets, JSONL_NAME))}
+    return write_manifest(assets, scan(assets, provenance, markdown, db, previous))
@@ -0,0 +1,172 @@
+"""2x2 moodboard collages as SVG.
+
+A moodboard is four square tiles, each center-cropped with
+``preserveAspectRatio="xMidYMid slice"``, separated by a light gutter. The
+tiles are usually thumbnails the project already ships, so inlining them as
+base64 in every moodboard stores each photo many times over. Two modes
+avoid that:
+
+``linked``
+    each moodboard references its tiles by relative path, so the SVG is a
+    few hundred bytes and the tiles are stored once;
+``sprite``
+    every moodboard is laid out in one sprite sheet that embeds each tile
+    once in ``<defs>`` and places it with ``<use>``. A ``<view>`` per
+    moodboard (``moodboards.svg#style_1_moodboard``) and a JSON index of
+    viewBox offsets let callers show one board at a time.
+
+``raster``
+    each moodboard is composited straight to a JPEG at its display size
+    (see :mod:`generator.collage`), so the app shows it as a plain image.
+
+``embed`` keeps the old self-contained files.
+"""
+
+import base64
+import json
+import os
+
+from generator.builddb import write_if_changed
+from generator.collage import Collage
+from generator.svgmin import optimize
+
+MODES = ("embed", "linked", "sprite", "raster")
+
+SIZE = 600
+GUTTER = 4
+GUTTER_COLOR = "#FAF7F2"
+
+_QUADRANTS = ((0, 0), (1, 0), (0, 1), (1, 1))
+
+
+def data_uri(data, mime="image/jpeg"):
+    return f"data:{mime};base64,{base64.b64encode(data).decode('ascii')}"
+
+
+def _clip_defs(size):
+    half = size // 2
+    return "\n".join(
+        f'    <clipPath id="c{n}"><rect x="{qx * half}" y="{qy * half}" width="{half}" height="{half}" /></clipPath>'
+        for n, (qx, qy) in enumerate(_QUADRANTS, 1))
+
+
+def _gutters(size, indent="  "):
+    half = size // 2
+    return (f'{indent}<rect x="0" y="0" width="{size}" height="{size}" fill="none" stroke="{GUTTER_COLOR}" stroke-width="{GUTTER}" />\n'
+            f'{indent}<line x1="{half}" y1="0" x2="{half}" y2="{size}" stroke="{GUTTER_COLOR}" stroke-width="{GUTTER}" />\n'
+            f'{indent}<line x1="0" y1="{half}" x2="{size}" y2="{half}" stroke="{GUTTER_COLOR}" stroke-width="{GUTTER}" />')
+
+
+def collage_svg(hrefs, size=SIZE):
+    """Return a standalone 2x2 collage of the four images in ``hrefs``.
+
+    Each href is a relative path or a ``data:`` URI.
+    """
+    half = size // 2
+    images = "\n".join(
+        f'  <image x="{qx * half}" y="{qy * half}" width="{half}" height="{half}" preserveAspectRatio="xMidYMid slice"'
+        f' clip-path="url(#c{n})" xlink:href="{href}" />'
+        for n, ((qx, qy), href) in enumerate(zip(_QUADRANTS, hrefs), 1))
+    return (f'<svg width="{size}" height="{size}" viewBox="0 0 {size} {size}" xmlns="http://www.w3.org/2000/svg"'
+            f' xmlns:xlink="http://www.w3.org/1999/xlink">\n'
+            f'  <defs>\n{_clip_defs(size)}\n  </defs>\n'
+            f'{images}\n'
+            f'{_gutters(size)}\n'
+            f'</svg>\n')
+
+
+def sprite_svg(boards, tiles, size=SIZE, columns=6):
+    """Lay out every moodboard in one sheet and return ``(svg, index)``.
+
+    ``boards`` maps a board name to the four tile keys it shows, ``tiles``
+    maps each tile key to its href. ``index`` maps each board name to the
+    viewBox (``"x y w h"``) that shows just that board.
+    """
+    half = size // 2
+    names = list(boards)
+    rows = max(1, -(-len(names) // columns))
+    width = size * min(columns, max(1, len(names)))
+    height = size * rows
+
+    used = []
+    for name in names:
+        for key in boards[name]:
+            if key not in used:
+                used.append(key)
+    ids = {key: f"t{n}" for n, key in enumerate(used, 1)}
+
+    defs = [_clip_defs(size)]
+    for key in used:
+        defs.append(f'    <image id="{ids[key]}" width="{half}" height="{half}" preserveAspectRatio="xMidYMid slice"'
+                    f' xlink:href="{tiles[key]}" />')
+
+    body = []
+    index = {}
+    for i, name in enumerate(names):
+        x, y = (i % columns) * size, (i // columns) * size
+        view = f"{x} {y} {size} {size}"
+        index[name] = view
+        defs.append(f'    <view id="{name}" viewBox="{view}" />')
+        body.append(f'  <g id="{name}_board" transform="translate({x} {y})">')
+        for n, ((qx, qy), key) in enumerate(zip(_QUADRANTS, boards[name]), 1):
+            # Clip on a wrapper so the clip stays in board space, not in the
+            # space shifted by the <use> element's x/y.
+            body.append(f'    <g clip-path="url(#c{n})"><use xlink:href="#{ids[key]}" x="{qx * half}" y="{qy * half}" /></g>')
+        body.append(_gutters(size, indent="    "))
+        body.append("  </g>")
+
+    svg = (f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}"'
+           f' xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink">\n'
+           f'  <defs>\n' + "\n".join(defs) + '\n  </defs>\n'
+           + "\n".join(body) + "\n</svg>\n")
+    return svg, index
+
+
+def raster_collage(path, sources, size=SIZE, quality=82):
+    """Composite the four images in ``sources`` into ``path`` as a raster moodboard."""
+    board = Collage(SIZE, scale=size / SIZE)
+    for box, src in zip(board.cells(), sources):
+        board.image_cell(box, src)
+    board.gutters(GUTTER, GUTTER_COLOR)
+    return board.save(path, quality=quality)
+
+
+def write_moodboards(out_dir, boards, tiles, mode="linked", sprite_name="moodboards"):
+    """Write ``boards`` into ``out_dir`` and return the paths written.
+
+    ``tiles`` maps each tile key to the tile's file path. In ``linked``
+    mode hrefs are made relative to ``out_dir``; in ``embed`` and
+    ``sprite`` mode the tile bytes are inlined (once per board, or once
+    overall); ``raster`` writes a JPEG per board instead of SVG.
+    """
+    if mode not in MODES:
+        raise ValueError(f"unknown moodboard mode {mode!r}; expected one of {', '.join(MODES)}")
+    os.makedirs(out_dir, exist_ok=True)
+
+    if mode == "raster":
+        return [raster_collage(os.path.join(out_dir, f"{name}.jpg"), [tiles[key] for key in keys])
+                for name, keys in boards.items()]
+
+    if mode == "linked":
+        hrefs = {key: os.path.relpath(path, out_dir).replace(os.sep, "/") for key, path in tiles.items()}
+    else:
+        hrefs = {}
+        for key, path in tiles.items():
+            with open(path, "rb") as f:
+                hrefs[key] = data_uri(f.read())
+
+    written = []
+    if mode == "sprite":
+        svg, index = sprite_svg(boards, hrefs)
+        path = os.path.join(out_dir, f"{sprite_name}.svg")
+        write_if_changed(path, optimize(svg).encode("utf-8"))
+        index_path = os.path.join(out_dir, f"{sprite_name}.json")
+        text = json.dumps({"sprite": os.path.basename(path), "views": index}, indent=1) + "\n"
+        write_if_changed(index_path, text.encode("utf-8"))
+        return [path, index_path]
+
+    for name, keys in boards.items():
+        path = os.path.join(out_dir, f"{name}.svg")
+        write_if_changed(path, optimize(collage_svg([hrefs[key] for key in keys])).encode("utf-8"))
+        written.append(path)
+    return written
@@ -0,0 +1,263 @@
+"""Bound the size and encoding of bundled images at build time.
+
+Every app's ``ImagePrepService.prepImageForAPI`` decodes an image,
+shrinks it to ``maxDimension = 1024`` and re-encodes it as JPEG at quality
+85 on the device, while the fetch scripts ship 1200-1800 px Unsplash
+photos. :func:`normalize_project` applies the same limits once, at build
+time, to every bitmap under a project's ``assets/``:
+
+* an image whose longer side exceeds its category's limit is downsampled
+  (Lanczos) and re-encoded;
+* an image whose bytes do not match its extension (a PNG or BMP saved as
+  ``.jpg``) is re-encoded as what the extension says, since Dart refers to
+  the path and the file cannot be renamed;
+* an EXIF rotation is applied to the pixels, so no decoder has to honor it.
+
+Everything else is left byte for byte as it is; a JPEG is never re-encoded
+just to change its quality. Limits are per asset directory (``LIMITS``)
+and can be overridden per category with the spec's ``normalize`` key::
+
+    "normalize": {"style_tiles": {"max_dimension": 600}, "examples": {"quality": 80}}
+
+Bitmaps the build renders itself and the ``2.0x/``/``3.0x/`` density
+variants (whose limit scales with the density) are not shrunk below what
+they were drawn for. What changed is listed in the project's
+``.normalize_report.json``. A rewritten download is re-recorded in the
+build database and in the project's fetch journal, so neither the build
+nor the fetch scripts download it again.
+
+Needs Pillow, like :mod:`generator.resize`.
+"""
+
+import hashlib
+import io
+import json
+import os
+import re
+from dataclasses import asdict, dataclass, field
+
+from generator.builddb import write_if_changed
+from generator.journal import JobJournal
+from generator.resize import encode_jpeg, fit_within, require_pillow
+from generator.sniff import HEAD_SIZE, sniff
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # pragma: no cover - exercised on machines without Pillow
+    Image = None
+
+MAX_DIMENSION = 1024    # ImagePrepService.maxDimension
+QUALITY = 85            # ImagePrepService's encodeJpg quality
+
+# Longest side per asset directory; anything unlisted gets MAX_DIMENSION.
+LIMITS = {
+    "style_tiles": 800,
+}
+
+REPORT_NAME = ".normalize_report.json"
+
+# Extension -> the format its bytes must be in.
+FORMATS = {".jpg": "jpeg", ".jpeg": "jpeg", ".png": "png", ".webp": "webp"}
+
+_VARIANT_DIR = re.compile(r"^(\d+(?:\.\d+)?)x$")
+_ORIENTATION = 0x0112
+
+
+@dataclass(frozen=True)
+class Rule:
+    max_dimension: int = MAX_DIMENSION
+    quality: int = QUALITY
+
+
+def rules_for(spec):
+    """``{category: Rule}`` with the spec's ``normalize`` overrides applied."""
+    overrides = spec.get("normalize", {})
+    rules = {}
+    for category in set(LIMITS) | set(overrides):
+        base = Rule(LIMITS.get(category, MAX_DIMENSION))
+        rules[category] = Rule(**{**asdict(base), **overrides.get(category, {})})
+    return rules
+
+
+def rule_for(rules, rel):
+    """The rule for the asset at ``rel`` (relative to ``assets/``)."""
+    parts = rel.split("/")
+    rule = rules.get(parts[0] if len(parts) > 1 else "", Rule())
+    m = _VARIANT_DIR.match(parts[-2]) if len(parts) > 1 else None
+    if m:
+        # assets/x/3.0x/a.png is drawn for 3x screens; its limit is 3x too.
+        rule = Rule(round(rule.max_dimension * float(m.group(1))), rule.quality)
+    return rule
+
+
+@dataclass
+class Change:
+    path: str          # relative to assets/
+    reasons: list
+    size_before: list
+    size_after: list
+    bytes_before: int
+    bytes_after: int
+
+
+@dataclass
+class NormalizeReport:
+    checked: int = 0
+    changes: list = field(default_factory=list)
+    written: list = field(default_factory=list)
+    skipped: list = field(default_factory=list)    # (path, why) for files Pillow cannot open
+
+    def summary(self):
+        before = sum(c.bytes_before for c in self.changes)
+        after = sum(c.bytes_after for c in self.changes)
+        return (f"{self.checked} images checked, {len(self.changes)} normalized "
+                f"({before / 1024:.1f} KiB -> {after / 1024:.1f} KiB)")
+
+
+def _reasons(head, im, ext, rule):
+    reasons = []
+    actual = sniff(head)
+    wanted = FORMATS[ext]
+    if actual != wanted:
+        reasons.append(f"{actual or 'unknown'} data in a {ext} file")
+    if max(im.size) > rule.max_dimension:
+        reasons.append(f"longer side {max(im.size)} > {rule.max_dimension}")
+    orientation = im.getexif().get(_ORIENTATION, 1)
+    if orientation not in (1, None):
+        reasons.append(f"EXIF orientation {orientation}")
+    return reasons
+
+
+def _encode(im, fmt, rule, icc_profile):
+    if fmt == "jpeg":
+        return encode_jpeg(im, rule.quality, icc_profile)
+    buf = io.BytesIO()
+    extra = {"icc_profile": icc_profile} if icc_profile else {}
+    if fmt == "webp":
+        im.save(buf, "WEBP", quality=rule.quality, method=6, **extra)
+    else:
+        im.save(buf, "PNG", optimize=True, **extra)
+    return buf.getvalue()
+
+
+def normalize_image(path, rule):
+    """Return ``(reasons, old size, new size, new bytes)``; ``new bytes`` is None when ``path`` is fine."""
+    require_pillow("Normalizing images")
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, "rb") as f:
+        head = f.read(HEAD_SIZE)
+    with Image.open(path) as im:
+        reasons = _reasons(head, im, ext, rule)
+        if not reasons:
+            return [], im.size, im.size, None
+        before = im.size
+        if im.format == "JPEG":
+            # Let the decoder skip detail the target size will not keep.
+            scale = rule.max_dimension / max(im.size)
+            if scale < 1:
+                im.draft("RGB", (max(1, int(im.width * scale)), max(1, int(im.height * scale))))
+        icc_profile = im.info.get("icc_profile")
+        out = ImageOps.exif_transpose(im)
+        if out.mode not in ("RGB", "RGBA", "L", "LA"):
+            out = out.convert("RGBA" if "transparency" in im.info or out.mode.endswith("A") else "RGB")
+        out = fit_within(out, rule.max_dimension)
+        data = _encode(out, FORMATS[ext], rule, icc_profile)
+        return reasons, before, out.size, data
+
+
+def _generated(spec):
+    """Relative paths the build renders itself; they are drawn at their target size."""
+    from generator.build import group_assets, raster_outputs
+
+    rels = set()
+    for group in spec.get("groups", []):
+        for rel, _ in group_assets(group):
+            rels.add(rel)
+            rels.update(png for png, _ in raster_outputs(group, rel))
+    return rels
+
+
+def normalize_project(project_dir, spec, db=None, check=False):
+    """Normalize the bitmaps under ``project_dir/assets``; return a :class:`NormalizeReport`.
+
+    With ``check`` nothing is written. A rewritten file that ``db`` knows
+    about (a downloaded source) is re-recorded under its old fingerprint,
+    and one the fetch journal knows about under its new size and hash, so
+    neither the fetch stage nor the fetch scripts download it again.
+    """
+    from generator.build import ASSETS_DIR, JOURNAL_NAME
+    from generator.walk import iter_files
+
+    assets = os.path.join(project_dir, ASSETS_DIR)
+    journal_path = os.path.join(project_dir, JOURNAL_NAME)
+    journal = JobJournal(journal_path) if not check and os.path.exists(journal_path) else None
+    rules = rules_for(spec)
+    skip = _generated(spec)
+    report = NormalizeReport()
+    for path, size in sorted(iter_files(assets, tuple(FORMATS))):
+        rel = os.path.relpath(path, assets).replace(os.sep, "/")
+        if rel in skip or not size:
+            continue
+        report.checked += 1
+        try:
+            reasons, before, after, data = normalize_image(path, rule_for(rules, rel))
+        except (OSError, ValueError) as e:    # Image.open raises UnidentifiedImageError (an OSError)
+            report.skipped.append((rel, str(e)))
+            continue
+        if data is None:
+            continue
+        report.changes.append(Change(rel, reasons, list(before), list(after), size, len(data)))
+        if check:
+            continue
+        if write_if_changed(path, data):
+            report.written.append(path)
+        entry = db.get(rel) if db is not None else None
+        if entry is not None:
+            db.record(rel, entry["fp"], path, normalized=True)
+        if journal is not None:
+            journal.rewritten(path, len(data), hashlib.sha256(data).hexdigest())
+    if report.changes and not check:
+        write_report(project_dir, report)
+    return report
+
+
+def write_report(project_dir, report):
+    """Write what the last normalizing run changed to ``.normalize_report.json``."""
+    data = {"changes": [asdict(c) for c in report.changes],
+            "skipped": [{"path": p, "error": e} for p, e in report.skipped]}
+    text = json.dumps(data, indent=1) + "\n"
+    write_if_changed(os.path.join(project_dir, REPORT_NAME), text.encode("utf-8"))
+
+
+def main(argv=None):
+    import argparse
+
+    from generator.build import SPEC_NAME, find_projects, load_spec, resolve_projects
+
+    parser = argparse.ArgumentParser(prog="python -m generator normalize",
+                                     description="Downsize and re-encode bundled images to the build's limits.")
+    parser.add_argument("projects", nargs="*", help="project directories or numbers, e.g. 44 or 44_Guest_Room_AI")
+    parser.add_argument("--all", action="store_true", help="normalize every project that has a spec")
+    parser.add_argument("--root", default=".", help="directory that holds the projects (default: current)")
+    parser.add_argument("--check", action="store_true", help="list what would change without writing")
+    args = parser.parse_args(argv)
+
+    if args.all == bool(args.projects):
+        parser.error("name one or more projects, or pass --all")
+    try:
+        projects = find_projects(args.root) if args.all else resolve_projects(args.projects, args.root)
+    except ValueError as e:
+        parser.error(str(e))
+
+    failed = False
+    for project in projects:
+        project_dir = os.path.join(args.root, project)
+        report = normalize_project(project_dir, load_spec(os.path.join(project_dir, SPEC_NAME)), check=args.check)
+        for c in report.changes:
+            print(f"{project}/{c.path}: {'; '.join(c.reasons)} -> {c.size_after[0]}x{c.size_after[1]}, "
+                  f"{c.bytes_before // 1024} KiB -> {c.bytes_after // 1024} KiB")
+        for rel, error in report.skipped:
+            print(f"{project}/{rel}: skipped, {error}")
+            failed = True
+        print(f"{project}: {report.summary()}")
+    return 1 if failed else 0
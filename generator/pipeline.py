@@ -0,0 +1,148 @@
+"""A small DAG runner for the asset build.
+
+A build is a set of :class:`Stage` objects, each naming the stages it
+depends on. :func:`run_stages` starts every stage whose dependencies have
+finished on a shared thread pool, so independent projects (and independent
+stages of one project) run side by side in one interpreter. SVG templates
+are plain string formatting, Pillow releases the GIL while it draws and
+downloads wait on sockets, so threads are enough.
+
+A stage that raises is recorded as failed and every stage that depends on
+it, directly or not, is skipped; unrelated stages keep running.
+"""
+
+import os
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+
+class Stage:
+    def __init__(self, name, run, deps=()):
+        """``run()`` does the work; ``deps`` are the names of stages that must finish first."""
+        self.name = name
+        self.run = run
+        self.deps = tuple(deps)
+
+    def __repr__(self):
+        return f"Stage({self.name!r}, deps={list(self.deps)!r})"
+
+
+@dataclass
+class StageResult:
+    name: str
+    ok: bool
+    value: object = None
+    error: str = None
+    seconds: float = 0.0
+    skipped: bool = False
+
+
+@dataclass
+class PipelineReport:
+    results: list = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def failed(self):
+        return [r for r in self.results if not r.ok]
+
+    def summary(self):
+        ok = sum(1 for r in self.results if r.ok)
+        skipped = sum(1 for r in self.results if r.skipped)
+        failed = len(self.results) - ok - skipped
+        return f"{ok} stages ok, {failed} failed, {skipped} skipped in {self.seconds:.2f}s"
+
+
+def _check(stages):
+    by_name = {}
+    for stage in stages:
+        if stage.name in by_name:
+            raise ValueError(f"duplicate stage {stage.name!r}")
+        by_name[stage.name] = stage
+    for stage in stages:
+        for dep in stage.deps:
+            if dep not in by_name:
+                raise ValueError(f"stage {stage.name!r} depends on unknown stage {dep!r}")
+    # Kahn's algorithm, only to reject cycles before anything runs.
+    pending = {s.name: len(s.deps) for s in stages}
+    ready = [name for name, n in pending.items() if n == 0]
+    dependents = {name: [] for name in by_name}
+    for stage in stages:
+        for dep in stage.deps:
+            dependents[dep].append(stage.name)
+    seen = 0
+    while ready:
+        name = ready.pop()
+        seen += 1
+        for child in dependents[name]:
+            pending[child] -= 1
+            if pending[child] == 0:
+                ready.append(child)
+    if seen != len(stages):
+        cycle = sorted(name for name, n in pending.items() if n)
+        raise ValueError(f"dependency cycle between stages: {', '.join(cycle)}")
+    return by_name, dependents
+
+
+def run_stages(stages, workers=None, on_done=None):
+    """Run ``stages`` in dependency order and return a :class:`PipelineReport`.
+
+    ``on_done(result)`` is called in the calling thread as each stage
+    finishes, fails or is skipped.
+    """
+    stages = list(stages)
+    by_name, dependents = _check(stages)
+    started = time.perf_counter()
+    report = PipelineReport()
+    waiting = {s.name: set(s.deps) for s in stages}
+    blocked = set()
+
+    def call(stage):
+        t = time.perf_counter()
+        try:
+            value = stage.run()
+        except Exception as e:
+            detail = "".join(traceback.format_exception_only(type(e), e)).strip()
+            return StageResult(stage.name, False, error=detail, seconds=time.perf_counter() - t)
+        return StageResult(stage.name, True, value, seconds=time.perf_counter() - t)
+
+    def finish(result):
+        report.results.append(result)
+        if on_done is not None:
+            on_done(result)
+
+    def block(name, cause):
+        for child in dependents[name]:
+            if child not in blocked:
+                blocked.add(child)
+                waiting.pop(child, None)
+                finish(StageResult(child, False, error=f"skipped: {cause} failed", skipped=True))
+                block(child, cause)
+
+    with ThreadPoolExecutor(workers or min(32, (os.cpu_count() or 1) + 4)) as pool:
+        running = {}
+
+        def submit_ready():
+            for name in [n for n, deps in waiting.items() if not deps]:
+                del waiting[name]
+                running[pool.submit(call, by_name[name])] = name
+
+        submit_ready()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                result = future.result()
+                finish(result)
+                if result.ok:
+                    for child in dependents[name]:
+                        if child in waiting:
+                            waiting[child].discard(name)
+                else:
+                    block(name, name)
+            submit_ready()
+
+    report.seconds = time.perf_counter() - started
+    return report
@@ -0,0 +1,120 @@
+"""Placeholders that can be painted before an image is decoded.
+
+A grid of photos or moodboards shows empty cells until every image has
+been read and decoded. :func:`placeholder` boils an asset down to what a
+cell needs to look right at once: its dominant color (``#RRGGBB``, the
+most common color of a median-cut palette) and a BlurHash
+(https://blurha.sh), about 30 characters that decode to a blurred
+preview. Both are computed from a thumbnail of at most ``THUMB_SIZE`` px;
+SVGs are drawn at that size by :mod:`generator.svgraster`.
+
+Needs Pillow, like :mod:`generator.resize`.
+"""
+
+import math
+import os
+
+from generator.resize import fit_within, require_pillow
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - exercised on machines without Pillow
+    Image = None
+
+THUMB_SIZE = 32
+PALETTE_SIZE = 5
+
+_BASE83 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~"
+_TO_LINEAR = [((v / 255) / 12.92 if v / 255 <= 0.04045 else ((v / 255 + 0.055) / 1.055) ** 2.4) for v in range(256)]
+
+
+def _base83(value, length):
+    return "".join(_BASE83[(value // 83 ** (length - i)) % 83] for i in range(1, length + 1))
+
+
+def _to_srgb(value):
+    v = max(0.0, min(1.0, value))
+    if v <= 0.0031308:
+        return int(v * 12.92 * 255 + 0.5)
+    return int((1.055 * v ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def _sign_pow(value, exp):
+    return math.copysign(abs(value) ** exp, value)
+
+
+def blurhash(image, x_components=4, y_components=3):
+    """The BlurHash of an RGB Pillow ``image`` (keep it small; the cost is per pixel)."""
+    width, height = image.size
+    raw = image.tobytes()
+    pixels = [(_TO_LINEAR[raw[k]], _TO_LINEAR[raw[k + 1]], _TO_LINEAR[raw[k + 2]]) for k in range(0, len(raw), 3)]
+    factors = []
+    for j in range(y_components):
+        cos_y = [math.cos(math.pi * j * y / height) for y in range(height)]
+        for i in range(x_components):
+            cos_x = [math.cos(math.pi * i * x / width) for x in range(width)]
+            r = g = b = 0.0
+            for y in range(height):
+                row = y * width
+                for x in range(width):
+                    basis = cos_x[x] * cos_y[y]
+                    pr, pg, pb = pixels[row + x]
+                    r += basis * pr
+                    g += basis * pg
+                    b += basis * pb
+            scale = (1 if i == j == 0 else 2) / (width * height)
+            factors.append((r * scale, g * scale, b * scale))
+
+    dc, ac = factors[0], factors[1:]
+    out = _base83((x_components - 1) + (y_components - 1) * 9, 1)
+    if ac:
+        quantised = max(0, min(82, int(max(abs(v) for f in ac for v in f) * 166 - 0.5)))
+        maximum = (quantised + 1) / 166
+        out += _base83(quantised, 1)
+    else:
+        maximum = 1.0
+        out += _base83(0, 1)
+    out += _base83((_to_srgb(dc[0]) << 16) + (_to_srgb(dc[1]) << 8) + _to_srgb(dc[2]), 4)
+    for f in ac:
+        q = [max(0, min(18, int(_sign_pow(v / maximum, 0.5) * 9 + 9.5))) for v in f]
+        out += _base83(q[0] * 19 * 19 + q[1] * 19 + q[2], 2)
+    return out
+
+
+def dominant_color(image):
+    """``#RRGGBB`` of the most common color in a median-cut palette of ``image``."""
+    quantized = image.quantize(PALETTE_SIZE, method=Image.Quantize.MEDIANCUT)
+    count, index = max(quantized.getcolors())
+    r, g, b = quantized.getpalette()[index * 3:index * 3 + 3]
+    return f"#{r:02X}{g:02X}{b:02X}"
+
+
+def thumbnail(path):
+    """An RGB thumbnail of the bitmap or SVG at ``path``, no side above ``THUMB_SIZE``."""
+    require_pillow("Computing placeholders")
+    if path.lower().endswith(".svg"):
+        from generator.imagehead import image_info
+        from generator.svgraster import rasterize
+
+        with open(path, "rb") as f:
+            text = f.read()
+        info = image_info(text)
+        board = rasterize(text, THUMB_SIZE / max(info.width, info.height), base_dir=os.path.dirname(path))
+        im = board.render()
+    else:
+        with Image.open(path) as src:
+            src.draft("RGB", (THUMB_SIZE * 2, THUMB_SIZE * 2))
+            im = src.convert("RGBA" if src.mode in ("RGBA", "LA", "P") else "RGB")
+            im.load()
+    if im.mode == "RGBA":
+        flat = Image.new("RGB", im.size, (255, 255, 255))
+        flat.paste(im, mask=im.getchannel("A"))
+        im = flat
+    return fit_within(im.convert("RGB"), THUMB_SIZE)
+
+
+def placeholder(path):
+    """``(dominant color, blurhash)`` for the image at ``path``."""
+    im = thumbnail(path)
+    x, y = (4, 3) if im.width >= im.height else (3, 4)
+    return dominant_color(im), blurhash(im, x, y)
@@ -0,0 +1,192 @@
+"""Stdlib-only PNG encoder for :class:`generator.raster.Raster` images.
+
+Truecolor images are written as 8-bit RGB. When a palette is supplied the
+image is written as indexed color at the smallest bit depth that fits,
+which is what the flat procedural placeholders want: an 8-color source
+packs two pixels per byte before zlib ever sees it.
+
+Each scanline picks its own filter. The adaptive strategy tries None, Sub
+and Up and keeps the one with the smallest sum of absolute differences,
+the usual libpng heuristic. Average and Paeth are left out so the NumPy
+and pure-Python paths stay byte-identical; on flat procedural art they
+rarely win anyway.
+"""
+
+import struct
+import zlib
+
+from generator.builddb import write_if_changed
+from generator.raster import np
+
+FILTER_NONE = 0
+FILTER_SUB = 1
+FILTER_UP = 2
+
+# Maps a filtered byte to its magnitude as a signed delta.
+_ABS_TABLE = bytes(min(v, 256 - v) for v in range(256))
+
+
+def _chunk(kind, data):
+    body = kind + data
+    return struct.pack('>I', len(data)) + body + struct.pack('>I', zlib.crc32(body))
+
+
+def _bit_depth(colors):
+    for depth in (1, 2, 4):
+        if colors <= 1 << depth:
+            return depth
+    return 8
+
+
+def _sub_bytes(row, other, high, low):
+    # Bytewise (row - other) mod 256 on big integers, without borrows
+    # crossing byte lanes.
+    return ((row | high) - (other & low)) ^ ((row ^ ~other) & high)
+
+
+def _filter_rows_py(rows, bpp, strategy):
+    out = bytearray()
+    prev = None
+    high = low = None
+    for row in rows:
+        row = bytes(row)
+        n = len(row)
+        if high is None:
+            high = int.from_bytes(b'\x80' * n, 'big')
+            low = int.from_bytes(b'\x7f' * n, 'big')
+        cur = int.from_bytes(row, 'big')
+        candidates = {}
+        if strategy in ('adaptive', FILTER_NONE):
+            candidates[FILTER_NONE] = row
+        if strategy in ('adaptive', FILTER_SUB):
+            left = cur >> (8 * bpp)
+            candidates[FILTER_SUB] = _sub_bytes(cur, left, high, low).to_bytes(n, 'big')
+        if strategy in ('adaptive', FILTER_UP):
+            up = prev if prev is not None else 0
+            candidates[FILTER_UP] = _sub_bytes(cur, up, high, low).to_bytes(n, 'big')
+        kind = min(candidates, key=lambda k: (sum(candidates[k].translate(_ABS_TABLE)), k))
+        out.append(kind)
+        out.extend(candidates[kind])
+        prev = cur
+    return bytes(out)
+
+
+def _filter_rows_np(data, bpp, strategy):
+    data = data.astype(np.uint8, copy=False)
+    height, n = data.shape
+    candidates = {}
+    if strategy in ('adaptive', FILTER_NONE):
+        candidates[FILTER_NONE] = data
+    if strategy in ('adaptive', FILTER_SUB):
+        left = np.zeros_like(data)
+        left[:, bpp:] = data[:, :-bpp]
+        candidates[FILTER_SUB] = data - left
+    if strategy in ('adaptive', FILTER_UP):
+        up = np.zeros_like(data)
+        up[1:] = data[:-1]
+        candidates[FILTER_UP] = data - up
+    kinds = sorted(candidates)
+    abs_table = np.frombuffer(_ABS_TABLE, dtype=np.uint8)
+    scores = np.stack([abs_table[candidates[k]].sum(axis=1, dtype=np.int64) for k in kinds])
+    choice = np.argmin(scores, axis=0)
+    out = np.empty((height, n + 1), dtype=np.uint8)
+    out[:, 0] = np.array(kinds, dtype=np.uint8)[choice]
+    for i, k in enumerate(kinds):
+        rows = choice == i
+        out[rows, 1:] = candidates[k][rows]
+    return out.tobytes()
+
+
+def _index_rows_py(raster, palette, depth):
+    lut = {}
+    for i, color in enumerate(palette):
+        lut.setdefault(bytes(color), i)
+    per_byte = 8 // depth
+    for row in raster.rows():
+        row = bytes(row)
+        try:
+            idx = [lut[row[i:i + 3]] for i in range(0, len(row), 3)]
+        except KeyError as e:
+            raise ValueError(f"pixel color {tuple(e.args[0])} is not in the palette") from None
+        if depth == 8:
+            yield bytes(idx)
+            continue
+        idx.extend([0] * (-len(idx) % per_byte))
+        packed = bytearray()
+        for i in range(0, len(idx), per_byte):
+            value = 0
+            for v in idx[i:i + per_byte]:
+                value = (value << depth) | v
+            packed.append(value)
+        yield bytes(packed)
+
+
+def _index_rows_np(raster, palette, depth):
+    px = raster._px.astype(np.uint32)
+    keys = (px[:, :, 0] << 16) | (px[:, :, 1] << 8) | px[:, :, 2]
+    pal = np.array([(r << 16) | (g << 8) | b for r, g, b in palette], dtype=np.uint32)
+    order = np.argsort(pal, kind='stable')
+    pos = np.searchsorted(pal[order], keys)
+    pos = np.clip(pos, 0, len(pal) - 1)
+    if not np.all(pal[order][pos] == keys):
+        bad = keys[pal[order][pos] != keys][0]
+        raise ValueError(f"pixel color {((bad >> 16) & 255, (bad >> 8) & 255, bad & 255)} is not in the palette")
+    idx = order[pos].astype(np.uint8)
+    if depth == 8:
+        return idx
+    per_byte = 8 // depth
+    height, width = idx.shape
+    pad = -width % per_byte
+    if pad:
+        idx = np.hstack([idx, np.zeros((height, pad), dtype=np.uint8)])
+    groups = idx.reshape(height, -1, per_byte)
+    packed = np.zeros(groups.shape[:2], dtype=np.uint8)
+    for i in range(per_byte):
+        packed |= groups[:, :, i] << (depth * (per_byte - 1 - i))
+    return packed
+
+
+def encode_png(raster, palette=None, strategy='adaptive', level=9):
+    """Encode ``raster`` as PNG and return the bytes.
+
+    ``palette`` is an optional list of up to 256 RGB tuples covering every
+    pixel; when given the image is written as indexed color. ``strategy``
+    is ``'adaptive'`` or one of ``FILTER_NONE``/``FILTER_SUB``/``FILTER_UP``
+    to force a single filter for every row.
+    """
+    if strategy not in ('adaptive', FILTER_NONE, FILTER_SUB, FILTER_UP):
+        raise ValueError(f"unknown PNG filter strategy: {strategy!r}")
+    width, height = raster.width, raster.height
+    chunks = []
+
+    if palette is not None:
+        palette = [tuple(c) for c in palette]
+        if not 0 < len(palette) <= 256:
+            raise ValueError("palette must hold between 1 and 256 colors")
+        depth = _bit_depth(len(palette))
+        ihdr = struct.pack('>IIBBBBB', width, height, depth, 3, 0, 0, 0)
+        chunks.append(_chunk(b'PLTE', b''.join(bytes(c) for c in palette)))
+        bpp = 1
+        if np is not None:
+            data = _filter_rows_np(_index_rows_np(raster, palette, depth), bpp, strategy)
+        else:
+            data = _filter_rows_py(_index_rows_py(raster, palette, depth), bpp, strategy)
+    else:
+        ihdr = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+        bpp = 3
+        if np is not None:
+            data = _filter_rows_np(raster._px.reshape(height, width * 3), bpp, strategy)
+        else:
+            data = _filter_rows_py(raster.rows(), bpp, strategy)
+
+    return b''.join([
+        b'\x89PNG\r\n\x1a\n',
+        _chunk(b'IHDR', ihdr),
+        *chunks,
+        _chunk(b'IDAT', zlib.compress(data, level)),
+        _chunk(b'IEND', b''),
+    ])
+
+
+def write_png(path, raster, palette=None, strategy='adaptive', level=9):
+    write_if_changed(path, encode_png(raster, palette, strategy, level))
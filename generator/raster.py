@@ -0,0 +1,138 @@
+"""In-memory RGB raster with region fills and a single-write BMP encoder.
+
+Pixels are stored top-down, 3 bytes per pixel. When NumPy is available the
+buffer is an ``(height, width, 3)`` uint8 array; otherwise a flat
+``bytearray`` is used and rows are filled with slice assignment. Both
+backends draw noise from the same ``rng.randbytes`` stream, so a seeded
+``random.Random`` produces identical images either way.
+"""
+
+import struct
+
+from generator.builddb import write_if_changed
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised on machines without numpy
+    np = None
+
+
+def _clip(value, limit):
+    return max(0, min(int(value), limit))
+
+
+class Raster:
+    def __init__(self, width, height, fill=(0, 0, 0)):
+        self.width = width
+        self.height = height
+        if np is not None:
+            self._px = np.empty((height, width, 3), dtype=np.uint8)
+            self._px[:, :] = fill
+        else:
+            self._px = bytearray(bytes(fill) * (width * height))
+
+    def _box(self, x0, y0, x1, y1):
+        return (_clip(x0, self.width), _clip(y0, self.height),
+                _clip(x1, self.width), _clip(y1, self.height))
+
+    def fill_rect(self, x0, y0, x1, y1, color):
+        """Fill the half-open box [x0, x1) x [y0, y1) with ``color``."""
+        x0, y0, x1, y1 = self._box(x0, y0, x1, y1)
+        if x1 <= x0 or y1 <= y0:
+            return
+        if np is not None:
+            self._px[y0:y1, x0:x1] = color
+            return
+        span = bytes(color) * (x1 - x0)
+        stride = self.width * 3
+        for y in range(y0, y1):
+            start = y * stride + x0 * 3
+            self._px[start:start + len(span)] = span
+
+    def fill_noise(self, x0, y0, x1, y1, color_a, color_b, rng, threshold=0.5):
+        """Fill a box with a random per-pixel choice between two colors.
+
+        A pixel takes ``color_a`` when its random byte lands above
+        ``threshold`` (as a fraction of 256), mirroring the old
+        ``random.random() > 0.5`` test.
+        """
+        x0, y0, x1, y1 = self._box(x0, y0, x1, y1)
+        w, h = x1 - x0, y1 - y0
+        if w <= 0 or h <= 0:
+            return
+        cut = int(threshold * 256)
+        noise = rng.randbytes(w * h)
+        if np is not None:
+            mask = np.frombuffer(noise, dtype=np.uint8).reshape(h, w) >= cut
+            self._px[y0:y1, x0:x1] = np.where(
+                mask[:, :, None],
+                np.array(color_a, dtype=np.uint8),
+                np.array(color_b, dtype=np.uint8),
+            )
+            return
+        tables = [
+            bytes(color_a[c] if v >= cut else color_b[c] for v in range(256))
+            for c in range(3)
+        ]
+        stride = self.width * 3
+        row = bytearray(w * 3)
+        for j in range(h):
+            cells = noise[j * w:(j + 1) * w]
+            for c in range(3):
+                row[c::3] = cells.translate(tables[c])
+            start = (y0 + j) * stride + x0 * 3
+            self._px[start:start + len(row)] = row
+
+    def tobytes(self):
+        """Return packed RGB rows, top-down."""
+        if np is not None:
+            return self._px.tobytes()
+        return bytes(self._px)
+
+    def rows(self):
+        """Yield each row as a read-only RGB buffer, top-down."""
+        if np is not None:
+            for y in range(self.height):
+                yield self._px[y].tobytes()
+            return
+        view = memoryview(self._px)
+        stride = self.width * 3
+        for y in range(self.height):
+            yield view[y * stride:(y + 1) * stride]
+
+
+def encode_bmp(raster):
+    """Encode a raster as a 24-bit bottom-up BMP and return the bytes."""
+    width, height = raster.width, raster.height
+    padding = (4 - (width * 3) % 4) % 4
+    stride = width * 3 + padding
+    image_size = stride * height
+
+    header = b'BM' + struct.pack('<IHHI', 54 + image_size, 0, 0, 54)
+    header += struct.pack('<IiiHHIIiiII', 40, width, height, 1, 24, 0,
+                          image_size, 2835, 2835, 0, 0)
+
+    if np is not None:
+        bgr = raster._px[::-1, :, ::-1]
+        if padding:
+            pad = np.zeros((height, padding), dtype=np.uint8)
+            data = np.hstack([bgr.reshape(height, width * 3), pad]).tobytes()
+        else:
+            data = bgr.tobytes()
+        return header + data
+
+    out = bytearray(header)
+    out.extend(bytes(image_size))
+    offset = 54
+    for row in reversed(list(raster.rows())):
+        line = out[offset:offset + width * 3]
+        line[0::3] = row[2::3]
+        line[1::3] = row[1::3]
+        line[2::3] = row[0::3]
+        out[offset:offset + width * 3] = line
+        offset += stride
+    return bytes(out)
+
+
+def write_bmp(path, raster):
+    write_if_changed(path, encode_bmp(raster))
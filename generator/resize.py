@@ -0,0 +1,79 @@
+"""Derive smaller JPEG variants of a downloaded image locally.
+
+Fetching the same Unsplash photo once per width doubles network time and
+CDN load. :func:`derive` decodes the full-size download once and writes
+every configured width from that single decode, using Lanczos resampling.
+Targets wider than the source are written at the source size; nothing is
+ever upscaled.
+
+Decoding JPEG needs Pillow, which is optional for the rest of the package.
+"""
+
+import io
+
+from generator.builddb import write_if_changed
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - exercised on machines without Pillow
+    Image = None
+
+DEFAULT_QUALITY = 82
+
+
+def require_pillow(feature):
+    if Image is None:
+        raise RuntimeError(f"{feature} needs Pillow; install it with `pip install Pillow`")
+
+
+def _resample():
+    return getattr(Image, "Resampling", Image).LANCZOS
+
+
+def encode_jpeg(image, quality=DEFAULT_QUALITY, icc_profile=None):
+    """Encode a Pillow image as an optimized baseline JPEG and return the bytes."""
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    buf = io.BytesIO()
+    extra = {"icc_profile": icc_profile} if icc_profile else {}
+    image.save(buf, "JPEG", quality=quality, optimize=True, **extra)
+    return buf.getvalue()
+
+
+def fit_width(image, width):
+    """Return ``image`` downsampled to ``width`` px wide, keeping its aspect ratio."""
+    if width >= image.width:
+        return image
+    height = max(1, round(image.height * width / image.width))
+    return image.resize((width, height), _resample(), reducing_gap=3.0)
+
+
+def fit_within(image, max_dimension):
+    """Return ``image`` downsampled so neither side exceeds ``max_dimension``."""
+    longest = max(image.width, image.height)
+    if longest <= max_dimension:
+        return image
+    ratio = max_dimension / longest
+    size = (max(1, round(image.width * ratio)), max(1, round(image.height * ratio)))
+    return image.resize(size, _resample(), reducing_gap=3.0)
+
+
+def derive(src, targets, quality=DEFAULT_QUALITY):
+    """Write resized copies of ``src`` and return ``{dest: jpeg_bytes}``.
+
+    ``targets`` is a list of ``(dest, width)`` pairs. The source is decoded
+    once; the encoded bytes are returned so callers that embed them (base64
+    in an SVG, say) do not have to read the files back.
+    """
+    require_pillow("Resizing images")
+    with Image.open(src) as im:
+        widest = max(width for _, width in targets)
+        # Let the JPEG decoder skip detail none of the targets will keep.
+        im.draft("RGB", (widest, max(1, im.height * widest // im.width)))
+        im = im.convert("RGB")
+        out = {}
+        for dest, width in sorted(targets, key=lambda t: -t[1]):
+            data = encode_jpeg(fit_width(im, width), quality)
+            write_if_changed(dest, data)
+            out[dest] = data
+    return out
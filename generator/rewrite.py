@@ -0,0 +1,182 @@
+"""Single-pass multi-pattern text rewriting for the rename/clone scripts.
+
+The rename scripts used to call ``str.replace`` once per table entry, so a
+file was scanned once per rule and overlapping keys resolved by whichever
+rule happened to run first (``ShoeAI`` fired before ``ShoeAIText`` could
+match, leaving ``MeetingAIText`` instead of ``MeetingRoomText``).
+
+:class:`Rewriter` compiles the whole table into one regular expression
+whose alternatives are ordered longest first. The regex engine then picks
+the longest key at the leftmost position, every byte is examined once, and
+replaced text is never rescanned, so rules cannot feed into each other.
+
+Files are rewritten as bytes: nothing is decoded, and files that are not
+valid UTF-8 pass through untouched except for the matched keys.
+
+:func:`rewrite_tree` walks a project with :func:`generator.walk.iter_files`
+(so ``build/``, ``.dart_tool/``, ``ios/Pods`` and anything ``.gitignore``d
+is never opened) and shards the files across a process pool.
+"""
+
+import os
+import re
+import shutil
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from generator.walk import iter_files
+
+# Batches smaller than this are not worth shipping to another process.
+BATCH_BYTES = 4 * 1024 * 1024
+BATCH_FILES = 256
+
+
+class Rewriter:
+    def __init__(self, table):
+        """``table`` maps old text to new text (a dict or ``(old, new)`` pairs)."""
+        self.table = dict(table)
+        if "" in self.table:
+            raise ValueError("rewrite keys must be non-empty")
+        keys = sorted(self.table, key=lambda k: (-len(k.encode("utf-8")), k))
+        self._bytes_table = {k.encode("utf-8"): v.encode("utf-8") for k, v in self.table.items()}
+        self._text_re = re.compile("|".join(map(re.escape, keys))) if keys else None
+        self._bytes_re = re.compile(b"|".join(re.escape(k.encode("utf-8")) for k in keys)) if keys else None
+
+    def __bool__(self):
+        return bool(self.table)
+
+    def rewrite(self, data):
+        """Return ``(new_data, count)`` for ``data`` (``str`` or ``bytes``)."""
+        if not self.table:
+            return data, 0
+        if isinstance(data, str):
+            return self._text_re.subn(lambda m: self.table[m.group(0)], data)
+        return self._bytes_re.subn(lambda m: self._bytes_table[m.group(0)], data)
+
+    def search(self, data):
+        """True when ``data`` contains any key."""
+        if not self.table:
+            return False
+        pattern = self._text_re if isinstance(data, str) else self._bytes_re
+        return pattern.search(data) is not None
+
+    def matches(self, data):
+        """Return a ``Counter`` of the keys :meth:`rewrite` would replace in ``data``."""
+        if not self.table:
+            return Counter()
+        if isinstance(data, str):
+            return Counter(m.group(0) for m in self._text_re.finditer(data))
+        return Counter(m.group(0).decode("utf-8") for m in self._bytes_re.finditer(data))
+
+    def rewrite_file(self, path):
+        """Rewrite ``path`` in place and return the number of replacements.
+
+        The file is only written when something changed; the new content
+        goes to a temporary file that is renamed over the original.
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        new_data, count = self.rewrite(data)
+        if new_data == data:
+            return 0
+        tmp = f"{path}.rewrite"
+        with open(tmp, "wb") as f:
+            f.write(new_data)
+        shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+        return count
+
+
+@dataclass
+class RewriteReport:
+    files_scanned: int = 0
+    bytes_scanned: int = 0
+    replacements: int = 0
+    seconds: float = 0.0
+    changed: list = field(default_factory=list)
+    errors: list = field(default_factory=list)
+
+    def summary(self):
+        return (f"{len(self.changed)} of {self.files_scanned} files touched, "
+                f"{self.replacements} replacements, {self.bytes_scanned / 1024:.0f} KiB scanned "
+                f"in {self.seconds:.2f}s")
+
+
+_worker_rewriter = None
+
+
+def _init_worker(table):
+    global _worker_rewriter
+    _worker_rewriter = Rewriter(table)
+
+
+def _rewrite_batch(paths, rewriter=None):
+    rewriter = rewriter or _worker_rewriter
+    results = []
+    for path in paths:
+        try:
+            results.append((path, rewriter.rewrite_file(path), None))
+        except OSError as e:
+            results.append((path, 0, e))
+    return results
+
+
+def _batches(files):
+    batch, size = [], 0
+    for path, nbytes in files:
+        batch.append(path)
+        size += nbytes
+        if size >= BATCH_BYTES or len(batch) >= BATCH_FILES:
+            yield batch
+            batch, size = [], 0
+    if batch:
+        yield batch
+
+
+def rewrite_tree(root, rewriter, suffixes, on_change=None, on_error=None, workers=None, index=None):
+    """Rewrite every file under ``root`` whose name ends with one of ``suffixes``.
+
+    Ignored and build directories are pruned from the walk. With a refreshed
+    :class:`generator.index.SymbolIndex` as ``index``, only the files that
+    may contain a key are opened. ``on_change(path, count)`` is called for
+    each file that changed and ``on_error(path, exc)`` for each file that
+    could not be rewritten (the error is raised when no handler is given).
+    Callbacks run in the calling process. Returns a :class:`RewriteReport`.
+    """
+    started = time.perf_counter()
+    report = RewriteReport()
+    if index is not None:
+        files = [(path, os.path.getsize(path)) for path in index.candidates(rewriter.table, suffixes)]
+    else:
+        files = list(iter_files(root, suffixes))
+    report.files_scanned = len(files)
+    report.bytes_scanned = sum(size for _, size in files)
+    batches = list(_batches(files))
+
+    def collect(results):
+        for path, count, error in results:
+            if error is not None:
+                report.errors.append(path)
+                if on_error is None:
+                    raise error
+                on_error(path, error)
+            elif count:
+                report.changed.append(path)
+                report.replacements += count
+                if on_change is not None:
+                    on_change(path, count)
+
+    workers = min(workers or os.cpu_count() or 1, len(batches))
+    if workers <= 1:
+        for batch in batches:
+            collect(_rewrite_batch(batch, rewriter))
+    else:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(rewriter.table,)) as pool:
+            for results in pool.map(_rewrite_batch, batches):
+                collect(results)
+
+    report.changed.sort()
+    report.seconds = time.perf_counter() - started
+    return report
@@ -0,0 +1,25 @@
+"""Per-asset random streams that are the same on every machine and every run.
+
+Generators used to draw from the global ``random`` module: some never
+seeded it, others reseeded it with ``sum(ord(c) for c in name)`` (equal for
+anagrams) or with a loop index (equal across projects), so outputs could
+not be cached or diffed. :func:`asset_rng` gives each asset its own
+``random.Random`` seeded from a SHA-256 of ``(project, asset id, spec
+version)``: renaming or reordering other assets does not change it, two
+assets never share a stream by accident, and nothing else in the process
+can disturb it.
+"""
+
+import hashlib
+import random
+
+
+def asset_seed(project, asset_id, version=1):
+    """64-bit seed for ``asset_id`` (its path under ``assets/``) in ``project``."""
+    key = "\0".join((str(project), str(asset_id), str(version))).encode("utf-8")
+    return int.from_bytes(hashlib.sha256(key).digest()[:8], "big")
+
+
+def asset_rng(project, asset_id, version=1):
+    """A fresh ``random.Random`` for one asset; see :func:`asset_seed`."""
+    return random.Random(asset_seed(project, asset_id, version))
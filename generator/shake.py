@@ -0,0 +1,203 @@
+"""Bundle only the assets the Dart code can load.
+
+Most ``pubspec.yaml`` files list whole directories (``assets/``,
+``assets/style_sources/``), so everything in them ships: collage inputs
+such as 44's ``style_tiles/thumb_*.jpg``, ``ASSET_SOURCES.md`` and the
+JSONL manifest, files no screen ever names. :func:`shake_project` matches
+the asset index of :func:`generator.assetrefs.dart_refs` against the
+files under ``assets/`` and derives the smallest precise asset list:
+
+* a directory whose every file is referenced stays one ``dir/`` entry;
+* otherwise each referenced file gets its own entry (Flutter still picks
+  up its ``2.0x/``/``3.0x/`` variants);
+* anything else is left out, and reported with its size.
+
+Referenced files the current list does not bundle are added, so the
+result also fixes paths that would fail to load; SVGs handed to a raster
+image provider (``AssetImage('assets/a.svg')``) are reported too, since
+bundling them does not make them load. ``--keep GLOB`` holds on
+to files that are loaded by a computed name the index cannot see.
+``python -m generator shake --all`` prints the lists; ``--write`` puts
+them into each ``pubspec.yaml``.
+"""
+
+import fnmatch
+import os
+import re
+from dataclasses import dataclass, field
+
+from generator.assetrefs import bundled, dart_refs, matches, pubspec_assets
+from generator.builddb import write_if_changed
+
+_VARIANT_DIR = re.compile(r"^\d+(?:\.\d+)?x$")
+
+
+@dataclass
+class ShakeReport:
+    project: str
+    entries: list = field(default_factory=list)     # the new flutter: assets: list
+    kept: list = field(default_factory=list)        # (path, bytes) bundled before and after
+    dropped: list = field(default_factory=list)     # (path, bytes) bundled before, not after
+    added: list = field(default_factory=list)       # (path, bytes) referenced but not bundled before
+    unmatched: list = field(default_factory=list)   # AssetRefs that match no file
+    undecodable: list = field(default_factory=list) # (AssetRef, path) SVGs loaded as raster images
+
+    def summary(self):
+        before = len(self.kept) + len(self.dropped)
+        saved = sum(size for _, size in self.dropped)
+        return (f"{before} bundled files -> {len(self.kept) + len(self.added)} "
+                f"({len(self.dropped)} dropped, {saved / 1024:.1f} KiB; {len(self.added)} added)")
+
+
+def _variant_base(rel):
+    """``assets/a/2.0x/b.png`` -> ``assets/a/b.png``; None for a main asset."""
+    parts = rel.split("/")
+    if len(parts) > 2 and _VARIANT_DIR.match(parts[-2]):
+        return "/".join(parts[:-2] + parts[-1:])
+    return None
+
+
+def _entries(referenced, files):
+    """The shortest pubspec list that bundles exactly ``referenced`` (main assets only)."""
+    by_dir = {}
+    for rel in files:
+        if _variant_base(rel) is None:
+            by_dir.setdefault(rel.rsplit("/", 1)[0], []).append(rel)
+    entries = []
+    for directory, members in sorted(by_dir.items()):
+        wanted = sorted(rel for rel in members if rel in referenced)
+        if not wanted:
+            continue
+        if len(wanted) == len(members) and len(members) > 1:
+            entries.append(directory + "/")
+        else:
+            entries += wanted
+    return entries
+
+
+def shake_project(project_dir, keep=()):
+    """Return the :class:`ShakeReport` for one project."""
+    from generator.audit import iter_assets
+
+    report = ShakeReport(os.path.basename(os.path.normpath(project_dir)))
+    sizes = {}
+    for path, size in iter_assets(os.path.join(project_dir, "assets")):
+        sizes[os.path.relpath(path, project_dir).replace(os.sep, "/")] = size
+    files = set(sizes)
+    referenced = set()
+    for ref in dart_refs(project_dir):
+        found = matches(ref, files)
+        if not found:
+            report.unmatched.append(ref)
+        report.undecodable += [(ref, rel) for rel in ref.undecodable(found)]
+        referenced.update(found)
+    for pattern in keep:
+        referenced.update(rel for rel in files if fnmatch.fnmatchcase(rel, pattern))
+    # A referenced variant stands for its main asset, which Flutter needs listed.
+    referenced |= {base for rel in referenced if (base := _variant_base(rel)) in files}
+
+    report.entries = _entries(referenced, files)
+    old = pubspec_assets(project_dir)
+    for rel in sorted(files):
+        main = _variant_base(rel) or rel
+        before, after = bundled(rel, old), main in referenced
+        if before and after:
+            report.kept.append((rel, sizes[rel]))
+        elif before:
+            report.dropped.append((rel, sizes[rel]))
+        elif after:
+            report.added.append((rel, sizes[rel]))
+    return report
+
+
+def write_pubspec(project_dir, entries):
+    """Replace the ``flutter: assets:`` list in ``pubspec.yaml``; return True if it changed.
+
+    Only the list's lines are touched. A pubspec without one gets it
+    appended to its ``flutter:`` section; an empty list removes the key.
+    """
+    path = os.path.join(project_dir, "pubspec.yaml")
+    with open(path, "r", encoding="utf-8") as f:
+        lines = f.read().splitlines(keepends=True)
+    block = [f"    - {entry}\n" for entry in entries]
+    section = None
+    start = end = None
+    for i, line in enumerate(lines):
+        text = line.rstrip("\n")
+        indent = len(text) - len(text.lstrip())
+        if text.strip() and indent == 0:
+            if start is not None and end is None:
+                end = i
+            section = text.split("#", 1)[0].strip()
+        elif section == "flutter:" and text.strip() == "assets:" and start is None:
+            start = i + 1
+        elif start is not None and end is None and text.strip() and not text.lstrip().startswith(("- ", "#")):
+            end = i
+    if start is None and not entries:
+        return False
+    if start is None:
+        flutter = next((i for i, line in enumerate(lines) if line.rstrip() == "flutter:"), None)
+        if flutter is None:
+            lines += ["\nflutter:\n"]
+            flutter = len(lines) - 1
+        lines[flutter + 1:flutter + 1] = ["  assets:\n"] + block
+    else:
+        end = len(lines) if end is None else end
+        # Keep the blank lines that separate the list from what follows.
+        while end > start and not lines[end - 1].strip():
+            end -= 1
+        if entries:
+            lines[start:end] = block
+        else:
+            del lines[start - 1:end]
+            if start - 1 == len(lines):
+                while lines and not lines[-1].strip():
+                    lines.pop()
+    return write_if_changed(path, "".join(lines).encode("utf-8"))
+
+
+def main(argv=None):
+    import argparse
+
+    from generator.build import find_projects, resolve_projects
+
+    parser = argparse.ArgumentParser(prog="python -m generator shake",
+                                     description="List only the assets the Dart code references in pubspec.yaml.")
+    parser.add_argument("projects", nargs="*", help="project directories or numbers, e.g. 44 or 44_Guest_Room_AI")
+    parser.add_argument("--all", action="store_true", help="shake every project that has a spec")
+    parser.add_argument("--root", default=".", help="directory that holds the projects (default: current)")
+    parser.add_argument("--keep", action="append", default=[], metavar="GLOB",
+                        help="also bundle matching paths, e.g. 'assets/icons/*' (repeatable)")
+    parser.add_argument("--write", action="store_true", help="rewrite the asset list in each pubspec.yaml")
+    args = parser.parse_args(argv)
+
+    if args.all == bool(args.projects):
+        parser.error("name one or more projects, or pass --all")
+    try:
+        projects = find_projects(args.root) if args.all else resolve_projects(args.projects, args.root)
+    except ValueError as e:
+        parser.error(str(e))
+
+    saved = 0
+    for project in projects:
+        project_dir = os.path.join(args.root, project)
+        report = shake_project(project_dir, args.keep)
+        for rel, size in report.dropped:
+            print(f"{project}/{rel}: not referenced, dropped ({size / 1024:.1f} KiB)")
+        for rel, _ in report.added:
+            print(f"{project}/{rel}: referenced but not bundled, added")
+        for ref in report.unmatched:
+            print(f"{project}/{ref.file}:{ref.line}: '{ref.text}' matches no asset")
+        for ref, rel in report.undecodable:
+            print(f"{project}/{ref.file}:{ref.line}: {rel} is an SVG; {ref.loader} cannot decode it")
+        if args.write:
+            if write_pubspec(project_dir, report.entries):
+                print(f"{project}: pubspec.yaml updated")
+        else:
+            print(f"{project}: flutter: assets:")
+            for entry in report.entries:
+                print(f"    - {entry}")
+        print(f"{project}: {report.summary()}")
+        saved += sum(size for _, size in report.dropped)
+    print(f"{len(projects)} projects, {saved / 1024:.1f} KiB of unreferenced assets")
+    return 0
@@ -0,0 +1,50 @@
+"""Identify image formats from their leading bytes.
+
+Extensions in the asset trees have lied before (BMPs named ``.jpg``,
+HTML error pages saved as photos), so anything that needs to know what a
+file really is looks at its magic number instead.
+"""
+
+HEAD_SIZE = 32
+IMAGE_FORMATS = ("jpeg", "png", "gif", "webp", "bmp")
+
+_TRAILERS = {
+    "jpeg": b"\xff\xd9",
+    "png": b"IEND\xaeB`\x82",
+}
+
+
+def sniff(head):
+    """Return the format name for ``head``, the first bytes of a file.
+
+    Recognizes the raster formats Flutter decodes plus SVG and HTML, and
+    returns ``None`` for anything else (including empty input).
+    """
+    if head.startswith(b"\xff\xd8\xff"):
+        return "jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return "gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    if head[:2] == b"BM" and len(head) >= 14:
+        return "bmp"
+    text = head.lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+    if text.startswith((b"<!doctype html", b"<html", b"<head", b"<body")):
+        return "html"
+    if text.startswith(b"<svg") or (text.startswith(b"<?xml") and b"<svg" in head.lower()):
+        return "svg"
+    return None
+
+
+def has_trailer(kind, tail):
+    """True when ``tail`` (the last bytes of a file) ends the way ``kind`` must.
+
+    Formats without a fixed trailer always pass.
+    """
+    trailer = _TRAILERS.get(kind)
+    if trailer is None:
+        return True
+    # JPEG encoders sometimes pad after EOI; allow a little slack.
+    return trailer in tail[-len(trailer) - 8:]
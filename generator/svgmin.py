@@ -0,0 +1,733 @@
+"""Lossless SVG minifier for the generated moodboards and illustrations.
+
+The generators write readable SVG: indented, commented, with
+``fill-opacity="1.0"`` on every shape (49's ``rect()``/``circle()``
+helpers), long-hand colors and ``style="stop-color:...;stop-opacity:1"``.
+flutter_svg parses all of it at runtime. :func:`optimize` rewrites a
+document into the smallest form that draws the same thing:
+
+* comments and whitespace between elements are dropped (text content is
+  kept as is);
+* ``style`` declarations become presentation attributes;
+* attributes equal to their initial or inherited value are dropped
+  (``opacity="1"``, ``x="0"`` on a rect, ``fill-opacity="1.0"``...);
+* colors are shortened (``#FFFFFF`` -> ``#fff``, ``white`` -> ``#fff``),
+  and colors with alpha (``rgba()``, ``#RRGGBBAA``) become an opaque color
+  plus ``fill-opacity``/``stroke-opacity``, which every renderer supports;
+* numbers, ``viewBox`` lists and path data are printed in their shortest
+  exact form (``0.50`` -> ``.5``, ``M0 800 L300 400`` -> ``M0 800L300 400``);
+  no precision is dropped;
+* identical gradients, patterns, clip paths and filters in ``<defs>`` are
+  merged and references rewritten; unreferenced ones are removed.
+
+Every result is checked with :func:`equivalent`, which compares the
+documents' render models: each element with its geometry, computed paint
+(inherited properties and alpha folded in) and resolved references. A
+rewrite that would change the picture raises :class:`SvgOptimizeError`
+instead of being written.
+
+Run ``python -m generator svgmin PATH...`` on files or asset directories.
+"""
+
+import argparse
+import math
+import os
+import re
+import sys
+import time
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+
+SVG_NS = "http://www.w3.org/2000/svg"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+XML_NS = "http://www.w3.org/XML/1998/namespace"
+_HREFS = ("href", f"{{{XLINK_NS}}}href")
+
+# Properties that inherit, with their initial values.
+INHERITED = {
+    "fill": "black", "fill-opacity": "1", "fill-rule": "nonzero",
+    "stroke": "none", "stroke-opacity": "1", "stroke-width": "1",
+    "stroke-linecap": "butt", "stroke-linejoin": "miter",
+    "font-family": None, "font-size": None, "font-weight": "normal", "font-style": "normal",
+    "text-anchor": "start", "visibility": "visible", "clip-rule": "nonzero", "color": None,
+}
+PRESENTATION = set(INHERITED) | {
+    "opacity", "stop-color", "stop-opacity", "flood-color", "flood-opacity",
+    "dominant-baseline", "filter", "clip-path", "mask", "display",
+}
+# Non-inherited attributes whose value is the initial one.
+DEFAULTS = {
+    "*": {"opacity": 1.0},
+    "stop": {"stop-opacity": 1.0, "offset": 0.0},
+    "rect": {"x": 0.0, "y": 0.0},
+    "image": {"x": 0.0, "y": 0.0},
+    "use": {"x": 0.0, "y": 0.0},
+    "circle": {"cx": 0.0, "cy": 0.0},
+    "ellipse": {"cx": 0.0, "cy": 0.0},
+    "line": {"x1": 0.0, "y1": 0.0, "x2": 0.0, "y2": 0.0},
+    "pattern": {"x": 0.0, "y": 0.0},
+    "linearGradient": {"x1": 0.0, "y1": 0.0, "x2": 1.0, "y2": 0.0},   # objectBoundingBox only
+}
+_GRADIENT_VECTOR = ("x1", "y1", "x2", "y2")
+_ALPHA_OF = {"fill": "fill-opacity", "stroke": "stroke-opacity", "stop-color": "stop-opacity",
+             "flood-color": "flood-opacity"}
+_NUMERIC = {
+    "x", "y", "width", "height", "rx", "ry", "cx", "cy", "r", "x1", "y1", "x2", "y2",
+    "stroke-width", "opacity", "fill-opacity", "stroke-opacity", "stop-opacity", "flood-opacity",
+    "offset", "font-size", "stdDeviation", "fx", "fy",
+}
+_MERGEABLE = {"linearGradient", "radialGradient", "pattern", "clipPath", "filter", "mask"}
+
+NAMED_COLORS = {
+    "black": "#000000", "white": "#ffffff", "red": "#ff0000", "green": "#008000", "blue": "#0000ff",
+    "yellow": "#ffff00", "cyan": "#00ffff", "aqua": "#00ffff", "magenta": "#ff00ff", "fuchsia": "#ff00ff",
+    "gray": "#808080", "grey": "#808080", "silver": "#c0c0c0", "maroon": "#800000", "olive": "#808000",
+    "lime": "#00ff00", "navy": "#000080", "purple": "#800080", "teal": "#008080", "orange": "#ffa500",
+    "gold": "#ffd700", "tan": "#d2b48c", "pink": "#ffc0cb", "plum": "#dda0dd", "snow": "#fffafa",
+    "linen": "#faf0e6", "ivory": "#fffff0", "beige": "#f5f5dc", "khaki": "#f0e68c", "coral": "#ff7f50",
+    "salmon": "#fa8072", "orchid": "#da70d6", "peru": "#cd853f", "sienna": "#a0522d", "wheat": "#f5deb3",
+    "indigo": "#4b0082", "violet": "#ee82ee", "brown": "#a52a2a", "crimson": "#dc143c",
+}
+_SHORT_NAMES = {}
+for _name, _hex in NAMED_COLORS.items():
+    if _hex not in _SHORT_NAMES or len(_name) < len(_SHORT_NAMES[_hex]):
+        _SHORT_NAMES[_hex] = _name
+
+_NUMBER = re.compile(r"^\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)(%?)\s*$")
+_PATH_TOKEN = re.compile(r"[MmZzLlHhVvCcSsQqTtAa]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_URL = re.compile(r"url\(\s*['\"]?#([^)'\"\s]+)['\"]?\s*\)")
+_RGB = re.compile(r"^rgba?\(\s*([^)]*)\)$")
+
+
+class SvgOptimizeError(ValueError):
+    pass
+
+
+# Values -------------------------------------------------------------------
+
+def parse_color(value):
+    """``(r, g, b, a)`` with 0-255 channels and 0-1 alpha, or None for non-colors."""
+    v = value.strip().lower()
+    v = NAMED_COLORS.get(v, v)
+    if v == "transparent":
+        return (0, 0, 0, 0.0)
+    if v.startswith("#") and re.fullmatch(r"#[0-9a-f]+", v) and len(v) in (4, 5, 7, 9):
+        digits = v[1:]
+        if len(digits) in (3, 4):
+            digits = "".join(c * 2 for c in digits)
+        channels = [int(digits[i:i + 2], 16) for i in range(0, len(digits), 2)]
+        alpha = channels[3] / 255 if len(channels) == 4 else 1.0
+        return (channels[0], channels[1], channels[2], alpha)
+    m = _RGB.match(v)
+    if m:
+        parts = [p.strip() for p in m.group(1).replace("/", ",").split(",")]
+        if len(parts) not in (3, 4):
+            return None
+        try:
+            rgb = [round(float(p[:-1]) * 2.55) if p.endswith("%") else int(float(p)) for p in parts[:3]]
+            alpha = 1.0
+            if len(parts) == 4:
+                alpha = float(parts[3][:-1]) / 100 if parts[3].endswith("%") else float(parts[3])
+        except ValueError:
+            return None
+        return (*[max(0, min(255, c)) for c in rgb], max(0.0, min(1.0, alpha)))
+    return None
+
+
+def format_color(r, g, b):
+    """Shortest spelling of an opaque color."""
+    hexed = f"#{r:02x}{g:02x}{b:02x}"
+    short = hexed
+    if hexed[1] == hexed[2] and hexed[3] == hexed[4] and hexed[5] == hexed[6]:
+        short = f"#{hexed[1]}{hexed[3]}{hexed[5]}"
+    name = _SHORT_NAMES.get(hexed)
+    return name if name is not None and len(name) < len(short) else short
+
+
+def format_number(x):
+    """Shortest decimal that reads back as exactly ``x``."""
+    if x == int(x) and abs(x) < 1e15:
+        return str(int(x))
+    text = repr(x)
+    if "e" in text:
+        return text
+    if text.startswith("0."):
+        return text[1:]
+    if text.startswith("-0."):
+        return "-" + text[2:]
+    return text
+
+
+def _number(value):
+    m = _NUMBER.match(value)
+    if not m:
+        return None
+    return float(m.group(1)), m.group(2)
+
+
+def _short_number(value):
+    parsed = _number(value)
+    if parsed is None:
+        return value
+    x, unit = parsed
+    return format_number(x) + unit
+
+
+def _short_list(value):
+    parts = value.replace(",", " ").split()
+    if not parts or any(_number(p) is None or _number(p)[1] for p in parts):
+        return value
+    return " ".join(format_number(_number(p)[0]) for p in parts)
+
+
+def parse_path(d):
+    """``[(command, [numbers...]), ...]``."""
+    out = []
+    for token in _PATH_TOKEN.findall(d):
+        if token.isalpha():
+            out.append((token, []))
+        elif out:
+            out[-1][1].append(float(token))
+    return out
+
+
+def format_path(d):
+    tokens = _PATH_TOKEN.findall(d)
+    if "".join(tokens) != re.sub(r"[\s,]+", "", d):
+        return d    # something we don't tokenize (arc flag packing, junk): leave it
+    out = []
+    prev = None
+    for token in tokens:
+        if token.isalpha():
+            out.append(token)
+        else:
+            text = format_number(float(token))
+            if prev is not None and not prev.isalpha():
+                if not (text.startswith("-") or (text.startswith(".") and "." in prev and "e" not in prev)):
+                    out.append(" ")
+            out.append(text)
+            token = text
+        prev = token
+    return "".join(out)
+
+
+def _style(value):
+    decls = {}
+    for decl in value.split(";"):
+        name, sep, val = decl.partition(":")
+        if sep and name.strip():
+            decls[name.strip()] = val.strip()
+    return decls
+
+
+def _local(tag):
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def _refs(value):
+    return _URL.findall(value)
+
+
+# Optimizer ----------------------------------------------------------------
+
+def _flatten_style(elem):
+    style = elem.attrib.pop("style", None)
+    if style is None:
+        return
+    decls = _style(style)
+    leftover = []
+    for name, value in decls.items():
+        if name in PRESENTATION:
+            elem.set(name, value)
+        else:
+            leftover.append(f"{name}:{value}")
+    if leftover:
+        elem.set("style", ";".join(leftover))
+
+
+def _computed(elem, ctx):
+    """Inherited properties in effect for ``elem``'s children."""
+    out = dict(ctx)
+    for name in INHERITED:
+        if name in elem.attrib:
+            out[name] = elem.attrib[name]
+    return out
+
+
+def _same_paint(a, b):
+    if a is None or b is None:
+        return a == b
+    ca, cb = parse_color(a), parse_color(b)
+    if ca is not None and cb is not None:
+        return ca == cb
+    return a.strip() == b.strip()
+
+
+def _same_value(name, a, b):
+    if a is None or b is None:
+        return False
+    if name in ("fill", "stroke", "color"):
+        return _same_paint(a, b)
+    na, nb = _number(a), _number(b)
+    if na is not None and nb is not None:
+        return na == nb
+    return a.strip() == b.strip()
+
+
+def _optimize_element(elem, ctx, in_defs, uses_use, text_parent=False):
+    tag = _local(elem.tag)
+    _flatten_style(elem)
+    attrib = elem.attrib
+
+    # Fold color alpha into the matching opacity, unless the element sits in
+    # <defs> of a document with <use>, where inheritance depends on the use site.
+    for paint, opacity in _ALPHA_OF.items():
+        value = attrib.get(paint)
+        color = parse_color(value) if value is not None else None
+        if color is None:
+            continue
+        r, g, b, a = color
+        if a < 1.0:
+            own = attrib.get(opacity)
+            if own is None and opacity in INHERITED:
+                if in_defs and uses_use:
+                    continue
+                own = ctx.get(opacity, "1")
+            base = _number(own) if own is not None else (1.0, "")
+            if base is None or base[1]:
+                continue
+            attrib[opacity] = format_number(round(base[0] * a, 3))
+        attrib[paint] = format_color(r, g, b)
+
+    # Drop values equal to the inherited or initial ones.
+    for name in list(attrib):
+        value = attrib[name]
+        if name in INHERITED and not (in_defs and uses_use):
+            if _same_value(name, value, ctx.get(name)):
+                del attrib[name]
+                continue
+        default = _default(tag, elem, name)
+        if default is not None:
+            parsed = _gradient_number(tag, elem, name, value)
+            if parsed is not None and parsed == default:
+                del attrib[name]
+
+    # Shorten what is left.
+    for name, value in list(attrib.items()):
+        if name in _NUMERIC:
+            if tag == "stop" and name == "offset" or tag == "linearGradient" and name in _GRADIENT_VECTOR:
+                parsed = _gradient_number(tag, elem, name, value)
+                if parsed is not None:
+                    attrib[name] = format_number(parsed)
+                    continue
+            attrib[name] = _short_number(value)
+        elif name == "viewBox":
+            attrib[name] = _short_list(value)
+        elif name == "d":
+            attrib[name] = format_path(value)
+        elif name in ("fill", "stroke", "stop-color", "flood-color", "color"):
+            color = parse_color(value)
+            if color is not None and color[3] == 1.0:
+                attrib[name] = format_color(*color[:3])
+
+    child_ctx = _computed(elem, ctx)
+    is_text = tag in ("text", "tspan", "textPath")
+    if not is_text and elem.text is not None and not elem.text.strip():
+        elem.text = None
+    for child in list(elem):
+        if not isinstance(child.tag, str):
+            elem.remove(child)
+            continue
+        _optimize_element(child, child_ctx, in_defs or tag == "defs", uses_use, is_text)
+        if not is_text and child.tail is not None and not child.tail.strip():
+            child.tail = None
+
+
+def _bounding_box_units(elem):
+    """True when a gradient's coordinates are known to be in objectBoundingBox units.
+
+    A gradient without its own ``gradientUnits`` that ``href``s a template
+    inherits the template's units, so it is not known here.
+    """
+    units = elem.get("gradientUnits")
+    if units is None:
+        return not any(elem.get(h) for h in _HREFS)
+    return units.strip() == "objectBoundingBox"
+
+
+def _default(tag, elem, name):
+    """The initial value of a non-inherited attribute, or None."""
+    if tag == "linearGradient" and name in _GRADIENT_VECTOR and not _bounding_box_units(elem):
+        # userSpaceOnUse defaults are percentages of the viewport.
+        return None
+    return DEFAULTS.get(tag, {}).get(name, DEFAULTS["*"].get(name))
+
+
+def _gradient_number(tag, elem, name, value):
+    """Numeric value of an attribute, with bounding-box percentages as fractions."""
+    parsed = _number(value)
+    if parsed is None:
+        return None
+    x, unit = parsed
+    if not unit:
+        return x
+    if tag == "stop" and name == "offset":
+        return x / 100
+    if tag == "linearGradient" and name in _GRADIENT_VECTOR and _bounding_box_units(elem):
+        return x / 100
+    return None
+
+
+def _gradient_vector(elem, ids):
+    """``(units, x1, y1, x2, y2)`` a linearGradient draws with, templates resolved.
+
+    Coordinates are ``(value, unit)``; bounding-box percentages become
+    fractions and missing ones take the initial value for their units.
+    """
+    attrs = {}
+    seen = set()
+    node = elem
+    while node is not None and id(node) not in seen:
+        seen.add(id(node))
+        for name in ("gradientUnits",) + _GRADIENT_VECTOR:
+            if name not in attrs and node.get(name) is not None:
+                attrs[name] = node.get(name)
+        href = next((node.get(h) for h in _HREFS if node.get(h)), "")
+        node = ids.get(href[1:]) if href.startswith("#") else None
+    units = attrs.get("gradientUnits", "objectBoundingBox").strip()
+    initial = {"x1": "0%", "y1": "0%", "x2": "100%", "y2": "0%"}
+    vector = [units]
+    for name in _GRADIENT_VECTOR:
+        value = attrs.get(name, initial[name])
+        parsed = _number(value)
+        if parsed is None:
+            vector.append(value.strip())
+            continue
+        x, unit = parsed
+        if unit and units == "objectBoundingBox":
+            x, unit = x / 100, ""
+        vector.append((round(x, 6), unit))
+    return tuple(vector)
+
+
+def _all_refs(root):
+    refs = []
+    for elem in root.iter():
+        for name, value in elem.attrib.items():
+            if name in _HREFS and value.startswith("#"):
+                refs.append(value[1:])
+            else:
+                refs += _refs(value)
+    return refs
+
+
+def _rename_refs(root, mapping):
+    def swap(m):
+        return f"url(#{mapping.get(m.group(1), m.group(1))})"
+    for elem in root.iter():
+        for name, value in list(elem.attrib.items()):
+            if name in _HREFS and value.startswith("#") and value[1:] in mapping:
+                elem.set(name, "#" + mapping[value[1:]])
+            elif "url(" in value:
+                elem.set(name, _URL.sub(swap, value))
+
+
+def _merge_defs(root):
+    for _ in range(4):  # merging children can make their parents identical
+        mapping = {}
+        for defs in root.iter(f"{{{SVG_NS}}}defs"):
+            seen = {}
+            for child in list(defs):
+                if _local(child.tag) not in _MERGEABLE or "id" not in child.attrib:
+                    continue
+                key = _canonical(child)
+                if key in seen:
+                    mapping[child.get("id")] = seen[key]
+                    defs.remove(child)
+                else:
+                    seen[key] = child.get("id")
+        if not mapping:
+            break
+        _rename_refs(root, mapping)
+    # Unreferenced definitions.
+    while True:
+        used = set(_all_refs(root))
+        removed = False
+        for defs in root.iter(f"{{{SVG_NS}}}defs"):
+            for child in list(defs):
+                ident = child.get("id")
+                if ident is not None and ident not in used and _local(child.tag) in _MERGEABLE | {"image", "g", "path"}:
+                    defs.remove(child)
+                    removed = True
+        if not removed:
+            break
+    for parent in root.iter():
+        for child in list(parent):
+            if _local(child.tag) == "defs" and len(child) == 0:
+                parent.remove(child)
+
+
+def _canonical(elem):
+    attrs = sorted((k, v) for k, v in elem.attrib.items() if k != "id")
+    return (elem.tag, tuple(attrs), (elem.text or "").strip(), tuple(_canonical(c) for c in elem))
+
+
+def _escape(text, attr=False):
+    text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    return text.replace('"', "&quot;") if attr else text
+
+
+def _qname(name, prefixes):
+    if name.startswith("{"):
+        ns, local = name[1:].split("}", 1)
+        if ns == SVG_NS:
+            return local
+        if ns == XML_NS:
+            return f"xml:{local}"
+        if ns not in prefixes:
+            prefixes[ns] = "xlink" if ns == XLINK_NS else f"ns{len(prefixes)}"
+        return f"{prefixes[ns]}:{local}"
+    return name
+
+
+def _serialize(elem, out, prefixes):
+    name = _qname(elem.tag, prefixes)
+    out.append(f"<{name}")
+    if not out[:-1]:
+        out.append(None)    # namespace declarations go here once all prefixes are known
+    for key, value in elem.attrib.items():
+        out.append(f' {_qname(key, prefixes)}="{_escape(value, attr=True)}"')
+    if elem.text is None and len(elem) == 0:
+        out.append("/>")
+    else:
+        out.append(">")
+        if elem.text:
+            out.append(_escape(elem.text))
+        for child in elem:
+            _serialize(child, out, prefixes)
+            if child.tail:
+                out.append(_escape(child.tail))
+        out.append(f"</{name}>")
+
+
+def _parse(text):
+    if isinstance(text, str):
+        text = text.encode("utf-8")
+    try:
+        return ET.fromstring(text)
+    except ET.ParseError as e:
+        raise SvgOptimizeError(f"not well-formed SVG: {e}") from None
+
+
+def optimize(text, verify=True):
+    """Return the minified form of the SVG document ``text``.
+
+    Raises :class:`SvgOptimizeError` if the input does not parse or (with
+    ``verify``) the output would not render the same.
+    """
+    root = _parse(text)
+    uses_use = any(_local(e.tag) == "use" for e in root.iter())
+    _optimize_element(root, {k: v for k, v in INHERITED.items() if v is not None}, False, uses_use)
+    _merge_defs(root)
+    root.attrib.pop("version", None)
+    prefixes = {}
+    out = []
+    _serialize(root, out, prefixes)
+    # ElementTree drops namespace declarations; put back the ones in use.
+    out[1] = f' xmlns="{SVG_NS}"' + "".join(f' xmlns:{p}="{ns}"' for ns, p in prefixes.items())
+    result = "".join(out)
+    if verify and not equivalent(text, result):
+        raise SvgOptimizeError("optimized SVG does not render the same as its input")
+    return result
+
+
+# Render model ---------------------------------------------------------------
+
+def _paint(value, opacity, ids, ctx, depth):
+    if value is None or value.strip() == "none":
+        return "none"
+    refs = _refs(value)
+    if refs:
+        target = ids.get(refs[0])
+        return ("url", _model(target, ids, _root_ctx(), depth + 1) if target is not None else refs[0], opacity)
+    color = parse_color(value)
+    if color is None:
+        return ("raw", value.strip(), opacity)
+    r, g, b, a = color
+    return ("rgb", (r, g, b), round(opacity * a, 3))
+
+
+def _root_ctx():
+    return {k: v for k, v in INHERITED.items() if v is not None}
+
+
+def _value(tag, elem, name, value, ids, depth):
+    if name == "d":
+        return tuple((c, tuple(n)) for c, n in parse_path(value))
+    if name in ("viewBox", "points"):
+        return _short_list(value)
+    if name in _NUMERIC:
+        parsed = _gradient_number(tag, elem, name, value)
+        if parsed is not None:
+            return round(parsed, 6)
+        parsed = _number(value)
+        return (round(parsed[0], 6), parsed[1]) if parsed else value.strip()
+    if name in _HREFS and value.startswith("#"):
+        target = ids.get(value[1:])
+        return _model(target, ids, _root_ctx(), depth + 1) if target is not None else value
+    refs = _refs(value)
+    if refs:
+        target = ids.get(refs[0])
+        return _model(target, ids, _root_ctx(), depth + 1) if target is not None else value
+    return value.strip()
+
+
+def _model(elem, ids, ctx, depth=0, in_defs=False):
+    if depth > 16:
+        return "..."
+    tag = _local(elem.tag)
+    attrib = dict(elem.attrib)
+    attrib.update({k: v for k, v in _style(attrib.pop("style", "")).items() if k in PRESENTATION})
+    here = dict(ctx)
+    for name in INHERITED:
+        if name in attrib:
+            here[name] = attrib.pop(name)
+
+    own = []
+    if tag == "linearGradient":
+        own.append(("vector", _gradient_vector(elem, ids)))
+    for name, value in attrib.items():
+        if name == "id" and (in_defs or depth > 0):
+            continue
+        if tag == "svg" and name == "version":
+            continue    # draws nothing; optimize() drops it
+        if tag == "linearGradient" and name in ("gradientUnits",) + _GRADIENT_VECTOR:
+            continue    # part of the resolved vector
+        if name in ("stop-color", "flood-color"):
+            continue
+        if name in ("stop-opacity", "flood-opacity"):
+            continue
+        v = _value(tag, elem, name, value, ids, depth)
+        default = _default(tag, elem, name)
+        if default is not None and v == round(default, 6):
+            continue
+        own.append((name, v))
+    for color_name, opacity_name in (("stop-color", "stop-opacity"), ("flood-color", "flood-opacity")):
+        if color_name in attrib or opacity_name in attrib:
+            opacity = _number(attrib.get(opacity_name, "1"))
+            opacity = opacity[0] if opacity else 1.0
+            own.append((color_name, _paint(attrib.get(color_name, "black"), opacity, ids, here, depth)))
+    if tag in ("rect", "circle", "ellipse", "line", "path", "polygon", "polyline", "text", "tspan"):
+        for paint, opacity_name in (("fill", "fill-opacity"), ("stroke", "stroke-opacity")):
+            opacity = _number(here.get(opacity_name, "1"))
+            own.append((paint, _paint(here.get(paint), opacity[0] if opacity else 1.0, ids, here, depth)))
+        for name in INHERITED:
+            if name not in ("fill", "stroke", "fill-opacity", "stroke-opacity") and name in here:
+                value = here[name]
+                parsed = _number(value)
+                own.append((name, (round(parsed[0], 6), parsed[1]) if parsed else value.strip()))
+    text = elem.text if tag in ("text", "tspan", "textPath") else None
+    children = []
+    for child in elem:
+        if not isinstance(child.tag, str):
+            continue
+        if _local(child.tag) == "defs":
+            continue    # definitions draw nothing; they are compared where referenced
+        children.append(_model(child, ids, here, depth, in_defs))
+        if tag in ("text", "tspan") and child.tail:
+            children.append(child.tail)
+    return (tag, tuple(sorted(own, key=lambda kv: kv[0])), text, tuple(children))
+
+
+def render_model(text):
+    """A comparable description of what ``text`` draws."""
+    root = _parse(text)
+    ids = {e.get("id"): e for e in root.iter() if e.get("id") is not None}
+    return _model(root, ids, _root_ctx())
+
+
+def _close(a, b):
+    if isinstance(a, float) and isinstance(b, float):
+        return math.isclose(a, b, rel_tol=1e-9, abs_tol=2e-3)
+    if isinstance(a, tuple) and isinstance(b, tuple):
+        return len(a) == len(b) and all(_close(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def equivalent(a, b):
+    """True when the SVG documents ``a`` and ``b`` draw the same picture."""
+    return _close(render_model(a), render_model(b))
+
+
+# Files ----------------------------------------------------------------------
+
+@dataclass
+class MinifyReport:
+    files: int = 0
+    changed: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+    seconds: float = 0.0
+    errors: list = field(default_factory=list)
+
+    def summary(self):
+        saved = self.bytes_before - self.bytes_after
+        pct = 100 * saved / self.bytes_before if self.bytes_before else 0
+        return (f"{self.changed} of {self.files} SVGs rewritten, {self.bytes_before / 1024:.1f} KiB -> "
+                f"{self.bytes_after / 1024:.1f} KiB ({pct:.0f}% smaller) in {self.seconds:.2f}s")
+
+
+def optimize_file(path, check=False):
+    """Minify ``path`` in place; return ``(bytes before, bytes after)``.
+
+    With ``check`` nothing is written.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    new = optimize(data).encode("utf-8")
+    if len(new) >= len(data):
+        return len(data), len(data)
+    if not check:
+        from generator.builddb import write_if_changed
+        write_if_changed(path, new)
+    return len(data), len(new)
+
+
+def svg_files(paths):
+    from generator.walk import iter_files
+    for path in paths:
+        if os.path.isdir(path):
+            for found, _ in iter_files(path, (".svg",)):
+                yield found
+        else:
+            yield path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m generator svgmin",
+                                     description="Minify SVG files in place, verifying each renders the same.")
+    parser.add_argument("paths", nargs="+", help="SVG files or directories to walk")
+    parser.add_argument("--check", action="store_true", help="report the savings without writing")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    report = MinifyReport()
+    for path in sorted(set(svg_files(args.paths))):
+        report.files += 1
+        try:
+            before, after = optimize_file(path, args.check)
+        except (OSError, SvgOptimizeError) as e:
+            report.errors.append(path)
+            print(f"Skipped {path}: {e}")
+            continue
+        report.bytes_before += before
+        report.bytes_after += after
+        if after < before:
+            report.changed += 1
+    report.seconds = time.perf_counter() - started
+    print(report.summary())
+    return 1 if report.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
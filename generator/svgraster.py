@@ -0,0 +1,514 @@
+"""Rasterize generated SVGs into Flutter's resolution-aware bitmap variants.
+
+flutter_svg parses and rasterizes every style card's moodboard on the UI
+thread while the grid scrolls. The generators only ever emit a small SVG
+subset, so the build can draw it ahead of time with
+:class:`generator.collage.Collage`: rects (with ``rx`` and strokes),
+circles (with ``feGaussianBlur``), lines, ``M``/``L``/``H``/``V``/``Z``
+paths, two-stop linear gradients along an axis or the diagonal, dot
+``<pattern>`` fills, opacity, text labels and center-cropped ``<image>``
+tiles. Anything else raises :class:`SvgRasterError` rather than drawing
+something different.
+
+Each SVG's ``width``/``height`` is its logical size. A variant at density
+``d`` is ``d`` times that, written where Flutter's asset resolver looks
+for it::
+
+    style_moodboards/style_1.svg        the vector source
+    style_moodboards/style_1.png        1x
+    style_moodboards/2.0x/style_1.png   2x
+    style_moodboards/3.0x/style_1.png   3x
+
+``Image.asset('assets/style_moodboards/style_1.png')`` then loads the
+bitmap matching the device pixel ratio with no vector work at runtime.
+Flat art is written as PNG; boards with photo tiles as JPEG.
+
+Run ``python -m generator raster [--densities 1,2,3] PATH...``; spec
+groups with a ``densities`` list get their variants from the build.
+Needs Pillow, like :mod:`generator.collage`.
+"""
+
+import argparse
+import base64
+import io
+import math
+import os
+import re
+import sys
+import time
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+
+from generator.collage import Collage, Gradient
+from generator.svgmin import INHERITED, XLINK_NS, parse_color, parse_path
+
+DENSITIES = (1, 2, 3)
+
+_HREFS = ("href", f"{{{XLINK_NS}}}href")
+_NUMBER = re.compile(r"^\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)(%|px)?\s*$")
+_URL = re.compile(r"^url\(\s*['\"]?#([^)'\"\s]+)['\"]?\s*\)$")
+_SKIP = {"defs", "title", "desc", "metadata", "linearGradient", "pattern", "clipPath", "filter"}
+
+
+class SvgRasterError(ValueError):
+    """The document uses SVG this rasterizer does not draw."""
+
+
+def variant_rel(rel, density, fmt="png"):
+    """``style_moodboards/style_1.svg`` at density 2 -> ``style_moodboards/2.0x/style_1.png``."""
+    folder, name = os.path.split(rel.replace("\\", "/"))
+    name = f"{os.path.splitext(name)[0]}.{fmt}"
+    if density != 1:
+        name = f"{float(density)}x/{name}"
+    return f"{folder}/{name}" if folder else name
+
+
+def parse_densities(value):
+    """``"1,2,3"`` -> ``(1, 2, 3)``; fractional ratios such as ``1.5`` are kept."""
+    try:
+        densities = sorted({float(v) for v in value.split(",") if v.strip()})
+    except ValueError:
+        raise ValueError(f"bad density list {value!r}") from None
+    if not densities or densities[0] <= 0:
+        raise ValueError(f"bad density list {value!r}")
+    return tuple(int(d) if d.is_integer() else d for d in densities)
+
+
+def _local(tag):
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def _attrs(elem):
+    attrib = dict(elem.attrib)
+    for decl in attrib.pop("style", "").split(";"):
+        name, sep, value = decl.partition(":")
+        if sep and name.strip():
+            attrib[name.strip()] = value.strip()
+    return attrib
+
+
+def _number(value, extent=None, default=0.0):
+    if value is None:
+        return default
+    m = _NUMBER.match(value)
+    if not m:
+        raise SvgRasterError(f"unsupported length {value!r}")
+    number = float(m.group(1))
+    if m.group(2) == "%":
+        if extent is None:
+            raise SvgRasterError(f"percentage {value!r} has no reference length here")
+        number = number / 100 * extent
+    return number
+
+
+def _fraction(value, default):
+    """A gradient coordinate in bounding-box units (``"100%"`` or ``"1"``)."""
+    if value is None:
+        return default
+    m = _NUMBER.match(value)
+    if not m:
+        raise SvgRasterError(f"unsupported gradient coordinate {value!r}")
+    return float(m.group(1)) / (100 if m.group(2) == "%" else 1)
+
+
+def _color(value, alpha=1.0):
+    color = parse_color(value)
+    if color is None:
+        raise SvgRasterError(f"unsupported color {value!r}")
+    r, g, b, a = color
+    return (r, g, b, round(a * alpha * 255))
+
+
+class _Document:
+    def __init__(self, root, base_dir):
+        self.root = root
+        self.base_dir = base_dir
+        self.ids = {e.get("id"): e for e in root.iter() if e.get("id") is not None}
+
+    def target(self, value, tag):
+        """The element a ``url(#id)`` points at, None when it is missing.
+
+        A missing paint server draws nothing, which is what flutter_svg
+        does with 49's dangling ``url(#grad1)``.
+        """
+        m = _URL.match(value.strip())
+        if not m:
+            raise SvgRasterError(f"unsupported reference {value!r}")
+        elem = self.ids.get(m.group(1))
+        if elem is not None and _local(elem.tag) != tag:
+            raise SvgRasterError(f"#{m.group(1)} is a <{_local(elem.tag)}>, expected <{tag}>")
+        return elem
+
+    def paint(self, value, opacity):
+        """``(fill, opacity)`` for Collage, or None when nothing is painted."""
+        value = value.strip()
+        if value == "none" or opacity <= 0:
+            return None
+        if not value.startswith("url("):
+            return _color(value), opacity
+        m = _URL.match(value)
+        elem = self.ids.get(m.group(1)) if m else None
+        if elem is None:
+            return None
+        tag = _local(elem.tag)
+        if tag == "linearGradient":
+            return self.gradient(elem), opacity
+        if tag == "pattern":
+            return elem, opacity
+        raise SvgRasterError(f"unsupported paint server <{tag}>")
+
+    def gradient(self, elem):
+        attrib = _attrs(elem)
+        if attrib.get("gradientUnits", "objectBoundingBox") != "objectBoundingBox" or "gradientTransform" in attrib:
+            raise SvgRasterError("only bounding-box gradients without transforms are supported")
+        stops = []
+        for stop in elem:
+            if _local(stop.tag) != "stop":
+                continue
+            s = _attrs(stop)
+            stops.append((_fraction(s.get("offset"), 0.0),
+                           _color(s.get("stop-color", "black"), _number(s.get("stop-opacity"), default=1.0))))
+        if len(stops) == 1:
+            stops.append((1.0, stops[0][1]))
+        if len(stops) != 2 or stops[0][0] != 0 or stops[1][0] != 1:
+            raise SvgRasterError("only two-stop gradients from 0% to 100% are supported")
+        vector = tuple(_fraction(attrib.get(k), d) for k, d in (("x1", 0), ("y1", 0), ("x2", 1), ("y2", 0)))
+        (_, start), (_, end) = stops
+        directions = {(0, 0, 1, 0): "x", (0, 0, 0, 1): "y", (0, 0, 1, 1): "xy",
+                      (1, 0, 0, 0): "-x", (0, 1, 0, 0): "-y", (1, 1, 0, 0): "-xy"}
+        direction = directions.get(vector)
+        if direction is None:
+            raise SvgRasterError(f"unsupported gradient vector {vector}")
+        if direction.startswith("-"):
+            start, end, direction = end, start, direction[1:]
+        return Gradient(start, end, direction=direction)
+
+    def blur(self, value):
+        elem = self.target(value, "filter")
+        if elem is None:
+            return 0
+        prims = [child for child in elem if isinstance(child.tag, str)]
+        if len(prims) != 1 or _local(prims[0].tag) != "feGaussianBlur" \
+                or prims[0].get("in", "SourceGraphic") != "SourceGraphic":
+            raise SvgRasterError("only single feGaussianBlur filters are supported")
+        return _number(prims[0].get("stdDeviation"))
+
+    def clip_box(self, value):
+        elem = self.target(value, "clipPath")
+        if elem is None:
+            return None
+        shapes = [child for child in elem if isinstance(child.tag, str)]
+        if len(shapes) != 1 or _local(shapes[0].tag) != "rect" or "transform" in shapes[0].attrib:
+            raise SvgRasterError("only single-rect clip paths are supported")
+        a = _attrs(shapes[0])
+        x, y = _number(a.get("x")), _number(a.get("y"))
+        return (x, y, x + _number(a.get("width")), y + _number(a.get("height")))
+
+
+def _pattern_fill(board, doc, box, pattern, opacity):
+    """Tile a dot pattern's circles over ``box``."""
+    attrib = _attrs(pattern)
+    if attrib.get("patternUnits") != "userSpaceOnUse" or "patternTransform" in attrib or "viewBox" in attrib:
+        raise SvgRasterError("only userSpaceOnUse patterns without transforms are supported")
+    px, py = _number(attrib.get("x")), _number(attrib.get("y"))
+    pw, ph = _number(attrib.get("width")), _number(attrib.get("height"))
+    if pw <= 0 or ph <= 0:
+        return
+    # The first tile whose origin is at or before the box's corner.
+    tx = px + math.floor((box[0] - px) / pw) * pw
+    ty = py + math.floor((box[1] - py) / ph) * ph
+    for child in pattern:
+        if not isinstance(child.tag, str):
+            continue
+        if _local(child.tag) != "circle":
+            raise SvgRasterError("only circle patterns are supported")
+        a = _attrs(child)
+        paint = doc.paint(a.get("fill", "black"), _number(a.get("fill-opacity"), default=1.0)
+                          * _number(a.get("opacity"), default=1.0))
+        if paint is None:
+            continue
+        fill, alpha = paint
+        if not isinstance(fill, tuple):
+            raise SvgRasterError("pattern dots must be a solid color")
+        cx, cy = _number(a.get("cx")), _number(a.get("cy"))
+        board.dots(box, (pw, ph), (tx - box[0] + cx, ty - box[1] + cy), _number(a.get("r")), fill,
+                   opacity=alpha * opacity)
+
+
+def _subpaths(d):
+    """Split path data into ``(points, closed)`` polylines."""
+    out = []
+    points, x, y, start = [], 0.0, 0.0, (0.0, 0.0)
+    for command, numbers in parse_path(d):
+        upper = command.upper()
+        relative = command != upper
+        if upper == "Z":
+            if points:
+                out.append((points, True))
+            points, (x, y) = [], start
+            continue
+        step = {"M": 2, "L": 2, "H": 1, "V": 1}.get(upper)
+        if step is None or not numbers or len(numbers) % step:
+            raise SvgRasterError(f"unsupported path command {command!r}")
+        for i in range(0, len(numbers), step):
+            if upper == "H":
+                x = numbers[i] + (x if relative else 0)
+            elif upper == "V":
+                y = numbers[i] + (y if relative else 0)
+            else:
+                dx, dy = numbers[i], numbers[i + 1]
+                x, y = (x + dx, y + dy) if relative else (dx, dy)
+            if upper == "M" and i == 0:
+                if points:
+                    out.append((points, False))
+                points, start = [], (x, y)
+            points.append((x, y))
+    if points:
+        out.append((points, False))
+    return out
+
+
+def _text_anchor(attrib):
+    horizontal = {"start": "l", "middle": "m", "end": "r"}.get(attrib.get("text-anchor", "start"))
+    vertical = {"middle": "m", "central": "m", "hanging": "t", "text-before-edge": "t"}.get(
+        attrib.get("dominant-baseline", "auto"), "s")
+    if horizontal is None:
+        raise SvgRasterError(f"unsupported text-anchor {attrib.get('text-anchor')!r}")
+    return horizontal + vertical
+
+
+def _draw(board, doc, elem, ctx, group_opacity):
+    tag = _local(elem.tag)
+    if not tag or tag in _SKIP:
+        return
+    attrib = _attrs(elem)
+    if attrib.get("display") == "none" or attrib.get("visibility") == "hidden":
+        return
+    if "transform" in attrib or "mask" in attrib:
+        raise SvgRasterError(f"<{tag}> uses transform or mask")
+    here = dict(ctx)
+    here.update({k: v for k, v in attrib.items() if k in INHERITED})
+    # Group opacity is applied to each child separately; the generators
+    # never overlap shapes inside a translucent group.
+    opacity = group_opacity * _number(attrib.get("opacity"), default=1.0)
+
+    if tag in ("svg", "g"):
+        for child in elem:
+            _draw(board, doc, child, here, opacity)
+        return
+    if "clip-path" in attrib and tag != "image":
+        raise SvgRasterError(f"<{tag}> uses clip-path")
+    blur = doc.blur(attrib["filter"]) if "filter" in attrib else 0
+    if blur and tag != "circle":
+        raise SvgRasterError(f"<{tag}> uses a filter")
+
+    fill = doc.paint(here["fill"], opacity * _number(here["fill-opacity"], default=1.0))
+    stroke = doc.paint(here["stroke"], opacity * _number(here["stroke-opacity"], default=1.0))
+    stroke_width = _number(here["stroke-width"], default=1.0)
+    if stroke is not None and not isinstance(stroke[0], tuple):
+        raise SvgRasterError(f"<{tag}> strokes with a paint server")
+    if stroke_width <= 0:
+        stroke = None
+
+    if tag == "rect":
+        x, y = _number(attrib.get("x"), board.width), _number(attrib.get("y"), board.height)
+        w, h = _number(attrib.get("width"), board.width), _number(attrib.get("height"), board.height)
+        if w <= 0 or h <= 0:
+            return
+        rx = attrib.get("rx", attrib.get("ry"))
+        if "rx" in attrib and "ry" in attrib and attrib["rx"] != attrib["ry"]:
+            raise SvgRasterError("elliptical rect corners are not supported")
+        radius = min(_number(rx), w / 2, h / 2) if rx is not None else 0
+        box = (x, y, x + w, y + h)
+        if fill is not None:
+            if isinstance(fill[0], ET.Element):
+                if radius:
+                    raise SvgRasterError("pattern fills on rounded rects are not supported")
+                _pattern_fill(board, doc, box, *fill)
+            else:
+                board.rect(box, fill[0], radius=radius, opacity=fill[1])
+        if stroke is not None:
+            board.rect(box, None, radius=radius, opacity=stroke[1], stroke=stroke[0], stroke_width=stroke_width)
+    elif tag == "circle":
+        cx, cy = _number(attrib.get("cx"), board.width), _number(attrib.get("cy"), board.height)
+        r = _number(attrib.get("r"))
+        if r <= 0:
+            return
+        if fill is not None:
+            if isinstance(fill[0], ET.Element):
+                raise SvgRasterError("pattern fills are only supported on rects")
+            board.circle(cx, cy, r, fill=fill[0], opacity=fill[1], blur=blur)
+        if stroke is not None:
+            board.circle(cx, cy, r, stroke=stroke[0], stroke_width=stroke_width, opacity=stroke[1], blur=blur)
+    elif tag == "line":
+        if stroke is not None:
+            board.line(_number(attrib.get("x1"), board.width), _number(attrib.get("y1"), board.height),
+                       _number(attrib.get("x2"), board.width), _number(attrib.get("y2"), board.height),
+                       stroke[0], width=stroke_width, opacity=stroke[1])
+    elif tag == "path":
+        for points, closed in _subpaths(attrib.get("d", "")):
+            if fill is not None:
+                if isinstance(fill[0], ET.Element):
+                    raise SvgRasterError("pattern fills are only supported on rects")
+                board.polygon(points, fill=fill[0], opacity=fill[1])
+            if stroke is not None:
+                board.polygon(points, stroke=stroke[0], stroke_width=stroke_width, closed=closed, opacity=stroke[1])
+    elif tag == "text":
+        if len(elem):
+            raise SvgRasterError("<tspan> and other text children are not supported")
+        if fill is None:
+            return
+        if not isinstance(fill[0], tuple):
+            raise SvgRasterError("text must be filled with a solid color")
+        weight = here.get("font-weight", "normal")
+        board.text(_number(attrib.get("x"), board.width), _number(attrib.get("y"), board.height),
+                   elem.text or "", _number(here.get("font-size"), default=16.0), fill[0],
+                   family=(here.get("font-family") or "sans").lower(), anchor=_text_anchor(here | attrib),
+                   opacity=fill[1], bold=weight in ("bold", "bolder") or weight.isdigit() and int(weight) >= 600)
+    elif tag == "image":
+        _draw_image(board, doc, attrib, opacity)
+    else:
+        raise SvgRasterError(f"unsupported element <{tag}>")
+
+
+def _draw_image(board, doc, attrib, opacity):
+    if opacity < 1:
+        raise SvgRasterError("translucent images are not supported")
+    if "slice" not in attrib.get("preserveAspectRatio", "") or "xMidYMid" not in attrib["preserveAspectRatio"]:
+        raise SvgRasterError('only preserveAspectRatio="xMidYMid slice" images are supported')
+    x, y = _number(attrib.get("x")), _number(attrib.get("y"))
+    box = (x, y, x + _number(attrib.get("width")), y + _number(attrib.get("height")))
+    if "clip-path" in attrib:
+        clip = doc.clip_box(attrib["clip-path"])
+        # A slice image never draws outside its own box, so a clip that
+        # covers the box changes nothing.
+        if clip is not None and not (clip[0] <= box[0] and clip[1] <= box[1]
+                                     and clip[2] >= box[2] and clip[3] >= box[3]):
+            raise SvgRasterError("clip paths that cut into an image are not supported")
+    href = next((attrib[k] for k in _HREFS if k in attrib), None)
+    if not href:
+        return
+    if href.startswith("data:"):
+        from PIL import Image
+        src = Image.open(io.BytesIO(base64.b64decode(href.split(",", 1)[1])))
+    elif doc.base_dir is None:
+        raise SvgRasterError(f"cannot resolve {href!r} without the SVG's directory")
+    else:
+        src = os.path.join(doc.base_dir, *href.split("/"))
+    board.image_cell(box, src)
+
+
+def rasterize(text, scale=1.0, base_dir=None):
+    """Draw the SVG document ``text`` and return the :class:`generator.collage.Collage`.
+
+    ``scale`` is device pixels per SVG pixel (the density). ``base_dir``
+    resolves relative ``<image>`` hrefs.
+    """
+    try:
+        root = ET.fromstring(text)
+    except ET.ParseError as e:
+        raise SvgRasterError(f"not well-formed: {e}") from None
+    if _local(root.tag) != "svg":
+        raise SvgRasterError("root element is not <svg>")
+    attrib = _attrs(root)
+    view_box = [float(v) for v in re.split(r"[\s,]+", attrib["viewBox"].strip())] if "viewBox" in attrib else None
+    width = _number(attrib.get("width"), default=view_box[2] if view_box else 0)
+    height = _number(attrib.get("height"), default=view_box[3] if view_box else 0)
+    if width <= 0 or height <= 0:
+        raise SvgRasterError("the SVG has no size")
+    if view_box:
+        vx, vy, vw, vh = view_box
+        if vx or vy or not math.isclose(vw / vh, width / height, rel_tol=1e-6):
+            raise SvgRasterError("only viewBoxes at the origin with the document's aspect ratio are supported")
+        scale *= width / vw
+        width, height = vw, vh
+    board = Collage(width, height, scale=scale)
+    ctx = {k: v for k, v in INHERITED.items() if v is not None}
+    _draw(board, _Document(root, base_dir), root, ctx, 1.0)
+    return board
+
+
+def render_variants(text, rel, densities=DENSITIES, base_dir=None):
+    """Yield ``(variant rel, bytes)`` for each density of the SVG at ``rel``.
+
+    Flat art is written as PNG; a document with photo tiles (44's linked
+    moodboards) as JPEG, which is a tenth of the size for the same board.
+    """
+    for density in densities:
+        board = rasterize(text, density, base_dir)
+        yield variant_rel(rel, density, board.format), board.encode(board.format)
+
+
+# Files ----------------------------------------------------------------------
+
+@dataclass
+class RasterReport:
+    files: int = 0
+    written: int = 0
+    svg_bytes: int = 0
+    raster_bytes: int = 0
+    seconds: float = 0.0
+    errors: list = field(default_factory=list)
+
+    def summary(self):
+        return (f"{self.files} SVGs rasterized, {self.written} variants written "
+                f"({self.raster_bytes / 1024:.1f} KiB of bitmaps for {self.svg_bytes / 1024:.1f} KiB of SVG) "
+                f"in {self.seconds:.2f}s")
+
+
+def rasterize_file(path, densities=DENSITIES):
+    """Write the density variants of the SVG at ``path``; return ``[(path, bytes, written)]``."""
+    from generator.builddb import write_if_changed
+
+    with open(path, "rb") as f:
+        text = f.read()
+    folder, name = os.path.split(path)
+    out = []
+    for rel, data in render_variants(text, name, densities, base_dir=folder):
+        dest = os.path.join(folder, *rel.split("/"))
+        out.append((dest, len(data), write_if_changed(dest, data)))
+    return out
+
+
+def main(argv=None):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from generator.svgmin import svg_files
+
+    parser = argparse.ArgumentParser(prog="python -m generator raster",
+                                     description="Write 1x/2x/3x bitmap variants of SVG files for Flutter.")
+    parser.add_argument("paths", nargs="+", help="SVG files or directories to walk")
+    parser.add_argument("--densities", default="1,2,3", help="device pixel ratios to write (default 1,2,3)")
+    parser.add_argument("--jobs", type=int, help="worker threads (default: CPU count + 4)")
+    args = parser.parse_args(argv)
+    try:
+        densities = parse_densities(args.densities)
+    except ValueError as e:
+        parser.error(str(e))
+
+    def run(path):
+        try:
+            return path, rasterize_file(path, densities), None
+        except (OSError, SvgRasterError) as e:
+            return path, None, e
+
+    started = time.perf_counter()
+    report = RasterReport()
+    # Pillow releases the GIL while it resamples and encodes, so threads scale.
+    with ThreadPoolExecutor(args.jobs) as pool:
+        for path, variants, error in pool.map(run, sorted(set(svg_files(args.paths)))):
+            report.files += 1
+            if error is not None:
+                report.errors.append(path)
+                print(f"Skipped {path}: {error}")
+                continue
+            report.svg_bytes += os.path.getsize(path)
+            report.raster_bytes += sum(size for _, size, _ in variants)
+            report.written += sum(1 for _, _, written in variants if written)
+    report.seconds = time.perf_counter() - started
+    print(report.summary())
+    return 1 if report.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,324 @@
+"""Asset templates used by the project specs.
+
+Each template renders one asset from the parameters of a spec item plus the
+project palette. The SVG markup is what the per-project scripts used to
+write, with the text escaped (``Black & Brass Bar`` used to produce a file
+no XML parser accepts). Templates that also have a raster layout (see
+:mod:`generator.collage`) register it alongside, for ``--raster`` builds.
+
+Every template takes ``rng``, the asset's own stream from
+:func:`generator.seed.asset_rng`, and never touches the module-level
+generator: stages run in parallel threads, and the SVG and PNG of one asset
+must draw the same colors.
+"""
+
+from xml.sax.saxutils import escape
+
+from generator.collage import Collage, Gradient
+
+
+# 48_Mini_Bar_AI ------------------------------------------------------------
+
+def minibar_collage(palette, rng, title, color1, color2):
+    # Generate a 2x2 moodboard SVG
+    return f'''<svg width="400" height="400" xmlns="http://www.w3.org/2000/svg">
+  <defs>
+    <linearGradient id="grad1" x1="0%" y1="0%" x2="100%" y2="100%">
+      <stop offset="0%" style="stop-color:{color1};stop-opacity:1" />
+      <stop offset="100%" style="stop-color:{color2};stop-opacity:1" />
+    </linearGradient>
+    <pattern id="pattern1" x="0" y="0" width="20" height="20" patternUnits="userSpaceOnUse">
+        <circle cx="2" cy="2" r="1" fill="#FFFFFF33" />
+    </pattern>
+  </defs>
+
+  <!-- Tile 1: Material (Top Left) -->
+  <rect x="0" y="0" width="200" height="200" fill="url(#grad1)" />
+  <text x="100" y="100" font-family="serif" font-size="20" fill="white" text-anchor="middle" dominant-baseline="middle">Material</text>
+
+  <!-- Tile 2: Display (Top Right) -->
+  <rect x="200" y="0" width="200" height="200" fill="{color2}" />
+  <rect x="200" y="0" width="200" height="200" fill="url(#pattern1)" />
+  <text x="300" y="100" font-family="serif" font-size="20" fill="white" text-anchor="middle" dominant-baseline="middle">Display</text>
+
+  <!-- Tile 3: Lighting (Bottom Left) -->
+  <rect x="0" y="200" width="200" height="200" fill="{color1}" />
+  <circle cx="100" cy="300" r="50" fill="url(#grad1)" fill-opacity="0.5" />
+  <text x="100" y="300" font-family="serif" font-size="20" fill="white" text-anchor="middle" dominant-baseline="middle">Lighting</text>
+
+  <!-- Tile 4: Glassware (Bottom Right) -->
+  <rect x="200" y="200" width="200" height="200" fill="#141A27" />
+  <text x="300" y="300" font-family="serif" font-size="20" fill="white" text-anchor="middle" dominant-baseline="middle">Glassware</text>
+
+  <!-- Overlay Title -->
+  <rect x="0" y="360" width="400" height="40" fill="#000000" fill-opacity="0.6" />
+  <text x="20" y="385" font-family="sans-serif" font-size="16" fill="white">{escape(title)}</text>
+</svg>'''
+
+
+def minibar_collage_png(palette, rng, title, color1, color2, size=400):
+    # Same layout as minibar_collage, drawn straight to a bitmap
+    board = Collage(400, scale=size / 400)
+    grad = Gradient(color1, color2)
+    tl, tr, bl, br = board.cells()
+
+    board.rect(tl, grad)
+    board.text(100, 100, "Material", 20, "white", family="serif", anchor="mm")
+
+    board.rect(tr, color2)
+    board.dots(tr, 20, 2, 1, "#FFFFFF33")
+    board.text(300, 100, "Display", 20, "white", family="serif", anchor="mm")
+
+    board.rect(bl, color1)
+    board.circle(100, 300, 50, fill=grad, opacity=0.5)
+    board.text(100, 300, "Lighting", 20, "white", family="serif", anchor="mm")
+
+    board.rect(br, "#141A27")
+    board.text(300, 300, "Glassware", 20, "white", family="serif", anchor="mm")
+
+    board.label_band(title, 40, "#000000", "white", 16, band_opacity=0.6)
+    return board
+
+
+# 43_Camper_Van_Interior_AI -------------------------------------------------
+
+def camper_colors(palette, rng):
+    return [rng.choice(palette) for _ in range(4)]
+
+
+def camper_collage(palette, rng, style_name):
+    c1, c2, c3, c4 = camper_colors(palette, rng)
+    return f'''<svg width="400" height="400" xmlns="http://www.w3.org/2000/svg">
+  <rect x="0" y="0" width="400" height="400" fill="#101520" />
+
+  <!-- Top Left: Bed/Texture -->
+  <rect x="10" y="10" width="185" height="185" rx="8" fill="{c1}" />
+  <circle cx="100" cy="100" r="40" fill="rgba(255,255,255,0.1)" />
+
+  <!-- Top Right: Kitchen/Detail -->
+  <rect x="205" y="10" width="185" height="185" rx="8" fill="{c2}" />
+  <rect x="235" y="40" width="125" height="20" fill="rgba(0,0,0,0.2)" />
+  <rect x="235" y="70" width="125" height="20" fill="rgba(0,0,0,0.2)" />
+
+  <!-- Bottom Left: Storage/Wood -->
+  <rect x="10" y="205" width="185" height="185" rx="8" fill="{c3}" />
+  <line x1="10" y1="250" x2="195" y2="250" stroke="rgba(0,0,0,0.1)" stroke-width="2" />
+  <line x1="10" y1="300" x2="195" y2="300" stroke="rgba(0,0,0,0.1)" stroke-width="2" />
+
+  <!-- Bottom Right: Light/Decor -->
+  <rect x="205" y="205" width="185" height="185" rx="8" fill="{c4}" />
+  <circle cx="297" cy="297" r="50" stroke="rgba(255,255,255,0.2)" stroke-width="4" fill="none" />
+
+  <text x="200" y="380" font-family="Arial" font-size="14" fill="white" text-anchor="middle" opacity="0.5">{escape(style_name)}</text>
+</svg>'''
+
+
+def camper_collage_png(palette, rng, style_name, size=400):
+    # Same layout as camper_collage, drawn straight to a bitmap
+    c1, c2, c3, c4 = camper_colors(palette, rng)
+    board = Collage(400, scale=size / 400, background="#101520")
+    tl, tr, bl, br = board.cells(margin=10, gap=10)
+
+    board.rect(tl, c1, radius=8)
+    board.circle(100, 100, 40, fill="rgba(255,255,255,0.1)")
+
+    board.rect(tr, c2, radius=8)
+    board.rect((235, 40, 360, 60), "rgba(0,0,0,0.2)")
+    board.rect((235, 70, 360, 90), "rgba(0,0,0,0.2)")
+
+    board.rect(bl, c3, radius=8)
+    board.line(10, 250, 195, 250, "rgba(0,0,0,0.1)", width=2)
+    board.line(10, 300, 195, 300, "rgba(0,0,0,0.1)", width=2)
+
+    board.rect(br, c4, radius=8)
+    board.circle(297, 297, 50, stroke="rgba(255,255,255,0.2)", stroke_width=4)
+
+    board.text(200, 380, style_name, 14, "white", anchor="ms", opacity=0.5)
+    return board
+
+
+# 42_Study_Class_AI ---------------------------------------------------------
+
+def study_moodboard(palette, rng, title, colors=None):
+    # colors is a list of 4 hex codes; picked from the palette when omitted
+    c1, c2, c3, c4 = colors or [rng.choice(palette) for _ in range(4)]
+    return f'''<svg width="400" height="400" xmlns="http://www.w3.org/2000/svg">
+  <!-- Top Left -->
+  <rect x="0" y="0" width="200" height="200" fill="{c1}" />
+  <circle cx="100" cy="100" r="40" fill="rgba(255,255,255,0.1)" />
+
+  <!-- Top Right -->
+  <rect x="200" y="0" width="200" height="200" fill="{c2}" />
+  <rect x="250" y="50" width="100" height="100" fill="rgba(255,255,255,0.1)" />
+
+  <!-- Bottom Left -->
+  <rect x="0" y="200" width="200" height="200" fill="{c3}" />
+  <path d="M50 350 L100 250 L150 350 Z" fill="rgba(255,255,255,0.1)" />
+
+  <!-- Bottom Right -->
+  <rect x="200" y="200" width="200" height="200" fill="{c4}" />
+  <circle cx="300" cy="300" r="50" fill="rgba(0,0,0,0.1)" />
+
+  <!-- Overlay Text -->
+  <rect x="0" y="340" width="400" height="60" fill="rgba(0,0,0,0.6)" />
+  <text x="200" y="375" dominant-baseline="middle" text-anchor="middle" font-family="Arial" font-weight="bold" font-size="20" fill="white">{escape(title)}</text>
+</svg>'''
+
+
+def study_simple(palette, rng, text, color=None):
+    color = color or rng.choice(palette)
+    return f'''<svg width="400" height="600" xmlns="http://www.w3.org/2000/svg">
+  <rect width="400" height="600" fill="{color}" />
+  <text x="50%" y="50%" dominant-baseline="middle" text-anchor="middle" font-family="Arial" font-size="24" fill="white">{escape(text)}</text>
+</svg>'''
+
+
+# 49_Barbershop_AI ----------------------------------------------------------
+
+def _svg(width, height, content):
+    return f'<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">{content}</svg>'
+
+
+def _rect(x, y, w, h, fill, opacity=1.0):
+    return f'<rect x="{x}" y="{y}" width="{w}" height="{h}" fill="{fill}" fill-opacity="{opacity}" />'
+
+
+def _circle(cx, cy, r, fill, opacity=1.0):
+    return f'<circle cx="{cx}" cy="{cy}" r="{r}" fill="{fill}" fill-opacity="{opacity}" />'
+
+
+def _text(x, y, content, fill, size=20):
+    return f'<text x="{x}" y="{y}" font-family="serif" font-size="{size}" fill="{fill}" text-anchor="middle">{escape(content)}</text>'
+
+
+def barber_moodboard(palette, rng, primary, secondary, label=None):
+    # Layout:
+    # [ Chair ] [ Mirror ]
+    # [ Matrl ] [ Light  ]
+    primary = palette.get(primary, primary)
+    secondary = palette.get(secondary, secondary)
+    content = ""
+    # Bg
+    content += _rect(0, 0, 400, 400, palette["charcoal"])
+
+    # Tile 1: Chair (Top Left)
+    content += _rect(10, 10, 185, 185, primary)
+    content += _circle(102, 102, 40, secondary)  # Chair seat representation
+
+    # Tile 2: Mirror (Top Right)
+    content += _rect(205, 10, 185, 185, "#2A3144")
+    content += _rect(230, 30, 135, 145, "#4A5164")  # Mirror reflection
+
+    # Tile 3: Material Detail (Bottom Left)
+    content += _rect(10, 205, 185, 185, secondary)
+    content += f'<path d="M10 205 L195 390" stroke="{primary}" stroke-width="2" />'  # Texture
+
+    # Tile 4: Lighting (Bottom Right)
+    content += _rect(205, 205, 185, 185, "#000000")
+    content += _circle(297, 297, 30, "#FFFFCC", opacity=0.8)  # Light glow
+
+    return _svg(400, 400, content)
+
+
+def barber_shop(palette, rng):
+    content = _rect(0, 0, 600, 800, palette["charcoal"])
+    content += _rect(0, 0, 600, 800, "url(#grad1)", opacity=0.3)
+    # Perspective lines
+    content += f'<path d="M0 800 L300 400 L600 800" fill="{palette["wood"]}" opacity="0.5"/>'
+    # Mirror
+    content += _rect(100, 100, 400, 300, palette["chrome"])
+    content += _rect(120, 120, 360, 260, "#333333")
+    return _svg(600, 800, content)
+
+
+def barber_empty(palette, rng):
+    return _svg(300, 300, _rect(0, 0, 300, 300, palette["charcoal"]) + _circle(150, 150, 80, palette["muted"])
+                + _text(150, 160, "?", palette["charcoal"], 80))
+
+
+def barber_guide_lighting(palette, rng):
+    return _svg(400, 300, _rect(0, 0, 400, 300, palette["charcoal"]) + _circle(200, 100, 50, palette["gold"]))
+
+
+def barber_guide_angle(palette, rng):
+    return _svg(400, 300, _rect(0, 0, 400, 300, palette["charcoal"]) + _rect(100, 100, 200, 100, palette["chrome"]))
+
+
+# 50_Beauty_Salon_AI --------------------------------------------------------
+
+def beauty_colors(palette, rng):
+    # 2x2 Grid colors
+    c1 = rng.choice([palette["primary"], palette["primarySoft"], palette["gold"], palette["bg"]])
+    c2 = rng.choice([palette["white"], palette["mint"], palette["primarySoft"]])
+    c3 = rng.choice([palette["ink"], palette["dark"], palette["primary"]])
+    c4 = rng.choice([palette["gold"], palette["primarySoft"], palette["white"]])
+    return c1, c2, c3, c4
+
+
+def beauty_moodboard(palette, rng, style_name):
+    c1, c2, c3, c4 = beauty_colors(palette, rng)
+    return f"""<svg width="400" height="400" xmlns="http://www.w3.org/2000/svg">
+      <defs>
+        <filter id="blur" x="0" y="0">
+          <feGaussianBlur in="SourceGraphic" stdDeviation="2" />
+        </filter>
+      </defs>
+      <rect x="0" y="0" width="400" height="400" fill="{palette['bg']}" />
+
+      <!-- Top Left: Material/Texture -->
+      <rect x="10" y="10" width="185" height="185" rx="8" fill="{c1}" opacity="0.8"/>
+      <circle cx="100" cy="100" r="50" fill="white" opacity="0.2"/>
+
+      <!-- Top Right: Lighting/Vibe -->
+      <rect x="205" y="10" width="185" height="185" rx="8" fill="{c2}" opacity="0.9"/>
+      <circle cx="297" cy="102" r="30" fill="{palette['gold']}" opacity="0.5" filter="url(#blur)"/>
+
+      <!-- Bottom Left: Furniture/Shape -->
+      <rect x="10" y="205" width="185" height="185" rx="8" fill="{c3}" opacity="0.8"/>
+      <rect x="50" y="250" width="100" height="80" fill="white" opacity="0.1"/>
+
+      <!-- Bottom Right: Detail/Accessory -->
+      <rect x="205" y="205" width="185" height="185" rx="8" fill="{c4}" opacity="0.9"/>
+      <line x1="220" y1="220" x2="380" y2="380" stroke="{palette['primary']}" stroke-width="2" opacity="0.3"/>
+
+      <!-- Text Overlay (Simulated Label) -->
+      <rect x="0" y="360" width="400" height="40" fill="white" opacity="0.9"/>
+      <text x="20" y="385" font-family="Arial" font-size="14" fill="{palette['ink']}">{escape(style_name)}</text>
+    </svg>"""
+
+
+def beauty_moodboard_png(palette, rng, style_name, size=400):
+    # Same layout as beauty_moodboard, drawn straight to a bitmap
+    c1, c2, c3, c4 = beauty_colors(palette, rng)
+    board = Collage(400, scale=size / 400, background=palette["bg"])
+    tl, tr, bl, br = board.cells(margin=10, gap=10)
+
+    board.rect(tl, c1, radius=8, opacity=0.8)
+    board.circle(100, 100, 50, fill="white", opacity=0.2)
+
+    board.rect(tr, c2, radius=8, opacity=0.9)
+    board.circle(297, 102, 30, fill=palette["gold"], opacity=0.5, blur=2)
+
+    board.rect(bl, c3, radius=8, opacity=0.8)
+    board.rect((50, 250, 150, 330), "white", opacity=0.1)
+
+    board.rect(br, c4, radius=8, opacity=0.9)
+    board.line(220, 220, 380, 380, palette["primary"], width=2, opacity=0.3)
+
+    board.label_band(style_name, 40, "white", palette["ink"], 14, band_opacity=0.9)
+    return board
+
+
+# name -> (svg template, raster template or None)
+TEMPLATES = {
+    "minibar_collage": (minibar_collage, minibar_collage_png),
+    "camper_collage": (camper_collage, camper_collage_png),
+    "study_moodboard": (study_moodboard, None),
+    "study_simple": (study_simple, None),
+    "barber_moodboard": (barber_moodboard, None),
+    "barber_shop": (barber_shop, None),
+    "barber_empty": (barber_empty, None),
+    "barber_guide_lighting": (barber_guide_lighting, None),
+    "barber_guide_angle": (barber_guide_angle, None),
+    "beauty_moodboard": (beauty_moodboard, beauty_moodboard_png),
+}
@@ -0,0 +1,181 @@
+"""Pruned directory walks over the Flutter project trees.
+
+A checkout that has been built holds far more generated files than source:
+``build/``, ``.dart_tool/``, ``ios/Pods`` and friends. :func:`iter_files`
+walks with ``os.scandir`` and never descends into directories that are on
+the built-in deny list or ignored by a ``.gitignore`` between the walk root
+and the directory itself (or in the root's parents, up to the repository
+top), so tools only ever see files git would track.
+
+The ``.gitignore`` support covers what the project files use: comments,
+``!`` negation, ``/`` anchoring, trailing-``/`` directory patterns and the
+``*``, ``?``, ``[...]`` and ``**`` wildcards.
+"""
+
+import os
+import re
+
+DENY_DIRS = frozenset({
+    ".git", ".dart_tool", ".pub-cache", ".pub", "build", "Pods", ".symlinks",
+    ".gradle", ".idea", ".vscode", "DerivedData", "ephemeral", "node_modules",
+    "__pycache__", ".venv", "venv",
+})
+
+
+def _translate(pattern):
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == n:
+            out.append("/.*")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif c == "*":
+            out.append("[^/]*")
+            i += 1
+        elif c == "?":
+            out.append("[^/]")
+            i += 1
+        elif c == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                out.append(re.escape(c))
+                i += 1
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end + 1
+        elif c == "\\" and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(c))
+            i += 1
+    return re.compile("".join(out) + r"\Z")
+
+
+class IgnoreRules:
+    """The patterns of one ``.gitignore``, matched relative to its directory."""
+
+    def __init__(self, lines):
+        self.rules = []
+        for line in lines:
+            line = line.rstrip("\n").rstrip("\r")
+            if not line.strip() or line.startswith("#"):
+                continue
+            if not line.endswith("\\ "):
+                line = line.rstrip(" ")
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            elif line.startswith("\\"):
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+            anchored = "/" in line
+            self.rules.append((_translate(line.lstrip("/")), negate, dir_only, anchored))
+
+    @classmethod
+    def load(cls, path):
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                return cls(f.readlines())
+        except OSError:
+            return None
+
+    def match(self, relpath, is_dir):
+        """Return True (ignored), False (re-included) or None (no opinion)."""
+        result = None
+        name = relpath.rsplit("/", 1)[-1]
+        for regex, negate, dir_only, anchored in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(relpath if anchored else name):
+                result = not negate
+        return result
+
+
+def _parent_rules(root):
+    """``.gitignore`` files above ``root`` that still apply inside it."""
+    rules = []
+    here = os.path.abspath(root)
+    prefix = ""
+    while not os.path.exists(os.path.join(here, ".git")):
+        parent = os.path.dirname(here)
+        if parent == here:
+            break
+        prefix = os.path.basename(here) + ("/" + prefix if prefix else "")
+        here = parent
+        ignore = IgnoreRules.load(os.path.join(here, ".gitignore"))
+        if ignore is not None:
+            rules.append((prefix, ignore))
+    rules.reverse()  # outermost first, so deeper files override
+    return rules
+
+
+def _ignored(stack, relpath, is_dir):
+    result = False
+    for base, ignore in stack:
+        sub = f"{base}/{relpath}" if base else relpath
+        verdict = ignore.match(sub, is_dir)
+        if verdict is not None:
+            result = verdict
+    return result
+
+
+def iter_files(root, suffixes=None, deny=DENY_DIRS, gitignore=True):
+    """Yield ``(path, size)`` for files under ``root``, pruning ignored directories.
+
+    ``suffixes`` restricts the walk to file names ending in one of them.
+    Symlinks are not followed.
+    """
+    parents = _parent_rules(root) if gitignore else []
+    # Each pending directory carries the ignore files that apply to it, as
+    # (path of the walked dir relative to the .gitignore, rules) pairs.
+    pending = [(root, parents)]
+    while pending:
+        dirpath, stack = pending.pop()
+        if gitignore:
+            own = IgnoreRules.load(os.path.join(dirpath, ".gitignore"))
+            if own is not None:
+                stack = stack + [("", own)]
+        try:
+            entries = list(os.scandir(dirpath))
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            name = entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir:
+                if name in deny:
+                    continue
+                if stack and _ignored(stack, name, True):
+                    continue
+                subdirs.append(entry)
+            elif entry.is_file(follow_symlinks=False):
+                if suffixes is not None and not name.endswith(suffixes):
+                    continue
+                if stack and _ignored(stack, name, False):
+                    continue
+                try:
+                    size = entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+                yield entry.path, size
+        for entry in reversed(subdirs):
+            child = [(f"{base}/{entry.name}" if base else entry.name, rules) for base, rules in stack]
+            pending.append((entry.path, child))
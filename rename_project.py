@@ -1,33 +1,23 @@
-import os
+from generator.rewrite import Rewriter, rewrite_tree
 
-def replace_in_file(filepath):
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        new_content = content.replace('rooftop_lounge_ai', 'small_apartment_studio')
-        new_content = new_content.replace('Rooftop Lounge', 'Small Apartment Studio')
-        new_content = new_content.replace('RooftopLoungeApp', 'SmallApartmentStudioApp')
-        # Be careful with generic 'Rooftop' -> 'Apartment' to avoid breaking things,
-        # but for class names it is usually desired.
-        # specific renames for known classes based on memory/exploration
-        new_content = new_content.replace('RooftopResultStorage', 'ApartmentResultStorage')
-        new_content = new_content.replace('RooftopHistoryRepository', 'ApartmentHistoryRepository')
-        new_content = new_content.replace('RooftopConfig', 'ApartmentConfig')
-
-        if content != new_content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-            print(f"Updated: {filepath}")
-    except Exception as e:
-        print(f"Error reading {filepath}: {e}")
+REPLACEMENTS = Rewriter({
+    'rooftop_lounge_ai': 'small_apartment_studio',
+    'Rooftop Lounge': 'Small Apartment Studio',
+    'RooftopLoungeApp': 'SmallApartmentStudioApp',
+    # Be careful with generic 'Rooftop' -> 'Apartment' to avoid breaking things,
+    # but for class names it is usually desired.
+    # specific renames for known classes based on memory/exploration
+    'RooftopResultStorage': 'ApartmentResultStorage',
+    'RooftopHistoryRepository': 'ApartmentHistoryRepository',
+    'RooftopConfig': 'ApartmentConfig',
+})
 
 def main():
     target_dir = '41_Small_Apartment_Studio'
-    for root, dirs, files in os.walk(target_dir):
-        for file in files:
-            if file.endswith(('.dart', '.yaml', '.xml', '.plist', '.json')):
-                replace_in_file(os.path.join(root, file))
+    report = rewrite_tree(target_dir, REPLACEMENTS, ('.dart', '.yaml', '.xml', '.plist', '.json'),
+                          on_change=lambda path, count: print(f"Updated: {path}"),
+                          on_error=lambda path, e: print(f"Error reading {path}: {e}"))
+    print(report.summary())
 
 if __name__ == '__main__':
     main()
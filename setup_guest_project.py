@@ -1,5 +1,10 @@
+import argparse
 import os
 
+from generator.index import SymbolIndex, print_preview
+from generator.rewrite import Rewriter, rewrite_tree
+from generator.walk import iter_files
+
 PROJECT_DIR = "44_Guest_Room_AI"
 OLD_PREFIX = "shoe"
 NEW_PREFIX = "guest"
@@ -8,55 +13,61 @@ NEW_NAME = "Guest Room"
 OLD_CLASS = "Shoe"
 NEW_CLASS = "Guest"
 
-def replace_in_file(filepath):
-    try:
-        with open(filepath, 'r') as f:
-            content = f.read()
-
-        new_content = content
-        # Replace imports and identifiers
-        new_content = new_content.replace(f"{OLD_PREFIX}_", f"{NEW_PREFIX}_")
-        new_content = new_content.replace(f"package:{OLD_PREFIX}_room_ai", f"package:{NEW_PREFIX}_room_ai")
-
-        # Replace Display Names
-        new_content = new_content.replace(OLD_NAME, NEW_NAME)
+# One pass over each file; the longest matching key wins at every position.
+REPLACEMENTS = Rewriter({
+    # Imports and identifiers
+    f"{OLD_PREFIX}_": f"{NEW_PREFIX}_",
+    f"package:{OLD_PREFIX}_room_ai": f"package:{NEW_PREFIX}_room_ai",
+    # Display names
+    OLD_NAME: NEW_NAME,
+    # Class names (CamelCase): "ShoeAI" -> "GuestAI", "ShoeResult" -> "GuestResult"
+    OLD_CLASS: NEW_CLASS,
+    # Lowercase check for pubspec
+    f"name: {OLD_PREFIX}_room_ai": f"name: {NEW_PREFIX}_room_ai",
+})
 
-        # Replace Class Names (CamelCase)
-        # We need to be careful here. "ShoeAI" -> "GuestAI", "ShoeResult" -> "GuestResult"
-        new_content = new_content.replace(OLD_CLASS, NEW_CLASS)
+CONTENT_SUFFIXES = ('.dart', '.yaml', '.xml', '.plist', '.md')
 
-        # Lowercase check for pubspec
-        new_content = new_content.replace(f"name: {OLD_PREFIX}_room_ai", f"name: {NEW_PREFIX}_room_ai")
+def planned_renames():
+    # Only files are renamed, so collecting the list first keeps every path valid.
+    # Build output, Pods and other ignored trees are skipped.
+    renames = []
+    for old_path, _ in iter_files(PROJECT_DIR):
+        root, filename = os.path.split(old_path)
+        if OLD_PREFIX in filename:
+            renames.append((old_path, os.path.join(root, filename.replace(OLD_PREFIX, NEW_PREFIX))))
+    return renames
 
-        if content != new_content:
-            with open(filepath, 'w') as f:
-                f.write(new_content)
-            print(f"Updated content: {filepath}")
-    except Exception as e:
-        print(f"Error processing {filepath}: {e}")
-
-def rename_files():
-    # We walk bottom-up so we don't lose paths
-    for root, dirs, files in os.walk(PROJECT_DIR, topdown=False):
-        for filename in files:
-            if OLD_PREFIX in filename:
-                old_path = os.path.join(root, filename)
-                new_filename = filename.replace(OLD_PREFIX, NEW_PREFIX)
-                new_path = os.path.join(root, new_filename)
-                os.rename(old_path, new_path)
-                print(f"Renamed: {old_path} -> {new_path}")
+def rename_files(renames):
+    for old_path, new_path in renames:
+        os.rename(old_path, new_path)
+        print(f"Renamed: {old_path} -> {new_path}")
 
 def main():
+    parser = argparse.ArgumentParser(description="Rename the shoe project copy to Guest Room.")
+    parser.add_argument("--dry-run", action="store_true", help="print the edit set and exit without changing files")
+    args = parser.parse_args()
+
     print(f"Starting setup for {PROJECT_DIR}...")
 
+    # The index only opens files that contain one of the old names.
+    index = SymbolIndex(PROJECT_DIR).refresh()
+    renames = planned_renames()
+    print("Planned edits:")
+    print_preview(index.preview(REPLACEMENTS, CONTENT_SUFFIXES), REPLACEMENTS.table)
+    for old_path, new_path in renames:
+        print(f"  rename {old_path} -> {new_path}")
+    if args.dry_run:
+        return
+
     # 1. Content Replacement
-    for root, dirs, files in os.walk(PROJECT_DIR):
-        for filename in files:
-            if filename.endswith(('.dart', '.yaml', '.xml', '.plist', '.md')):
-                replace_in_file(os.path.join(root, filename))
+    report = rewrite_tree(PROJECT_DIR, REPLACEMENTS, CONTENT_SUFFIXES, index=index,
+                          on_change=lambda path, count: print(f"Updated content: {path}"),
+                          on_error=lambda path, e: print(f"Error processing {path}: {e}"))
+    print(report.summary())
 
     # 2. File Renaming
-    rename_files()
+    rename_files(renames)
 
     print("Setup complete.")
 
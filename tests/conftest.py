@@ -0,0 +1,81 @@
+"""Shared fixtures: a scriptable local HTTP server and image-shaped bodies.
+
+Run the suite from the repository root with ``python -m pytest``.
+"""
+
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def jpeg(size, seed=0):
+    """``size`` bytes that sniff as a complete JPEG."""
+    filler = bytes((seed + i * 7) % 251 for i in range(max(0, size - 6)))
+    return b"\xff\xd8\xff\xe0" + filler + b"\xff\xd9"
+
+
+class Server:
+    """Serves scripted responses and records every request it gets.
+
+    ``route(path, *responses)`` queues ``(status, headers, body)`` tuples,
+    or callables taking the request headers and returning one; the last
+    response repeats once the queue is down to it.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                headers = {k.lower(): v for k, v in self.headers.items()}
+                with server.lock:
+                    server.requests.append((self.path, headers))
+                    queue = server.routes.get(self.path)
+                    response = (queue.pop(0) if len(queue) > 1 else queue[0]) if queue else (404, {}, b"")
+                if callable(response):
+                    response = response(headers)
+                status, extra, body = response
+                self.send_response(status)
+                for name, value in extra.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, args=(0.01,), daemon=True)
+        self.thread.start()
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}{path}"
+
+    def route(self, path, *responses):
+        with self.lock:
+            self.routes[path] = list(responses)
+
+    def hits(self, path):
+        return [headers for p, headers in self.requests if p == path]
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    srv = Server()
+    yield srv
+    srv.close()
@@ -0,0 +1,72 @@
+import pytest
+
+from generator import manifest
+from generator.assetrefs import dart_refs
+from generator.audit import ERROR, audit_project
+from generator.dartindex import INDEX_PATH, write_index
+from generator.shake import shake_project
+
+PUBSPEC = "name: app\nflutter:\n  assets:\n    - assets/examples/\n"
+SVG = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 1 1"><rect width="1" height="1"/></svg>'
+
+
+@pytest.fixture
+def project(tmp_path):
+    def make(dart):
+        (tmp_path / "pubspec.yaml").write_text(PUBSPEC)
+        (tmp_path / "lib").mkdir()
+        (tmp_path / "lib" / "main.dart").write_text(dart)
+        (tmp_path / "assets" / "examples").mkdir(parents=True)
+        (tmp_path / "assets" / "examples" / "a.svg").write_text(SVG)
+        return str(tmp_path)
+    return make
+
+
+def loaders(project_dir):
+    return {(ref.line, ref.text): ref.loader for ref in dart_refs(project_dir)}
+
+
+def test_raster_providers_are_recorded(project):
+    project_dir = project(
+        "final a = AssetImage('assets/examples/a.svg');\n"
+        "final b = Image.asset(\n  'assets/examples/a.svg',\n  fit: BoxFit.cover,\n);\n"
+        "final c = SvgPicture.asset('assets/examples/a.svg');\n"
+        "const d = 'assets/examples/a.svg';\n")
+    assert loaders(project_dir) == {
+        (1, "assets/examples/a.svg"): "AssetImage",
+        (3, "assets/examples/a.svg"): "Image.asset",
+        (6, "assets/examples/a.svg"): None,
+        (7, "assets/examples/a.svg"): None,
+    }
+
+
+def test_svg_through_asset_image_is_flagged(project):
+    project_dir = project("const image = DecorationImage(\n"
+                          "  image: AssetImage('assets/examples/a.svg'), // Placeholder\n);\n")
+    [(ref, rel)] = shake_project(project_dir).undecodable
+    assert (ref.line, ref.loader, rel) == (2, "AssetImage", "assets/examples/a.svg")
+    [issue] = audit_project(project_dir).issues
+    assert issue.path == "lib/main.dart:2" and issue.level == ERROR
+    assert "AssetImage cannot decode it" in issue.message
+
+
+def test_svg_picture_is_not_flagged(project):
+    project_dir = project("final w = SvgPicture.asset('assets/examples/a.svg');\n")
+    assert shake_project(project_dir).undecodable == []
+    assert audit_project(project_dir).issues == []
+
+
+def test_generated_index_is_not_a_reference(project, tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    project_dir = project("final w = SvgPicture.asset('assets/examples/a.svg');\n")
+    Image.new("RGB", (8, 8), (200, 80, 40)).save(tmp_path / "assets" / "examples" / "zz_unused.jpg")
+    before = shake_project(project_dir)
+
+    manifest.update(project_dir)
+    assert write_index(project_dir)
+    assert "assets/examples/zz_unused.jpg" in (tmp_path / INDEX_PATH).read_text()
+
+    after = shake_project(project_dir)
+    assert [rel for rel, _ in after.dropped] == [rel for rel, _ in before.dropped]
+    assert "assets/examples/zz_unused.jpg" in [rel for rel, _ in after.dropped]
+    assert after.entries == ["assets/examples/a.svg"]
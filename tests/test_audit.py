@@ -0,0 +1,81 @@
+import io
+
+import pytest
+
+from generator.audit import ERROR, WARNING, audit_project, check_file
+
+Image = pytest.importorskip("PIL.Image")
+
+PUBSPEC = "name: app\nflutter:\n  assets:\n    - assets/examples/\n    - assets/icons/logo.png\n"
+
+
+def encoded(size, fmt="JPEG"):
+    buf = io.BytesIO()
+    Image.new("RGB", size, (40, 80, 120)).save(buf, fmt)
+    return buf.getvalue()
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "pubspec.yaml").write_text(PUBSPEC)
+    (tmp_path / "lib").mkdir()
+    examples = tmp_path / "assets" / "examples"
+    examples.mkdir(parents=True)
+    (examples / "good.jpg").write_bytes(encoded((64, 48)))
+    return tmp_path
+
+
+def issues(project_dir):
+    return sorted((i.path, i.level, i.message) for i in audit_project(str(project_dir)).issues)
+
+
+def test_a_clean_project_has_no_issues(project):
+    (project / "lib" / "main.dart").write_text("const a = 'assets/examples/good.jpg';\n")
+    (project / "pubspec.yaml").write_text("name: app\nflutter:\n  assets:\n    - assets/examples/\n")
+    report = audit_project(str(project))
+    assert report.files == 1 and report.issues == []
+
+
+def test_broken_files_are_errors(project):
+    examples = project / "assets" / "examples"
+    (examples / "page.jpg").write_bytes(b"<!DOCTYPE html><html><body>503</body></html>")
+    (examples / "cut.jpg").write_bytes(encoded((64, 48))[:-40])
+    (examples / "empty.png").write_bytes(b"")
+    (examples / "png.jpg").write_bytes(encoded((8, 8), "PNG"))
+    (project / "assets" / "unused").mkdir()
+    found = issues(project)
+    assert ("assets/examples/page.jpg", ERROR, "html data in a .jpg file") in found
+    assert ("assets/examples/cut.jpg", ERROR, "truncated: no jpeg end marker") in found
+    assert ("assets/examples/empty.png", ERROR, "empty file") in found
+    assert ("assets/examples/png.jpg", ERROR, "png data in a .jpg file") in found
+    assert ("assets/unused/", WARNING, "empty asset directory") in found
+    assert not [i for i in found if i[0] == "assets/examples/good.jpg"]
+
+
+def test_oversized_bitmaps_are_warnings(project):
+    (project / "assets" / "examples" / "huge.jpg").write_bytes(encoded((1200, 300)))
+    assert ("assets/examples/huge.jpg", WARNING, "1200x300 exceeds the 1024 px limit") in issues(project)
+
+
+def test_pubspec_and_dart_references_are_checked(project):
+    (project / "assets" / "extra").mkdir()
+    (project / "assets" / "extra" / "x.jpg").write_bytes(encoded((8, 8)))
+    (project / "lib" / "main.dart").write_text(
+        "const a = 'assets/examples/good.jpg';\n"
+        "const b = 'assets/examples/gone.jpg';\n"
+        "const c = 'assets/extra/x.jpg';\n")
+    found = issues(project)
+    assert ("pubspec.yaml", ERROR, "asset assets/icons/logo.png does not exist") in found
+    assert ("lib/main.dart:2", ERROR, "'assets/examples/gone.jpg' matches no asset") in found
+    assert ("lib/main.dart:3", ERROR,
+            "'assets/extra/x.jpg' is not bundled; pubspec.yaml lists no assets/extra/") in found
+    assert not [i for i in found if i[0] == "lib/main.dart:1"]
+
+
+def test_check_file_returns_the_header(tmp_path):
+    path = tmp_path / "a.png"
+    path.write_bytes(encoded((30, 20), "PNG"))
+    problems, info = check_file(str(path), path.stat().st_size)
+    assert problems == [] and (info.width, info.height, info.format) == (30, 20, "png")
+    (tmp_path / "notes.txt").write_text("x")
+    assert check_file(str(tmp_path / "notes.txt"), 1) == ([], None)
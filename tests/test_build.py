@@ -0,0 +1,115 @@
+import json
+import os
+
+import pytest
+
+from generator.build import SPEC_NAME, build, find_projects, load_spec, plan, resolve_projects
+from generator.manifest import JSONL_NAME, read_manifest
+
+ITEMS = [{"file": "style_1.svg", "title": "Noir", "color1": "#1A237E", "color2": "#880E4F"},
+         {"file": "style_2.svg", "title": "Wine", "color1": "#880E4F", "color2": "#F8BBD0"}]
+
+
+def spec(**overrides):
+    data = {"version": 1, "title": "Bar AI", "palette": [],
+            "categories": {"style_moodboards": "Style Moodboard"},
+            "groups": [{"id": "moodboards", "category": "style_moodboards", "template": "minibar_collage",
+                        "size": [400, 400], "items": ITEMS}],
+            "manifest": {"notes": "Generated."}}
+    data.update(overrides)
+    return data
+
+
+@pytest.fixture
+def root(tmp_path):
+    project = tmp_path / "48_Bar_AI"
+    (project / "lib").mkdir(parents=True)
+    (project / "pubspec.yaml").write_text("name: bar\nflutter:\n  assets:\n    - assets/style_moodboards/\n")
+    (project / SPEC_NAME).write_text(json.dumps(spec()))
+    (tmp_path / "notes").mkdir()    # not a project
+    return tmp_path
+
+
+def test_find_and_resolve_projects(root):
+    assert find_projects(str(root)) == ["48_Bar_AI"]
+    assert resolve_projects(["48", "48_Bar_AI/"], str(root)) == ["48_Bar_AI", "48_Bar_AI"]
+    with pytest.raises(ValueError):
+        resolve_projects(["49"], str(root))
+
+
+@pytest.mark.parametrize("change, message", [
+    ({"colour": 1}, "unknown spec keys colour"),
+    ({"version": 2}, "unsupported spec version 2"),
+    ({"groups": [dict(spec()["groups"][0], template="nope")]}, "unknown template 'nope'"),
+    ({"groups": [dict(spec()["groups"][0], category="misc")]}, "undeclared category 'misc'"),
+    ({"groups": [dict(spec()["groups"][0], densities=[2, 2])]}, "distinct positive densities"),
+    ({"groups": spec()["groups"] * 2}, "duplicate group id 'moodboards'"),
+    ({"normalize": {"examples": {"max_size": 1}}}, "unknown keys max_size"),
+])
+def test_invalid_specs_are_rejected(tmp_path, change, message):
+    path = tmp_path / SPEC_NAME
+    path.write_text(json.dumps(spec(**change)))
+    with pytest.raises(ValueError, match=message):
+        load_spec(str(path))
+
+
+def test_plan_orders_the_stages(root):
+    stages = plan(str(root / "48_Bar_AI"), load_spec(str(root / "48_Bar_AI" / SPEC_NAME)))
+    deps = {s.name: list(s.deps) for s in stages}
+    assert deps == {"48_Bar_AI:moodboards": [], "48_Bar_AI:normalize": [],
+                    "48_Bar_AI:manifest": ["48_Bar_AI:moodboards", "48_Bar_AI:normalize"],
+                    "48_Bar_AI:asset_index": ["48_Bar_AI:manifest"]}
+
+
+def test_build_writes_assets_manifests_and_index(root):
+    pytest.importorskip("PIL.Image")
+    report = build(["48_Bar_AI"], str(root), workers=2)
+    assert not report.failed, report.failed
+    assets = root / "48_Bar_AI" / "assets"
+    svg = (assets / "style_moodboards" / "style_1.svg").read_text()
+    assert svg.startswith("<svg") and "Noir" in svg
+    sources = (assets / "ASSET_SOURCES.md").read_text()
+    assert "| style_moodboards/style_2.svg | Style Moodboard | Generated In-Project | MIT |" in sources
+    entries = list(read_manifest(str(assets / JSONL_NAME)))
+    assert [e["path"] for e in entries] == ["style_moodboards/style_1.svg", "style_moodboards/style_2.svg"]
+    assert entries[1]["width"] == 400 and entries[1]["fingerprint"]
+    assert "assets/style_moodboards/style_1.svg" in (root / "48_Bar_AI" / "lib" / "src" / "asset_index.dart").read_text()
+
+
+def outputs_of(report, stage):
+    return next(r.value for r in report.results if r.name == stage)
+
+
+def test_second_build_renders_nothing(root):
+    pytest.importorskip("PIL.Image")
+    build(["48_Bar_AI"], str(root))
+    svg = root / "48_Bar_AI" / "assets" / "style_moodboards" / "style_1.svg"
+    mtime = svg.stat().st_mtime_ns
+    again = outputs_of(build(["48_Bar_AI"], str(root)), "48_Bar_AI:moodboards")
+    assert (again.written, again.unchanged, again.up_to_date) == ([], 0, 2)
+    assert svg.stat().st_mtime_ns == mtime
+
+
+def test_changed_inputs_rebuild_only_their_outputs(root):
+    pytest.importorskip("PIL.Image")
+    project = root / "48_Bar_AI"
+    build(["48_Bar_AI"], str(root))
+    changed = spec()
+    changed["groups"][0]["items"] = [dict(ITEMS[0], title="Noir Deluxe"), ITEMS[1]]
+    (project / SPEC_NAME).write_text(json.dumps(changed))
+    out = outputs_of(build(["48_Bar_AI"], str(root)), "48_Bar_AI:moodboards")
+    assert [os.path.basename(p) for p in out.written] == ["style_1.svg"] and out.up_to_date == 1
+    assert "Noir Deluxe" in (project / "assets" / "style_moodboards" / "style_1.svg").read_text()
+
+
+def test_hand_edits_are_rebuilt_and_force_rerenders(root):
+    pytest.importorskip("PIL.Image")
+    build(["48_Bar_AI"], str(root))
+    svg = root / "48_Bar_AI" / "assets" / "style_moodboards" / "style_2.svg"
+    original = svg.read_bytes()
+    svg.write_text("<svg/>")
+    out = outputs_of(build(["48_Bar_AI"], str(root)), "48_Bar_AI:moodboards")
+    assert len(out.written) == 1 and svg.read_bytes() == original
+
+    forced = outputs_of(build(["48_Bar_AI"], str(root), force=True), "48_Bar_AI:moodboards")
+    assert (forced.written, forced.unchanged, forced.up_to_date) == ([], 2, 0)
@@ -0,0 +1,54 @@
+import os
+
+from generator.builddb import BuildDB, fingerprint, write_if_changed
+
+
+def test_fingerprint_is_stable_and_order_free_for_dicts():
+    assert fingerprint({"a": 1, "b": [1, 2]}) == fingerprint({"b": [1, 2], "a": 1})
+    assert fingerprint({"a": 1}) != fingerprint({"a": 2})
+    assert fingerprint("x", 1) != fingerprint("x1")
+
+
+def test_write_if_changed(tmp_path):
+    path = str(tmp_path / "sub" / "a.bin")
+    assert write_if_changed(path, b"one")
+    mtime = os.stat(path).st_mtime_ns
+    assert not write_if_changed(path, b"one")
+    assert os.stat(path).st_mtime_ns == mtime
+    assert write_if_changed(path, b"two")
+    assert open(path, "rb").read() == b"two"
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_fresh_needs_matching_fingerprint_and_file(tmp_path):
+    path = str(tmp_path / "a.svg")
+    write_if_changed(path, b"<svg/>")
+    db = BuildDB(str(tmp_path / "db.json"))
+    db.record("a.svg", "fp1", path)
+    assert db.fresh("a.svg", "fp1", path)
+    assert not db.fresh("a.svg", "fp2", path)
+    assert not db.fresh("b.svg", "fp1", path)
+    os.utime(path, ns=(1, 1))                   # touched by hand
+    assert not db.fresh("a.svg", "fp1", path)
+    os.unlink(path)
+    assert not db.fresh("a.svg", "fp1", path)
+
+
+def test_save_round_trips_and_drops_stale_entries(tmp_path):
+    db_path = str(tmp_path / "db.json")
+    for name in ("a", "b"):
+        write_if_changed(str(tmp_path / name), name.encode())
+    db = BuildDB(db_path)
+    db.record("a", "fa", str(tmp_path / "a"), sha256="x")
+    db.record("b", "fb", str(tmp_path / "b"))
+    db.save(keep={"a"})
+    loaded = BuildDB(db_path)
+    assert loaded.get("a")["sha256"] == "x" and loaded.get("b") is None
+    assert loaded.fresh("a", "fa", str(tmp_path / "a"))
+
+    mtime = os.stat(db_path).st_mtime_ns
+    loaded.record("a", "fa", str(tmp_path / "a"), sha256="x")
+    loaded.save(keep={"a"})
+    assert os.stat(db_path).st_mtime_ns == mtime     # nothing changed, nothing written
+
+    assert BuildDB(db_path, load=False).get("a") is None
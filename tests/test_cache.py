@@ -0,0 +1,99 @@
+import os
+
+import pytest
+
+from generator.cache import DownloadCache, canonical_url, default_cache, file_sha256, materialize
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A clock that moves one second per reading; tests can also wind it forward."""
+    now = [1000.0]
+
+    def time():
+        now[0] += 1
+        return now[0]
+    monkeypatch.setattr("generator.cache.time.time", time)
+    return now
+
+
+def body(tmp_path, name, data):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_canonical_url_sorts_the_query():
+    assert canonical_url("HTTPS://Example.COM/p?w=800&q=80#x") == canonical_url("https://example.com/p?q=80&w=800")
+    assert canonical_url("https://example.com/p?w=800") != canonical_url("https://example.com/p?w=400")
+
+
+def test_put_and_lookup(tmp_path):
+    cache = DownloadCache(str(tmp_path / "cache"))
+    src = body(tmp_path, "a.jpg", b"abc")
+    blob = cache.put("https://example.com/a?w=1&q=2", src)
+    assert os.path.basename(blob) == file_sha256(src)
+    assert cache.lookup("https://example.com/a?q=2&w=1") == blob
+    assert cache.lookup("https://example.com/b") is None
+
+
+def test_same_bytes_share_one_blob(tmp_path):
+    cache = DownloadCache(str(tmp_path / "cache"))
+    first = cache.put("https://example.com/a", body(tmp_path, "a", b"same"))
+    second = cache.put("https://example.com/b", body(tmp_path, "b", b"same"))
+    assert first == second
+
+
+def test_least_recently_used_blobs_are_evicted(tmp_path, clock):
+    cache = DownloadCache(str(tmp_path / "cache"), max_bytes=25)
+    for name in "abc":
+        cache.put(f"https://example.com/{name}", body(tmp_path, name, name.encode() * 10))
+        if name == "b":
+            assert cache.lookup("https://example.com/a")     # a is now newer than b
+    assert cache.lookup("https://example.com/b") is None
+    assert cache.lookup("https://example.com/a") and cache.lookup("https://example.com/c")
+    assert len(os.listdir(tmp_path / "cache" / "objects" / file_sha256(tmp_path / "b")[:2])) == 0
+
+
+def test_damaged_blob_is_forgotten(tmp_path):
+    cache = DownloadCache(str(tmp_path / "cache"))
+    blob = cache.put("https://example.com/a", body(tmp_path, "a", b"abcdef"))
+    os.unlink(blob)
+    with open(blob, "wb") as f:
+        f.write(b"abc")
+    assert cache.lookup("https://example.com/a") is None
+
+
+def test_failures_expire(tmp_path, clock):
+    cache = DownloadCache(str(tmp_path / "cache"))
+    cache.put_failure("https://example.com/gone", 404, ttl=5)
+    assert cache.lookup_failure("https://example.com/gone") == 404
+    clock[0] += 10
+    assert cache.lookup_failure("https://example.com/gone") is None
+
+
+def test_success_clears_a_remembered_failure(tmp_path):
+    cache = DownloadCache(str(tmp_path / "cache"))
+    cache.put_failure("https://example.com/a", 404, ttl=60)
+    cache.put("https://example.com/a", body(tmp_path, "a", b"back"))
+    assert cache.lookup_failure("https://example.com/a") is None
+
+
+def test_materialize_replaces_instead_of_writing_through(tmp_path):
+    src = body(tmp_path, "src", b"new")
+    dest = body(tmp_path, "dest", b"old")
+    other = tmp_path / "other"
+    os.link(dest, other)
+    materialize(src, dest)
+    assert (tmp_path / "dest").read_bytes() == b"new"
+    assert other.read_bytes() == b"old"
+
+
+def test_default_cache_follows_the_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("GENERATOR_NO_CACHE", "1")
+    assert default_cache() is None
+    monkeypatch.delenv("GENERATOR_NO_CACHE")
+    monkeypatch.setenv("GENERATOR_CACHE_DIR", str(tmp_path / "c"))
+    monkeypatch.setenv("GENERATOR_CACHE_MAX_MB", "0.5")
+    cache = default_cache()
+    assert cache.root == str(tmp_path / "c") and cache.max_bytes == 512 * 1024
@@ -0,0 +1,96 @@
+import errno
+import json
+import os
+
+import pytest
+
+from generator import clone
+from generator.clone import COPY, HARDLINK, REFLINK, _Sharer, clone_project, load_spec, project_dir_name
+
+
+@pytest.fixture
+def source(tmp_path):
+    src = tmp_path / "32_shoe_room_ai"
+    files = {
+        "lib/main.dart": "import 'model/shoe_ai_config.dart';\nclass ShoeAIApp {}\n",
+        "lib/model/shoe_ai_config.dart": "class ShoeAIConfig {}\n",
+        "lib/screens/shoe_page.dart": "// ShoeAI page\n",
+        "build/app.dart": "ShoeAI\n",
+        ".gitignore": "*.log\n",
+        "debug.log": "x",
+    }
+    for rel, text in files.items():
+        path = src / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    (src / "assets").mkdir()
+    (src / "assets" / "shoe_icon.png").write_bytes(b"\x89PNG ShoeAI bytes")
+    return src
+
+
+def test_clone_rewrites_renames_and_shares(source, tmp_path):
+    dest = tmp_path / "51_Guest"
+    report = clone_project(str(source), str(dest), {"ShoeAI": "GuestAI", "shoe_": "guest_"},
+                           rename={"lib/model/shoe_ai_config.dart": "lib/model/guest_config.dart"},
+                           rename_names={"shoe_": "guest_"}, workers=2)
+
+    files = sorted(os.path.relpath(os.path.join(d, f), dest).replace(os.sep, "/")
+                   for d, _, names in os.walk(dest) for f in names)
+    assert files == [".gitignore", "assets/guest_icon.png", "lib/main.dart",
+                     "lib/model/guest_config.dart", "lib/screens/guest_page.dart"]
+    assert (dest / "lib" / "main.dart").read_text() == "import 'model/guest_ai_config.dart';\nclass GuestAIApp {}\n"
+    # Binaries are shared byte for byte, never rewritten.
+    assert (dest / "assets" / "guest_icon.png").read_bytes() == b"\x89PNG ShoeAI bytes"
+    assert report.files == 5 and report.rewritten == 3
+    assert ("lib/model/shoe_ai_config.dart", "lib/model/guest_config.dart") in report.renamed
+    assert sum(report.methods.values()) == 2       # the icon and .gitignore
+
+
+def test_clone_refuses_a_non_empty_destination(source, tmp_path):
+    dest = tmp_path / "taken"
+    dest.mkdir()
+    (dest / "x").write_text("")
+    with pytest.raises(FileExistsError):
+        clone_project(str(source), str(dest), {})
+
+
+def test_unsupported_methods_are_skipped_from_then_on(tmp_path, monkeypatch):
+    calls = []
+
+    def no_reflink(src, dest):
+        calls.append(dest)
+        open(dest, "wb").close()
+        raise OSError(errno.EOPNOTSUPP, "no reflinks here")
+    monkeypatch.setattr(clone, "_reflink", no_reflink)
+    src = tmp_path / "src.bin"
+    src.write_bytes(b"data")
+    sharer = _Sharer(prefer_hardlinks=True)
+    sharer.order = [REFLINK, HARDLINK, COPY]
+    assert sharer.share(str(src), str(tmp_path / "a.bin")) == HARDLINK
+    assert sharer.share(str(src), str(tmp_path / "b.bin")) == HARDLINK
+    assert len(calls) == 1
+    assert (tmp_path / "b.bin").read_bytes() == b"data"
+
+
+def test_real_errors_are_not_swallowed(tmp_path, monkeypatch):
+    def broken(src, dest):
+        raise OSError(errno.EIO, "disk on fire")
+    monkeypatch.setattr(clone, "_reflink", broken)
+    sharer = _Sharer()
+    sharer.order = [REFLINK, COPY]
+    (tmp_path / "src.bin").write_bytes(b"x")
+    with pytest.raises(OSError) as info:
+        sharer.share(str(tmp_path / "src.bin"), str(tmp_path / "a.bin"))
+    assert info.value.errno == errno.EIO
+
+
+def test_project_dir_name():
+    assert project_dir_name(51, "Laundry Room AI") == "51_Laundry_Room_AI"
+    assert project_dir_name("7", " Tiny / Home ") == "07_Tiny_Home"
+
+
+def test_load_spec_rejects_unknown_keys(tmp_path):
+    path = tmp_path / "spec.json"
+    path.write_text(json.dumps({"replace": {}, "renames": {}}))
+    with pytest.raises(ValueError, match="renames"):
+        load_spec(str(path))
@@ -0,0 +1,85 @@
+import io
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from generator.collage import Collage, Gradient, cover, parse_color  # noqa: E402
+
+
+def decoded(data):
+    with Image.open(io.BytesIO(data)) as im:
+        im.load()
+        return im
+
+
+def test_parse_color():
+    assert parse_color("#fff") == (255, 255, 255, 255)
+    assert parse_color("#11223380") == (17, 34, 51, 128)
+    assert parse_color("rgba(10, 20, 30, 0.5)") == (10, 20, 30, 128)
+    assert parse_color("teal") == (0, 128, 128, 255)
+    assert parse_color((1, 2, 3)) == (1, 2, 3, 255)
+
+
+def test_cells_form_a_2x2_grid():
+    board = Collage(100)
+    assert board.cells(margin=10, gap=4) == [(10, 10, 48, 48), (52, 10, 90, 48),
+                                             (10, 52, 48, 90), (52, 52, 90, 90)]
+
+
+def test_scale_sets_the_output_size():
+    board = Collage(200, 100, scale=0.5, background="#000")
+    board.rect((0, 0, 100, 100), "#f00")
+    out = board.render()
+    assert out.size == (100, 50) and out.mode == "RGB"
+    assert out.getpixel((10, 25)) == (255, 0, 0)
+    assert out.getpixel((90, 25)) == (0, 0, 0)
+
+
+def test_opacity_and_translucent_fills_blend():
+    board = Collage(10, background="#000")
+    board.rect((0, 0, 10, 10), "#fff", opacity=0.5)
+    r, g, b = board.render().getpixel((5, 5))
+    assert 120 <= r <= 135 and r == g == b
+
+
+def test_gradient_runs_along_its_axis():
+    board = Collage(100, background="#000")
+    board.rect((0, 0, 100, 100), Gradient("#000", "#fff", direction="x"))
+    out = board.render()
+    left, right = out.getpixel((5, 50))[0], out.getpixel((95, 50))[0]
+    assert left < 30 and right > 225
+    assert out.getpixel((50, 5)) == out.getpixel((50, 95))
+
+
+def test_cover_crops_evenly():
+    src = Image.new("RGB", (300, 100), (255, 0, 0))
+    src.paste((0, 0, 255), (100, 0, 200, 100))
+    tile = cover(src, 50, 50)
+    assert tile.size == (50, 50)
+    # Only the blue middle third survives; Lanczos may bleed a shade at the edges.
+    assert all(tile.getpixel((x, 25))[0] < 20 for x in (0, 25, 49))
+
+
+def test_format_follows_the_content(tmp_path):
+    flat = Collage(40, background="#123456")
+    flat.rect((0, 0, 20, 40), "#abcdef")
+    assert flat.format == "png"
+    path = flat.save(str(tmp_path / "flat.png"))
+    im = decoded(open(path, "rb").read())
+    assert im.format == "PNG" and im.mode == "P"     # exact fit in a palette
+
+    photo = Collage(40)
+    photo.image_cell((0, 0, 40, 40), Image.new("RGB", (64, 48), (30, 140, 60)))
+    assert photo.format == "jpg"
+    im = decoded(photo.encode(photo.format))
+    assert im.format == "JPEG" and im.size == (40, 40)
+
+
+def test_save_only_writes_changes(tmp_path):
+    board = Collage(20, background="#fff")
+    path = str(tmp_path / "b.png")
+    board.save(path)
+    mtime = (tmp_path / "b.png").stat().st_mtime_ns
+    board.save(path)
+    assert (tmp_path / "b.png").stat().st_mtime_ns == mtime
@@ -0,0 +1,52 @@
+import json
+
+from generator.dartindex import INDEX_PATH, _name, index_entries, render_index, write_index
+from generator.manifest import JSONL_NAME
+
+
+def entry(path, color="#102030", blurhash="L00000fQfQfQfQfQfQfQfQfQfQfQ"):
+    return {"path": path, "width": 4, "height": 2, "color": color, "blurhash": blurhash}
+
+
+def test_by_stem_names_files_whose_extension_varies():
+    source = render_index([entry("style/a.jpg"), entry("style/b.png"), entry("x/c.jpg"), entry("x/c.png")])
+    by_stem = source.split("byStem")[1]
+    assert "'assets/style/a': styleA," in by_stem
+    assert "'assets/style/b': styleB," in by_stem
+    assert "'assets/x/c'" not in by_stem    # two formats: ambiguous, left to byPath
+
+
+def test_names_are_camel_case_and_unique():
+    taken = set()
+    assert _name("examples/ex_01.jpg", taken) == "examplesEx01"
+    assert _name("examples/ex-01.png", taken) == "examplesEx01Png"
+    assert _name("examples/ex 01.png", taken) == "examplesEx01Png2"
+    assert _name("3d/cube.png", taken) == "a3dCube"
+
+
+def test_render_index_lists_every_entry_by_path():
+    source = render_index([entry("style/a.jpg", color="#abcdef")])
+    assert "static const styleA = AssetInfo('assets/style/a.jpg', 4, 2, Color(0xFFABCDEF), " \
+           "'L00000fQfQfQfQfQfQfQfQfQfQfQ');" in source
+    assert "    'assets/style/a.jpg': styleA,\n" in source.split("byPath")[1]
+    empty = render_index([])
+    assert "static const byPath = <String, AssetInfo>{};" in empty
+    assert "static const byStem = <String, AssetInfo>{};" in empty
+
+
+def test_index_covers_bundled_main_images_with_placeholders(tmp_path):
+    (tmp_path / "pubspec.yaml").write_text("name: app\nflutter:\n  assets:\n    - assets/style/\n")
+    (tmp_path / "lib").mkdir()
+    (tmp_path / "assets").mkdir()
+    rows = [dict(entry("style/a.jpg"), format="jpeg"),
+            dict(entry("style/2.0x/a.jpg"), format="jpeg"),        # a variant
+            dict(entry("style/b.jpg", blurhash=None), format="jpeg"),
+            dict(entry("style/notes.md"), format=None),
+            dict(entry("other/c.jpg"), format="jpeg")]              # not bundled
+    (tmp_path / "assets" / JSONL_NAME).write_text("".join(json.dumps(r) + "\n" for r in rows))
+    assert [e["path"] for e in index_entries(str(tmp_path))] == ["style/a.jpg"]
+
+    assert write_index(str(tmp_path))
+    assert "styleA" in (tmp_path / INDEX_PATH).read_text()
+    assert not write_index(str(tmp_path))
+    assert not write_index(str(tmp_path / "missing"))
@@ -0,0 +1,68 @@
+import os
+
+import pytest
+from conftest import jpeg
+
+import fetch_guest_assets
+from generator.dedup import exact_duplicates, find_duplicates, link_duplicates
+from generator.png import write_png
+from generator.raster import Raster
+
+
+def linked_pair(tmp_path, data=b"same bytes"):
+    for name in ("a.bin", "b.bin"):
+        (tmp_path / name).write_bytes(data)
+    files = [(name, len(data)) for name in ("a.bin", "b.bin")]
+    [group] = exact_duplicates(files, str(tmp_path))
+    assert link_duplicates(group, str(tmp_path)) == len(data)
+    assert os.path.samefile(tmp_path / "a.bin", tmp_path / "b.bin")
+    return group
+
+
+def test_exact_duplicates_and_wasted_bytes(tmp_path):
+    for name, data in (("p1/a.png", b"x" * 10), ("p2/b.png", b"x" * 10), ("p2/c.png", b"y" * 10)):
+        path = tmp_path / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(data)
+    report = find_duplicates(["p1", "p2"], str(tmp_path), near=False)
+    [group] = report.groups
+    assert group.paths == ["p1/a.png", "p2/b.png"]
+    assert report.wasted_by_project() == {"p2": 10}
+
+
+def test_linked_copies_are_not_counted_again(tmp_path):
+    linked_pair(tmp_path)
+    [group] = exact_duplicates([("a.bin", 10), ("b.bin", 10)], str(tmp_path))
+    assert group.linked == ["b.bin"] and group.wasted == 0
+
+
+def test_writers_replace_linked_copies(tmp_path):
+    linked_pair(tmp_path)
+    write_png(str(tmp_path / "b.bin"), Raster(2, 2))
+    assert (tmp_path / "a.bin").read_bytes() == b"same bytes"
+
+
+def test_guest_placeholders_do_not_truncate_linked_examples(tmp_path, monkeypatch):
+    dirs = {name: str(tmp_path / name) for name in ("examples", "onboarding", "illustrations")}
+    for path in dirs.values():
+        os.makedirs(path)
+    monkeypatch.setattr(fetch_guest_assets, "DIRS", dirs)
+    example = tmp_path / "examples" / "guest_example_1.jpg"
+    example.write_bytes(jpeg(500))
+    fetch_guest_assets.copy_placeholders(1)
+    onboard = tmp_path / "onboarding" / "onboard_1.jpg"
+    [group] = exact_duplicates([(str(p), 500) for p in (example, onboard)])
+    link_duplicates(group)
+    assert os.path.samefile(example, onboard)
+
+    fetch_guest_assets.copy_placeholders(1)     # the re-run that used to zero both files
+
+    assert example.read_bytes() == jpeg(500)
+    assert onboard.read_bytes() == jpeg(500)
+    assert (tmp_path / "illustrations" / "empty_1.jpg").read_bytes() == jpeg(500)
+
+
+@pytest.mark.parametrize("data", [b"", b"x"])
+def test_empty_and_unique_files_are_not_grouped(tmp_path, data):
+    (tmp_path / "a").write_bytes(data)
+    assert exact_duplicates([("a", len(data))], str(tmp_path)) == []
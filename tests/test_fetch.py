@@ -0,0 +1,300 @@
+import os
+
+import pytest
+from conftest import jpeg
+
+from generator.cache import DownloadCache, file_sha256
+from generator.fetch import MAX_REDIRECTS, Downloader, FetchError, _CircuitBreaker, _content_range_start, _retry_after
+from generator.journal import DONE, JobJournal
+
+IMAGE = {"Content-Type": "image/jpeg"}
+
+
+def downloader(**kwargs):
+    kwargs.setdefault("backoff", 0)
+    kwargs.setdefault("max_backoff", 0)
+    return Downloader(**kwargs)
+
+
+def test_download_writes_file_and_hash(server, tmp_path):
+    body = jpeg(5000)
+    server.route("/a.jpg", (200, IMAGE, body))
+    dest = str(tmp_path / "a.jpg")
+    with downloader() as dl:
+        result = dl.download(server.url("/a.jpg"), dest)
+    assert result.ok and result.size == len(body)
+    with open(dest, "rb") as f:
+        assert f.read() == body
+    assert not os.path.exists(dest + ".part")
+
+
+def test_download_all_fetches_each_url_once(server, tmp_path):
+    server.route("/a.jpg", (200, IMAGE, jpeg(100)))
+    url = server.url("/a.jpg")
+    jobs = [(url, str(tmp_path / "one.jpg")), (url, str(tmp_path / "two.jpg"))]
+    with downloader() as dl:
+        results = dl.download_all(jobs)
+    assert [r.ok for r in results] == [True, True]
+    assert len(server.hits("/a.jpg")) == 1
+    assert (tmp_path / "two.jpg").read_bytes() == jpeg(100)
+
+
+def test_transient_errors_are_retried(server, tmp_path):
+    server.route("/a.jpg", (503, {"Retry-After": "0"}, b""), (500, {}, b""), (200, IMAGE, jpeg(100)))
+    with downloader(retries=3) as dl:
+        result = dl.download(server.url("/a.jpg"), str(tmp_path / "a.jpg"))
+    assert result.ok
+    assert len(server.hits("/a.jpg")) == 3
+
+
+def test_retries_give_up(server, tmp_path):
+    server.route("/a.jpg", (503, {}, b""))
+    with downloader(retries=2) as dl:
+        result = dl.download(server.url("/a.jpg"), str(tmp_path / "a.jpg"))
+    assert not result.ok and "503" in result.error
+    assert len(server.hits("/a.jpg")) == 3
+
+
+def test_not_found_is_remembered(server, tmp_path):
+    server.route("/gone.jpg", (404, {}, b""))
+    url = server.url("/gone.jpg")
+    with downloader(cache=DownloadCache(str(tmp_path / "cache"))) as dl:
+        first = dl.download(url, str(tmp_path / "a.jpg"))
+        second = dl.download(url, str(tmp_path / "b.jpg"))
+    assert not first.ok and not second.ok
+    assert "remembered" in second.error
+    assert len(server.hits("/gone.jpg")) == 1
+
+
+def test_cache_serves_repeat_downloads(server, tmp_path):
+    server.route("/a.jpg", (200, IMAGE, jpeg(100)))
+    url = server.url("/a.jpg")
+    with downloader(cache=DownloadCache(str(tmp_path / "cache"))) as dl:
+        dl.download(url, str(tmp_path / "a.jpg"))
+        again = dl.download(url, str(tmp_path / "b.jpg"))
+    assert again.ok and again.from_cache
+    assert len(server.hits("/a.jpg")) == 1
+
+
+def test_html_error_page_is_rejected(server, tmp_path):
+    server.route("/a.jpg", (200, {"Content-Type": "text/html"}, b"<html>nope</html>"))
+    with downloader() as dl:
+        result = dl.download(server.url("/a.jpg"), str(tmp_path / "a.jpg"))
+    assert not result.ok and "expected an image" in result.error
+    assert len(server.hits("/a.jpg")) == 1
+    assert not os.path.exists(tmp_path / "a.jpg")
+
+
+def test_missing_end_marker_is_rejected(server, tmp_path):
+    server.route("/a.jpg", (200, IMAGE, jpeg(100)[:-2]))
+    with downloader() as dl:
+        result = dl.download(server.url("/a.jpg"), str(tmp_path / "a.jpg"))
+    assert not result.ok and "end marker" in result.error
+    assert not os.path.exists(tmp_path / "a.jpg.part")
+
+
+def test_journal_skips_finished_items(server, tmp_path):
+    server.route("/a.jpg", (200, dict(IMAGE, ETag='"v1"'), jpeg(100)))
+    url, dest = server.url("/a.jpg"), str(tmp_path / "a.jpg")
+    journal = JobJournal(str(tmp_path / "journal.json"))
+    with downloader(journal=journal) as dl:
+        dl.download(url, dest)
+        again = dl.download(url, dest)
+    assert again.skipped
+    assert journal.get(dest, url)["state"] == DONE
+    assert len(server.hits("/a.jpg")) == 1
+
+
+def test_circuit_breaker_opens_and_recovers(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("generator.fetch.time.monotonic", lambda: now[0])
+    breaker = _CircuitBreaker(threshold=2, cooldown=10)
+    breaker.record(ok=False)
+    assert breaker.allow()
+    breaker.record(ok=False)
+    assert not breaker.allow()
+    now[0] += 11
+    assert breaker.allow()          # the one trial request
+    assert not breaker.allow()
+    breaker.record(ok=True)
+    assert breaker.allow()
+
+
+def test_open_circuit_fails_fast(server, tmp_path):
+    server.route("/a.jpg", (503, {}, b""))
+    with downloader(retries=5, breaker_threshold=2, breaker_cooldown=60) as dl:
+        result = dl.download(server.url("/a.jpg"), str(tmp_path / "a.jpg"))
+    assert not result.ok and "circuit open" in result.error
+    assert len(server.hits("/a.jpg")) == 2
+
+
+def test_fallback_fills_failed_jobs(server, tmp_path):
+    server.route("/a.jpg", (404, {}, b""))
+
+    def fallback(url, dest):
+        path = os.path.splitext(dest)[0] + ".png"
+        with open(path, "wb") as f:
+            f.write(b"x")
+        return path
+
+    with downloader() as dl:
+        [result] = dl.download_all([(server.url("/a.jpg"), str(tmp_path / "a.jpg"))], fallback=fallback)
+    assert result.ok and result.fallback and result.dest.endswith(".png")
+
+
+def test_header_parsers():
+    assert _content_range_start("bytes 100-199/200") == 100
+    assert _content_range_start(None) is None
+    assert _retry_after("3") == 3.0
+    assert _retry_after("") is None
+    assert _retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_fetch_raises_on_error_status(server):
+    server.route("/x", (500, {}, b""))
+    with downloader() as dl, pytest.raises(FetchError) as info:
+        dl.fetch(server.url("/x"))
+    assert info.value.status == 500 and info.value.transient
+
+
+def test_refresh_revalidates_past_the_cache(server, tmp_path):
+    body = jpeg(100)
+    server.route("/a.jpg", (200, dict(IMAGE, ETag='"v1"'), body),
+                 lambda headers: (304, {}, b"") if headers.get("if-none-match") == '"v1"'
+                 else (200, dict(IMAGE, ETag='"v1"'), body))
+    url, dest = server.url("/a.jpg"), str(tmp_path / "a.jpg")
+    journal = JobJournal(str(tmp_path / "journal.json"))
+    with downloader(cache=DownloadCache(str(tmp_path / "cache")), journal=journal) as dl:
+        dl.download(url, dest)
+    with downloader(cache=DownloadCache(str(tmp_path / "cache")), journal=journal, revalidate=True) as dl:
+        result = dl.download(url, dest)
+    assert result.ok and result.skipped and not result.from_cache
+    hits = server.hits("/a.jpg")
+    assert len(hits) == 2 and hits[1]["if-none-match"] == '"v1"'
+
+
+def test_refresh_replaces_changed_items(server, tmp_path):
+    server.route("/a.jpg", (200, dict(IMAGE, ETag='"v1"'), jpeg(100)),
+                 (200, dict(IMAGE, ETag='"v2"'), jpeg(120, seed=1)))
+    url, dest = server.url("/a.jpg"), str(tmp_path / "a.jpg")
+    journal = JobJournal(str(tmp_path / "journal.json"))
+    cache = str(tmp_path / "cache")
+    with downloader(cache=DownloadCache(cache), journal=journal) as dl:
+        dl.download(url, dest)
+    with downloader(cache=DownloadCache(cache), journal=journal, revalidate=True) as dl:
+        result = dl.download(url, dest)
+    assert result.ok and result.size == 120
+    assert (tmp_path / "a.jpg").read_bytes() == jpeg(120, seed=1)
+    assert journal.get(dest, url)["etag"] == '"v2"'
+    with downloader(cache=DownloadCache(cache)) as dl:
+        assert dl.download(url, str(tmp_path / "b.jpg")).size == 120
+
+
+def ranged(body, etag='"v1"'):
+    """A handler that honors ``Range`` when ``If-Range`` still matches."""
+    def respond(headers):
+        spec = headers.get("range")
+        if spec and headers.get("if-range") == etag:
+            start = int(spec.split("=")[1].rstrip("-"))
+            if start >= len(body):
+                return 416, {"Content-Range": f"bytes */{len(body)}"}, b""
+            headers = dict(IMAGE, ETag=etag)
+            headers["Content-Range"] = f"bytes {start}-{len(body) - 1}/{len(body)}"
+            return 206, headers, body[start:]
+        return 200, dict(IMAGE, ETag=etag), body
+    return respond
+
+
+def interrupted(tmp_path, url, body, received, etag='"v1"'):
+    dest = str(tmp_path / "a.jpg")
+    journal = JobJournal(str(tmp_path / "journal.json"))
+    journal.start(dest, url, etag)
+    with open(dest + ".part", "wb") as f:
+        f.write(body[:received])
+    return dest, journal
+
+
+def test_resume_with_206(server, tmp_path):
+    body = jpeg(10000)
+    server.route("/a.jpg", ranged(body))
+    url = server.url("/a.jpg")
+    dest, journal = interrupted(tmp_path, url, body, 6000)
+    with downloader(journal=journal) as dl:
+        result = dl.download(url, dest)
+    assert result.ok and result.size == len(body)
+    assert (tmp_path / "a.jpg").read_bytes() == body
+    [hit] = server.hits("/a.jpg")
+    assert hit["range"] == "bytes=6000-"
+
+
+def test_resume_answered_with_full_body(server, tmp_path):
+    body = jpeg(10000, seed=1)
+    server.route("/a.jpg", ranged(body, etag='"v2"'))
+    url = server.url("/a.jpg")
+    dest, journal = interrupted(tmp_path, url, jpeg(10000), 6000)
+    with downloader(journal=journal, retries=0) as dl:
+        result = dl.download(url, dest)
+    assert result.ok, result.error
+    assert result.size == len(body)
+    assert (tmp_path / "a.jpg").read_bytes() == body
+    assert len(server.hits("/a.jpg")) == 1
+
+
+def test_resume_past_the_end_restarts(server, tmp_path):
+    body = jpeg(10000)
+    server.route("/a.jpg", ranged(body))
+    url = server.url("/a.jpg")
+    dest, journal = interrupted(tmp_path, url, body + b"junk", len(body) + 4)
+    with downloader(journal=journal, retries=1) as dl:
+        result = dl.download(url, dest)
+    assert result.ok and (tmp_path / "a.jpg").read_bytes() == body
+    first, second = server.hits("/a.jpg")
+    assert first["range"] == f"bytes={len(body) + 4}-"
+    assert "range" not in second
+
+
+def test_revalidated_normalized_file_stays_out_of_the_cache(server, tmp_path):
+    server.route("/a.jpg", (200, dict(IMAGE, ETag='"v1"'), jpeg(100)), (304, {}, b""))
+    url, dest = server.url("/a.jpg"), str(tmp_path / "a.jpg")
+    journal = JobJournal(str(tmp_path / "journal.json"))
+    cache = str(tmp_path / "cache")
+    with downloader(journal=journal) as dl:
+        dl.download(url, dest)
+    (tmp_path / "a.jpg").write_bytes(jpeg(50))     # shrunk in place by the build
+    journal.rewritten(dest, 50, file_sha256(dest))
+    with downloader(cache=DownloadCache(cache), journal=journal, revalidate=True) as dl:
+        result = dl.download(url, dest)
+    assert result.ok and result.skipped
+    assert journal.get(dest, url)["normalized"]
+    assert DownloadCache(cache).lookup(url) is None
+
+
+def test_damaged_file_is_fetched_without_validators(server, tmp_path):
+    body = jpeg(5000)
+    server.route("/a.jpg", lambda headers: (304, {}, b"") if headers.get("if-none-match") == '"v1"'
+                 else (200, dict(IMAGE, ETag='"v1"'), body))
+    url, dest = server.url("/a.jpg"), str(tmp_path / "a.jpg")
+    journal = JobJournal(str(tmp_path / "journal.json"))
+    cache = str(tmp_path / "cache")
+    with downloader(journal=journal) as dl:
+        dl.download(url, dest)
+    (tmp_path / "a.jpg").write_bytes(body[:100])
+    with downloader(cache=DownloadCache(cache), journal=journal, revalidate=True) as dl:
+        result = dl.download(url, dest)
+    assert result.ok and not result.skipped and result.size == len(body)
+    assert (tmp_path / "a.jpg").read_bytes() == body
+    assert "if-none-match" not in server.hits("/a.jpg")[1]
+    blob = DownloadCache(cache).lookup(url)
+    assert os.path.basename(blob) == file_sha256(dest) and os.path.getsize(blob) == len(body)
+
+
+def test_permanent_request_errors_are_not_retried(server, tmp_path):
+    server.route("/loop", (302, {"Location": "/loop"}, b""))
+    server.route("/ftp", (302, {"Location": "ftp://example.com/a.jpg"}, b""))
+    with downloader(retries=3) as dl:
+        looped = dl.download(server.url("/loop"), str(tmp_path / "a.jpg"))
+        moved = dl.download(server.url("/ftp"), str(tmp_path / "b.jpg"))
+    assert not looped.ok and "too many redirects" in looped.error
+    assert not moved.ok and "unsupported scheme" in moved.error
+    assert len(server.hits("/loop")) == MAX_REDIRECTS + 1
+    assert len(server.hits("/ftp")) == 1
@@ -0,0 +1,60 @@
+import json
+import os
+
+from generator.journal import DONE, PARTIAL, JobJournal
+
+
+def test_entries_survive_a_reload(tmp_path):
+    path = str(tmp_path / "journal.json")
+    dest = str(tmp_path / "a.jpg")
+    (tmp_path / "a.jpg").write_bytes(b"12345")
+    journal = JobJournal(path)
+    journal.start(dest, "u", etag='"v1"')
+    assert journal.get(dest, "u")["state"] == PARTIAL
+    journal.complete(dest, "u", 5, '"v1"', "Wed, 21 Oct 2015 07:28:00 GMT", sha256="abc")
+
+    entry = JobJournal(path).get(dest, "u")
+    assert entry["state"] == DONE and entry["etag"] == '"v1"' and entry["sha256"] == "abc"
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_entries_belong_to_their_url(tmp_path):
+    journal = JobJournal(str(tmp_path / "journal.json"))
+    journal.complete("a.jpg", "old", 1)
+    assert journal.get("a.jpg", "new") is None
+    assert not journal.is_done("a.jpg", "new")
+
+
+def test_is_done_checks_the_file(tmp_path):
+    dest = str(tmp_path / "a.jpg")
+    journal = JobJournal(str(tmp_path / "journal.json"))
+    journal.complete(dest, "u", 5)
+    assert not journal.is_done(dest, "u")           # missing
+    (tmp_path / "a.jpg").write_bytes(b"12345")
+    assert journal.is_done(dest, "u")
+    (tmp_path / "a.jpg").write_bytes(b"123")
+    assert not journal.is_done(dest, "u")           # truncated
+    journal.start(dest, "u")
+    (tmp_path / "a.jpg").write_bytes(b"12345")
+    assert not journal.is_done(dest, "u")           # unfinished
+
+
+def test_rewritten_matches_paths_by_location(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    journal = JobJournal("journal.json")
+    journal.complete(os.path.join("p", "a.jpg"), "u", 10, '"v1"', sha256="old")
+    assert journal.rewritten(os.path.join(".", "p", "a.jpg"), 4, "new")
+    assert not journal.rewritten("other.jpg", 4, "new")
+    entry = JobJournal("journal.json").get(os.path.join("p", "a.jpg"), "u")
+    assert (entry["size"], entry["sha256"], entry["normalized"], entry["etag"]) == (4, "new", True, '"v1"')
+
+
+def test_unreadable_or_foreign_journals_start_empty(tmp_path, capsys):
+    torn = tmp_path / "torn.json"
+    torn.write_text('{"version": 1, "items": {')
+    assert JobJournal(str(torn)).get("a", "u") is None
+    assert "unreadable" in capsys.readouterr().out
+
+    future = tmp_path / "future.json"
+    future.write_text(json.dumps({"version": 99, "items": {"a": {"url": "u", "state": DONE}}}))
+    assert JobJournal(str(future)).get("a", "u") is None
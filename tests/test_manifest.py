@@ -0,0 +1,92 @@
+import hashlib
+import json
+
+import pytest
+
+from generator.builddb import DB_NAME, BuildDB
+from generator.manifest import FIELDS, JSONL_NAME, MARKDOWN_NAME, file_entry, markdown_rows, read_manifest, scan, update
+
+SOURCES = """# Asset Sources
+
+| File | Category | Source URL | License Note |
+|------|----------|------------|--------------|
+| `assets/examples/ex_0.txt` | Example | https://picsum.photos | Unsplash License |
+| `*.md` | Notes | Hand-written | MIT |
+
+| Filename | Source |
+|---|---|
+| readme.txt | Team |
+"""
+
+
+def test_markdown_rows_read_any_column_names(tmp_path):
+    path = tmp_path / MARKDOWN_NAME
+    path.write_text(SOURCES)
+    assert markdown_rows(str(path)) == [
+        ("assets/examples/ex_0.txt", "Example", "https://picsum.photos", "Unsplash License"),
+        ("*.md", "Notes", "Hand-written", "MIT"),
+        ("readme.txt", None, "Team", None),
+    ]
+    assert markdown_rows(str(tmp_path / "missing.md")) == []
+
+
+def test_file_entry_reads_hash_size_and_header(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    path = tmp_path / "a.png"
+    Image.new("RGB", (30, 20)).save(path)
+    entry = file_entry(str(path), "a.png")
+    assert entry["sha256"] == hashlib.sha256(path.read_bytes()).hexdigest()
+    assert (entry["bytes"], entry["width"], entry["height"], entry["format"]) == \
+        (path.stat().st_size, 30, 20, "png")
+    (tmp_path / "empty.txt").write_bytes(b"")
+    assert file_entry(str(tmp_path / "empty.txt"), "empty.txt")["width"] is None
+
+
+def markdown_rows_from(text, tmp_path):
+    path = tmp_path / "rows.md"
+    path.write_text(text)
+    return markdown_rows(str(path))
+
+
+def test_scan_takes_provenance_from_the_spec_then_the_markdown(tmp_path):
+    assets = tmp_path / "assets"
+    (assets / "examples").mkdir(parents=True)
+    for rel in ("examples/ex_0.txt", "examples/ex_1.txt", "notes.md", "readme.txt", ".hidden", "x.part"):
+        (assets / rel).write_text(rel)
+    db = BuildDB(str(tmp_path / DB_NAME), load=False)
+    db.record("examples/ex_1.txt", "fp1", str(assets / "examples" / "ex_1.txt"))
+
+    entries = list(scan(str(assets), {"examples/ex_1.txt": ("Example", "Spec", "MIT")},
+                        markdown_rows_from(SOURCES, tmp_path), db))
+
+    assert all(tuple(e) == FIELDS for e in entries)
+    rows = {e["path"]: (e["category"], e["label"], e["source"], e["license"], e["fingerprint"]) for e in entries}
+    assert rows == {
+        "examples/ex_0.txt": ("examples", "Example", "https://picsum.photos", "Unsplash License", None),
+        "examples/ex_1.txt": ("examples", "Example", "Spec", "MIT", "fp1"),
+        "notes.md": ("", "Notes", "Hand-written", "MIT", None),
+        "readme.txt": ("", None, "Team", None, None),
+    }
+
+
+def test_update_writes_only_changes_and_keeps_placeholders(tmp_path):
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    (assets / "a.txt").write_text("a")
+    (assets / MARKDOWN_NAME).write_text(SOURCES)
+    manifest = assets / JSONL_NAME
+
+    assert update(str(tmp_path))
+    assert [e["path"] for e in read_manifest(str(manifest))] == ["a.txt"]
+    assert not update(str(tmp_path))
+
+    # Placeholders carry over while the hash is unchanged.
+    entry = next(read_manifest(str(manifest)))
+    manifest.write_text(json.dumps(dict(entry, color="#123456", blurhash="L00000fQfQfQfQfQfQfQfQfQfQfQ")) + "\n")
+    update(str(tmp_path))
+    assert next(read_manifest(str(manifest)))["color"] == "#123456"
+    (assets / "a.txt").write_text("changed")
+    update(str(tmp_path))
+    assert next(read_manifest(str(manifest)))["color"] is None
+
+    assert not update(str(tmp_path / "missing"))
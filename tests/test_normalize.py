@@ -0,0 +1,91 @@
+import os
+
+import pytest
+
+from generator.journal import JobJournal
+from generator.normalize import MAX_DIMENSION, REPORT_NAME, Rule, normalize_project, rule_for, rules_for
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def test_normalized_download_stays_done_in_the_fetch_journal(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    dest = os.path.join("proj", "assets", "examples", "a.jpg")
+    os.makedirs(os.path.dirname(dest))
+    Image.new("RGB", (1600, 1200), (90, 120, 150)).save(dest, quality=95)
+    journal = JobJournal(os.path.join("proj", ".fetch_journal.json"))
+    journal.complete(dest, "https://example.com/a", os.path.getsize(dest), '"v1"', sha256="old")
+
+    report = normalize_project("./proj", {})
+
+    assert [c.path for c in report.changes] == ["examples/a.jpg"]
+    with Image.open(dest) as im:
+        assert max(im.size) == 1024
+    journal = JobJournal(os.path.join("proj", ".fetch_journal.json"))
+    assert journal.is_done(dest, "https://example.com/a")
+    entry = journal.get(dest, "https://example.com/a")
+    assert entry["normalized"] and entry["sha256"] != "old" and entry["etag"] == '"v1"'
+
+
+def test_check_leaves_the_journal_alone(tmp_path):
+    dest = str(tmp_path / "assets" / "a.jpg")
+    os.makedirs(os.path.dirname(dest))
+    Image.new("RGB", (1600, 1200)).save(dest)
+    journal = JobJournal(str(tmp_path / ".fetch_journal.json"))
+    journal.complete(dest, "u", os.path.getsize(dest))
+
+    normalize_project(str(tmp_path), {}, check=True)
+
+    assert JobJournal(str(tmp_path / ".fetch_journal.json")).is_done(dest, "u")
+
+
+def write(root, rel, image, fmt="JPEG", **params):
+    path = root / "assets" / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    image.save(path, fmt, **params)
+    return path
+
+
+def test_rules_per_category_and_density():
+    rules = rules_for({"normalize": {"examples": {"quality": 70}}})
+    assert rule_for(rules, "style_tiles/a.jpg") == Rule(800)
+    assert rule_for(rules, "style_tiles/2.0x/a.jpg") == Rule(1600)
+    assert rule_for(rules, "examples/a.jpg") == Rule(MAX_DIMENSION, 70)
+    assert rule_for(rules, "icon.png") == Rule()
+
+
+def test_check_reports_without_writing(tmp_path):
+    path = write(tmp_path, "style_tiles/big.jpg", Image.new("RGB", (1000, 500)))
+    before = path.read_bytes()
+    report = normalize_project(str(tmp_path), {}, check=True)
+    assert [(c.path, c.size_after) for c in report.changes] == [("style_tiles/big.jpg", [800, 400])]
+    assert report.written == [] and path.read_bytes() == before
+    assert not (tmp_path / REPORT_NAME).exists()
+
+
+def test_small_right_format_files_are_untouched(tmp_path):
+    path = write(tmp_path, "examples/small.jpg", Image.new("RGB", (300, 200)))
+    mtime = path.stat().st_mtime_ns
+    report = normalize_project(str(tmp_path), {})
+    assert report.checked == 1 and report.changes == []
+    assert path.stat().st_mtime_ns == mtime
+
+
+def test_wrong_format_and_orientation_are_fixed(tmp_path):
+    write(tmp_path, "examples/photo.jpg", Image.new("RGB", (40, 20)), "PNG")
+    exif = Image.Exif()
+    exif[0x0112] = 6                # rotate 90 degrees clockwise to display
+    write(tmp_path, "examples/turned.jpg", Image.new("RGB", (40, 20)), exif=exif)
+    (tmp_path / "assets" / "examples" / "broken.png").write_bytes(b"not a png")
+
+    report = normalize_project(str(tmp_path), {})
+
+    reasons = {c.path: c.reasons for c in report.changes}
+    assert reasons == {"examples/photo.jpg": ["png data in a .jpg file"],
+                       "examples/turned.jpg": ["EXIF orientation 6"]}
+    assert [p for p, _ in report.skipped] == ["examples/broken.png"]
+    with Image.open(tmp_path / "assets" / "examples" / "photo.jpg") as im:
+        assert im.format == "JPEG"
+    with Image.open(tmp_path / "assets" / "examples" / "turned.jpg") as im:
+        assert im.size == (20, 40) and im.getexif().get(0x0112, 1) == 1
+    assert (tmp_path / REPORT_NAME).exists()
@@ -0,0 +1,55 @@
+import threading
+
+import pytest
+
+from generator.pipeline import Stage, run_stages
+
+
+def recorder():
+    order = []
+    lock = threading.Lock()
+
+    def step(name, fail=False):
+        def run():
+            with lock:
+                order.append(name)
+            if fail:
+                raise RuntimeError(f"{name} broke")
+            return name
+        return run
+    return order, step
+
+
+def test_dependencies_run_first():
+    order, step = recorder()
+    stages = [Stage("manifest", step("manifest"), ["a", "b"]), Stage("a", step("a")),
+              Stage("b", step("b"), ["a"]), Stage("index", step("index"), ["manifest"])]
+    report = run_stages(stages, workers=4)
+    assert order.index("a") < order.index("b") < order.index("manifest") < order.index("index")
+    assert not report.failed
+    assert {r.name: r.value for r in report.results} == {n: n for n in order}
+
+
+def test_failure_skips_only_its_dependents():
+    order, step = recorder()
+    results = []
+    stages = [Stage("bad", step("bad", fail=True)), Stage("child", step("child"), ["bad"]),
+              Stage("grandchild", step("grandchild"), ["child"]), Stage("other", step("other"))]
+    report = run_stages(stages, on_done=results.append)
+    assert sorted(order) == ["bad", "other"]
+    by_name = {r.name: r for r in report.results}
+    assert "bad broke" in by_name["bad"].error and not by_name["bad"].skipped
+    assert by_name["grandchild"].skipped and by_name["grandchild"].error == "skipped: bad failed"
+    assert by_name["other"].ok
+    assert len(results) == 4
+    assert report.summary().startswith("1 stages ok, 1 failed, 2 skipped")
+
+
+@pytest.mark.parametrize("stages, message", [
+    ([Stage("a", None), Stage("a", None)], "duplicate stage 'a'"),
+    ([Stage("a", None, ["missing"])], "unknown stage 'missing'"),
+    ([Stage("a", None, ["b"]), Stage("b", None, ["a"]), Stage("c", None)], "cycle between stages: a, b"),
+])
+def test_bad_graphs_are_rejected_before_running(stages, message):
+    with pytest.raises(ValueError, match=message):
+        run_stages(stages)
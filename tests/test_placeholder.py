@@ -0,0 +1,43 @@
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from generator.placeholder import blurhash, dominant_color, placeholder  # noqa: E402
+
+
+def image(width, height, pixel):
+    im = Image.new("RGB", (width, height))
+    im.putdata([pixel(x, y) for y in range(height) for x in range(width)])
+    return im
+
+
+# Hashes from the reference encoder (the ``blurhash`` package on PyPI) for the same pixels.
+@pytest.mark.parametrize("im, components, expected", [
+    (image(8, 6, lambda x, y: (255, 0, 0)), (4, 3), "LsTI:j]9fQ]9|csUfQsUfQfQfQfQ"),
+    (image(8, 6, lambda x, y: (255, 0, 0)), (1, 1), "00TI:j"),
+    (image(16, 8, lambda x, y: (x * 16, 128, 255 - x * 16)), (4, 3), "L[GuFP77sakFxbSijvflfQfQfQfQ"),
+    (image(16, 8, lambda x, y: (x * 16, 128, 255 - x * 16)), (3, 4), "T[GuFP77saxbSijvfQfQfQxbSijv"),
+    (image(12, 12, lambda x, y: (255, 255, 255) if (x < 6) == (y < 6) else (20, 40, 200)), (4, 3),
+     "L+LqhwxvfQxvxv~n%KIWfQ%KofRk"),
+])
+def test_blurhash_matches_the_reference_encoder(im, components, expected):
+    assert blurhash(im, *components) == expected
+
+
+def test_dominant_color_is_the_commonest():
+    im = image(10, 10, lambda x, y: (200, 30, 30) if x < 7 else (10, 10, 250))
+    assert dominant_color(im) == "#C81E1E"
+
+
+def test_placeholder_reads_bitmaps_and_svgs(tmp_path):
+    png = tmp_path / "wide.png"
+    Image.new("RGBA", (200, 100), (0, 0, 0, 0)).save(png)
+    color, hash_ = placeholder(str(png))
+    assert color == "#FFFFFF"             # transparency is flattened onto white
+    assert hash_[0] == "L"                # 4x3 components for a landscape image
+
+    svg = tmp_path / "tall.svg"
+    svg.write_text('<svg xmlns="http://www.w3.org/2000/svg" width="50" height="100">'
+                   '<rect width="50" height="100" fill="#336699"/></svg>')
+    color, hash_ = placeholder(str(svg))
+    assert color == "#336699" and hash_[0] == "T"    # 3x4 for a portrait one
@@ -0,0 +1,82 @@
+import io
+import random
+import struct
+import zlib
+
+import pytest
+
+from generator import png, raster
+from generator.png import FILTER_NONE, FILTER_SUB, FILTER_UP, encode_png
+from generator.raster import Raster
+
+Image = pytest.importorskip("PIL.Image")
+
+COLORS = [(10, 12, 16), (62, 123, 250), (244, 242, 237)]
+
+
+def flat(width=13, height=9):
+    r = Raster(width, height, fill=COLORS[0])
+    r.fill_rect(0, 4, width, height, COLORS[1])
+    r.fill_noise(width // 2, 0, width, 4, COLORS[2], COLORS[0], random.Random(1))
+    return r
+
+
+def decode(data):
+    with Image.open(io.BytesIO(data)) as im:
+        return im.size, im.mode, im.convert("RGB").tobytes()
+
+
+def chunks(data):
+    i = 8
+    while i < len(data):
+        size, = struct.unpack_from(">I", data, i)
+        yield data[i + 4:i + 8], data[i + 8:i + 8 + size]
+        i += size + 12
+
+
+@pytest.mark.parametrize("strategy", ["adaptive", FILTER_NONE, FILTER_SUB, FILTER_UP])
+def test_truecolor_round_trip(strategy):
+    r = flat()
+    assert decode(encode_png(r, strategy=strategy)) == ((13, 9), "RGB", r.tobytes())
+
+
+@pytest.mark.parametrize("count, depth", [(2, 1), (3, 2), (4, 2), (9, 4), (17, 8)])
+def test_palette_uses_the_smallest_bit_depth(count, depth):
+    palette = (COLORS + [(i, i, i) for i in range(count)])[:count]
+    r = flat() if count >= len(COLORS) else Raster(13, 9, fill=COLORS[0])
+    data = encode_png(r, palette=palette)
+    ihdr = dict(chunks(data))[b"IHDR"]
+    assert ihdr[8:10] == bytes([depth, 3])
+    assert decode(data) == ((13, 9), "P", r.tobytes())
+
+
+def test_backends_write_identical_bytes(monkeypatch):
+    if raster.np is None:
+        pytest.skip("numpy is not installed")
+    r = flat()
+    expected = encode_png(r), encode_png(r, palette=COLORS)
+    monkeypatch.setattr(raster, "np", None)
+    monkeypatch.setattr(png, "np", None)
+    r = flat()
+    assert (encode_png(r), encode_png(r, palette=COLORS)) == expected
+
+
+def test_adaptive_filter_picks_up_for_repeated_rows():
+    r = Raster(16, 4)
+    for x in range(16):
+        r.fill_rect(x, 0, x + 1, 4, (x * 16, 255 - x * 16, x))
+    idat = dict(chunks(encode_png(r)))[b"IDAT"]
+    rows = zlib.decompress(idat)
+    assert [rows[i * 49] for i in range(4)][1:] == [FILTER_UP] * 3
+
+
+def test_missing_palette_color_is_an_error():
+    with pytest.raises(ValueError, match="not in the palette"):
+        encode_png(flat(), palette=COLORS[:2])
+
+
+def test_bad_arguments():
+    with pytest.raises(ValueError):
+        encode_png(flat(), strategy="paeth")
+    with pytest.raises(ValueError):
+        encode_png(flat(), palette=[])
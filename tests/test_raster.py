@@ -0,0 +1,72 @@
+import io
+import random
+import struct
+
+import pytest
+
+from generator import raster
+from generator.raster import Raster, encode_bmp
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(raster, "np", None)
+    elif raster.np is None:
+        pytest.skip("numpy is not installed")
+    return request.param
+
+
+def drawn():
+    r = Raster(7, 5, fill=(1, 2, 3))
+    r.fill_rect(1, 1, 4, 3, (200, 10, 10))
+    r.fill_rect(-5, 4, 100, 100, (0, 255, 0))   # clipped to the bottom row
+    r.fill_noise(4, 0, 7, 4, (255, 255, 255), (0, 0, 0), random.Random(7))
+    return r
+
+
+def pixel(r, x, y):
+    data = r.tobytes()
+    i = (y * r.width + x) * 3
+    return tuple(data[i:i + 3])
+
+
+def test_fill_rect_is_half_open_and_clipped(backend):
+    r = drawn()
+    assert pixel(r, 0, 0) == (1, 2, 3)
+    assert pixel(r, 1, 1) == pixel(r, 3, 2) == (200, 10, 10)
+    assert pixel(r, 4, 1) != (200, 10, 10) and pixel(r, 1, 3) == (1, 2, 3)
+    assert {pixel(r, x, 4) for x in range(7)} == {(0, 255, 0)}
+    assert {pixel(r, x, y) for x in range(4, 7) for y in range(4)} == {(255, 255, 255), (0, 0, 0)}
+
+
+def test_backends_draw_the_same_pixels(monkeypatch):
+    if raster.np is None:
+        pytest.skip("numpy is not installed")
+    vectorized = drawn().tobytes()
+    monkeypatch.setattr(raster, "np", None)
+    assert drawn().tobytes() == vectorized
+
+
+def test_rows_are_top_down(backend):
+    r = drawn()
+    assert b"".join(bytes(row) for row in r.rows()) == r.tobytes()
+
+
+def test_bmp_header_and_padding(backend):
+    r = drawn()
+    data = encode_bmp(r)
+    stride = (7 * 3 + 3) // 4 * 4
+    assert data[:2] == b"BM"
+    assert struct.unpack_from("<I", data, 2)[0] == len(data) == 54 + stride * 5
+    assert struct.unpack_from("<iiHH", data, 18) == (7, 5, 1, 24)
+    # Bottom-up BGR: the first stored row is the last drawn one.
+    assert data[54:57] == bytes(reversed(pixel(r, 0, 4)))
+
+
+def test_bmp_decodes_to_the_raster(backend):
+    Image = pytest.importorskip("PIL.Image")
+    r = drawn()
+    with Image.open(io.BytesIO(encode_bmp(r))) as im:
+        assert im.size == (7, 5)
+        assert im.convert("RGB").tobytes() == r.tobytes()
@@ -0,0 +1,61 @@
+import os
+
+import pytest
+
+from generator.rewrite import Rewriter, rewrite_tree
+
+
+def test_longest_key_wins():
+    rw = Rewriter({"ShoeAI": "MeetingAI", "ShoeAIText": "MeetingRoomText"})
+    assert rw.rewrite("ShoeAIText ShoeAI") == ("MeetingRoomText MeetingAI", 2)
+
+
+def test_replacements_are_not_rescanned():
+    rw = Rewriter({"a": "b", "b": "c"})
+    assert rw.rewrite("ab") == ("bc", 2)
+
+
+def test_bytes_pass_through_invalid_utf8():
+    rw = Rewriter({"shoe": "hotel"})
+    assert rw.rewrite(b"\xff shoe \xfe") == (b"\xff hotel \xfe", 1)
+
+
+def test_matches_and_search():
+    rw = Rewriter([("shoe", "hotel"), ("shoe_room", "hotel_room")])
+    assert rw.matches("shoe_room shoe shoe") == {"shoe_room": 1, "shoe": 2}
+    assert rw.search(b"a shoe")
+    assert not rw.search("nothing here")
+
+
+def test_empty_table():
+    rw = Rewriter({})
+    assert not rw
+    assert rw.rewrite("x") == ("x", 0)
+    with pytest.raises(ValueError):
+        Rewriter({"": "x"})
+
+
+def test_rewrite_file_only_writes_changes(tmp_path):
+    path = tmp_path / "a.dart"
+    path.write_text("ShoeAI")
+    os.chmod(path, 0o640)
+    rw = Rewriter({"ShoeAI": "HotelAI"})
+    assert rw.rewrite_file(str(path)) == 1
+    assert path.read_text() == "HotelAI"
+    assert os.stat(path).st_mode & 0o777 == 0o640
+    mtime = os.stat(path).st_mtime_ns
+    assert rw.rewrite_file(str(path)) == 0
+    assert os.stat(path).st_mtime_ns == mtime
+
+
+def test_rewrite_tree_skips_ignored_and_build_dirs(tmp_path):
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".gitignore").write_text("generated/\n")
+    for rel in ("lib/a.dart", "build/b.dart", "generated/c.dart", "lib/d.png"):
+        path = tmp_path / rel
+        path.parent.mkdir(exist_ok=True)
+        path.write_text("ShoeAI")
+    report = rewrite_tree(str(tmp_path), Rewriter({"ShoeAI": "HotelAI"}), (".dart",), workers=1)
+    assert report.changed == [str(tmp_path / "lib" / "a.dart")]
+    assert (tmp_path / "build" / "b.dart").read_text() == "ShoeAI"
+    assert (tmp_path / "generated" / "c.dart").read_text() == "ShoeAI"
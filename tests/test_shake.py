@@ -0,0 +1,68 @@
+from generator.shake import _entries, shake_project, write_pubspec
+
+FILES = {"assets/tiles/a.jpg", "assets/tiles/b.jpg", "assets/tiles/2.0x/a.jpg",
+         "assets/photos/x.jpg", "assets/photos/y.jpg", "assets/logo.png"}
+
+
+def test_entries_collapse_fully_referenced_directories():
+    assert _entries({"assets/tiles/a.jpg", "assets/tiles/b.jpg", "assets/photos/x.jpg"}, FILES) == \
+        ["assets/photos/x.jpg", "assets/tiles/"]
+    # A single file stays a file entry; nothing referenced, nothing listed.
+    assert _entries({"assets/logo.png"}, FILES) == ["assets/logo.png"]
+    assert _entries(set(), FILES) == []
+
+
+def make(tmp_path, dart, pubspec="name: app\nflutter:\n  assets:\n    - assets/photos/\n"):
+    (tmp_path / "pubspec.yaml").write_text(pubspec)
+    (tmp_path / "lib").mkdir(exist_ok=True)
+    (tmp_path / "lib" / "main.dart").write_text(dart)
+    for rel in FILES:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x" * 10)
+    return str(tmp_path)
+
+
+def test_shake_drops_unreferenced_and_adds_missing(tmp_path):
+    project_dir = make(tmp_path, "const a = 'assets/photos/x.jpg';\n"
+                                 "const b = 'assets/tiles/2.0x/a.jpg';\n"
+                                 "const c = 'assets/gone.png';\n")
+    report = shake_project(project_dir)
+    assert report.entries == ["assets/photos/x.jpg", "assets/tiles/a.jpg"]
+    assert report.kept == [("assets/photos/x.jpg", 10)]
+    assert report.dropped == [("assets/photos/y.jpg", 10)]
+    assert report.added == [("assets/tiles/2.0x/a.jpg", 10), ("assets/tiles/a.jpg", 10)]
+    assert [ref.text for ref in report.unmatched] == ["assets/gone.png"]
+    assert report.summary() == "2 bundled files -> 3 (1 dropped, 0.0 KiB; 2 added)"
+
+
+def test_keep_holds_computed_names(tmp_path):
+    project_dir = make(tmp_path, "final p = 'assets/photos/$name.jpg';\n")
+    assert shake_project(project_dir).entries == ["assets/photos/"]
+    project_dir = make(tmp_path, "void main() {}\n")
+    assert shake_project(project_dir, keep=["assets/photos/*"]).entries == ["assets/photos/"]
+
+
+def test_write_pubspec_replaces_only_the_list(tmp_path):
+    (tmp_path / "pubspec.yaml").write_text(
+        "name: app\nflutter:\n  uses-material-design: true\n  assets:\n    - assets/\n    # note\n"
+        "    - assets/x/\n\n  fonts:\n    - family: A\n")
+    assert write_pubspec(str(tmp_path), ["assets/a.png", "assets/b/"])
+    assert (tmp_path / "pubspec.yaml").read_text() == (
+        "name: app\nflutter:\n  uses-material-design: true\n  assets:\n    - assets/a.png\n"
+        "    - assets/b/\n\n  fonts:\n    - family: A\n")
+    assert not write_pubspec(str(tmp_path), ["assets/a.png", "assets/b/"])
+
+
+def test_write_pubspec_appends_and_removes_the_list(tmp_path):
+    path = tmp_path / "pubspec.yaml"
+    path.write_text("name: app\nflutter:\n  uses-material-design: true\n")
+    assert not write_pubspec(str(tmp_path), [])
+    assert write_pubspec(str(tmp_path), ["assets/a.png"])
+    assert path.read_text() == "name: app\nflutter:\n  assets:\n    - assets/a.png\n  uses-material-design: true\n"
+    assert write_pubspec(str(tmp_path), [])
+    assert path.read_text() == "name: app\nflutter:\n  uses-material-design: true\n"
+
+    path.write_text("name: app\n")
+    assert write_pubspec(str(tmp_path), ["assets/a.png"])
+    assert path.read_text() == "name: app\n\nflutter:\n  assets:\n    - assets/a.png\n"
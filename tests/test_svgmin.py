@@ -0,0 +1,192 @@
+import glob
+import os
+
+import pytest
+
+from generator.svgmin import (SvgOptimizeError, equivalent, format_color, format_number, format_path,
+                              optimize, optimize_file, parse_color, svg_files)
+
+SVG = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100">{}</svg>'
+
+
+def test_format_number_is_shortest_exact():
+    assert format_number(0.5) == ".5"
+    assert format_number(-0.25) == "-.25"
+    assert format_number(100.0) == "100"
+    assert format_number(1e-7) in ("1e-7", "1e-07")
+
+
+def test_colors():
+    assert parse_color("white") == (255, 255, 255, 1.0)
+    assert parse_color("rgba(255,0,0,0.5)") == (255, 0, 0, 0.5)
+    assert parse_color("#FF000080")[:3] == (255, 0, 0)
+    assert format_color(255, 255, 255) == "#fff"
+    assert format_color(255, 0, 0) == "red"
+
+
+def test_format_path():
+    assert format_path("M 0 800 L 300 400 Z") == "M0 800L300 400Z"
+    assert format_path("M0,0 L-1,-2") == "M0 0L-1-2"
+
+
+def test_optimize_drops_defaults_and_comments():
+    text = SVG.format('\n  <!-- note -->\n  <rect x="0" y="0" width="50.50" height="10" '
+                      'opacity="1.0" style="fill:#FFFFFF;fill-opacity:1"/>\n')
+    out = optimize(text)
+    assert out == SVG.format('<rect width="50.5" height="10" fill="#fff"/>')
+    assert equivalent(text, out)
+
+
+def test_alpha_folds_into_opacity():
+    text = SVG.format('<g fill-opacity=".5"><circle r="2" fill="rgba(255,0,0,0.5)"/></g>')
+    out = optimize(text)
+    assert 'fill="red"' in out and 'fill-opacity=".25"' in out
+
+
+def test_identical_gradients_are_merged_and_unused_removed():
+    text = SVG.format(
+        '<defs>'
+        '<linearGradient id="a" x1="0%" x2="100%"><stop offset="0%" stop-color="#fff"/>'
+        '<stop offset="100%" stop-color="#000"/></linearGradient>'
+        '<linearGradient id="b" x1="0" x2="1"><stop offset="0" stop-color="white"/>'
+        '<stop offset="1" stop-color="black"/></linearGradient>'
+        '<linearGradient id="c"><stop/></linearGradient>'
+        '</defs>'
+        '<rect width="5" height="5" fill="url(#a)"/><rect x="5" width="5" height="5" fill="url(#b)"/>')
+    out = optimize(text)
+    assert out.count("<linearGradient") == 1
+    assert 'id="c"' not in out
+    assert equivalent(text, out)
+
+
+def test_inherited_values_are_dropped():
+    text = SVG.format('<g fill="red"><rect width="1" height="1" fill="#f00"/></g>')
+    assert optimize(text) == SVG.format('<g fill="red"><rect width="1" height="1"/></g>')
+
+
+def test_text_content_is_kept():
+    text = SVG.format('<text x="1" y="2">  two  spaces </text>')
+    assert "  two  spaces " in optimize(text)
+
+
+@pytest.mark.parametrize("a, b", [
+    ('<rect width="1" height="1" fill="red"/>', '<rect width="1" height="1" fill="blue"/>'),
+    ('<rect width="1" height="1"/>', '<rect width="2" height="1"/>'),
+    ('<path d="M0 0L1 1"/>', '<path d="M0 0L1 2"/>'),
+    ('<g opacity=".5"><rect width="1" height="1"/></g>', '<g><rect width="1" height="1"/></g>'),
+])
+def test_equivalent_sees_changes(a, b):
+    assert not equivalent(SVG.format(a), SVG.format(b))
+
+
+def test_malformed_input_raises():
+    with pytest.raises(SvgOptimizeError):
+        optimize("<svg")
+
+
+GRADIENT = SVG.format('<defs><linearGradient id="g"{}><stop stop-color="red"/>'
+                      '<stop offset="1" stop-color="blue"/></linearGradient></defs>'
+                      '<rect width="100" height="100" fill="url(#g)"/>')
+
+
+def test_bounding_box_gradient_defaults_are_dropped():
+    text = GRADIENT.format(' x1="0%" y1="0" x2="100%" y2="0"')
+    out = optimize(text)
+    assert "<linearGradient id=\"g\">" in out
+    assert equivalent(text, out)
+
+
+def test_user_space_gradient_keeps_unitless_vector():
+    text = GRADIENT.format(' gradientUnits="userSpaceOnUse" x1="0" y1="0" x2="1" y2="0"')
+    out = optimize(text)
+    assert 'x2="1"' in out
+    assert equivalent(text, out)
+
+
+@pytest.mark.parametrize("a, b", [
+    # userSpaceOnUse defaults to 0%..100% of the viewport, not 0..1.
+    (' gradientUnits="userSpaceOnUse" x2="1"', ' gradientUnits="userSpaceOnUse"'),
+    (' gradientUnits="userSpaceOnUse" x2="1"', ' x2="1"'),
+    (' gradientUnits="userSpaceOnUse" x2="100%"', ' gradientUnits="userSpaceOnUse" x2="1"'),
+    (' x2=".5"', ''),
+])
+def test_gradient_vector_differences_are_seen(a, b):
+    assert not equivalent(GRADIENT.format(a), GRADIENT.format(b))
+
+
+@pytest.mark.parametrize("a, b", [
+    (' x2="1"', ''),
+    (' x1="0%" x2="100%"', ' x2="1"'),
+    (' gradientUnits="objectBoundingBox" x2="50%"', ' x2=".5"'),
+    (' gradientUnits="userSpaceOnUse" x1="0%" x2="100%"', ' gradientUnits="userSpaceOnUse"'),
+])
+def test_equivalent_gradient_vectors(a, b):
+    assert equivalent(GRADIENT.format(a), GRADIENT.format(b))
+
+
+def test_gradient_template_units_are_inherited():
+    text = SVG.format(
+        '<defs><linearGradient id="t" gradientUnits="userSpaceOnUse" x2="1"><stop stop-color="red"/>'
+        '<stop offset="1" stop-color="blue"/></linearGradient>'
+        '<linearGradient id="g" href="#t" x2="1"/></defs>'
+        '<rect width="100" height="100" fill="url(#g)"/>')
+    out = optimize(text)
+    assert out.count('x2="1"') == 2
+    # g's x2 is the template's anyway, but the template's units decide what it means.
+    assert equivalent(text, text.replace('id="g" href="#t" x2="1"', 'id="g" href="#t"'))
+    assert not equivalent(text, text.replace(' gradientUnits="userSpaceOnUse"', ''))
+
+
+def test_version_attribute_is_not_drawn():
+    text = SVG.replace("<svg ", '<svg version="1.1" ').format('<rect width="1" height="1"/>')
+    assert optimize(text) == SVG.format('<rect width="1" height="1"/>')
+
+
+def test_style_declarations_become_attributes():
+    text = SVG.format('<defs><linearGradient id="g"><stop offset="0" style="stop-color:#FF0000;stop-opacity:1"/>'
+                      '<stop offset="1" style="stop-color:#0000FF"/></linearGradient></defs>'
+                      '<rect width="10" height="10" style="fill:url(#g); stroke: #000000; stroke-width:2"/>')
+    out = optimize(text)
+    assert "style=" not in out
+    assert '<stop stop-color="red"/>' in out and 'stroke="#000" stroke-width="2"' in out
+    assert equivalent(text, out)
+
+
+def test_merged_definitions_keep_every_reference():
+    clip = '<clipPath id="{}"><rect width="5" height="5"/></clipPath>'
+    text = SVG.format('<defs>' + clip.format("c1") + clip.format("c2") + '</defs>'
+                      '<rect width="9" height="9" clip-path="url(#c1)"/>'
+                      '<circle r="4" clip-path="url(#c2)"/>')
+    out = optimize(text)
+    assert out.count("<clipPath") == 1
+    assert out.count('clip-path="url(#c1)"') == 2
+    assert equivalent(text, out)
+
+
+def test_optimize_is_idempotent():
+    text = SVG.format('<g fill="#FFFFFF" opacity="0.50"><path d="M 10 10 L 20 20 Z"/>'
+                      '<circle cx="5.000" cy="5" r="2" fill-opacity="1"/></g>')
+    once = optimize(text)
+    assert optimize(once) == once
+
+
+def test_optimize_file_check_and_write(tmp_path):
+    path = tmp_path / "a.svg"
+    text = SVG.format('<!-- big -->\n<rect x="0" width="1" height="1" fill="#FFFFFF"/>\n')
+    path.write_text(text)
+    before, after = optimize_file(str(path), check=True)
+    assert after < before == len(text) and path.read_text() == text
+    assert optimize_file(str(path)) == (before, after)
+    assert path.read_text() == optimize(text)
+    assert optimize_file(str(path)) == (after, after)
+
+
+def test_generated_assets_are_already_minified():
+    # The build minifies every generated SVG, so each committed one is a fixed point.
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    paths = sorted(svg_files(glob.glob(os.path.join(root, "[0-9][0-9]_*", "assets"))))
+    assert paths
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        assert optimize(text) == text, path
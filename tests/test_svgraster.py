@@ -0,0 +1,61 @@
+import io
+import os
+
+import pytest
+
+from generator.svgraster import SvgRasterError, parse_densities, rasterize, rasterize_file, variant_rel
+
+Image = pytest.importorskip("PIL.Image")
+
+FLAT = ('<svg xmlns="http://www.w3.org/2000/svg" width="40" height="20" viewBox="0 0 40 20">'
+        '<rect width="40" height="20" fill="#000"/><rect x="20" width="20" height="20" fill="#f00"/></svg>')
+
+
+def decoded(data):
+    with Image.open(io.BytesIO(data)) as im:
+        return im.convert("RGB")
+
+
+def test_variant_rel():
+    assert variant_rel("style_moodboards/style_1.svg", 1) == "style_moodboards/style_1.png"
+    assert variant_rel("style_moodboards/style_1.svg", 2) == "style_moodboards/2.0x/style_1.png"
+    assert variant_rel("a.svg", 1.5, "jpg") == "1.5x/a.jpg"
+
+
+def test_parse_densities():
+    assert parse_densities("3, 1,2,2") == (1, 2, 3)
+    assert parse_densities("1.5") == (1.5,)
+    for bad in ("", "0,1", "x"):
+        with pytest.raises(ValueError):
+            parse_densities(bad)
+
+
+def test_rasterize_draws_at_each_density():
+    for density in (1, 2):
+        im = decoded(rasterize(FLAT, density).encode("png"))
+        assert im.size == (40 * density, 20 * density)
+        assert im.getpixel((5, 5)) == (0, 0, 0)
+        assert im.getpixel((im.width - 5, 5)) == (255, 0, 0)
+
+
+@pytest.mark.parametrize("svg, message", [
+    ("<svg", "not well-formed"),
+    ('<svg xmlns="http://www.w3.org/2000/svg"/>', "no size"),
+    ('<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"><ellipse/></svg>', "unsupported element <ellipse>"),
+    ('<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"><path d="M0 0 C1 1 2 2 3 3"/></svg>',
+     "unsupported path command"),
+    ('<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10" viewBox="5 0 10 10"/>', "viewBoxes at the origin"),
+])
+def test_unsupported_svg_is_refused(svg, message):
+    with pytest.raises(SvgRasterError, match=message):
+        rasterize(svg)
+
+
+def test_rasterize_file_writes_variants_once(tmp_path):
+    path = tmp_path / "flat.svg"
+    path.write_text(FLAT)
+    out = rasterize_file(str(path), densities=(1, 2))
+    assert [(os.path.relpath(p, tmp_path), written) for p, _, written in out] == \
+        [("flat.png", True), (os.path.join("2.0x", "flat.png"), True)]
+    assert decoded((tmp_path / "2.0x" / "flat.png").read_bytes()).size == (80, 40)
+    assert [written for _, _, written in rasterize_file(str(path), densities=(1, 2))] == [False, False]
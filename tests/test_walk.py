@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+from generator.walk import IgnoreRules, iter_files
+
+
+@pytest.fixture
+def repo(tmp_path):
+    (tmp_path / ".git").mkdir()
+
+    def make(*rels):
+        for rel in rels:
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(rel)
+        return tmp_path
+
+    return make
+
+
+def walk(root, **kwargs):
+    return sorted(os.path.relpath(p, root).replace(os.sep, "/") for p, _ in iter_files(str(root), **kwargs))
+
+
+def test_deny_list_and_suffixes(repo):
+    root = repo("lib/a.dart", "lib/b.py", ".dart_tool/x.dart", "ios/Pods/p.dart", "build/out.dart")
+    assert walk(root) == ["lib/a.dart", "lib/b.py"]
+    assert walk(root, suffixes=(".dart",)) == ["lib/a.dart"]
+
+
+def test_gitignore_patterns(repo):
+    root = repo(".gitignore", "keep.log", "a.log", "sub/b.log", "out/x", "sub/out/y",
+                "docs/out", "top/z", "sub/top/z")
+    (root / ".gitignore").write_text("# comment\n*.log\n!keep.log\nout/\n/top\n")
+    assert walk(root) == [".gitignore", "docs/out", "keep.log", "sub/top/z"]
+
+
+def test_nested_gitignore_overrides_parent(repo):
+    root = repo("a.tmp", "sub/.gitignore", "sub/b.tmp", "sub/c.txt")
+    (root / ".gitignore").write_text("*.tmp\n")
+    (root / "sub" / ".gitignore").write_text("!b.tmp\n*.txt\n")
+    assert walk(root) == [".gitignore", "sub/.gitignore", "sub/b.tmp"]
+
+
+def test_parent_gitignore_applies_to_subtree(repo):
+    root = repo("proj/lib/a.dart", "proj/gen/b.dart")
+    (root / ".gitignore").write_text("proj/gen/\n")
+    assert walk(root / "proj") == ["lib/a.dart"]
+
+
+def test_gitignore_can_be_disabled(repo):
+    root = repo(".gitignore", "a.log")
+    (root / ".gitignore").write_text("*.log\n")
+    assert walk(root, gitignore=False) == [".gitignore", "a.log"]
+
+
+@pytest.mark.parametrize("pattern, path, is_dir, expected", [
+    ("**/cache", "a/b/cache", True, True),
+    ("doc/**", "doc/x/y.md", False, True),
+    ("a/**/b", "a/b", False, True),
+    ("a/**/b", "a/x/y/b", False, True),
+    ("file[0-9].txt", "dir/file3.txt", False, True),
+    ("file[!0-9].txt", "file3.txt", False, None),
+    ("build/", "build", False, None),
+    ("?.txt", "ab.txt", False, None),
+])
+def test_ignore_rule_matching(pattern, path, is_dir, expected):
+    assert IgnoreRules([pattern]).match(path, is_dir) is expected